@@ -0,0 +1,311 @@
+"""
+Archive Cache Module
+
+On-disk cache of downloaded source archives, keyed by S3 ETag.
+
+Every archive that is downloaded is kept as <cache dir>/<ETag>/<file name>,
+so re-running after a failure, or reloading the same export for a backfill,
+reads the archive from disk instead of S3. An ETag identifies the content
+of an object, so a re-uploaded object is never served stale. The cache is
+bounded in size; the least recently used archives are evicted first (use is
+tracked through the file's modification time, which is refreshed on every
+hit).
+
+Archives are written to a temporary file in the cache directory and only
+renamed into place once complete and verified, so the MOLO and Stellar
+processes can share one cache and an interrupted download never leaves a
+truncated entry behind.
+
+find_local_archive() resolves the --from-local replay path: a single
+archive, or a directory (such as the cache itself) searched for the newest
+archive of a source by its export-time file name.
+"""
+
+import logging
+import os
+import re
+import tempfile
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default size bound of the cache
+DEFAULT_ARCHIVE_CACHE_GB = 2.0
+
+# Bytes copied per step when storing an archive
+CACHE_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Suffix of archives that are still being written
+PARTIAL_SUFFIX = '.part'
+
+
+def find_local_archive(path, scheme):
+    """
+    Resolve a --from-local path to one source's archive.
+
+    Args:
+        path (str): Archive file, or directory searched recursively
+        scheme (BackupKeyScheme): Naming scheme of the source's archives
+
+    Returns:
+        str: Path of the archive to replay, or None if there is none for this source
+    """
+    if os.path.isfile(path):
+        return path if path.lower().endswith(scheme.suffix.lower()) else None
+
+    latest = None
+    latest_time = None
+    for directory, _, file_names in os.walk(path):
+        for file_name in file_names:
+            exported = scheme.timestamp(file_name)
+            if exported is not None and (latest_time is None or exported > latest_time):
+                latest, latest_time = os.path.join(directory, file_name), exported
+    return latest
+
+
+class ArchiveCache:
+    """
+    Size-bounded LRU cache of archives on local disk.
+
+    Attributes:
+        directory (str): Cache directory
+        max_bytes (int): Size bound; archives larger than this are not cached
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def open(cls, directory, max_gb=DEFAULT_ARCHIVE_CACHE_GB):
+        """
+        Open the cache, or return None if it is disabled.
+
+        Args:
+            directory (str): Cache directory (None or '' disables the cache)
+            max_gb (float): Size bound in GB (0 disables the cache)
+
+        Returns:
+            ArchiveCache: Cache, or None
+        """
+        if not directory or max_gb <= 0:
+            return None
+        try:
+            return cls(directory, int(max_gb * 1024 ** 3))
+        except OSError as e:
+            logger.warning(f"⚠️  Archive cache disabled, cannot use {directory}: {e}")
+            return None
+
+    def entry_path(self, etag, key):
+        """
+        Location of an archive in the cache.
+
+        Args:
+            etag (str): ETag of the S3 object
+            key (str): S3 object key (its file name is kept in the cache)
+
+        Returns:
+            str: <cache dir>/<ETag>/<file name>
+        """
+        etag_dir = re.sub(r'[^0-9A-Za-z-]', '', etag)
+        return os.path.join(self.directory, etag_dir, os.path.basename(key))
+
+    def lookup(self, etag, key):
+        """
+        Find a cached archive and mark it as recently used.
+
+        Args:
+            etag (str): ETag of the S3 object
+            key (str): S3 object key (its file name is kept in the cache)
+
+        Returns:
+            str: Path of the cached archive, or None on a miss
+        """
+        path = self.entry_path(etag, key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        logger.info(f"💾 Archive cache hit: {os.path.basename(key)} (ETag {etag})")
+        return path
+
+    def writer(self, etag, key):
+        """
+        Start storing an archive as it is read.
+
+        Args:
+            etag (str): ETag of the S3 object
+            key (str): S3 object key
+
+        Returns:
+            CacheWriter: Writer; call commit() once the archive is verified
+        """
+        return CacheWriter(self, etag, key)
+
+    def store(self, etag, key, source):
+        """
+        Copy a downloaded archive into the cache.
+
+        Args:
+            etag (str): ETag of the S3 object
+            key (str): S3 object key
+            source: Seekable binary file holding the archive; its position is kept
+        """
+        position = source.tell()
+        source.seek(0)
+        writer = self.writer(etag, key)
+        try:
+            for chunk in iter(lambda: source.read(CACHE_COPY_CHUNK_SIZE), b''):
+                writer.write(chunk)
+            writer.commit()
+        except OSError as e:
+            logger.warning(f"⚠️  Could not cache {os.path.basename(key)}: {e}")
+            writer.discard()
+        finally:
+            source.seek(position)
+
+    def _entries(self):
+        """List cached archives as (last used, size, path)."""
+        entries = []
+        for directory, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                if file_name.endswith(PARTIAL_SUFFIX):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, keep=None):
+        """
+        Remove least recently used archives until the cache fits its bound.
+
+        Args:
+            keep (str): Path that is never evicted (the archive just stored)
+
+        Returns:
+            int: Number of archives removed
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            total -= size
+            removed += 1
+            logger.info(f"💾 Evicted {os.path.basename(path)} from the archive cache")
+        return removed
+
+
+class CacheWriter:
+    """
+    Writes one archive into the cache, published only by commit().
+
+    Writing stops silently once the archive outgrows the cache bound or the
+    disk fails, so a caching problem never fails the load itself.
+    """
+
+    def __init__(self, cache, etag, key):
+        self.cache = cache
+        self.path = cache.entry_path(etag, key)
+        self._size = 0
+        self._file = None
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(self.path), suffix=PARTIAL_SUFFIX, delete=False
+            )
+        except OSError as e:
+            logger.warning(f"⚠️  Could not cache {os.path.basename(key)}: {e}")
+
+    def write(self, data):
+        """Append the next bytes of the archive."""
+        if self._file is None:
+            return
+        self._size += len(data)
+        if self._size > self.cache.max_bytes:
+            logger.info(f"💾 {os.path.basename(self.path)} is larger than the archive cache, not cached")
+            self.discard()
+            return
+        try:
+            self._file.write(data)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not cache {os.path.basename(self.path)}: {e}")
+            self.discard()
+
+    def commit(self):
+        """Publish the complete archive and evict older ones if needed."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            os.replace(self._file.name, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not cache {os.path.basename(self.path)}: {e}")
+            self.discard()
+            return
+        self._file = None
+        logger.info(f"💾 Cached {os.path.basename(self.path)} ({self._size / (1024 * 1024):.1f} MB)")
+        self.cache.evict(keep=self.path)
+
+    def discard(self):
+        """Drop the partial archive."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            os.remove(self._file.name)
+            os.rmdir(os.path.dirname(self.path))
+        except OSError:
+            pass
+        self._file = None
+
+
+class CachingReader:
+    """
+    File-like wrapper that copies everything read from a download stream
+    (s3_download.ParallelRangeStream) into the cache.
+
+    The cache entry is published by finish(), after the stream has verified
+    the archive's ETag.
+    """
+
+    def __init__(self, stream, writer):
+        self.stream = stream
+        self.writer = writer
+
+    @property
+    def bytes_read(self):
+        """int: Bytes handed to the consumer so far."""
+        return self.stream.bytes_read
+
+    def read(self, size=-1):
+        """Read up to size bytes and copy them into the cache."""
+        data = self.stream.read(size)
+        self.writer.write(data)
+        return data
+
+    def finish(self):
+        """Read the rest of the archive, verify it and publish the cache entry."""
+        while self.read(CACHE_COPY_CHUNK_SIZE):
+            pass
+        self.stream.finish()
+        self.writer.commit()
+
+    def close(self):
+        """Close the stream; an unfinished cache entry is dropped."""
+        self.stream.close()
+        self.writer.discard()
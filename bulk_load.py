@@ -0,0 +1,277 @@
+"""
+Bulk Load Module
+
+Optional bulk-load engine for the largest staging tables.
+
+Staging loads normally bind rows with executemany() over a plain INSERT,
+in arrays sized by the connector's load policy (see load_policy.py), as
+conventional inserts: every row goes through the buffer cache and
+generates undo and redo. The tables that
+dominate a load (InvoiceItemSet, InvoiceSet and Transactions in MOLO,
+bookings and booking_payments in Stellar) can load in a bulk mode instead:
+
+- append: the same INSERT with an APPEND_VALUES hint, in arrays of
+  BULK_BATCH_SIZE rows. Each array is a direct-path insert written above
+  the table's high-water mark; the table cannot be touched again in that
+  transaction (ORA-12838), so every array is committed before the next.
+- direct: python-oracledb's Direct Path Load interface
+  (Connection.direct_path_load), which streams the rows in the database's
+  block format without SQL processing. It is only available in Thin mode,
+  so the MOLO pipeline opens its connections in Thin mode when this mode
+  is requested (the connectors otherwise initialize Instant Client, which
+  makes every connection of the process Thick). It needs typed rows (a
+  spec with bind_types and no SQL conversions in its INSERT) and commits by
+  itself, so a table loading this way writes no per-batch checkpoints: an
+  interrupted run reloads it from the start. When any of this does not hold
+  - Stellar's rows are never typed - the table loads with APPEND_VALUES
+  instead.
+
+Tables opt in through TableSpec.bulk_load (MOLO) and
+STELLAR_BULK_LOAD_TABLES (Stellar); every other table, and every table in
+the default conventional mode, loads as before.
+
+Run this module directly to compare rows/sec of the modes on a MOLO staging
+table (it truncates that staging table, so not while a load runs):
+    python3 bulk_load.py [--table INVOICE_ITEMS] [--rows 200000] [--csv InvoiceItemSet.csv]
+"""
+
+import argparse
+import itertools
+import logging
+import re
+import time
+from datetime import datetime
+
+
+logger = logging.getLogger(__name__)
+
+
+CONVENTIONAL = 'conventional'
+APPEND = 'append'
+DIRECT = 'direct'
+
+BULK_LOAD_MODES = (CONVENTIONAL, APPEND, DIRECT)
+
+# Rows per array in the bulk modes. Every APPEND_VALUES array starts new
+# blocks above the high-water mark and ends with a commit, so arrays are
+# kept an order of magnitude larger than conventional batches
+BULK_BATCH_SIZE = 50000
+
+_INSERT_KEYWORD = re.compile(r'^(\s*)INSERT\b', re.IGNORECASE)
+
+
+def append_values_sql(insert_sql):
+    """
+    Add the APPEND_VALUES hint to an INSERT ... VALUES statement.
+
+    Args:
+        insert_sql (str): INSERT statement
+
+    Returns:
+        str: The statement as a direct-path insert
+    """
+    return _INSERT_KEYWORD.sub(r'\1INSERT /*+ APPEND_VALUES */', insert_sql, count=1)
+
+
+def direct_path_supported(connection):
+    """
+    Check whether a connection can use the Direct Path Load interface.
+
+    Args:
+        connection: Oracle database connection
+
+    Returns:
+        bool: True in python-oracledb Thin mode with direct_path_load()
+    """
+    return bool(getattr(connection, 'thin', False)) and hasattr(connection, 'direct_path_load')
+
+
+def choose_mode(
+    requested, connection, table_name, typed_rows=True, resuming=False, batch_errors=False
+):
+    """
+    Decide how a bulk-load table actually loads.
+
+    Args:
+        requested (str): Mode asked for ('conventional', 'append' or 'direct')
+        connection: Oracle database connection the table loads on
+        table_name (str): Staging table name, for the log
+        typed_rows (bool): Rows carry final Python types and the INSERT has
+                           no SQL conversions (required for direct path)
+        resuming (bool): The load continues after batches committed by an
+                         interrupted run, which direct path cannot checkpoint
+        batch_errors (bool): Bad rows are to be quarantined, which only
+                             conventional inserts report (see row_quarantine.py)
+
+    Returns:
+        str: CONVENTIONAL, APPEND or DIRECT
+    """
+    if batch_errors and requested != CONVENTIONAL:
+        logger.info(f"🚚 {table_name}: rejected rows are quarantined - using conventional inserts")
+        return CONVENTIONAL
+    if requested != DIRECT:
+        return requested
+    if not typed_rows:
+        reason = "its INSERT converts values in SQL"
+    elif not direct_path_supported(connection):
+        reason = "the session is not in python-oracledb Thin mode"
+    elif resuming:
+        reason = "it resumes after committed batches"
+    else:
+        return DIRECT
+    logger.info(f"🚚 {table_name}: direct path unavailable ({reason}) - using APPEND_VALUES")
+    return APPEND
+
+
+def direct_path_load(connection, table_name, columns, rows):
+    """
+    Load rows with the Direct Path Load interface; they are committed on return.
+
+    Args:
+        connection: Oracle database connection (Thin mode)
+        table_name (str): Table in the connected user's schema
+        columns (tuple): Column names in row order
+        rows (list): Row tuples
+    """
+    connection.direct_path_load(connection.username.upper(), table_name, list(columns), rows)
+
+
+def append_insert(connector, insert_sql, rows, batch_size=BULK_BATCH_SIZE):
+    """
+    Insert rows with APPEND_VALUES, committing after every array.
+
+    Args:
+        connector: Database connector with cursor and connection attributes
+        insert_sql (str): Conventional INSERT ... VALUES statement
+        rows (iterable): Row tuples, pulled one array at a time
+        batch_size (int): Rows per array
+
+    Returns:
+        int: Number of rows inserted
+    """
+    sql = append_values_sql(insert_sql)
+    rows = iter(rows)
+    row_count = 0
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return row_count
+        connector.cursor.executemany(sql, batch)
+        connector.connection.commit()
+        row_count += len(batch)
+
+
+def _synthetic_rows(spec, row_count):
+    """Typed rows shaped after a spec's bind types, with unique keys."""
+    now = datetime.now().replace(microsecond=0)
+    values = []
+    for type_name, size in spec.bind_types:
+        if type_name == 'VARCHAR':
+            values.append('x' * min(size or 20, 20))
+        elif type_name == 'NUMBER':
+            values.append(1)
+        elif type_name in ('DATE', 'TIMESTAMP'):
+            values.append(now)
+        else:
+            values.append(None)
+    key = spec.key_index
+    rows = []
+    for i in range(1, row_count + 1):
+        row = list(values)
+        if key is not None:
+            row[key] = i if spec.bind_types[key][0] == 'NUMBER' else str(i)
+        rows.append(tuple(row))
+    return rows
+
+
+def benchmark(connector, spec, rows, modes=BULK_LOAD_MODES):
+    """
+    Load the same rows into a staging table once per mode and time each load.
+
+    The staging table is truncated before every load and after the last.
+
+    Args:
+        connector: molo_db_functions.OracleConnector
+        spec (TableSpec): Registry entry of the table
+        rows (list): Row tuples in spec.columns order
+        modes (iterable): Modes to compare
+
+    Returns:
+        dict: {mode: {'rows': int, 'seconds': float, 'rows_per_second': float}}
+    """
+    results = {}
+    truncate_sql = f"TRUNCATE TABLE {spec.staging_table}"
+    for mode in modes:
+        connector.cursor.execute(truncate_sql)
+        started = time.perf_counter()
+        loaded = connector.load_staging_table(spec, iter(rows), bulk_mode=mode)
+        seconds = time.perf_counter() - started
+        results[mode] = {
+            'rows': loaded,
+            'seconds': seconds,
+            'rows_per_second': loaded / seconds if seconds else 0.0
+        }
+    connector.cursor.execute(truncate_sql)
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark staging load modes (rows/sec) against the Oracle database'
+    )
+    parser.add_argument(
+        '--table',
+        default='INVOICE_ITEMS',
+        help='MOLO registry table to load (default: INVOICE_ITEMS)'
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=200000,
+        help='Synthetic rows to load when no --csv is given (default: 200000)'
+    )
+    parser.add_argument(
+        '--csv',
+        help="The table's CSV export to parse and load instead of synthetic rows"
+    )
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=BULK_LOAD_MODES,
+        default=list(BULK_LOAD_MODES),
+        help='Modes to compare (default: all)'
+    )
+    args = parser.parse_args()
+
+    from download_csv_from_s3 import MOLO_TABLES, load_config_file
+    from molo_db_functions import OracleConnector
+
+    specs = {spec.table_name: spec for spec in MOLO_TABLES}
+    spec = specs[args.table.upper()]
+    if args.csv:
+        with open(args.csv, encoding='utf-8-sig', newline='') as f:
+            bench_rows = list(spec.parser(f.read()))
+    elif spec.bind_types is None:
+        parser.error(f"{spec.table_name} has no bind types; pass its --csv")
+    else:
+        bench_rows = _synthetic_rows(spec, args.rows)
+
+    database = load_config_file('config.json')['database']
+    # Direct Path Load needs Thin mode, which the process cannot leave again
+    with OracleConnector(
+        database['user'], database['password'], database['dsn'], thin=DIRECT in args.modes
+    ) as connector:
+        results = benchmark(connector, spec, bench_rows, args.modes)
+
+    baseline = results.get(CONVENTIONAL)
+    for mode, result in results.items():
+        speedup = (
+            f" ({result['rows_per_second'] / baseline['rows_per_second']:.1f}x conventional)"
+            if baseline and baseline['rows_per_second'] and mode != CONVENTIONAL else ""
+        )
+        logger.info(
+            f"📊 {spec.staging_table} {mode:<12} {result['rows']:,} rows in "
+            f"{result['seconds']:.2f}s: {result['rows_per_second']:,.0f} rows/s{speedup}"
+        )
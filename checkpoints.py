@@ -0,0 +1,254 @@
+"""
+Checkpoints Module
+
+Checkpoint journal for restartable loads of one source object.
+
+While an object (a MOLO ZIP or Stellar DATA file) is loaded, the
+ETL_LOAD_CHECKPOINTS control table (tables/oracle_etl_control_tables.sql)
+records how far each table got:
+
+- LOADING: the first ROWS_DONE rows are committed to staging, in
+  BATCHES_DONE batches (tables that commit per batch, see load_policy.py)
+- STAGED:  every row is in staging; the table's merge has not run yet
+- MERGED:  the table's merge procedure ran as well
+
+Batch checkpoints are written in the same transaction as the batch they
+describe, so the journal never claims more rows than staging holds. A run
+started with --resume keeps the staging tables of the tables already
+started, skips the tables already loaded and continues a partly loaded
+table after its last committed batch. A run without --resume starts over
+and clears the journal; a successful run clears it too.
+
+If the control table does not exist the journal is disabled with a warning
+and every run loads the whole object as before.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+CHECKPOINT_TABLE = 'ETL_LOAD_CHECKPOINTS'
+
+LOADING = 'LOADING'
+STAGED = 'STAGED'
+MERGED = 'MERGED'
+
+# Identifies a replayed local archive, which has no ETag
+LOCAL_ETAG = 'LOCAL'
+
+CHECKPOINT_SELECT_SQL = f"""
+    SELECT TABLE_NAME, STATUS, BATCHES_DONE, ROWS_DONE
+    FROM {CHECKPOINT_TABLE}
+    WHERE SOURCE_SYSTEM = :1 AND OBJECT_KEY = :2 AND ETAG = :3"""
+
+CHECKPOINT_CLEAR_SQL = f"""
+    DELETE FROM {CHECKPOINT_TABLE}
+    WHERE SOURCE_SYSTEM = :1"""
+
+CHECKPOINT_MERGE_SQL = f"""
+    MERGE INTO {CHECKPOINT_TABLE} tgt
+    USING (
+        SELECT :1 AS SOURCE_SYSTEM, :2 AS OBJECT_KEY, :3 AS ETAG, :4 AS TABLE_NAME,
+               :5 AS STATUS, :6 AS BATCHES_DONE, :7 AS ROWS_DONE
+        FROM DUAL
+    ) src
+    ON (tgt.SOURCE_SYSTEM = src.SOURCE_SYSTEM AND tgt.OBJECT_KEY = src.OBJECT_KEY
+        AND tgt.ETAG = src.ETAG AND tgt.TABLE_NAME = src.TABLE_NAME)
+    WHEN MATCHED THEN
+        UPDATE SET
+            tgt.STATUS = src.STATUS,
+            tgt.BATCHES_DONE = src.BATCHES_DONE,
+            tgt.ROWS_DONE = src.ROWS_DONE,
+            tgt.UPDATED_AT = SYSTIMESTAMP
+    WHEN NOT MATCHED THEN
+        INSERT (SOURCE_SYSTEM, OBJECT_KEY, ETAG, TABLE_NAME, STATUS,
+                BATCHES_DONE, ROWS_DONE, UPDATED_AT)
+        VALUES (src.SOURCE_SYSTEM, src.OBJECT_KEY, src.ETAG, src.TABLE_NAME, src.STATUS,
+                src.BATCHES_DONE, src.ROWS_DONE, SYSTIMESTAMP)"""
+
+
+class TableCheckpoint:
+    """
+    How far one table of the object got.
+
+    Attributes:
+        journal (CheckpointJournal): Journal the checkpoint is written to
+        table_name (str): Table name
+        status (str): LOADING, STAGED, MERGED, or None if the table was not started
+        batches_done (int): Batches committed to staging
+        rows_done (int): Rows committed to staging
+    """
+
+    def __init__(self, journal, table_name, status=None, batches_done=0, rows_done=0):
+        self.journal = journal
+        self.table_name = table_name
+        self.status = status
+        self.batches_done = batches_done
+        self.rows_done = rows_done
+
+    @property
+    def started(self):
+        """bool: True if staging holds rows of this table from the interrupted run."""
+        return self.status is not None
+
+    @property
+    def loaded(self):
+        """bool: True if every row of the table is in staging."""
+        return self.status in (STAGED, MERGED)
+
+    def batch_committed(self, connector, batches_done, rows_done):
+        """
+        Record a staging batch; the caller's following commit covers both.
+
+        Args:
+            connector: Database connector the batch was inserted with
+            batches_done (int): Batches inserted so far
+            rows_done (int): Rows inserted so far
+        """
+        self._write(connector, LOADING, batches_done, rows_done)
+
+    def record(self, connector, status, rows_done, commit=True):
+        """
+        Record that the table reached a status, and commit.
+
+        Args:
+            connector: Database connector the table was loaded with
+            status (str): STAGED or MERGED
+            rows_done (int): Rows in staging
+            commit (bool): False leaves the commit to the caller (commit per run)
+        """
+        self._write(connector, status, self.batches_done, rows_done)
+        if commit:
+            connector.connection.commit()
+
+    def _write(self, connector, status, batches_done, rows_done):
+        if not self.journal.enabled:
+            return
+        try:
+            connector.cursor.execute(CHECKPOINT_MERGE_SQL, [
+                self.journal.system, self.journal.object_key, self.journal.etag,
+                self.table_name, status, batches_done, rows_done
+            ])
+        except Exception as e:
+            # A failed statement leaves the rest of the transaction intact
+            logger.warning(f"⚠️  Could not checkpoint {self.table_name}: {e}")
+            return
+        self.status = status
+        self.batches_done = batches_done
+        self.rows_done = rows_done
+
+
+class CheckpointJournal:
+    """
+    Checkpoints of the tables of one source object.
+
+    Attributes:
+        system (str): Source system ('MOLO' or 'STELLAR')
+        object_key (str): Key of the object being loaded
+        etag (str): Its ETag (LOCAL_ETAG for a replayed local archive)
+        enabled (bool): False if the control table could not be used
+        checkpoints (dict): {table_name: TableCheckpoint} of the interrupted run
+    """
+
+    def __init__(self, system, object_key, etag, checkpoints=None, enabled=True):
+        self.system = system
+        self.object_key = object_key
+        self.etag = etag or LOCAL_ETAG
+        self.enabled = enabled
+        self.checkpoints = dict(checkpoints or {})
+
+    @classmethod
+    def open(cls, connector, system, object_key, etag, resume=False):
+        """
+        Start the journal of an object.
+
+        Without resume, checkpoints left by earlier runs are cleared. With
+        resume, the checkpoints of this object (same key and ETag) are read;
+        those of any other object are ignored.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            system (str): Source system ('MOLO' or 'STELLAR')
+            object_key (str): Key of the object being loaded
+            etag (str): ETag of the object (None for a local archive)
+            resume (bool): Continue the interrupted run of this object
+
+        Returns:
+            CheckpointJournal: Journal (disabled if the control table is missing)
+        """
+        journal = cls(system, object_key, etag)
+        try:
+            if not resume:
+                connector.cursor.execute(CHECKPOINT_CLEAR_SQL, [system])
+                connector.connection.commit()
+                return journal
+            connector.cursor.execute(CHECKPOINT_SELECT_SQL, [system, object_key, journal.etag])
+            rows = connector.cursor.fetchall()
+        except Exception as e:
+            logger.warning(f"⚠️  Checkpoint journal unavailable: {e}")
+            logger.warning(
+                f"   Create {CHECKPOINT_TABLE} (tables/oracle_etl_control_tables.sql) "
+                "to resume interrupted loads."
+            )
+            connector.connection.rollback()
+            journal.enabled = False
+            return journal
+
+        for table_name, status, batches_done, rows_done in rows:
+            journal.checkpoints[table_name] = TableCheckpoint(
+                journal, table_name, status, int(batches_done or 0), int(rows_done or 0)
+            )
+        if journal.checkpoints:
+            loaded = sum(1 for checkpoint in journal.checkpoints.values() if checkpoint.loaded)
+            logger.info(
+                f"⏩ Resuming {object_key}: {loaded} of {len(journal.checkpoints)} "
+                f"started tables already loaded"
+            )
+        else:
+            logger.info(f"⏩ No interrupted load of {object_key} to resume - loading everything")
+        return journal
+
+    def checkpoint(self, table_name):
+        """
+        Checkpoint of a table, to consult and update while it loads.
+
+        Args:
+            table_name (str): Table name
+
+        Returns:
+            TableCheckpoint: The interrupted run's checkpoint, or a fresh one
+        """
+        if table_name not in self.checkpoints:
+            self.checkpoints[table_name] = TableCheckpoint(self, table_name)
+        return self.checkpoints[table_name]
+
+    def started(self, table_name):
+        """
+        Check whether the interrupted run left rows of a table in staging.
+
+        Args:
+            table_name (str): Table name
+
+        Returns:
+            bool: True if the table's staging table must not be truncated
+        """
+        checkpoint = self.checkpoints.get(table_name)
+        return checkpoint is not None and checkpoint.started
+
+    def clear(self, connector):
+        """
+        Remove the checkpoints once the object loaded completely.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+        """
+        if not self.enabled:
+            return
+        try:
+            connector.cursor.execute(CHECKPOINT_CLEAR_SQL, [self.system])
+            connector.connection.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not clear the checkpoint journal: {e}")
+            connector.connection.rollback()
@@ -0,0 +1,294 @@
+"""
+Column Converters Module
+
+Precompiled per-column value converters for CSV parsing.
+
+Each *_column() factory turns a column spec (type, max length, null policy,
+default) into one specialized callable that converts a raw CSV cell. The
+null check, length limit and default are bound once when the converter is
+built, so converting a cell costs a single strip and a frozenset lookup
+instead of re-creating helper closures for every file and stringifying each
+value twice. Datetime columns parse through a per-column DateColumnParser
+(see date_parsing.py).
+
+build_row_converter() combines the per-column converters of a table into a
+single row-level function that maps a csv.DictReader row to a database-ready
+tuple.
+
+Every converter also declares the Oracle bind type its values need as a
+bind_type attribute: ('VARCHAR', max_length), ('NUMBER', None) or
+('DATE', None). The row converter collects them in column order as
+bind_types, which TableSpec passes on to OracleConnector for setinputsizes().
+"""
+
+import logging
+from datetime import datetime
+
+from date_parsing import DateColumnParser
+
+
+logger = logging.getLogger(__name__)
+
+
+# Cell values treated as NULL by the MOLO exports (compared after strip)
+NULL_TOKENS = frozenset(['', 'NULL', 'N/A', 'NONE'])
+
+# Only empty/whitespace cells are NULL; literal 'NULL' text is kept
+EMPTY_ONLY = frozenset([''])
+
+TRUE_TOKENS = frozenset(['TRUE', '1', 'YES', 'Y'])
+FALSE_TOKENS = frozenset(['FALSE', '0', 'NO', 'N'])
+
+
+def string_column(max_length=None, default=None, null_tokens=NULL_TOKENS):
+    """
+    Build a converter for a text column.
+
+    Args:
+        max_length (int): Truncate values to this many characters (None = no limit)
+        default: Value returned for NULL cells (None or a placeholder string)
+        null_tokens (frozenset): Stripped cell values treated as NULL
+
+    Returns:
+        callable: Converter taking a raw cell value
+    """
+    def convert(value):
+        if value is None:
+            return default
+        text = value.strip()
+        if text in null_tokens:
+            return default
+        return text[:max_length] if max_length else text
+
+    convert.bind_type = ('VARCHAR', max_length)
+    return convert
+
+
+def int_column(default=0, null_tokens=NULL_TOKENS, truncate=False):
+    """
+    Build a converter for an integer column.
+
+    By default "12.0" is accepted but "12.5" falls back to the default.
+    With truncate=True any numeric value is truncated ("12.5" -> 12).
+
+    Args:
+        default: Value returned for NULL or unparseable cells
+        null_tokens (frozenset): Stripped cell values treated as NULL
+        truncate (bool): Truncate fractional values instead of rejecting them
+
+    Returns:
+        callable: Converter taking a raw cell value
+    """
+    if truncate:
+        def convert(value):
+            if value is None:
+                return default
+            text = value.strip()
+            if text in null_tokens:
+                return default
+            try:
+                return int(float(text))
+            except ValueError:
+                return default
+    else:
+        def convert(value):
+            if value is None:
+                return default
+            text = value.strip()
+            if text in null_tokens:
+                return default
+            try:
+                # Handle "1.0" format integers
+                if '.' in text:
+                    float_val = float(text)
+                    if float_val.is_integer():
+                        return int(float_val)
+                return int(text)
+            except ValueError:
+                return default
+
+    convert.bind_type = ('NUMBER', None)
+    return convert
+
+
+def float_column(default=0.0, null_tokens=NULL_TOKENS):
+    """
+    Build a converter for a floating point column.
+
+    Args:
+        default: Value returned for NULL or unparseable cells
+        null_tokens (frozenset): Stripped cell values treated as NULL
+
+    Returns:
+        callable: Converter taking a raw cell value
+    """
+    def convert(value):
+        if value is None:
+            return default
+        text = value.strip()
+        if text in null_tokens:
+            return default
+        try:
+            return float(text)
+        except ValueError:
+            return default
+
+    convert.bind_type = ('NUMBER', None)
+    return convert
+
+
+def bool_int_column(
+    default=0,
+    null_tokens=NULL_TOKENS,
+    numeric_fallback=False,
+    true_tokens=TRUE_TOKENS,
+    false_tokens=FALSE_TOKENS
+):
+    """
+    Build a converter for a boolean column stored as 1/0.
+
+    Args:
+        default: Value returned for NULL or unrecognized cells
+        null_tokens (frozenset): Stripped cell values treated as NULL
+        numeric_fallback (bool): Convert unrecognized numeric text with int(float(x))
+        true_tokens (frozenset): Upper-cased cell values converted to 1
+        false_tokens (frozenset): Upper-cased cell values converted to 0
+
+    Returns:
+        callable: Converter taking a raw cell value
+    """
+    def convert(value):
+        if value is None:
+            return default
+        text = value.strip()
+        if text in null_tokens:
+            return default
+        upper = text.upper()
+        if upper in true_tokens:
+            return 1
+        if upper in false_tokens:
+            return 0
+        if numeric_fallback:
+            try:
+                return int(float(text))
+            except ValueError:
+                return default
+        return default
+
+    convert.bind_type = ('NUMBER', None)
+    return convert
+
+
+def datetime_column(
+    formats,
+    null_tokens=NULL_TOKENS,
+    date_only=False,
+    warn_label=None,
+    text_format=None
+):
+    """
+    Build a converter for a datetime (or date) column.
+
+    Each converter owns a DateColumnParser, so the winning format is
+    memoized per column. Build one converter per column rather than sharing
+    one between columns.
+
+    Args:
+        formats (list): strptime formats to try, in order
+        null_tokens (frozenset): Stripped cell values treated as NULL
+        date_only (bool): Return a date instead of a datetime
+        warn_label (str): If set, log "Could not parse <label>: <value>" on a miss
+        text_format (str): If set, emit the value as text in this strftime
+                           format (for staging columns declared as VARCHAR)
+
+    Returns:
+        callable: Converter taking a raw cell value (its DateColumnParser is
+                  available as the date_parser attribute)
+    """
+    date_parser = DateColumnParser(formats, date_only=date_only)
+    parse = date_parser.parse
+
+    def convert(value):
+        if value is None:
+            return None
+        text = value.strip()
+        if text in null_tokens:
+            return None
+        parsed = parse(text)
+        if parsed is None:
+            if warn_label:
+                logger.warning(f"Could not parse {warn_label}: {text}")
+            return None
+        return parsed.strftime(text_format) if text_format else parsed
+
+    convert.date_parser = date_parser
+    if text_format:
+        convert.bind_type = ('VARCHAR', len(datetime(2000, 12, 31, 23, 59, 59).strftime(text_format)))
+    else:
+        convert.bind_type = ('DATE', None)
+    return convert
+
+
+def build_row_converter(columns):
+    """
+    Combine per-column converters into one row-level conversion function.
+
+    The row function is compiled once from the column list, so converting a
+    row is a single tuple display of direct converter calls with no per-cell
+    loop or unpacking overhead.
+
+    Args:
+        columns (list): (csv_field, converter) pairs in database column order
+
+    Returns:
+        callable: Function taking a csv.DictReader row and returning a tuple
+    """
+    columns = tuple(columns)
+    namespace = {}
+    calls = []
+    for position, (field, convert) in enumerate(columns):
+        namespace[f"_c{position}"] = convert
+        calls.append(f"_c{position}(get({field!r}))")
+
+    source = (
+        "def convert_row(row):\n"
+        "    get = row.get\n"
+        f"    return ({', '.join(calls)},)\n"
+    )
+    exec(compile(source, '<row converter>', 'exec'), namespace)
+
+    convert_row = namespace['convert_row']
+    convert_row.fields = tuple(field for field, _ in columns)
+    convert_row.bind_types = tuple(
+        getattr(convert, 'bind_type', (None, None)) for _, convert in columns
+    )
+    convert_row.date_parsers = {
+        field: convert.date_parser
+        for field, convert in columns
+        if hasattr(convert, 'date_parser')
+    }
+    return convert_row
+
+
+def reset_date_parsers(row_converter):
+    """
+    Reset the memoized formats and statistics of a row converter's date
+    columns. Call once at the start of each file.
+
+    Args:
+        row_converter (callable): Function built by build_row_converter()
+    """
+    for date_parser in row_converter.date_parsers.values():
+        date_parser.reset()
+
+
+def log_date_format_stats(row_converter, label):
+    """
+    Log the per-column datetime format statistics of a row converter.
+
+    Args:
+        row_converter (callable): Function built by build_row_converter()
+        label (str): Table label for the log lines
+    """
+    for field, date_parser in row_converter.date_parsers.items():
+        logger.info(f"📊 {label} {field} date formats: {date_parser.describe()}")
@@ -0,0 +1,261 @@
+"""
+Date Parsing Module
+
+Format-sniffing datetime parser with per-column format memoization.
+
+A column of a MOLO export almost always uses one datetime layout, yet the
+multi-format parsers used to try every strptime format in order for every
+cell, paying for a raised ValueError on each miss. DateColumnParser remembers
+the format that last won for its column and re-parses the following values
+with a fixed-position fast path (string slicing and int(), no strptime). Only
+when a value does not fit the remembered layout does it fall back to the
+ordered multi-format search.
+
+Results are identical to trying the formats in order with strptime: the fast
+path only handles zero-padded values whose layout matches exactly, and when an
+earlier format in the list could also match the same text (e.g. '%m/%d/%Y'
+ahead of '%d/%m/%Y') that format is still tried first.
+"""
+
+from collections import Counter
+from datetime import datetime
+
+
+# Fixed-width directives supported by the fast path: directive -> (width, field)
+FAST_DIRECTIVES = {
+    'Y': (4, 'year'),
+    'm': (2, 'month'),
+    'd': (2, 'day'),
+    'H': (2, 'hour'),
+    'M': (2, 'minute'),
+    'S': (2, 'second')
+}
+
+DATETIME_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second')
+DATETIME_DEFAULTS = {'year': '1900', 'month': '1', 'day': '1', 'hour': '0', 'minute': '0', 'second': '0'}
+
+
+def compile_fixed_layout(fmt):
+    """
+    Compile a strptime format into a fixed-position parse function.
+
+    The generated function checks the exact length, every literal character
+    and that each field is ASCII digits, then builds the datetime directly
+    from string slices. It returns None for any value that does not fit the
+    zero-padded layout (or is not a valid date), leaving it to the caller to
+    fall back to strptime.
+
+    Args:
+        fmt (str): strptime format
+
+    Returns:
+        callable: Function taking text and returning datetime or None, or None
+                  if the format uses directives the fast path cannot reproduce
+    """
+    literals = []
+    field_slices = {}
+    position = 0
+    index = 0
+    while index < len(fmt):
+        char = fmt[index]
+        if char == '%':
+            directive = fmt[index + 1:index + 2]
+            if directive not in FAST_DIRECTIVES:
+                return None
+            width, field = FAST_DIRECTIVES[directive]
+            if field in field_slices:
+                return None
+            field_slices[field] = f"text[{position}:{position + width}]"
+            position += width
+            index += 2
+            continue
+        if char.isspace() and char != ' ':
+            return None
+        literals.append(f"text[{position}] != {char!r}")
+        position += 1
+        index += 1
+
+    if not field_slices:
+        return None
+
+    checks = ' or '.join([f"len(text) != {position}", "not text.isascii()"] + literals)
+    digits = ' + '.join(field_slices.values())
+    arguments = ', '.join(
+        f"int({field_slices[field]})" if field in field_slices else DATETIME_DEFAULTS[field]
+        for field in DATETIME_FIELDS
+    )
+    source = (
+        "def parse_fixed(text):\n"
+        f"    if {checks}:\n"
+        "        return None\n"
+        f"    if not ({digits}).isdigit():\n"
+        "        return None\n"
+        "    try:\n"
+        f"        return datetime({arguments})\n"
+        "    except ValueError:\n"
+        "        return None\n"
+    )
+    namespace = {'datetime': datetime}
+    exec(compile(source, f'<fixed layout {fmt}>', 'exec'), namespace)
+    return namespace['parse_fixed']
+
+
+def format_signature(fmt):
+    """
+    Separator signature of a format: its literal characters, lowercased, with
+    whitespace removed.
+
+    strptime matches literals case-insensitively and lets a space absorb any
+    run of whitespace, so two formats can only match the same zero-padded
+    value if their signatures are equal.
+
+    Args:
+        fmt (str): strptime format
+
+    Returns:
+        str: Signature, or None if the format contains digits or directives
+             outside the fast-path set (treat as possibly matching anything)
+    """
+    signature = []
+    index = 0
+    while index < len(fmt):
+        char = fmt[index]
+        if char == '%':
+            if fmt[index + 1:index + 2] not in FAST_DIRECTIVES:
+                return None
+            index += 2
+            continue
+        if char.isdigit():
+            return None
+        if not char.isspace():
+            signature.append(char.lower())
+        index += 1
+    return ''.join(signature)
+
+
+class DateColumnParser:
+    """
+    Datetime parser for one column with format memoization and statistics.
+
+    Call reset() at the start of each file so the winning format is detected
+    again per file.
+
+    The memoized format is swapped in a single assignment, so a parser shared
+    by tables loading on different threads always pairs a fast-path layout
+    with its own rival formats; only the statistics may then be approximate.
+
+    Attributes:
+        formats (tuple): strptime formats, in priority order
+        date_only (bool): Return date instead of datetime values
+        current_format (str): Format that won for the most recent value
+        fast_hits (int): Values parsed by the fixed-position fast path
+        fallbacks (int): Values that needed the ordered multi-format search
+        failures (int): Values no format could parse
+        format_counts (Counter): Parsed values per winning format
+    """
+
+    def __init__(self, formats, date_only=False):
+        self.formats = tuple(formats)
+        self.date_only = date_only
+        self._layouts = {fmt: compile_fixed_layout(fmt) for fmt in self.formats}
+
+        # For each format, the earlier formats that could match the same text
+        signatures = [format_signature(fmt) for fmt in self.formats]
+        self._earlier_rivals = {}
+        for index, fmt in enumerate(self.formats):
+            self._earlier_rivals[fmt] = tuple(
+                earlier for earlier, signature in zip(self.formats[:index], signatures[:index])
+                if signature is None or signatures[index] is None
+                or signature == signatures[index]
+            )
+
+        self.reset()
+
+    def reset(self):
+        """Forget the memoized format and clear statistics."""
+        self.current_format = None
+        self._current = (None, None, ())
+        self.fast_hits = 0
+        self.fallbacks = 0
+        self.failures = 0
+        self.format_counts = Counter()
+
+    def parse(self, text):
+        """
+        Parse a stripped, non-NULL value.
+
+        Args:
+            text (str): Value to parse
+
+        Returns:
+            datetime or date: Parsed value, or None if no format matches
+        """
+        current_format, parse_fixed, rivals = self._current
+        if parse_fixed is not None:
+            parsed = parse_fixed(text)
+            if parsed is not None:
+                for rival in rivals:
+                    try:
+                        parsed = datetime.strptime(text, rival)
+                    except ValueError:
+                        continue
+                    # An earlier format matches too; it wins, as it always has
+                    self._remember(rival)
+                    self.format_counts[rival] += 1
+                    self.fallbacks += 1
+                    return parsed.date() if self.date_only else parsed
+                self.fast_hits += 1
+                self.format_counts[current_format] += 1
+                return parsed.date() if self.date_only else parsed
+
+        return self._search(text)
+
+    def _search(self, text):
+        """Ordered multi-format search; memoizes the winning format."""
+        for fmt in self.formats:
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            self.fallbacks += 1
+            self.format_counts[fmt] += 1
+            if fmt != self.current_format:
+                self._remember(fmt)
+            return parsed.date() if self.date_only else parsed
+
+        self.failures += 1
+        return None
+
+    def _remember(self, fmt):
+        self._current = (fmt, self._layouts[fmt], self._earlier_rivals[fmt])
+        self.current_format = fmt
+
+    def stats(self):
+        """
+        Format statistics since the last reset().
+
+        Returns:
+            dict: parsed, fast_hits, fallbacks, failures and per-format counts
+        """
+        return {
+            'parsed': self.fast_hits + self.fallbacks,
+            'fast_hits': self.fast_hits,
+            'fallbacks': self.fallbacks,
+            'failures': self.failures,
+            'formats': dict(self.format_counts)
+        }
+
+    def describe(self):
+        """
+        One-line summary of the statistics for logging.
+
+        Returns:
+            str: e.g. "'%m/%d/%Y %H:%M:%S' x43,210 (fast 43,209, fallback 1, unparsed 0)"
+        """
+        formats = ', '.join(
+            f"'{fmt}' x{count:,}" for fmt, count in self.format_counts.most_common()
+        ) or 'no values'
+        return (
+            f"{formats} (fast {self.fast_hits:,}, fallback {self.fallbacks:,}, "
+            f"unparsed {self.failures:,})"
+        )
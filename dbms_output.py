@@ -0,0 +1,45 @@
+"""
+DBMS_OUTPUT Module
+
+Bulk retrieval of the DBMS_OUTPUT lines printed by the merge procedures.
+
+Reading the buffer with dbms_output.get_line costs one round trip per line,
+and SP_RUN_ALL_MOLO_STELLAR_MERGES alone prints dozens of lines over a link
+to Autonomous Database that crosses the public internet. read_output()
+drains the buffer with dbms_output.get_lines into an array bind instead, so
+a procedure's output costs one round trip (one more per
+DBMS_OUTPUT_BATCH_LINES lines).
+"""
+
+
+# Lines fetched per dbms_output.get_lines call
+DBMS_OUTPUT_BATCH_LINES = 100
+
+# Longest line DBMS_OUTPUT can hold
+DBMS_OUTPUT_LINE_SIZE = 32767
+
+
+def read_output(cursor, batch_lines=DBMS_OUTPUT_BATCH_LINES):
+    """
+    Drain the session's DBMS_OUTPUT buffer.
+
+    Output must have been enabled with dbms_output.enable before the
+    procedure ran.
+
+    Args:
+        cursor: Oracle cursor of the session that ran the procedure
+        batch_lines (int): Lines fetched per round trip
+
+    Returns:
+        list: Output lines in order (empty lines as '')
+    """
+    lines_var = cursor.arrayvar(str, batch_lines, DBMS_OUTPUT_LINE_SIZE)
+    num_lines_var = cursor.var(int)
+    output = []
+    while True:
+        num_lines_var.setvalue(0, batch_lines)
+        cursor.callproc("dbms_output.get_lines", (lines_var, num_lines_var))
+        num_lines = num_lines_var.getvalue() or 0
+        output.extend(line or '' for line in lines_var.getvalue()[:num_lines])
+        if num_lines < batch_lines:
+            return output
@@ -31,10 +31,11 @@ import io
 import json
 import logging
 import os
-import signal
 import sys
 import zipfile
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from functools import partial
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -48,6 +49,46 @@ from botocore.exceptions import NoCredentialsError, ClientError
 
 # Local imports
 from molo_db_functions import OracleConnector
+from column_converters import (
+    EMPTY_ONLY,
+    FALSE_TOKENS,
+    TRUE_TOKENS,
+    bool_int_column,
+    build_row_converter,
+    datetime_column,
+    float_column,
+    int_column,
+    log_date_format_stats,
+    reset_date_parsers,
+    string_column
+)
+from date_parsing import DateColumnParser
+from table_registry import TableSpec, check_dependencies, index_by_source
+from parallel_loader import (
+    DEFAULT_LOAD_WORKERS,
+    ParallelTableLoader,
+    TableJob,
+    log_table_timings
+)
+from pipeline_runner import Pipeline, describe_duration, run_pipelines
+from load_manifest import LoadManifest, hash_zip_member
+from row_delta import RowSnapshotStore
+from object_ledger import ProcessedObjectLedger, object_etag
+from s3_discovery import MOLO_BACKUP_KEYS, find_latest_key
+from s3_download import DEFAULT_DOWNLOAD_WORKERS, download_object
+from archive_cache import DEFAULT_ARCHIVE_CACHE_GB, ArchiveCache, find_local_archive
+from parsed_cache import ParsedTableCache, parser_fingerprint
+from checkpoints import MERGED, CheckpointJournal
+from merge_scheduler import AUTO, DEFERRED, MERGE_MODES, MergeScheduler, log_merge_timings
+from bulk_load import BULK_LOAD_MODES, CONVENTIONAL, DIRECT
+from load_policy import AUTO_COMMIT, COMMIT_MODES, PER_RUN, LoadPolicy
+from row_quarantine import RowQuarantine
+from watermarks import (
+    DEFAULT_FULL_REFRESH_DAYS,
+    DEFAULT_WATERMARK_OVERLAP,
+    WatermarkFilter,
+    WatermarkStore
+)
 
 # Optional validation imports
 try:
@@ -73,24 +114,6 @@ except ImportError as e:
     STELLAR_AVAILABLE = False
     logger.warning(f"Stellar processing module not available: {e}")
 
-# Target CSV files to extract from the ZIP archive
-TARGET_CSV_FILES = [
-    'MarinaLocations', 'Slips', 'SlipTypes', 'Reservations', 'Piers',
-    'Companies', 'Contacts', 'Boats', 'Accounts', 'InvoiceSet', 
-    'InvoiceItemSet', 'Transactions', 'ItemMasters', 'SeasonalPrices',
-    'TransientPrices', 'RecordStatusSet', 'BoatTypes', 'PowerNeeds',
-    'ReservationStatus', 'ReservationTypes', 'ContactTypes',
-    'InvoiceStatusSet', 'InvoiceTypeSet', 'TransactionTypeSet', 
-    'TransactionMethodSet', 'InsuranceSet', 'EquipmentSet', 'AccountStatus',
-    'ContactAutoChargeSet', 'StatementsPreferenceSet', 'InvoiceItemTypeSet',
-    'PaymentMethods', 'SeasonalChargeMethods', 'SeasonalInvoicingMethodSet',
-    'TransientChargeMethods', 'TransientInvoicingMethodSet', 'RecurringInvoiceOptionsSet',
-    'DueDateSettingsSet', 'ItemChargeMethods', 'InsuranceStatusSet',
-    'EquipmentTypeSet', 'EquipmentFuelTypeSet', 'VesselEngineClassSet',
-    'Cities', 'Countries', 'CurrenciesSet', 'PhoneTypes', 'AddressTypeSet',
-    'InstalmentsPaymentMethodSet', 'PaymentsProviderSet'
-]
-
 # =============================================================================
 # CONFIGURATION FILE LOADING
 # =============================================================================
@@ -466,2565 +489,1632 @@ def get_oci_vault_secrets():
 # CSV DATA PARSING FUNCTIONS
 # =============================================================================
 
-def parse_marina_locations_data(csv_content):
-    """
-    Parse MarinaLocations CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing marina location data for database insertion
-    """
-    def safe_string(value, max_length=None, allow_null=True):
-        """Safely convert value to string with optional length limit and NULL handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None if allow_null else ''
-        result = str(value).strip()
-        return result[:max_length] if max_length else result
-    
-    locations = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            location_data = (
-                safe_string(row.get('Id'), allow_null=False) or '',  # ID cannot be null
-                safe_string(row.get('Name'), 255, allow_null=False) or 'Unknown',  # Name cannot be null
-                safe_string(row.get('PrimaryPhoneNumber'), 50),  # Can be null
-                safe_string(row.get('PrimaryFaxNumber'), 50),  # Can be null
-                safe_string(row.get('Organization_Id')),  # Can be null
-                safe_string(row.get('MarinaHash'), 100),  # Can be null
-                safe_string(row.get('UnitSystem'), 20),  # Can be null
-                safe_string(row.get('DefaultArrivalTime'), 10),  # Can be null
-                safe_string(row.get('DefaultDepartureTime'), 10),  # Can be null
-                safe_string(row.get('EmailAddress'), 255),  # Can be null
-                safe_string(row.get('MarinaWebsite'), 500),  # Can be null
-                safe_string(row.get('TimeZone'), 100)  # Can be null
-            )
-            locations.append(location_data)
-        except Exception as e:
-            logger.warning(f"Error parsing marina location row: {e}")
-            continue
-    
-    return locations
+# Datetime formats of the MOLO exports, in priority order. Each datetime
+# column gets its own converter so its winning format is memoized per column.
+MOLO_DATETIME_FORMATS = [
+    '%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M'
+]
+MOLO_DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y']
+CONTACT_DATETIME_FORMATS = [
+    '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y', '%Y-%m-%d',
+    '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y'
+]
+CONTACT_DATE_FORMATS = [
+    '%m/%d/%Y %H:%M:%S', '%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y'
+]
+# MM/DD/YYYY Molo export format plus ISO variants
+EXPORT_DATETIME_FORMATS = [
+    '%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%m/%d/%Y', '%Y-%m-%d'
+]
+
+# STG_MOLO_INVOICE_ITEMS keeps its timestamps in VARCHAR columns, in the
+# session's DD/MM/YYYY HH24:MI:SS format (binding a datetime there fails with
+# DPY-3013), so those converters emit text directly
+STAGING_DATETIME_TEXT_FORMAT = '%d/%m/%Y %H:%M:%S'
 
+molo_datetime = partial(datetime_column, MOLO_DATETIME_FORMATS, warn_label='datetime')
+molo_datetime_text = partial(
+    datetime_column, MOLO_DATETIME_FORMATS,
+    warn_label='datetime', text_format=STAGING_DATETIME_TEXT_FORMAT
+)
+contact_datetime = partial(datetime_column, CONTACT_DATETIME_FORMATS, warn_label='date')
+contact_date = partial(datetime_column, CONTACT_DATE_FORMATS, date_only=True, warn_label='date')
+export_datetime = partial(datetime_column, EXPORT_DATETIME_FORMATS)
+molo_date = partial(datetime_column, MOLO_DATE_FORMATS, warn_label='date')
 
-def parse_piers_data(csv_content):
+# Text columns keep literal 'NULL'/'N/A' values; only empty cells are NULL
+molo_text = partial(string_column, null_tokens=EMPTY_ONLY)
+# Flags as exported by MOLO: TRUE/FALSE (or T/F, 1/0, YES/NO), NULL otherwise
+molo_boolean = partial(
+    bool_int_column, None,
+    true_tokens=TRUE_TOKENS | {'T'}, false_tokens=FALSE_TOKENS | {'F'}
+)
+
+
+def molo_row_parser(row_converter, description):
     """
-    Parse Piers CSV content into database-ready format.
+    Build the parse function of a MOLO table from its row converter.
     
     Args:
-        csv_content (str): Raw CSV content as string
+        row_converter (callable): Function built by build_row_converter()
+        description (str): Singular record label used in log messages
         
     Returns:
-        list: List of tuples containing pier data for database insertion
+        callable: Parser taking CSV content (str, file or reader) and
+                  yielding one database-ready tuple per row
     """
-    piers = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            pier_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255],
-                row.get('MarinaLocationId', '').strip()
-            )
-            piers.append(pier_data)
-        except Exception as e:
-            logger.warning(f"Error parsing pier row: {e}")
-            continue
-    
-    return piers
+    def parse_rows(csv_content):
+        reset_date_parsers(row_converter)
+        csv_reader = csv_dict_reader(csv_content)
+        
+        for row in csv_reader:
+            try:
+                yield row_converter(row)
+            except Exception as e:
+                logger.warning(f"Error parsing {description} row {row.get('Id', 'Unknown')}: {e}")
+                logger.warning(f"Problematic row data: {row}")
+                continue
+        
+        if row_converter.date_parsers:
+            log_date_format_stats(row_converter, description)
+    
+    return parse_rows
+
+
+MARINA_LOCATION_ROW = build_row_converter([
+    ('Id', string_column(default='')),  # ID cannot be null
+    ('Name', string_column(255, default='Unknown')),  # Name cannot be null
+    ('PrimaryPhoneNumber', string_column(50)),  # Can be null
+    ('PrimaryFaxNumber', string_column(50)),  # Can be null
+    ('Organization_Id', string_column()),  # Can be null
+    ('MarinaHash', string_column(100)),  # Can be null
+    ('UnitSystem', string_column(20)),  # Can be null
+    ('DefaultArrivalTime', string_column(10)),  # Can be null
+    ('DefaultDepartureTime', string_column(10)),  # Can be null
+    ('EmailAddress', string_column(255)),  # Can be null
+    ('MarinaWebsite', string_column(500)),  # Can be null
+    ('TimeZone', string_column(100)),  # Can be null
+])
+
+
+PIER_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('Name', molo_text(255, default='')),
+    ('MarinaLocationId', molo_text(default='')),
+])
+
+
+SLIP_ROW = build_row_converter([
+    ('Id', int_column(None)),
+    ('Name', molo_text(255)),
+    ('Type', molo_text(50)),
+    ('RecomendedLOA', molo_text(50)),
+    ('RecomendedBeam', molo_text(50)),
+    ('RecomendedDraft', molo_text(50)),
+    ('RecomendedAirDraft', molo_text(50)),
+    ('MaximumLOA', molo_text(50)),
+    ('MaximumBeam', molo_text(50)),
+    ('MaximumDraft', molo_text(50)),
+    ('MaximumAirDraft', molo_text(50)),
+    ('MarinaLocationId', int_column(None)),
+    ('Pier_Id', int_column(None)),
+    ('Status', molo_text(50)),
+    ('StartDate', molo_datetime()),
+    ('EndDate', molo_datetime()),
+    ('DoNotCountInOccupancy', molo_boolean()),
+    ('Active', molo_boolean()),
+    ('CreationDateTime', molo_datetime()),  # CREATION_DATE_TIME - KEY FIELD
+    ('CreationUser', molo_text(255)),
+    ('SlipType_Id', int_column(None)),
+    ('PaymentProcessingFee', float_column(0.0)),
+    ('ManagementFee', float_column(0.0)),
+    ('OwnerId', int_column(None)),
+    ('PaymentProcessingFeeTypeId', int_column(None)),
+    ('ManagementFeeTypeId', int_column(None)),
+    ('OverrideOccupancyLOA', molo_text(50)),
+    ('HashID', molo_text(50)),
+    ('MaintenanceFee', float_column(0.0)),
+    ('SvgId', molo_text(255)),
+    ('Assessment', float_column(0.0)),
+    ('Loan', float_column(0.0)),
+    ('OrderColumn', int_column(None)),
+    ('SignName', molo_text(255)),
+    ('MaxWeight', float_column(0.0)),
+])
+
+
+RESERVATION_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('MarinaLocationId', molo_text(default='')),
+    ('CreationTime', molo_datetime()),
+    ('ReservationStatusId', molo_text(default='')),
+    ('ReservationTypeId', molo_text(default='')),
+    ('ContactId', molo_text(default='')),
+    ('BoatId', molo_text(default='')),
+    ('ScheduledArrivalTime', molo_datetime()),
+    ('ScheduledDepartureTime', molo_datetime()),
+    ('CancellationTime', molo_datetime()),
+    ('AccountId', molo_text(default='')),
+    ('SlipId', molo_text(default='')),
+    ('Rate', molo_text(default='')),
+    ('Name', molo_text(500, default='')),
+    ('HashID', molo_text(50, default='')),
+    ('ReservationSource', molo_text(50, default='')),
+])
+
+
+COMPANY_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('Name', molo_text(255, default='')),
+    ('Owner', molo_text(255, default='')),
+    ('PrimaryFaxNumber', molo_text(50, default='')),
+    ('PrimaryPhoneNumber', molo_text(50, default='')),
+    ('City_Id', molo_text(default='')),
+    ('Image', molo_text(500, default='')),
+    ('Description', molo_text(2000, default='')),
+    ('PartnerId', molo_text(default='')),
+    ('MoloAPI_Partner_Id', molo_text(default='')),
+    ('CompanyMoloAPI_Partner_Company_Id', molo_text(default='')),
+    ('InvoiceAtCompanyLevel', molo_text(10, default='')),
+    ('MoloContactId', molo_text(default='')),
+    ('StripeCustomerId', molo_text(255, default='')),
+    ('LoginProviderId', molo_text(default='')),
+    ('DefaultCCFee', molo_text(default='')),
+    ('Tier1PercentACHFee', molo_text(default='')),
+    ('Tier2PercentACHFee', molo_text(default='')),
+])
+
+
+CONTACT_ROW = build_row_converter([
+    ('Id', string_column(default='')),
+    ('Emails', string_column(1000, default='')),
+    ('FirstName', string_column(255, default='')),
+    ('MiddleName', string_column(255, default='')),
+    ('LastName', string_column(255, default='')),
+    ('MarinaLocationId', string_column(default='')),
+    ('Notes', string_column(2000, default='')),
+    ('RecordStatusId', string_column(default='')),
+    ('IsSupplier', bool_int_column(0)),
+    ('IsCustomer', bool_int_column(0)),
+    ('XeroId', string_column(255, default='')),
+    ('CompanyContactName', string_column(255, default='')),
+    ('CreationUser', string_column(255, default='')),
+    ('CreationDateTime', contact_datetime()),
+    ('CIM_Id', string_column(255, default='')),
+    ('MarinaLocation1_Id', string_column(default='')),
+    ('QB_Customer_Id', string_column(255, default='')),
+    ('StatementsPreference_Id', string_column(default='')),
+    ('HashID', string_column(50, default='')),
+    ('MoloAPI_PartnerId', string_column(default='')),
+    ('TaxExemptStatus', bool_int_column(0)),
+    ('AutomaticDiscountPercent', float_column(0.0)),
+    ('CostPlusDiscount', float_column(0.0)),
+    ('LinkedParentContact', string_column(default='')),
+    ('ContactAutoChargeId', string_column(default='')),
+    ('LastEditedDateTime', contact_datetime()),
+    ('LastEditedUser_Id', string_column(default='')),
+    ('LastEditedMoloAPIPartner_Id', string_column(default='')),
+    ('StripeCustomer_Id', string_column(255, default='')),
+    ('AccountLimit', float_column(0.0)),
+    ('Filestack_Id', string_column(255, default='')),
+    ('ShowCompanyNamePrinted', bool_int_column(0)),
+    ('BookingMergingDone', bool_int_column(0)),
+    ('DateOfBirth', contact_date()),
+    ('IDSCustomerID', string_column(255, default='')),
+    ('DoNotLaunch', bool_int_column(0)),
+    ('DoNotLaunchReason', string_column(500, default='')),
+    ('DriverLicenseId', string_column(255, default='')),
+    ('QuickbooksId', string_column(255, default='')),
+    ('QuickbooksName', string_column(255, default='')),
+    ('QBOVendorId', string_column(255, default='')),
+    ('SkipForFinanceCharges', bool_int_column(0)),
+    ('MainContactId', string_column(default='')),
+])
+
+
+BOAT_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('Photo', molo_text(500, default='')),
+    ('Make', molo_text(255, default='')),
+    ('Model', molo_text(255, default='')),
+    ('Name', molo_text(255, default='')),
+    ('LOA', molo_text(50, default='')),
+    ('Beam', molo_text(50, default='')),
+    ('Draft', molo_text(50, default='')),
+    ('AirDraft', molo_text(50, default='')),
+    ('RegistrationNumber', molo_text(255, default='')),
+    ('RegistrationState', molo_text(50, default='')),
+    ('CreationTime', molo_datetime()),
+    ('BoatTypeId', molo_text(default='')),
+    ('MarinaLocationId', molo_text(default='')),
+    ('PowerNeedId', molo_text(default='')),
+    ('Notes', molo_text(2000, default='')),
+    ('RecordStatusId', molo_text(default='')),
+    ('AspNetUser_Id', molo_text(255, default='')),
+    ('MastLength', molo_text(50, default='')),
+    ('Weight', molo_text(50, default='')),
+    ('Color', molo_text(100, default='')),
+    ('HullID', molo_text(255, default='')),
+    ('KeyLocationCode', molo_text(100, default='')),
+    ('Year', molo_text(10, default='')),
+    ('HashID', molo_text(50, default='')),
+    ('MoloAPI_PartnerId', molo_text(default='')),
+    ('PowerNeed1_Id', molo_text(default='')),
+    ('LastEditedDateTime', molo_datetime()),
+    ('LastEditedUser_Id', molo_text(default='')),
+    ('LastEditedMoloAPIPartner_Id', molo_text(default='')),
+    ('Filestack_Id', molo_text(255, default='')),
+    ('Tonnage', molo_text(50, default='')),
+    ('GallonCapacity', molo_text(50, default='')),
+    ('IsActive', molo_text(10, default='')),
+    ('BookingMergingDone', molo_text(10, default='')),
+    ('DecalNumber', molo_text(100, default='')),
+    ('Manufacturer', molo_text(255, default='')),
+    ('SerialNumber', molo_text(255, default='')),
+    ('RegistrationExpiration', molo_date()),
+])
+
+
+ACCOUNT_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('AccountStatusId', molo_text(default='')),
+    ('MarinaLocationId', molo_text(default='')),
+    ('Contact_Id', molo_text(default='')),
+])
+
+
+INVOICE_ROW = build_row_converter([
+    ('Id', string_column(default='')),  # ID cannot be null
+    ('Date', molo_datetime()),
+    ('DolarDiscount', float_column(0.0)),  # Explicit defaults
+    ('PercentDiscount', float_column(0.0)),
+    ('Active', bool_int_column(0)),  # Boolean as 1/0
+    ('ClosingDate', molo_datetime()),
+    ('DiscountTotal', float_column(0.0)),
+    ('Opened', bool_int_column(0)),  # Boolean as 1/0
+    ('Payed', float_column(0.0)),
+    ('Subtotal', float_column(0.0)),
+    ('SubtotalWoDiscount', float_column(0.0)),
+    ('TaxTotal', float_column(0.0)),
+    ('Title', string_column(500, default='Untitled Invoice')),
+    ('Total', float_column(0.0)),
+    ('ReservationId', int_column(0)),  # Explicit 0 default
+    ('AccountId', int_column(0)),
+    ('ServicePaidAmount', float_column(0.0)),
+    ('MarinaPaidAmount', float_column(0.0)),
+    ('GasPaidAmount', float_column(0.0)),
+    ('InvoiceStatusId', int_column(0)),
+    ('StartDate', molo_datetime()),
+    ('InstalmentsPaymentMethodId', int_column(0)),
+    ('ScheduledForCron', bool_int_column(0)),  # Boolean as 1/0
+    ('OriginalInvoice', string_column(default='')),
+    ('PaymentsSentToXero', bool_int_column(0)),  # Boolean as 1/0
+    ('WorkOrderId', int_column(0)),
+    ('IsInstallmentInvoice', bool_int_column(0)),  # Boolean as 1/0
+    ('VoidUser', string_column(255, default='')),
+    ('VoidDateTime', molo_datetime()),
+    ('CreationUser', string_column(255, default='')),
+    ('Payment_Id', int_column(0)),
+    ('QB_Invoice_Id', string_column(255, default='')),
+    ('InvoiceType_Id', int_column(0)),
+    ('InvoiceDate', molo_datetime()),
+    ('DueDate', molo_datetime()),
+    ('CurrencyCode', string_column(10, default='')),
+    ('LastModifiedDateTime', molo_datetime()),
+    ('LastModifiedAspNetUser', string_column(255, default='')),
+    ('VoidReason', string_column(500, default='')),
+    ('CreatePartnerId', int_column(0)),
+    ('VoidPartnerId', int_column(0)),
+    ('UpdateHash', string_column(500, default='')),
+    ('ScheduledForInventoryCron', bool_int_column(0)),  # Boolean as 1/0
+    ('ScheduledForSubletCron', bool_int_column(0)),  # Boolean as 1/0
+    ('ScheduledForLaborCron', bool_int_column(0)),  # Boolean as 1/0
+    ('CreatedOnMobile', bool_int_column(0)),  # Boolean as 1/0
+    ('StripeInvoiceId', string_column(255, default='')),
+    ('SentToStripe', bool_int_column(0)),  # Boolean as 1/0
+    ('ResourceBookingId', int_column(0)),
+    ('ModifiedOnMobile', bool_int_column(0)),  # Boolean as 1/0
+    ('Note', string_column(2000, default='')),
+    ('QuickbooksInvoiceId', string_column(255, default='')),
+    ('TaxCap', float_column(0.0)),
+    ('IsSurcharge', bool_int_column(0)),  # Boolean as 1/0
+])
+
+
+INVOICE_ITEM_ROW = build_row_converter([
+    # 1-22: Non-datetime columns
+    ('Id', int_column(0)),  # 1: ID (NUMBER, not string!)
+    ('Prefix', string_column(10, default='')),  # 2: PREFIX
+    ('Quantity', float_column(0.0)),  # 3: QUANTITY
+    ('Title', string_column(500, default='Untitled Item')),  # 4: TITLE
+    ('Type', string_column(100, default='')),  # 5: TYPE_FIELD
+    ('Value', float_column(0.0)),  # 6: VALUE_FIELD
+    ('Discount', float_column(0.0)),  # 7: DISCOUNT
+    ('DiscountType', string_column(50, default='')),  # 8: DISCOUNT_TYPE
+    ('Taxable', bool_int_column(0)),  # 9: TAXABLE
+    ('Tax', float_column(0.0)),  # 10: TAX
+    ('Misc', string_column(500, default='')),  # 11: MISC
+    ('DiscountTotal', float_column(0.0)),  # 12: DISCOUNT_TOTAL
+    ('PriceSuffix', string_column(50, default='')),  # 13: PRICE_SUFFIX
+    ('SubTotal', float_column(0.0)),  # 14: SUB_TOTAL
+    ('SubtotalWoDiscount', float_column(0.0)),  # 15: SUBTOTAL_WO_DISCOUNT
+    ('TaxTotal', float_column(0.0)),  # 16: TAX_TOTAL
+    ('Total', float_column(0.0)),  # 17: TOTAL
+    ('InvoiceId', int_column(0)),  # 18: INVOICE_ID (NUMBER)
+    ('ChargeGroup', string_column(100, default='')),  # 19: CHARGE_GROUP
+    ('PaymentAccount', string_column(100, default='')),  # 20: PAYMENT_ACCOUNT
+    ('PriceStr', string_column(100, default='')),  # 21: PRICE_STR
+    ('IsVoid', bool_int_column(0)),  # 22: IS_VOID
+
+    # 23-96: Including TIMESTAMP columns
+    ('Date', molo_datetime_text()),  # 23: DATE_FIELD (VARCHAR)
+    ('TextAux', string_column(1000)),  # 24: TEXT_AUX
+    ('TextAux2', string_column(1000)),  # 25: TEXT_AUX2
+    ('DiscountDateTime', molo_datetime_text()),  # 26: DISCOUNT_DATE_TIME (VARCHAR)
+    ('DiscountUserId', string_column(1000)),  # 27: DISCOUNT_USER_ID
+    ('Notes', string_column(1000)),  # 28: NOTES
+    ('PR_Type', string_column(1000)),  # 29: PR_TYPE
+    ('Status', string_column(1000)),  # 30: STATUS_FIELD
+    ('DeletionUserId', string_column(1000)),  # 31: DELETION_USER_ID
+    ('DeletionDateTime', molo_datetime_text()),  # 32: DELETION_DATE_TIME (VARCHAR)
+    ('OverpaymentId', int_column(0)),  # 33: OVERPAYMENT_ID
+    ('VoidUser', string_column(1000)),  # 34: VOID_USER
+    ('VoidDateTime', molo_datetime_text()),  # 35: VOID_DATE_TIME (VARCHAR)
+    ('Misc2', string_column(1000)),  # 36: MISC2
+    ('PrepaymentId', int_column(0)),  # 37: PREPAYMENT_ID
+    ('CreditInvoiceId', int_column(0)),  # 38: CREDIT_INVOICE_ID
+    ('AllocationType', string_column(1000)),  # 39: ALLOCATION_TYPE
+    ('Reservation_Id', int_column(0)),  # 40: RESERVATION_ID
+    ('ItemMaster_Id', int_column(0)),  # 41: ITEM_MASTER_ID
+    ('AspNetUser_Id', string_column(256)),  # 42: ASPNET_USER_ID
+    ('InvoiceItemType_Id', int_column(0)),  # 43: INVOICE_ITEM_TYPE_ID
+    ('SeasonalPrice_Id', int_column(0)),  # 44: SEASONAL_PRICE_ID
+    ('TransientPrice_Id', int_column(0)),  # 45: TRANSIENT_PRICE_ID
+    ('SVJobId', int_column(0)),  # 46: SV_JOB_ID
+    ('OriginalCreditItem', int_column(0)),  # 47: ORIGINAL_CREDIT_ITEM
+    ('TaxExempt', bool_int_column(0)),  # 48: TAX_EXEMPT
+    ('LastModifiedDateTime', molo_datetime_text()),  # 49: LAST_MODIFIED_DATE_TIME (VARCHAR)
+    ('LastModifiedAspNetUser', string_column(1000)),  # 50: LAST_MODIFIED_ASPNET_USER
+    ('DeletionReason', string_column(1000)),  # 51: DELETION_REASON
+    ('VoidReason', string_column(1000)),  # 52: VOID_REASON
+    ('StartDateTime', molo_datetime_text()),  # 53: START_DATE_TIME (VARCHAR)
+    ('EndDateTime', molo_datetime_text()),  # 54: END_DATE_TIME (VARCHAR)
+    ('CreationPartnerId', int_column(0)),  # 55: CREATION_PARTNER_ID
+    ('DeletePartnerId', int_column(0)),  # 56: DELETE_PARTNER_ID
+    ('VoidPartnerId', int_column(0)),  # 57: VOID_PARTNER_ID
+    ('OriginalPrice', float_column(0.0)),  # 58: ORIGINAL_PRICE
+    ('OverrideXeroTaxRate', int_column(0)),  # 59: OVERRIDE_XERO_TAX_RATE
+    ('OverrideXeroSalesAccount', int_column(0)),  # 60: OVERRIDE_XERO_SALES_ACCOUNT
+    ('OriginalReservationPrice', float_column(0.0)),  # 61: ORIGINAL_RESERVATION_PRICE
+    ('NumberOfDecimals', int_column(0)),  # 62: NUMBER_OF_DECIMALS
+    ('StripeTransactionData_Id', int_column(0)),  # 63: STRIPE_TRANSACTION_DATA_ID
+    ('ValueAlternative', float_column(0.0)),  # 64: VALUE_ALTERNATIVE
+    ('StripeTerminalId', int_column(0)),  # 65: STRIPE_TERMINAL_ID
+    ('StripeApplicationName', string_column(1000)),  # 66: STRIPE_APPLICATION_NAME
+    ('StripeAID', string_column(1000)),  # 67: STRIPE_AID
+    ('EnteredAmount', float_column(0.0)),  # 68: ENTERED_AMOUNT
+    ('ExchangeRate', float_column(0.0)),  # 69: EXCHANGE_RATE
+    ('Currencies_Id', int_column(0)),  # 70: CURRENCIES_ID
+    ('SV_ChargeInstance_Id', int_column(0)),  # 71: SV_CHARGE_INSTANCE_ID
+    ('SV_LaborInstance_Id', int_column(0)),  # 72: SV_LABOR_INSTANCE_ID
+    ('SV_PartInstance_Id', int_column(0)),  # 73: SV_PART_INSTANCE_ID
+    ('RevenueGLCode', string_column(1000)),  # 74: REVENUE_GL_CODE
+    ('ARGLCode', string_column(1000)),  # 75: AR_GL_CODE
+    ('PaymentGLCode', string_column(1000)),  # 76: PAYMENT_GL_CODE
+    ('COGSGLCode', string_column(1000)),  # 77: COGS_GL_CODE
+    ('InventoryGLCode', string_column(1000)),  # 78: INVENTORY_GL_CODE
+    ('SalesTaxGLCode', string_column(1000)),  # 79: SALES_TAX_GL_CODE
+    ('PrepaymentGLCode', string_column(1000)),  # 80: PREPAYMENT_GL_CODE
+    ('AccountType', string_column(1000)),  # 81: ACCOUNT_TYPE
+    ('ApplicationCryptogram', string_column(1000)),  # 82: APPLICATION_CRYPTOGRAM
+    ('AuthorizationCode', string_column(1000)),  # 83: AUTHORIZATION_CODE
+    ('AuthorizationResponseCode', string_column(1000)),  # 84: AUTHORIZATION_RESPONSE_CODE
+    ('CardholderVerificationMethod', string_column(1000)),  # 85: CARDHOLDER_VERIFICATION_METHOD
+    ('TerminalVerificationResults', string_column(1000)),  # 86: TERMINAL_VERIFICATION_RESULTS
+    ('TransactionStatusInformation', string_column(1000)),  # 87: TRANSACTION_STATUS_INFORMATION
+    ('TrackingCode', string_column(1000)),  # 88: TRACKING_CODE
+    ('DiscountGLCode', string_column(1000)),  # 89: DISCOUNT_GL_CODE
+    ('OverrideTrackingCategory1', string_column(1000)),  # 90: OVERRIDE_TRACKING_CATEGORY1
+    ('OverrideTrackingCategory2', string_column(1000)),  # 91: OVERRIDE_TRACKING_CATEGORY2
+    ('QuickbooksPaymentId', string_column(1000)),  # 92: QUICKBOOKS_PAYMENT_ID
+    ('AllowTotalPriceEntry', bool_int_column(0)),  # 93: ALLOW_TOTAL_PRICE_ENTRY
+    ('AddedAutomatically', bool_int_column(0)),  # 94: ADDED_AUTOMATICALLY
+    ('AllocationPerformedDate', molo_datetime_text()),  # 95: ALLOCATION_PERFORMED_DATE (VARCHAR)
+    ('CreatedDate', molo_datetime_text()),  # 96: CREATED_DATE (VARCHAR)
+])
+
+
+TRANSACTION_ROW = build_row_converter([
+    ('Id', int_column(None, truncate=True)),
+    ('MarinaLocationId', int_column(None, truncate=True)),
+    ('CreationTime', molo_datetime()),
+    ('InvoiceId', int_column(None, truncate=True)),
+    ('TransactionTypeId', int_column(None, truncate=True)),
+    ('TransactionMethodId', int_column(None, truncate=True)),
+    ('Value', float_column(None)),
+    ('IsRefunded', bool_int_column(numeric_fallback=True)),
+    ('CustomerIPAddress', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('CustomerDevice', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('RefundReason', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('Aux', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('CheckNumber', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('CCType', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('InvoiceItemId', int_column(None, truncate=True)),
+    ('SentToXero', bool_int_column(numeric_fallback=True)),
+    ('OverpaymentID', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('PaymentCollectedOffline', bool_int_column(numeric_fallback=True)),
+    ('PartOfOverpayment', bool_int_column(numeric_fallback=True)),
+    ('PrepaymentID', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('AccountTransaction_Transaction_Id', int_column(None, truncate=True)),
+    ('Payment_Id', int_column(None, truncate=True)),
+    ('CreationDate', molo_datetime()),
+    ('AspNetUser_Id', string_column(256, null_tokens=EMPTY_ONLY)),
+    ('HashID', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('CustomTransactionMethodsId', int_column(None, truncate=True)),
+    ('Reference', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('IsVoid', bool_int_column(numeric_fallback=True)),
+    ('AmountRefunded', float_column(None)),
+    ('StripeTransactionDataId', int_column(None, truncate=True)),
+    ('PaymentIntentId', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('SentToPayout', bool_int_column(numeric_fallback=True)),
+    ('StripeAuthorizations_Id', int_column(None, truncate=True)),
+    ('StripeResponse_Id', int_column(None, truncate=True)),
+    ('StripeReaderSerialNumber', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('StripeTerminalId', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('CreatedOnMobile', bool_int_column(numeric_fallback=True)),
+    ('OnlinePercentFee', float_column(None)),
+    ('OnlineFeeAmount', float_column(None)),
+    ('ScheduledForOnlineFeeCron', bool_int_column(numeric_fallback=True)),
+    ('OnlinePaymentFee_Id', int_column(None, truncate=True)),
+    ('BankName', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('Last4', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('StripeBankAccountId', int_column(None, truncate=True)),
+    ('StripeBatchId', int_column(None, truncate=True)),
+    ('RoutingNumber', string_column(1000, null_tokens=EMPTY_ONLY)),
+    ('FullyRefunded', bool_int_column(numeric_fallback=True)),
+    ('LastUpdated', molo_datetime()),
+    ('PaymentSource', string_column(1000, null_tokens=EMPTY_ONLY)),
+])
+
+
+ITEM_MASTER_ROW = build_row_converter([
+    ('Id', string_column(default='')),  # 1
+    ('Name', string_column(255, default='Unknown Item')),  # 2
+    ('Amount', float_column(0.0)),  # 3
+    ('ItemChargeMethodId', int_column(0)),  # 4
+    ('Taxable', bool_int_column(0)),  # 5
+    ('AvailableAsAddOn', bool_int_column(0)),  # 6
+    ('MarinaLocationId', int_column(0)),  # 7
+    ('Price', float_column(0.0)),  # 8
+    ('Tax', float_column(0.0)),  # 9
+    ('Single', bool_int_column(0)),  # 10
+    ('ChargeCategory', string_column(100, default='')),  # 11
+    ('AmountIsDecimal', bool_int_column(0)),  # 12
+    ('NumberOfDecimals', int_column(0)),  # 13
+    ('ItemShortName', string_column(100, default='')),  # 14
+    ('ItemCode', string_column(100, default='')),  # 15
+    ('TrackedInventory', bool_int_column(0)),  # 16
+    ('QuantityOnHand', float_column(0.0)),  # 17
+    ('PurchasePrice', float_column(0.0)),  # 18
+    ('FirstTrackingCategory', string_column(255, default='')),  # 19
+    ('SecondTrackingCategory', string_column(255, default='')),  # 20
+    ('XeroID', string_column(255, default='')),  # 21
+    ('SaleFrequency', float_column(0.0)),  # 22
+    ('LowQuantityWarning', float_column(0.0)),  # 23
+    ('MarinaLocation1Id', int_column(None)),  # 24
+    ('MarinaLocation2Id', int_column(None)),  # 25
+    ('PedestalId', int_column(None)),  # 26
+    ('Pedestal1Id', int_column(None)),  # 27
+    ('QbItemId', int_column(None)),  # 28
+    ('XeroItemId', int_column(None)),  # 29
+    ('Barcode', string_column(100)),  # 30
+    ('DistributeToOwners', bool_int_column(0)),  # 31
+    ('FuelCloudProductId', string_column(100)),  # 32
+    ('HashId', string_column(50, default='')),  # 33
+    ('RequiresAgeVerification', bool_int_column(0)),  # 34
+    ('MinimumAge', int_column(None)),  # 35
+    ('CreationDateTime', export_datetime()),  # 36 - DATETIME FIELD!
+    ('CreationAspNetUserId', string_column(256)),  # 37
+    ('RecordStatusId', int_column(0)),  # 38
+    ('UpdateHash', string_column(100)),  # 39
+    ('SubletItem', bool_int_column(0)),  # 40
+    ('InternalRevenueXeroAccountId', int_column(None)),  # 41
+    ('InternalCogsXeroAccountId', int_column(None)),  # 42
+    ('WipXeroAccountId', int_column(None)),  # 43
+    ('InventoryRevaluationId', int_column(None)),  # 44
+    ('MarinaLocation6Id', int_column(None)),  # 45
+    ('FinaleProductUrl', string_column(500)),  # 46
+    ('RevenueGLCode', string_column(50)),  # 47
+    ('CogsGLCode', string_column(50)),  # 48
+    ('InventoryGLCode', string_column(50)),  # 49
+    ('ARGLCode', string_column(50)),  # 50
+    ('SalesTaxGLCode', string_column(50)),  # 51
+    ('OnlyUseLast2Average', bool_int_column(0)),  # 52
+    ('DeferredRevenueRecognition', bool_int_column(0)),  # 53
+    ('DeferredRecognitionGLCode', string_column(50)),  # 54
+    ('TrackingCode', string_column(100)),  # 55
+    ('AddDescriptionToInvoiceNote', bool_int_column(0)),  # 56
+    ('MarinaLocation7Id', int_column(None)),  # 57
+    ('IgnoreInventoryQoh', bool_int_column(0)),  # 58
+    ('QohCommitted', float_column(0.0)),  # 59
+    ('QohOnOrder', float_column(0.0)),  # 60
+    ('AllowTotalPriceEntry', bool_int_column(0)),  # 61
+    ('MarinaLocation9Id', int_column(None)),  # 62
+    ('AllowPostingToNonIncomeAccounts', bool_int_column(0)),  # 63
+    ('OrderColumn', int_column(None)),  # 64
+    ('EnableNegativeInventory', bool_int_column(0)),  # 65
+    ('Wip', float_column(0.0)),  # 66
+])
+
+
+SEASONAL_PRICE_ROW = build_row_converter([
+    ('Id', int_column(None)),
+    ('SeasonName', molo_text(255, default='')),
+    ('StartDate', molo_datetime()),
+    ('EndDate', molo_datetime()),
+    ('SeasonalChargeMethodId', int_column(None)),
+    ('PricePerFoot', float_column(0.0)),
+    ('FlatRate', float_column(0.0)),
+    ('Taxable', molo_boolean()),
+    ('MarinaLocationId', int_column(None)),
+    ('Active', molo_boolean()),
+    ('Tax', float_column(0.0)),
+    ('RateDetails', molo_text(500, default='')),
+    ('RateShortName', molo_text(100, default='')),
+    ('OnlinePaymentPlaceholder', molo_text(255, default='')),
+    ('XeroItemCode', molo_text(100, default='')),
+    ('XeroId', molo_text(255, default='')),
+    ('FirstTrackingCategory', molo_text(255, default='')),
+    ('SecondTrackingCategory', molo_text(255, default='')),
+    ('SeasonalInvoicingMethod_Id', int_column(None)),
+    ('CreationDateTime', molo_datetime()),
+    ('AspNetUser_Id', molo_text(255, default='')),
+    ('CheckInTerms', molo_text(2000, default='')),
+    ('CheckOutTerms', molo_text(2000, default='')),
+    ('OnlinePaymentCompletion', molo_text(500, default='')),
+    ('DueDateDays', int_column(None)),
+    ('DueDateSettings_Id', int_column(None)),
+    ('ChargeCategory', molo_text(100, default='')),
+    ('IntroText', molo_text(1000, default='')),
+    ('RevenueGLCode', molo_text(50, default='')),
+    ('ARGLCode', molo_text(50, default='')),
+    ('SalesTaxGLCode', molo_text(50, default='')),
+])
+
+
+TRANSIENT_PRICE_ROW = build_row_converter([
+    ('Id', int_column(None)),  # 1
+    ('StartDate', export_datetime()),  # 2
+    ('EndDate', export_datetime()),  # 3
+    ('Fee', float_column(0.0)),  # 4
+    ('RateName', molo_text(1000, default='')),  # 5
+    ('TransientChargeMethodId', int_column(None)),  # 6
+    ('MarinaLocationId', int_column(None)),  # 7
+    ('Taxable', molo_boolean()),  # 8
+    ('Tax', float_column(0.0)),  # 9
+    ('RateDetails', molo_text(1000, default='')),  # 10
+    ('RateShortName', molo_text(1000, default='')),  # 11
+    ('OnlinePaymentPlaceholder', molo_text(1000, default='')),  # 12
+    ('XeroItemCode', molo_text(1000, default='')),  # 13
+    ('XeroID', molo_text(1000, default='')),  # 14
+    ('FirstTrackingCategory', int_column(None)),  # 15
+    ('SecondTrackingCategory', int_column(None)),  # 16
+    ('TransientInvoicingMethod_Id', int_column(None)),  # 17
+    ('SV_InventoryCategory_Id', int_column(None)),  # 18
+    ('SV_InventorySubCategory_Id', int_column(None)),  # 19
+    ('CreationDateTime', export_datetime()),  # 20
+    ('AspNetUser_Id', molo_text(256, default='')),  # 21
+    ('CheckInTerms', molo_text(1000, default='')),  # 22
+    ('CheckOutTerms', molo_text(1000, default='')),  # 23
+    ('OnlinePaymentCompletion', molo_text(1000, default='')),  # 24
+    ('DueDateDays', int_column(None)),  # 25
+    ('DueDateSettings_Id', int_column(None)),  # 26
+    ('HourlyCalculation', molo_text(1000, default='')),  # 27
+    ('RoundMinutes', int_column(None)),  # 28
+    ('MinimumHours', int_column(None)),  # 29
+    ('NumHoursBlock', int_column(None)),  # 30
+    ('ChargeCategory', molo_text(1000, default='')),  # 31
+    ('IntroText', molo_text(1000, default='')),  # 32
+    ('RevenueGLCode', molo_text(1000, default='')),  # 33
+    ('ARGLCode', molo_text(1000, default='')),  # 34
+    ('SalesTaxGLCode', molo_text(1000, default='')),  # 35
+    ('DeletionDatetime', export_datetime()),  # 36
+    ('DeletionAspNetUser_Id', molo_text(256, default='')),  # 37
+    ('RecordStatus_Id', int_column(None)),  # 38
+    ('RecurringInvoiceOptions_Id', int_column(None)),  # 39
+    ('Recurring', molo_boolean()),  # 40
+    ('TrackingCode', molo_text(1000, default='')),  # 41
+    ('AlternateReservationName', molo_text(1000, default='')),  # 42
+    ('ResourceRate', molo_boolean()),  # 43
+    ('QuantityCap', int_column(None)),  # 44
+    ('AllowPostingToNonIncomeAccounts', molo_boolean()),  # 45
+])
+
+
+INSURANCE_ROW = build_row_converter([
+    ('Id', molo_text(10)),
+    ('Provider', molo_text(1000)),
+    ('ListedIndividual', molo_text(1000)),
+    ('AccountNumber', molo_text(1000)),
+    ('PolicyNumber', molo_text(1000)),
+    ('GroupNumber', molo_text(1000)),
+    ('LiabilityMaximum', float_column(None)),
+    ('EffectiveDate', molo_datetime()),
+    ('ExpirationDate', molo_datetime()),
+    ('Notes', molo_text(1000)),
+    ('CreationUser', molo_text(1000)),
+    ('CreationDateTime', molo_datetime()),
+    ('LastEditUser', molo_text(1000)),
+    ('LastEditDateTime', molo_datetime()),
+    ('DeleteUser', molo_text(1000)),
+    ('DeleteDateTime', molo_datetime()),
+    ('InsuranceStatus_Id', molo_text(10)),
+    ('Boat_Id', molo_text(10)),
+    ('HashID', molo_text(1000)),
+])
+
+
+EQUIPMENT_ROW = build_row_converter([
+    ('Id', molo_text(10, default='')),
+    ('Name', molo_text(100, default='')),
+    ('Description', molo_text(500, default='')),
+    ('EquipmentTypeId', molo_text(10, default='')),
+    ('FuelTypeId', molo_text(10, default='')),
+    ('Model', molo_text(50, default='')),
+    ('Manufacturer', molo_text(50, default='')),
+    ('YearBuilt', int_column(None)),
+    ('SerialNumber', molo_text(50, default='')),
+    ('Location', molo_text(100, default='')),
+])
+
+
+CURRENCY_ROW = build_row_converter([
+    ('Id', molo_text(10, default='')),
+    ('Name', molo_text(100, default='')),
+    ('Code', molo_text(10)),
+    ('Symbol', molo_text(10)),
+])
+
+
+# Id/Name code tables; every lookup export with the same layout shares one
+# converter (they have no date columns, so there is no per-file state)
+LOOKUP_ROW = build_row_converter([
+    ('Id', molo_text(default='')),
+    ('Name', molo_text(255, default='')),
+])
+
+
+SHORT_LOOKUP_ROW = build_row_converter([
+    ('Id', molo_text(10, default='')),
+    ('Name', molo_text(100, default='')),
+])
 
 
-def parse_slip_types_data(csv_content):
+# =============================================================================
+# TABLE REGISTRY
+# =============================================================================
+
+# One entry per MOLO CSV file: staging/DW table, bind column order, parser and
+# merge behaviour. The generic load engine (OracleConnector.load_staging_table)
+# is driven entirely by these specs, and tables are processed in this order.
+MOLO_TABLES = [
+    TableSpec(
+        'MOLO', 'MarinaLocations', 'MARINA_LOCATIONS', 'marina location',
+        molo_row_parser(MARINA_LOCATION_ROW, 'marina location'),
+        columns=(
+            'ID', 'NAME', 'PRIMARY_PHONE_NUMBER', 'PRIMARY_FAX_NUMBER',
+            'ORGANIZATION_ID', 'MARINA_HASH', 'UNIT_SYSTEM', 'DEFAULT_ARRIVAL_TIME',
+            'DEFAULT_DEPARTURE_TIME', 'EMAIL_ADDRESS', 'MARINA_WEBSITE', 'TIME_ZONE'
+        ),
+        bind_types=MARINA_LOCATION_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'Piers', 'PIERS', 'pier',
+        molo_row_parser(PIER_ROW, 'pier'),
+        columns=(
+            'ID', 'NAME', 'MARINA_LOCATION_ID'
+        ),
+        bind_types=PIER_ROW.bind_types,
+        merge_inline=True
+    ),
+    TableSpec(
+        'MOLO', 'SlipTypes', 'SLIP_TYPES', 'slip type',
+        molo_row_parser(LOOKUP_ROW, 'slip type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'Slips', 'SLIPS', 'slip',
+        molo_row_parser(SLIP_ROW, 'slip'),
+        columns=(
+            'ID', 'NAME', 'TYPE', 'RECOMMENDED_LOA', 'RECOMMENDED_BEAM',
+            'RECOMMENDED_DRAFT', 'RECOMMENDED_AIR_DRAFT', 'MAXIMUM_LOA',
+            'MAXIMUM_BEAM', 'MAXIMUM_DRAFT', 'MAXIMUM_AIR_DRAFT',
+            'MARINA_LOCATION_ID', 'PIER_ID', 'STATUS', 'START_DATE', 'END_DATE',
+            'DO_NOT_COUNT_IN_OCCUPANCY', 'ACTIVE', 'CREATION_DATE_TIME',
+            'CREATION_USER', 'SLIP_TYPE_ID', 'PAYMENT_PROCESSING_FEE',
+            'MANAGEMENT_FEE', 'OWNER_ID', 'PAYMENT_PROCESSING_FEE_TYPE_ID',
+            'MANAGEMENT_FEE_TYPE_ID', 'OVERRIDE_OCCUPANCY_LOA', 'HASH_ID',
+            'MAINTENANCE_FEE', 'SVG_ID', 'ASSESSMENT', 'LOAN', 'ORDER_COLUMN',
+            'SIGN_NAME', 'MAX_WEIGHT'
+        ),
+        bind_types=SLIP_ROW.bind_types,
+        merge_inline=True
+    ),
+    TableSpec(
+        'MOLO', 'Reservations', 'RESERVATIONS', 'reservation',
+        molo_row_parser(RESERVATION_ROW, 'reservation'),
+        columns=(
+            'ID', 'MARINA_LOCATION_ID', 'CREATION_TIME', 'RESERVATION_STATUS_ID',
+            'RESERVATION_TYPE_ID', 'CONTACT_ID', 'BOAT_ID',
+            'SCHEDULED_ARRIVAL_TIME', 'SCHEDULED_DEPARTURE_TIME',
+            'CANCELLATION_TIME', 'ACCOUNT_ID', 'SLIP_ID', 'RATE', 'NAME', 'HASH_ID',
+            'RESERVATION_SOURCE'
+        ),
+        bind_types=RESERVATION_ROW.bind_types,
+        merge_inline=True
+    ),
+    TableSpec(
+        'MOLO', 'Companies', 'COMPANIES', 'company',
+        molo_row_parser(COMPANY_ROW, 'company'),
+        columns=(
+            'ID', 'NAME', 'OWNER', 'PRIMARY_FAX_NUMBER', 'PRIMARY_PHONE_NUMBER',
+            'CITY_ID', 'IMAGE', 'DESCRIPTION', 'PARTNER_ID', 'MOLO_API_PARTNER_ID',
+            'COMPANY_MOLO_API_PARTNER_COMPANY_ID', 'INVOICE_AT_COMPANY_LEVEL',
+            'MOLO_CONTACT_ID', 'STRIPE_CUSTOMER_ID', 'LOGIN_PROVIDER_ID',
+            'DEFAULT_CC_FEE', 'TIER1_PERCENT_ACH_FEE', 'TIER2_PERCENT_ACH_FEE'
+        ),
+        bind_types=COMPANY_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'Contacts', 'CONTACTS', 'contact',
+        molo_row_parser(CONTACT_ROW, 'contact'),
+        columns=(
+            'ID', 'EMAILS', 'FIRST_NAME', 'MIDDLE_NAME', 'LAST_NAME',
+            'MARINA_LOCATION_ID', 'NOTES', 'RECORD_STATUS_ID', 'IS_SUPPLIER',
+            'IS_CUSTOMER', 'XERO_ID', 'COMPANY_CONTACT_NAME', 'CREATION_USER',
+            'CREATION_DATE_TIME', 'CIM_ID', 'MARINA_LOCATION1_ID', 'QB_CUSTOMER_ID',
+            'STATEMENTS_PREFERENCE_ID', 'HASH_ID', 'MOLO_API_PARTNER_ID',
+            'TAX_EXEMPT_STATUS', 'AUTOMATIC_DISCOUNT_PERCENT', 'COST_PLUS_DISCOUNT',
+            'LINKED_PARENT_CONTACT', 'CONTACT_AUTO_CHARGE_ID',
+            'LAST_EDITED_DATE_TIME', 'LAST_EDITED_USER_ID',
+            'LAST_EDITED_MOLO_API_PARTNER_ID', 'STRIPE_CUSTOMER_ID',
+            'ACCOUNT_LIMIT', 'FILESTACK_ID', 'SHOW_COMPANY_NAME_PRINTED',
+            'BOOKING_MERGING_DONE', 'DATE_OF_BIRTH', 'IDS_CUSTOMER_ID',
+            'DO_NOT_LAUNCH', 'DO_NOT_LAUNCH_REASON', 'DRIVER_LICENSE_ID',
+            'QUICKBOOKS_ID', 'QUICKBOOKS_NAME', 'QBO_VENDOR_ID',
+            'SKIP_FOR_FINANCE_CHARGES', 'MAIN_CONTACT_ID'
+        ),
+        bind_types=CONTACT_ROW.bind_types,
+        merge_inline=True,
+        watermark_column='LastEditedDateTime'
+    ),
+    TableSpec(
+        'MOLO', 'Boats', 'BOATS', 'boat',
+        molo_row_parser(BOAT_ROW, 'boat'),
+        columns=(
+            'ID', 'PHOTO', 'MAKE', 'MODEL', 'NAME', 'LOA', 'BEAM', 'DRAFT',
+            'AIR_DRAFT', 'REGISTRATION_NUMBER', 'REGISTRATION_STATE',
+            'CREATION_TIME', 'BOAT_TYPE_ID', 'MARINA_LOCATION_ID', 'POWER_NEED_ID',
+            'NOTES', 'RECORD_STATUS_ID', 'ASPNET_USER_ID', 'MAST_LENGTH', 'WEIGHT',
+            'COLOR', 'HULL_ID', 'KEY_LOCATION_CODE', 'YEAR', 'HASH_ID',
+            'MOLO_API_PARTNER_ID', 'POWER_NEED1_ID', 'LAST_EDITED_DATE_TIME',
+            'LAST_EDITED_USER_ID', 'LAST_EDITED_MOLO_API_PARTNER_ID',
+            'FILESTACK_ID', 'TONNAGE', 'GALLON_CAPACITY', 'IS_ACTIVE',
+            'BOOKING_MERGING_DONE', 'DECAL_NUMBER', 'MANUFACTURER', 'SERIAL_NUMBER',
+            'REGISTRATION_EXPIRATION'
+        ),
+        bind_types=BOAT_ROW.bind_types,
+        merge_inline=True,
+        validation=('BOAT_ID', ['BOAT_NAME', 'LENGTH', 'WIDTH', 'BOAT_TYPE_ID']),
+        watermark_column='LastEditedDateTime'
+    ),
+    TableSpec(
+        'MOLO', 'Accounts', 'ACCOUNTS', 'account',
+        molo_row_parser(ACCOUNT_ROW, 'account'),
+        columns=(
+            'ID', 'ACCOUNT_STATUS_ID', 'MARINA_LOCATION_ID', 'CONTACT_ID'
+        ),
+        bind_types=ACCOUNT_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InvoiceSet', 'INVOICES', 'invoice',
+        molo_row_parser(INVOICE_ROW, 'invoice'),
+        columns=(
+            'ID', 'DATE_FIELD', 'DOLLAR_DISCOUNT', 'PERCENT_DISCOUNT', 'ACTIVE',
+            'CLOSING_DATE', 'DISCOUNT_TOTAL', 'OPENED', 'PAYED', 'SUBTOTAL',
+            'SUBTOTAL_WO_DISCOUNT', 'TAX_TOTAL', 'TITLE', 'TOTAL', 'RESERVATION_ID',
+            'ACCOUNT_ID', 'SERVICE_PAID_AMOUNT', 'MARINA_PAID_AMOUNT',
+            'GAS_PAID_AMOUNT', 'INVOICE_STATUS_ID', 'START_DATE',
+            'INSTALLMENTS_PAYMENT_METHOD_ID', 'SCHEDULED_FOR_CRON',
+            'ORIGINAL_INVOICE', 'PAYMENTS_SENT_TO_XERO', 'WORK_ORDER_ID',
+            'IS_INSTALLMENT_INVOICE', 'VOID_USER', 'VOID_DATE_TIME',
+            'CREATION_USER', 'PAYMENT_ID', 'QB_INVOICE_ID', 'INVOICE_TYPE_ID',
+            'INVOICE_DATE', 'DUE_DATE', 'CURRENCY_CODE', 'LAST_MODIFIED_DATE_TIME',
+            'LAST_MODIFIED_ASPNET_USER', 'VOID_REASON', 'CREATE_PARTNER_ID',
+            'VOID_PARTNER_ID', 'UPDATE_HASH', 'SCHEDULED_FOR_INVENTORY_CRON',
+            'SCHEDULED_FOR_SUBLET_CRON', 'SCHEDULED_FOR_LABOR_CRON',
+            'CREATED_ON_MOBILE', 'STRIPE_INVOICE_ID', 'SENT_TO_STRIPE',
+            'RESOURCE_BOOKING_ID', 'MODIFIED_ON_MOBILE', 'NOTE',
+            'QUICKBOOKS_INVOICE_ID', 'TAX_CAP', 'IS_SURCHARGE'
+        ),
+        bind_types=INVOICE_ROW.bind_types,
+        merge_inline=True,
+        bulk_load=True,
+        validation=(
+            'INVOICE_ID',
+            ['INVOICE_NUMBER', 'TOTAL_AMOUNT', 'INVOICE_DATE', 'INVOICE_STATUS_ID']
+        ),
+        watermark_column='LastModifiedDateTime'
+    ),
+    TableSpec(
+        'MOLO', 'InvoiceItemSet', 'INVOICE_ITEMS', 'invoice item',
+        molo_row_parser(INVOICE_ITEM_ROW, 'invoice item'),
+        columns=(
+            'ID', 'PREFIX', 'QUANTITY', 'TITLE', 'TYPE_FIELD', 'VALUE_FIELD',
+            'DISCOUNT', 'DISCOUNT_TYPE', 'TAXABLE', 'TAX', 'MISC', 'DISCOUNT_TOTAL',
+            'PRICE_SUFFIX', 'SUB_TOTAL', 'SUBTOTAL_WO_DISCOUNT', 'TAX_TOTAL',
+            'TOTAL', 'INVOICE_ID', 'CHARGE_GROUP', 'PAYMENT_ACCOUNT', 'PRICE_STR',
+            'IS_VOID', 'DATE_FIELD', 'TEXT_AUX', 'TEXT_AUX2', 'DISCOUNT_DATE_TIME',
+            'DISCOUNT_USER_ID', 'NOTES', 'PR_TYPE', 'STATUS_FIELD',
+            'DELETION_USER_ID', 'DELETION_DATE_TIME', 'OVERPAYMENT_ID', 'VOID_USER',
+            'VOID_DATE_TIME', 'MISC2', 'PREPAYMENT_ID', 'CREDIT_INVOICE_ID',
+            'ALLOCATION_TYPE', 'RESERVATION_ID', 'ITEM_MASTER_ID', 'ASPNET_USER_ID',
+            'INVOICE_ITEM_TYPE_ID', 'SEASONAL_PRICE_ID', 'TRANSIENT_PRICE_ID',
+            'SV_JOB_ID', 'ORIGINAL_CREDIT_ITEM', 'TAX_EXEMPT',
+            'LAST_MODIFIED_DATE_TIME', 'LAST_MODIFIED_ASPNET_USER',
+            'DELETION_REASON', 'VOID_REASON', 'START_DATE_TIME', 'END_DATE_TIME',
+            'CREATION_PARTNER_ID', 'DELETE_PARTNER_ID', 'VOID_PARTNER_ID',
+            'ORIGINAL_PRICE', 'OVERRIDE_XERO_TAX_RATE',
+            'OVERRIDE_XERO_SALES_ACCOUNT', 'ORIGINAL_RESERVATION_PRICE',
+            'NUMBER_OF_DECIMALS', 'STRIPE_TRANSACTION_DATA_ID', 'VALUE_ALTERNATIVE',
+            'STRIPE_TERMINAL_ID', 'STRIPE_APPLICATION_NAME', 'STRIPE_AID',
+            'ENTERED_AMOUNT', 'EXCHANGE_RATE', 'CURRENCIES_ID',
+            'SV_CHARGE_INSTANCE_ID', 'SV_LABOR_INSTANCE_ID', 'SV_PART_INSTANCE_ID',
+            'REVENUE_GL_CODE', 'AR_GL_CODE', 'PAYMENT_GL_CODE', 'COGS_GL_CODE',
+            'INVENTORY_GL_CODE', 'SALES_TAX_GL_CODE', 'PREPAYMENT_GL_CODE',
+            'ACCOUNT_TYPE', 'APPLICATION_CRYPTOGRAM', 'AUTHORIZATION_CODE',
+            'AUTHORIZATION_RESPONSE_CODE', 'CARDHOLDER_VERIFICATION_METHOD',
+            'TERMINAL_VERIFICATION_RESULTS', 'TRANSACTION_STATUS_INFORMATION',
+            'TRACKING_CODE', 'DISCOUNT_GL_CODE', 'OVERRIDE_TRACKING_CATEGORY1',
+            'OVERRIDE_TRACKING_CATEGORY2', 'QUICKBOOKS_PAYMENT_ID',
+            'ALLOW_TOTAL_PRICE_ENTRY', 'ADDED_AUTOMATICALLY',
+            'ALLOCATION_PERFORMED_DATE', 'CREATED_DATE'
+        ),
+        bind_types=INVOICE_ITEM_ROW.bind_types,
+        merge_inline=True,
+        commit_per_batch=True,
+        bulk_load=True,
+        watermark_column='LastModifiedDateTime'
+    ),
+    TableSpec(
+        'MOLO', 'Transactions', 'TRANSACTIONS', 'transaction',
+        molo_row_parser(TRANSACTION_ROW, 'transaction'),
+        columns=(
+            'ID', 'MARINA_LOCATION_ID', 'CREATION_TIME', 'INVOICE_ID',
+            'TRANSACTION_TYPE_ID', 'TRANSACTION_METHOD_ID', 'VALUE_FIELD',
+            'IS_REFUNDED', 'CUSTOMER_IP_ADDRESS', 'CUSTOMER_DEVICE',
+            'REFUND_REASON', 'AUX', 'CHECK_NUMBER', 'CC_TYPE', 'INVOICE_ITEM_ID',
+            'SENT_TO_XERO', 'OVERPAYMENT_ID', 'PAYMENT_COLLECTED_OFFLINE',
+            'PART_OF_OVERPAYMENT', 'PREPAYMENT_ID',
+            'ACCOUNT_TRANSACTION_TRANSACTION_ID', 'PAYMENT_ID', 'CREATION_DATE',
+            'ASPNET_USER_ID', 'HASH_ID', 'CUSTOM_TRANSACTION_METHODS_ID',
+            'REFERENCE', 'IS_VOID', 'AMOUNT_REFUNDED', 'STRIPE_TRANSACTION_DATA_ID',
+            'PAYMENT_INTENT_ID', 'SENT_TO_PAYOUT', 'STRIPE_AUTHORIZATIONS_ID',
+            'STRIPE_RESPONSE_ID', 'STRIPE_READER_SERIAL_NUMBER',
+            'STRIPE_TERMINAL_ID', 'CREATED_ON_MOBILE', 'ONLINE_PERCENT_FEE',
+            'ONLINE_FEE_AMOUNT', 'SCHEDULED_FOR_ONLINE_FEE_CRON',
+            'ONLINE_PAYMENT_FEE_ID', 'BANK_NAME', 'LAST4', 'STRIPE_BANK_ACCOUNT_ID',
+            'STRIPE_BATCH_ID', 'ROUTING_NUMBER', 'FULLY_REFUNDED', 'LAST_UPDATED',
+            'PAYMENT_SOURCE'
+        ),
+        bind_types=TRANSACTION_ROW.bind_types,
+        merge_inline=True,
+        bulk_load=True
+    ),
+    TableSpec(
+        'MOLO', 'ItemMasters', 'ITEM_MASTERS', 'item master',
+        molo_row_parser(ITEM_MASTER_ROW, 'item master'),
+        columns=(
+            'ID', 'NAME', 'AMOUNT', 'ITEM_CHARGE_METHOD_ID', 'TAXABLE',
+            'AVAILABLE_AS_ADD_ON', 'MARINA_LOCATION_ID', 'PRICE', 'TAX', 'SINGLE',
+            'CHARGE_CATEGORY', 'AMOUNT_IS_DECIMAL', 'NUMBER_OF_DECIMALS',
+            'ITEM_SHORT_NAME', 'ITEM_CODE', 'TRACKED_INVENTORY', 'QUANTITY_ON_HAND',
+            'PURCHASE_PRICE', 'FIRST_TRACKING_CATEGORY', 'SECOND_TRACKING_CATEGORY',
+            'XERO_ID', 'SALE_FREQUENCY', 'LOW_QUANTITY_WARNING',
+            'MARINA_LOCATION1_ID', 'MARINA_LOCATION2_ID', 'PEDESTAL_ID',
+            'PEDESTAL1_ID', 'QB_ITEM_ID', 'XERO_ITEM_ID', 'BARCODE',
+            'DISTRIBUTE_TO_OWNERS', 'FUEL_CLOUD_PRODUCT_ID', 'HASH_ID',
+            'REQUIRES_AGE_VERIFICATION', 'MINIMUM_AGE', 'CREATION_DATE_TIME',
+            'CREATION_ASPNET_USER_ID', 'RECORD_STATUS_ID', 'UPDATE_HASH',
+            'SUBLET_ITEM', 'INTERNAL_REVENUE_XERO_ACCOUNT_ID',
+            'INTERNAL_COGS_XERO_ACCOUNT_ID', 'WIP_XERO_ACCOUNT_ID',
+            'INVENTORY_REVALUATION_ID', 'MARINA_LOCATION6_ID', 'FINALE_PRODUCT_URL',
+            'REVENUE_GL_CODE', 'COGS_GL_CODE', 'INVENTORY_GL_CODE', 'AR_GL_CODE',
+            'SALES_TAX_GL_CODE', 'ONLY_USE_LAST2_AVERAGE',
+            'DEFERRED_REVENUE_RECOGNITION', 'DEFERRED_RECOGNITION_GL_CODE',
+            'TRACKING_CODE', 'ADD_DESCRIPTION_TO_INVOICE_NOTE',
+            'MARINA_LOCATION7_ID', 'IGNORE_INVENTORY_QOH', 'QOH_COMMITTED',
+            'QOH_ON_ORDER', 'ALLOW_TOTAL_PRICE_ENTRY', 'MARINA_LOCATION9_ID',
+            'ALLOW_POSTING_TO_NON_INCOME_ACCOUNTS', 'ORDER_COLUMN',
+            'ENABLE_NEGATIVE_INVENTORY', 'WIP'
+        ),
+        bind_types=ITEM_MASTER_ROW.bind_types,
+        validation=(
+            'ITEM_MASTER_ID',
+            ['DESCRIPTION', 'ITEM_TYPE', 'UNIT_PRICE', 'CREATION_DATE_TIME']
+        )
+    ),
+    TableSpec(
+        'MOLO', 'SeasonalPrices', 'SEASONAL_PRICES', 'seasonal price',
+        molo_row_parser(SEASONAL_PRICE_ROW, 'seasonal price'),
+        columns=(
+            'ID', 'SEASON_NAME', 'START_DATE', 'END_DATE',
+            'SEASONAL_CHARGE_METHOD_ID', 'PRICE_PER_FOOT', 'FLAT_RATE', 'TAXABLE',
+            'MARINA_LOCATION_ID', 'ACTIVE', 'TAX', 'RATE_DETAILS',
+            'RATE_SHORT_NAME', 'ONLINE_PAYMENT_PLACEHOLDER', 'XERO_ITEM_CODE',
+            'XERO_ID', 'FIRST_TRACKING_CATEGORY', 'SECOND_TRACKING_CATEGORY',
+            'SEASONAL_INVOICING_METHOD_ID', 'CREATION_DATE_TIME', 'ASPNET_USER_ID',
+            'CHECK_IN_TERMS', 'CHECK_OUT_TERMS', 'ONLINE_PAYMENT_COMPLETION',
+            'DUE_DATE_DAYS', 'DUE_DATE_SETTINGS_ID', 'CHARGE_CATEGORY',
+            'INTRO_TEXT', 'REVENUE_GL_CODE', 'AR_GL_CODE', 'SALES_TAX_GL_CODE'
+        ),
+        bind_types=SEASONAL_PRICE_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'TransientPrices', 'TRANSIENT_PRICES', 'transient price',
+        molo_row_parser(TRANSIENT_PRICE_ROW, 'transient price'),
+        columns=(
+            'ID', 'START_DATE', 'END_DATE', 'FEE', 'RATE_NAME',
+            'TRANSIENT_CHARGE_METHOD_ID', 'MARINA_LOCATION_ID', 'TAXABLE', 'TAX',
+            'RATE_DETAILS', 'RATE_SHORT_NAME', 'ONLINE_PAYMENT_PLACEHOLDER',
+            'XERO_ITEM_CODE', 'XERO_ID', 'FIRST_TRACKING_CATEGORY',
+            'SECOND_TRACKING_CATEGORY', 'TRANSIENT_INVOICING_METHOD_ID',
+            'SV_INVENTORY_CATEGORY_ID', 'SV_INVENTORY_SUB_CATEGORY_ID',
+            'CREATION_DATE_TIME', 'ASPNET_USER_ID', 'CHECK_IN_TERMS',
+            'CHECK_OUT_TERMS', 'ONLINE_PAYMENT_COMPLETION', 'DUE_DATE_DAYS',
+            'DUE_DATE_SETTINGS_ID', 'HOURLY_CALCULATION', 'ROUND_MINUTES',
+            'MINIMUM_HOURS', 'NUM_HOURS_BLOCK', 'CHARGE_CATEGORY', 'INTRO_TEXT',
+            'REVENUE_GL_CODE', 'AR_GL_CODE', 'SALES_TAX_GL_CODE',
+            'DELETION_DATETIME', 'DELETION_ASPNET_USER_ID', 'RECORD_STATUS_ID',
+            'RECURRING_INVOICE_OPTIONS_ID', 'RECURRING', 'TRACKING_CODE',
+            'ALTERNATE_RESERVATION_NAME', 'RESOURCE_RATE', 'QUANTITY_CAP',
+            'ALLOW_POSTING_TO_NON_INCOME_ACCOUNTS'
+        ),
+        bind_types=TRANSIENT_PRICE_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'RecordStatusSet', 'RECORD_STATUS', 'record status',
+        molo_row_parser(LOOKUP_ROW, 'record status'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'BoatTypes', 'BOAT_TYPES', 'boat type',
+        molo_row_parser(LOOKUP_ROW, 'boat type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'PowerNeeds', 'POWER_NEEDS', 'power need',
+        molo_row_parser(LOOKUP_ROW, 'power need'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'ReservationStatus', 'RESERVATION_STATUS', 'reservation status',
+        molo_row_parser(LOOKUP_ROW, 'reservation status'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'ReservationTypes', 'RESERVATION_TYPES', 'reservation type',
+        molo_row_parser(LOOKUP_ROW, 'reservation type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'ContactTypes', 'CONTACT_TYPES', 'contact type',
+        molo_row_parser(LOOKUP_ROW, 'contact type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InvoiceStatusSet', 'INVOICE_STATUS', 'invoice status',
+        molo_row_parser(LOOKUP_ROW, 'invoice status'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InvoiceTypeSet', 'INVOICE_TYPES', 'invoice type',
+        molo_row_parser(LOOKUP_ROW, 'invoice type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'TransactionTypeSet', 'TRANSACTION_TYPES', 'transaction type',
+        molo_row_parser(LOOKUP_ROW, 'transaction type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'TransactionMethodSet', 'TRANSACTION_METHODS', 'transaction method',
+        molo_row_parser(LOOKUP_ROW, 'transaction method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InsuranceSet', 'INSURANCE', 'insurance',
+        molo_row_parser(INSURANCE_ROW, 'insurance'),
+        columns=(
+            'ID', 'PROVIDER', 'LISTED_INDIVIDUAL', 'ACCOUNT_NUMBER',
+            'POLICY_NUMBER', 'GROUP_NUMBER', 'LIABILITY_MAXIMUM', 'EFFECTIVE_DATE',
+            'EXPIRATION_DATE', 'NOTES', 'CREATION_USER', 'CREATION_DATE_TIME',
+            'LAST_EDIT_USER', 'LAST_EDIT_DATE_TIME', 'DELETE_USER',
+            'DELETE_DATE_TIME', 'INSURANCE_STATUS_ID', 'BOAT_ID', 'HASH_ID'
+        ),
+        bind_types=INSURANCE_ROW.bind_types,
+        has_merge_procedure=False
+    ),
+    TableSpec(
+        'MOLO', 'EquipmentSet', 'EQUIPMENT', 'equipment',
+        molo_row_parser(EQUIPMENT_ROW, 'equipment'),
+        columns=(
+            'ID', 'NAME', 'DESCRIPTION', 'EQUIPMENT_TYPE_ID', 'FUEL_TYPE_ID',
+            'MODEL', 'MANUFACTURER', 'YEAR_BUILT', 'SERIAL_NUMBER', 'LOCATION'
+        ),
+        bind_types=EQUIPMENT_ROW.bind_types,
+        has_merge_procedure=False
+    ),
+    TableSpec(
+        'MOLO', 'AccountStatus', 'ACCOUNT_STATUS', 'account status',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'account status'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'ContactAutoChargeSet', 'CONTACT_AUTO_CHARGE', 'contact auto charge',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'contact auto charge'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'StatementsPreferenceSet', 'STATEMENTS_PREFERENCE', 'statements preference',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'statements preference'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InvoiceItemTypeSet', 'INVOICE_ITEM_TYPES', 'invoice item type',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'invoice item type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'PaymentMethods', 'PAYMENT_METHODS', 'payment method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'payment method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'SeasonalChargeMethods', 'SEASONAL_CHARGE_METHODS', 'seasonal charge method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'seasonal charge method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'SeasonalInvoicingMethodSet', 'SEASONAL_INVOICING_METHODS', 'seasonal invoicing method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'seasonal invoicing method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'TransientChargeMethods', 'TRANSIENT_CHARGE_METHODS', 'transient charge method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'transient charge method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'TransientInvoicingMethodSet', 'TRANSIENT_INVOICING_METHODS', 'transient invoicing method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'transient invoicing method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'RecurringInvoiceOptionsSet', 'RECURRING_INVOICE_OPTIONS', 'recurring invoice option',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'recurring invoice option'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'DueDateSettingsSet', 'DUE_DATE_SETTINGS', 'due date setting',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'due date setting'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'ItemChargeMethods', 'ITEM_CHARGE_METHODS', 'item charge method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'item charge method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InsuranceStatusSet', 'INSURANCE_STATUS', 'insurance status',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'insurance status'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'EquipmentTypeSet', 'EQUIPMENT_TYPES', 'equipment type',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'equipment type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'EquipmentFuelTypeSet', 'EQUIPMENT_FUEL_TYPES', 'equipment fuel type',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'equipment fuel type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'VesselEngineClassSet', 'VESSEL_ENGINE_CLASS', 'vessel engine class',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'vessel engine class'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'Cities', 'CITIES', 'city',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'city'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'Countries', 'COUNTRIES', 'country',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'country'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'CurrenciesSet', 'CURRENCIES', 'currency',
+        molo_row_parser(CURRENCY_ROW, 'currency'),
+        columns=(
+            'ID', 'NAME', 'CODE', 'SYMBOL'
+        ),
+        bind_types=CURRENCY_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'PhoneTypes', 'PHONE_TYPES', 'phone type',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'phone type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'AddressTypeSet', 'ADDRESS_TYPES', 'address type',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'address type'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'InstalmentsPaymentMethodSet', 'INSTALLMENTS_PAYMENT_METHODS', 'installments payment method',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'installments payment method'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+    TableSpec(
+        'MOLO', 'PaymentsProviderSet', 'PAYMENTS_PROVIDER', 'payments provider',
+        molo_row_parser(SHORT_LOOKUP_ROW, 'payments provider'),
+        columns=(
+            'ID', 'NAME'
+        ),
+        bind_types=SHORT_LOOKUP_ROW.bind_types
+    ),
+]
+
+MOLO_TABLES_BY_SOURCE = index_by_source(MOLO_TABLES)
+check_dependencies(MOLO_TABLES)
+
+# Target CSV files to extract from the ZIP archive
+TARGET_CSV_FILES = [spec.source_name for spec in MOLO_TABLES]
+
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+def csv_dict_reader(csv_content):
     """
-    Parse SlipTypes CSV content into database-ready format.
+    Create a csv.DictReader over CSV text or an open text stream.
+    
+    Parsers accept either form so a ZIP member can be streamed straight into
+    the parser without first being decoded into one large string. A reader
+    that is already open (e.g. one filtering rows by watermark) is used as is.
     
     Args:
-        csv_content (str): Raw CSV content as string
+        csv_content (str, file or csv.DictReader): Raw CSV content, an open
+                                                   text stream or a reader
         
     Returns:
-        list: List of tuples containing slip type data for database insertion
+        csv.DictReader: Reader yielding one dict per CSV row
     """
-    slip_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            slip_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            slip_types.append(slip_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing slip type row: {e}")
-            continue
-    
-    return slip_types
+    if isinstance(csv_content, csv.DictReader):
+        return csv_content
+    if isinstance(csv_content, str):
+        csv_content = io.StringIO(csv_content)
+    return csv.DictReader(csv_content)
 
 
-def parse_slips_data(csv_content):
+# =============================================================================
+# S3 OPERATIONS
+# =============================================================================
+
+def find_latest_zip_in_s3(s3_client, bucket, prefix=None, start_after=None):
     """
-    Parse Slips CSV content into database-ready format.
+    Find the newest YYYYMMDDhhmmss.zip export in an S3 bucket.
+    
+    Only recent keys are listed (see s3_discovery.py): those after
+    start_after, or else the current month's, stepping back month by month.
+    The whole bucket is only listed if no export follows the naming scheme.
+    If there are no exports under prefix, the bucket root is searched instead
+    (the prefix used to be ignored).
     
     Args:
-        csv_content (str): Raw CSV content as string
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        prefix (str, optional): S3 key prefix the exports live under
+        start_after (str, optional): Last key loaded (from the processed-object ledger)
         
     Returns:
-        list: List of tuples containing slip data for database insertion
+        str: Key of the latest .zip file, or None if none found
     """
-    slips = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
+    logger.info(f"Searching for latest .zip file in s3://{bucket}/{prefix or ''}...")
     
-    for row in csv_reader:
-        try:
-            slip_data = (
-                parse_int(row.get('Id', '')),
-                row.get('Name', '').strip()[:255] if row.get('Name') else None,
-                row.get('Type', '').strip()[:50] if row.get('Type') else None,
-                row.get('RecomendedLOA', '').strip()[:50] if row.get('RecomendedLOA') else None,
-                row.get('RecomendedBeam', '').strip()[:50] if row.get('RecomendedBeam') else None,
-                row.get('RecomendedDraft', '').strip()[:50] if row.get('RecomendedDraft') else None,
-                row.get('RecomendedAirDraft', '').strip()[:50] if row.get('RecomendedAirDraft') else None,
-                row.get('MaximumLOA', '').strip()[:50] if row.get('MaximumLOA') else None,
-                row.get('MaximumBeam', '').strip()[:50] if row.get('MaximumBeam') else None,
-                row.get('MaximumDraft', '').strip()[:50] if row.get('MaximumDraft') else None,
-                row.get('MaximumAirDraft', '').strip()[:50] if row.get('MaximumAirDraft') else None,
-                parse_int(row.get('MarinaLocationId', '')),
-                parse_int(row.get('Pier_Id', '')),
-                row.get('Status', '').strip()[:50] if row.get('Status') else None,
-                parse_datetime(row.get('StartDate', '')),  # START_DATE
-                parse_datetime(row.get('EndDate', '')),    # END_DATE
-                parse_boolean(row.get('DoNotCountInOccupancy', '')),  # DO_NOT_COUNT_IN_OCCUPANCY
-                parse_boolean(row.get('Active', '')),  # Convert TRUE/FALSE to 1/0
-                parse_datetime(row.get('CreationDateTime', '')),  # CREATION_DATE_TIME - KEY FIELD
-                row.get('CreationUser', '').strip()[:255] if row.get('CreationUser') else None,  # CREATION_USER
-                parse_int(row.get('SlipType_Id', '')),
-                parse_float(row.get('PaymentProcessingFee', '0')),  # PAYMENT_PROCESSING_FEE
-                parse_float(row.get('ManagementFee', '0')),  # MANAGEMENT_FEE
-                parse_int(row.get('OwnerId', '')),  # OWNER_ID
-                parse_int(row.get('PaymentProcessingFeeTypeId', '')),  # PAYMENT_PROCESSING_FEE_TYPE_ID
-                parse_int(row.get('ManagementFeeTypeId', '')),  # MANAGEMENT_FEE_TYPE_ID
-                row.get('OverrideOccupancyLOA', '').strip()[:50] if row.get('OverrideOccupancyLOA') else None,
-                row.get('HashID', '').strip()[:50] if row.get('HashID') else None,
-                parse_float(row.get('MaintenanceFee', '0')),  # MAINTENANCE_FEE
-                row.get('SvgId', '').strip()[:255] if row.get('SvgId') else None,  # SVG_ID
-                parse_float(row.get('Assessment', '0')),  # ASSESSMENT
-                parse_float(row.get('Loan', '0')),  # LOAN
-                parse_int(row.get('OrderColumn', '')),  # ORDER_COLUMN
-                row.get('SignName', '').strip()[:255] if row.get('SignName') else None,  # SIGN_NAME
-                parse_float(row.get('MaxWeight', '0'))  # MAX_WEIGHT
-            )
-            slips.append(slip_data)
-        except Exception as e:
-            logger.warning(f"Error parsing slip row: {e}")
-            continue
+    try:
+        latest_zip_key = find_latest_key(
+            s3_client, bucket, MOLO_BACKUP_KEYS, prefix, start_after
+        )
+        if not latest_zip_key and prefix:
+            logger.warning(f"No .zip files under '{prefix}', searching the bucket root")
+            latest_zip_key = find_latest_key(s3_client, bucket, MOLO_BACKUP_KEYS)
+    except ClientError as e:
+        logger.exception(f"An error occurred accessing S3: {e}")
+        return None
     
-    return slips
+    if latest_zip_key:
+        logger.info(f"Found latest file: {latest_zip_key}")
+    else:
+        logger.warning(f"No .zip files found in bucket '{bucket}'.")
+    return latest_zip_key
 
 
-def parse_reservations_data(csv_content):
+def spool_s3_object(s3_client, bucket, key, workers=DEFAULT_DOWNLOAD_WORKERS, etag=None):
     """
-    Parse Reservations CSV content into database-ready format.
+    Download an S3 object into an anonymous temporary file.
+    
+    The object is fetched as concurrent byte ranges written straight into
+    the preallocated file (see s3_download.py) and checked against its ETag,
+    so the archive is never held in memory as a single bytes object. The
+    caller owns the returned file and must close it (the file is deleted
+    automatically on close).
     
     Args:
-        csv_content (str): Raw CSV content as string
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        key (str): S3 object key
+        workers (int): Ranged GETs in flight at once
+        etag (str, optional): ETag the object must still have
         
     Returns:
-        list: List of tuples containing reservation data for database insertion
+        file: Seekable binary temporary file positioned at offset 0
     """
-    reservations = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            reservation_data = (
-                row.get('Id', '').strip(),
-                row.get('MarinaLocationId', '').strip(),
-                parse_datetime(row.get('CreationTime', '').strip()),
-                row.get('ReservationStatusId', '').strip(),
-                row.get('ReservationTypeId', '').strip(),
-                row.get('ContactId', '').strip(),
-                row.get('BoatId', '').strip(),
-                parse_datetime(row.get('ScheduledArrivalTime', '').strip()),
-                parse_datetime(row.get('ScheduledDepartureTime', '').strip()),
-                parse_datetime(row.get('CancellationTime', '').strip()),
-                row.get('AccountId', '').strip(),
-                row.get('SlipId', '').strip(),
-                row.get('Rate', '').strip(),
-                row.get('Name', '').strip()[:500],
-                row.get('HashID', '').strip()[:50],
-                row.get('ReservationSource', '').strip()[:50]
-            )
-            reservations.append(reservation_data)
-        except Exception as e:
-            logger.warning(f"Error parsing reservation row: {e}")
-            continue
-    
-    return reservations
+    return download_object(
+        s3_client, bucket, key, workers=workers,
+        suffix=os.path.splitext(key)[1], expected_etag=etag
+    )
 
 
-def parse_companies_data(csv_content):
+def open_zip_member_text(zip_archive, member):
     """
-    Parse Companies CSV content into database-ready format.
+    Open a single ZIP member as a UTF-8 text stream.
+    
+    The member is decompressed incrementally as it is read; newlines are
+    preserved exactly so quoted multi-line CSV fields parse unchanged.
     
     Args:
-        csv_content (str): Raw CSV content as string
+        zip_archive (zipfile.ZipFile): Open ZIP archive
+        member (zipfile.ZipInfo): Member to open
         
     Returns:
-        list: List of tuples containing company data for database insertion
+        io.TextIOWrapper: Text stream over the member (caller closes it)
     """
-    companies = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            company_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255],
-                row.get('Owner', '').strip()[:255],
-                row.get('PrimaryFaxNumber', '').strip()[:50],
-                row.get('PrimaryPhoneNumber', '').strip()[:50],
-                row.get('City_Id', '').strip(),
-                row.get('Image', '').strip()[:500],
-                row.get('Description', '').strip()[:2000],
-                row.get('PartnerId', '').strip(),
-                row.get('MoloAPI_Partner_Id', '').strip(),
-                row.get('CompanyMoloAPI_Partner_Company_Id', '').strip(),
-                row.get('InvoiceAtCompanyLevel', '').strip()[:10],
-                row.get('MoloContactId', '').strip(),
-                row.get('StripeCustomerId', '').strip()[:255],
-                row.get('LoginProviderId', '').strip(),
-                row.get('DefaultCCFee', '').strip(),
-                row.get('Tier1PercentACHFee', '').strip(),
-                row.get('Tier2PercentACHFee', '').strip()
-            )
-            companies.append(company_data)
-        except Exception as e:
-            logger.warning(f"Error parsing company row: {e}")
-            continue
-    
-    return companies
+    return io.TextIOWrapper(
+        zip_archive.open(member), encoding='utf-8', newline=''
+    )
 
 
-def parse_contacts_data(csv_content):
+def read_zip_member_text(zip_archive, member):
     """
-    Parse Contacts CSV content into database-ready format.
+    Read and decode a single ZIP member as UTF-8 text.
     
     Args:
-        csv_content (str): Raw CSV content as string
+        zip_archive (zipfile.ZipFile): Open ZIP archive
+        member (zipfile.ZipInfo): Member to read
         
     Returns:
-        list: List of tuples containing contact data for database insertion
+        str: Decoded member content
     """
-    def safe_int(value, default=0):
-        """Safely convert value to integer with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            # Handle "1.0" format integers
-            if isinstance(value, str) and '.' in value:
-                float_val = float(value.strip())
-                if float_val.is_integer():
-                    return int(float_val)
-            return int(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_float(value, default=0.0):
-        """Safely convert value to float with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            return float(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_bool_as_int(value, default=0):
-        """Safely convert boolean value to integer (1/0) with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        str_value = str(value).strip().upper()
-        if str_value in ['TRUE', '1', 'YES', 'Y']:
-            return 1
-        elif str_value in ['FALSE', '0', 'NO', 'N']:
-            return 0
-        else:
-            return default
-
-    def safe_string(value, max_length=None, allow_null=False):
-        """Safely convert value to string with optional length limit and NULL handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None if allow_null else ''
-        result = str(value).strip()
-        return result[:max_length] if max_length else result
-
-    def safe_datetime(value):
-        """Safely convert datetime value with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None  # Allow NULL for datetime fields
-        try:
-            date_str = str(value).strip()
-            if not date_str:
-                return None
-            
-            # Handle different date formats including MM/dd/yyyy HH:mm:ss
-            date_formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%m/%d/%Y %H:%M:%S', 
-                '%m/%d/%Y',
-                '%Y-%m-%d', 
-                '%d/%m/%Y', 
-                '%Y/%m/%d', 
-                '%m-%d-%Y'
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            
-            # If no format matches, log and return None
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
-        except:
-            return None
+    with open_zip_member_text(zip_archive, member) as stream:
+        return stream.read()
 
-    def safe_date(value):
-        """Safely convert date value with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None  # Allow NULL for date fields
-        try:
-            date_str = str(value).strip()
-            if not date_str:
-                return None
-            
-            # Handle different date formats including MM/dd/yyyy HH:mm:ss
-            date_formats = [
-                '%m/%d/%Y %H:%M:%S', 
-                '%m/%d/%Y',
-                '%Y-%m-%d', 
-                '%d/%m/%Y', 
-                '%Y/%m/%d', 
-                '%m-%d-%Y'
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.date()  # Return just the date part
-                except ValueError:
-                    continue
-            
-            # If no format matches, log and return None
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
-        except:
-            return None
-
-    contacts = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            contact_data = (
-                safe_string(row.get('Id'), allow_null=False) or '',
-                safe_string(row.get('Emails'), 1000, allow_null=False) or '',
-                safe_string(row.get('FirstName'), 255, allow_null=False) or '',
-                safe_string(row.get('MiddleName'), 255, allow_null=False) or '',
-                safe_string(row.get('LastName'), 255, allow_null=False) or '',
-                safe_string(row.get('MarinaLocationId'), allow_null=False) or '',
-                safe_string(row.get('Notes'), 2000, allow_null=False) or '',
-                safe_string(row.get('RecordStatusId'), allow_null=False) or '',
-                safe_bool_as_int(row.get('IsSupplier'), 0),
-                safe_bool_as_int(row.get('IsCustomer'), 0),
-                safe_string(row.get('XeroId'), 255, allow_null=False) or '',
-                safe_string(row.get('CompanyContactName'), 255, allow_null=False) or '',
-                safe_string(row.get('CreationUser'), 255, allow_null=False) or '',
-                safe_datetime(row.get('CreationDateTime')),
-                safe_string(row.get('CIM_Id'), 255, allow_null=False) or '',
-                safe_string(row.get('MarinaLocation1_Id'), allow_null=False) or '',
-                safe_string(row.get('QB_Customer_Id'), 255, allow_null=False) or '',
-                safe_string(row.get('StatementsPreference_Id'), allow_null=False) or '',
-                safe_string(row.get('HashID'), 50, allow_null=False) or '',
-                safe_string(row.get('MoloAPI_PartnerId'), allow_null=False) or '',
-                safe_bool_as_int(row.get('TaxExemptStatus'), 0),
-                safe_float(row.get('AutomaticDiscountPercent'), 0.0),
-                safe_float(row.get('CostPlusDiscount'), 0.0),
-                safe_string(row.get('LinkedParentContact'), allow_null=False) or '',
-                safe_string(row.get('ContactAutoChargeId'), allow_null=False) or '',
-                safe_datetime(row.get('LastEditedDateTime')),
-                safe_string(row.get('LastEditedUser_Id'), allow_null=False) or '',
-                safe_string(row.get('LastEditedMoloAPIPartner_Id'), allow_null=False) or '',
-                safe_string(row.get('StripeCustomer_Id'), 255, allow_null=False) or '',
-                safe_float(row.get('AccountLimit'), 0.0),
-                safe_string(row.get('Filestack_Id'), 255, allow_null=False) or '',
-                safe_bool_as_int(row.get('ShowCompanyNamePrinted'), 0),
-                safe_bool_as_int(row.get('BookingMergingDone'), 0),
-                safe_date(row.get('DateOfBirth')),
-                safe_string(row.get('IDSCustomerID'), 255, allow_null=False) or '',
-                safe_bool_as_int(row.get('DoNotLaunch'), 0),
-                safe_string(row.get('DoNotLaunchReason'), 500, allow_null=False) or '',
-                safe_string(row.get('DriverLicenseId'), 255, allow_null=False) or '',
-                safe_string(row.get('QuickbooksId'), 255, allow_null=False) or '',
-                safe_string(row.get('QuickbooksName'), 255, allow_null=False) or '',
-                safe_string(row.get('QBOVendorId'), 255, allow_null=False) or '',
-                safe_bool_as_int(row.get('SkipForFinanceCharges'), 0),
-                safe_string(row.get('MainContactId'), allow_null=False) or ''
-            )
-            contacts.append(contact_data)
-        except Exception as e:
-            logger.warning(f"Error parsing contact row {row.get('Id', 'Unknown')}: {e}")
-            logger.warning(f"Problematic row data: {row}")
-            continue
-    
-    return contacts
 
+# =============================================================================
+# VALIDATION HELPER FUNCTION
+# =============================================================================
 
-def parse_boats_data(csv_content):
+def perform_table_validation(
+    validator,
+    csv_content,
+    table_name,
+    staging_table,
+    dw_table,
+    id_column,
+    key_columns,
+    validate_fields,
+    validate_merge_changes,
+    validation_sample_size,
+    record_count=None
+):
     """
-    Parse Boats CSV content into database-ready format.
+    Perform field-level validation on imported table data.
     
     Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing boat data for database insertion
+        validator: DataValidator instance
+        csv_content: Raw CSV content
+        table_name: Display name for logging
+        staging_table: Staging table name (STG_MOLO_*)
+        dw_table: Data warehouse table name (DW_MOLO_*)
+        id_column: Primary key column name
+        key_columns: List of important columns to validate
+        validate_fields: Enable CSV vs DB validation
+        validate_merge_changes: Enable staging vs DW validation
+        validation_sample_size: Number of records to sample
+        record_count: Number of records inserted (optional)
     """
-    boats = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
+    if not validator:
+        return
+    
+    validation_issues = []
     
-    for row in csv_reader:
+    # Log staging insert summary
+    if record_count:
         try:
-            boat_data = (
-                row.get('Id', '').strip(),
-                row.get('Photo', '').strip()[:500],
-                row.get('Make', '').strip()[:255],
-                row.get('Model', '').strip()[:255],
-                row.get('Name', '').strip()[:255],
-                row.get('LOA', '').strip()[:50],
-                row.get('Beam', '').strip()[:50],
-                row.get('Draft', '').strip()[:50],
-                row.get('AirDraft', '').strip()[:50],
-                row.get('RegistrationNumber', '').strip()[:255],
-                row.get('RegistrationState', '').strip()[:50],
-                parse_datetime(row.get('CreationTime', '')),
-                row.get('BoatTypeId', '').strip(),
-                row.get('MarinaLocationId', '').strip(),
-                row.get('PowerNeedId', '').strip(),
-                row.get('Notes', '').strip()[:2000] if row.get('Notes') else '',
-                row.get('RecordStatusId', '').strip(),
-                row.get('AspNetUser_Id', '').strip()[:255],
-                row.get('MastLength', '').strip()[:50],
-                row.get('Weight', '').strip()[:50],
-                row.get('Color', '').strip()[:100],
-                row.get('HullID', '').strip()[:255],
-                row.get('KeyLocationCode', '').strip()[:100],
-                row.get('Year', '').strip()[:10],
-                row.get('HashID', '').strip()[:50],
-                row.get('MoloAPI_PartnerId', '').strip(),
-                row.get('PowerNeed1_Id', '').strip(),
-                parse_datetime(row.get('LastEditedDateTime', '')),
-                row.get('LastEditedUser_Id', '').strip(),
-                row.get('LastEditedMoloAPIPartner_Id', '').strip(),
-                row.get('Filestack_Id', '').strip()[:255],
-                row.get('Tonnage', '').strip()[:50],
-                row.get('GallonCapacity', '').strip()[:50],
-                row.get('IsActive', '').strip()[:10],
-                row.get('BookingMergingDone', '').strip()[:10],
-                row.get('DecalNumber', '').strip()[:100],
-                row.get('Manufacturer', '').strip()[:255],
-                row.get('SerialNumber', '').strip()[:255],
-                parse_date(row.get('RegistrationExpiration', ''))
+            # Get staging table count
+            staging_count = validator._get_row_count(staging_table)
+            logger.info(
+                f"   📥 Staging: {record_count} records inserted "
+                f"({staging_count} total in {staging_table})"
             )
-            boats.append(boat_data)
         except Exception as e:
-            logger.warning(f"Error parsing boat row: {e}")
-            continue
-    
-    return boats
-
-
-def parse_accounts_data(csv_content):
-    """
-    Parse Accounts CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing account data for database insertion
-    """
-    accounts = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
+            logger.debug(f"Could not get staging count for {table_name}: {e}")
     
-    for row in csv_reader:
+    # Validate CSV vs Database field values
+    if validate_fields:
         try:
-            account_data = (
-                row.get('Id', '').strip(),
-                row.get('AccountStatusId', '').strip(),
-                row.get('MarinaLocationId', '').strip(),
-                row.get('Contact_Id', '').strip()
+            passed, issues = validator.validate_field_values(
+                csv_content=csv_content,
+                dw_table=dw_table,
+                id_column=id_column,
+                columns_to_check=key_columns,
+                sample_size=validation_sample_size
             )
-            accounts.append(account_data)
+            if not passed:
+                logger.warning(f"⚠️  Field validation issues in {table_name}:")
+                for issue in issues[:5]:  # Show first 5 issues
+                    logger.warning(f"    {issue}")
+                if len(issues) > 5:
+                    logger.warning(f"    ... and {len(issues) - 5} more issues")
+                validation_issues.extend(issues)
         except Exception as e:
-            logger.warning(f"Error parsing account row: {e}")
-            continue
-    
-    return accounts
-
-
-def parse_invoices_data(csv_content):
-    """
-    Parse InvoiceSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing invoice data for database insertion
-    """
-    def safe_int(value, default=0):
-        """Safely convert value to integer with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            # Handle "1.0" format integers
-            if isinstance(value, str) and '.' in value:
-                float_val = float(value.strip())
-                if float_val.is_integer():
-                    return int(float_val)
-            return int(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_float(value, default=0.0):
-        """Safely convert value to float with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            return float(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_bool_as_int(value, default=0):
-        """Safely convert boolean value to integer (1/0) with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        str_value = str(value).strip().upper()
-        if str_value in ['TRUE', '1', 'YES', 'Y']:
-            return 1
-        elif str_value in ['FALSE', '0', 'NO', 'N']:
-            return 0
-        else:
-            return default
-
-    def safe_string(value, max_length=None, allow_null=False):
-        """Safely convert value to string with optional length limit and NULL handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None if allow_null else ''
-        result = str(value).strip()
-        return result[:max_length] if max_length else result
-
-    def safe_datetime(value):
-        """Safely convert datetime value with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None  # Allow NULL for datetime fields
-        try:
-            result = parse_datetime(str(value).strip())
-            return result if result else None
-        except:
-            return None
-
-    invoices = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
+            logger.warning(f"Field validation failed for {table_name}: {e}")
     
-    for row in csv_reader:
+    # Validate staging vs DW after merge
+    if validate_merge_changes:
         try:
-            invoice_data = (
-                safe_string(row.get('Id'), allow_null=False) or '',  # ID cannot be null
-                safe_datetime(row.get('Date')),
-                safe_float(row.get('DolarDiscount'), 0.0),  # Explicit defaults
-                safe_float(row.get('PercentDiscount'), 0.0),
-                safe_bool_as_int(row.get('Active'), 0),  # Boolean as 1/0
-                safe_datetime(row.get('ClosingDate')),
-                safe_float(row.get('DiscountTotal'), 0.0),
-                safe_bool_as_int(row.get('Opened'), 0),  # Boolean as 1/0
-                safe_float(row.get('Payed'), 0.0),
-                safe_float(row.get('Subtotal'), 0.0),
-                safe_float(row.get('SubtotalWoDiscount'), 0.0),
-                safe_float(row.get('TaxTotal'), 0.0),
-                safe_string(row.get('Title'), 500, allow_null=False) or 'Untitled Invoice',
-                safe_float(row.get('Total'), 0.0),
-                safe_int(row.get('ReservationId'), 0),  # Explicit 0 default
-                safe_int(row.get('AccountId'), 0),
-                safe_float(row.get('ServicePaidAmount'), 0.0),
-                safe_float(row.get('MarinaPaidAmount'), 0.0),
-                safe_float(row.get('GasPaidAmount'), 0.0),
-                safe_int(row.get('InvoiceStatusId'), 0),
-                safe_datetime(row.get('StartDate')),
-                safe_int(row.get('InstalmentsPaymentMethodId'), 0),
-                safe_bool_as_int(row.get('ScheduledForCron'), 0),  # Boolean as 1/0
-                safe_string(row.get('OriginalInvoice'), allow_null=False) or '',
-                safe_bool_as_int(row.get('PaymentsSentToXero'), 0),  # Boolean as 1/0
-                safe_int(row.get('WorkOrderId'), 0),
-                safe_bool_as_int(row.get('IsInstallmentInvoice'), 0),  # Boolean as 1/0
-                safe_string(row.get('VoidUser'), 255, allow_null=False) or '',
-                safe_datetime(row.get('VoidDateTime')),
-                safe_string(row.get('CreationUser'), 255, allow_null=False) or '',
-                safe_int(row.get('Payment_Id'), 0),
-                safe_string(row.get('QB_Invoice_Id'), 255, allow_null=False) or '',
-                safe_int(row.get('InvoiceType_Id'), 0),
-                safe_datetime(row.get('InvoiceDate')),
-                safe_datetime(row.get('DueDate')),
-                safe_string(row.get('CurrencyCode'), 10, allow_null=False) or '',
-                safe_datetime(row.get('LastModifiedDateTime')),
-                safe_string(row.get('LastModifiedAspNetUser'), 255, allow_null=False) or '',
-                safe_string(row.get('VoidReason'), 500, allow_null=False) or '',
-                safe_int(row.get('CreatePartnerId'), 0),
-                safe_int(row.get('VoidPartnerId'), 0),
-                safe_string(row.get('UpdateHash'), 500, allow_null=False) or '',
-                safe_bool_as_int(row.get('ScheduledForInventoryCron'), 0),  # Boolean as 1/0
-                safe_bool_as_int(row.get('ScheduledForSubletCron'), 0),  # Boolean as 1/0
-                safe_bool_as_int(row.get('ScheduledForLaborCron'), 0),  # Boolean as 1/0
-                safe_bool_as_int(row.get('CreatedOnMobile'), 0),  # Boolean as 1/0
-                safe_string(row.get('StripeInvoiceId'), 255, allow_null=False) or '',
-                safe_bool_as_int(row.get('SentToStripe'), 0),  # Boolean as 1/0
-                safe_int(row.get('ResourceBookingId'), 0),
-                safe_bool_as_int(row.get('ModifiedOnMobile'), 0),  # Boolean as 1/0
-                safe_string(row.get('Note'), 2000, allow_null=False) or '',
-                safe_string(row.get('QuickbooksInvoiceId'), 255, allow_null=False) or '',
-                safe_float(row.get('TaxCap'), 0.0),
-                safe_bool_as_int(row.get('IsSurcharge'), 0)  # Boolean as 1/0
+            passed, issues, stats = validator.validate_field_changes(
+                staging_table=staging_table,
+                dw_table=dw_table,
+                id_column=id_column,
+                columns_to_check=key_columns,
+                sample_size=validation_sample_size
             )
-            invoices.append(invoice_data)
+            if not passed:
+                logger.warning(
+                    f"⚠️  Merge validation for {table_name}: "
+                    f"{stats['records_with_changes']} records changed, "
+                    f"{stats['fields_changed']} fields modified"
+                )
+                for issue in issues[:3]:  # Show first 3 issues
+                    logger.warning(f"    {issue}")
+                if len(issues) > 3:
+                    logger.warning(f"    ... and {len(issues) - 3} more issues")
+                validation_issues.extend(issues)
         except Exception as e:
-            logger.warning(f"Error parsing invoice row {row.get('Id', 'Unknown')}: {e}")
-            logger.warning(f"Problematic row data: {row}")
-            continue
+            logger.warning(f"Merge validation failed for {table_name}: {e}")
     
-    return invoices
+    return len(validation_issues) == 0
 
 
-def parse_invoice_items_data(csv_content):
-    """
-    Parse InvoiceItemSet CSV content into database-ready format.
-    Maps CSV columns to database columns in the correct order.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing invoice item data for database insertion (96 columns)
-    """
-    def safe_int(value, default=0):
-        """Safely convert value to integer with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            # Handle "1.0" format integers
-            if isinstance(value, str) and '.' in value:
-                float_val = float(value.strip())
-                if float_val.is_integer():
-                    return int(float_val)
-            return int(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_float(value, default=0.0):
-        """Safely convert value to float with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            return float(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_bool_as_int(value, default=0):
-        """Safely convert boolean value to integer (1/0) with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        str_value = str(value).strip().upper()
-        if str_value in ['TRUE', '1', 'YES', 'Y']:
-            return 1
-        elif str_value in ['FALSE', '0', 'NO', 'N']:
-            return 0
-        else:
-            return default
-
-    def safe_string(value, max_length=None, allow_null=False):
-        """Safely convert value to string with optional length limit and NULL handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None if allow_null else ''
-        result = str(value).strip()
-        return result[:max_length] if max_length else result
-
-    def safe_datetime(value):
-        """Safely convert datetime value with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None  # Allow NULL for datetime fields
-        try:
-            result = parse_datetime(str(value).strip())
-            return result if result else None
-        except:
-            return None
+# =============================================================================
+# MAIN PROCESSING FUNCTION
+# =============================================================================
 
-    invoice_items = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
+def read_s3_zip_and_insert_to_db(
+    bucket,
+    s3_prefix,
+    region,
+    db_user,
+    db_password,
+    db_dsn,
+    aws_access_key_id=None,
+    aws_secret_access_key=None,
+    validate_fields=False,
+    validate_merge_changes=False,
+    validation_sample_size=10,
+    load_workers=1,
+    skip_unchanged=True,
+    load_deltas=True,
+    incremental=False,
+    watermark_overlap=DEFAULT_WATERMARK_OVERLAP,
+    full_refresh_days=DEFAULT_FULL_REFRESH_DAYS,
+    force=False,
+    download_workers=DEFAULT_DOWNLOAD_WORKERS,
+    archive_cache_dir=None,
+    archive_cache_gb=DEFAULT_ARCHIVE_CACHE_GB,
+    from_local=None,
+    parsed_cache_dir=None,
+    resume=False,
+    merge_mode=AUTO,
+    bulk_mode=CONVENTIONAL,
+    commit_mode=AUTO_COMMIT,
+    batch_size=None,
+    reject_bad_rows=False,
+    quarantine_dir=None
+):
+    """
+    Main processing function: Download latest ZIP from S3, extract target CSVs,
+    and synchronize data with Oracle database using INSERT operations into staging tables.
     
-    for row in csv_reader:
-        try:
-            invoice_item_data = (
-                # 1-22: Non-datetime columns
-                safe_int(row.get('Id'), 0),  # 1: ID (NUMBER, not string!)
-                safe_string(row.get('Prefix'), 10, allow_null=False) or '',  # 2: PREFIX
-                safe_float(row.get('Quantity'), 0.0),  # 3: QUANTITY
-                safe_string(row.get('Title'), 500, allow_null=False) or 'Untitled Item',  # 4: TITLE
-                safe_string(row.get('Type'), 100, allow_null=False) or '',  # 5: TYPE_FIELD
-                safe_float(row.get('Value'), 0.0),  # 6: VALUE_FIELD
-                safe_float(row.get('Discount'), 0.0),  # 7: DISCOUNT
-                safe_string(row.get('DiscountType'), 50, allow_null=False) or '',  # 8: DISCOUNT_TYPE
-                safe_bool_as_int(row.get('Taxable'), 0),  # 9: TAXABLE
-                safe_float(row.get('Tax'), 0.0),  # 10: TAX
-                safe_string(row.get('Misc'), 500, allow_null=False) or '',  # 11: MISC
-                safe_float(row.get('DiscountTotal'), 0.0),  # 12: DISCOUNT_TOTAL
-                safe_string(row.get('PriceSuffix'), 50, allow_null=False) or '',  # 13: PRICE_SUFFIX
-                safe_float(row.get('SubTotal'), 0.0),  # 14: SUB_TOTAL
-                safe_float(row.get('SubtotalWoDiscount'), 0.0),  # 15: SUBTOTAL_WO_DISCOUNT
-                safe_float(row.get('TaxTotal'), 0.0),  # 16: TAX_TOTAL
-                safe_float(row.get('Total'), 0.0),  # 17: TOTAL
-                safe_int(row.get('InvoiceId'), 0),  # 18: INVOICE_ID (NUMBER)
-                safe_string(row.get('ChargeGroup'), 100, allow_null=False) or '',  # 19: CHARGE_GROUP
-                safe_string(row.get('PaymentAccount'), 100, allow_null=False) or '',  # 20: PAYMENT_ACCOUNT
-                safe_string(row.get('PriceStr'), 100, allow_null=False) or '',  # 21: PRICE_STR
-                safe_bool_as_int(row.get('IsVoid'), 0),  # 22: IS_VOID
-                
-                # 23-96: Including TIMESTAMP columns
-                safe_datetime(row.get('Date')),  # 23: DATE_FIELD (TIMESTAMP)
-                safe_string(row.get('TextAux'), 1000, allow_null=True),  # 24: TEXT_AUX
-                safe_string(row.get('TextAux2'), 1000, allow_null=True),  # 25: TEXT_AUX2
-                safe_datetime(row.get('DiscountDateTime')),  # 26: DISCOUNT_DATE_TIME (TIMESTAMP)
-                safe_string(row.get('DiscountUserId'), 1000, allow_null=True),  # 27: DISCOUNT_USER_ID
-                safe_string(row.get('Notes'), 1000, allow_null=True),  # 28: NOTES
-                safe_string(row.get('PR_Type'), 1000, allow_null=True),  # 29: PR_TYPE
-                safe_string(row.get('Status'), 1000, allow_null=True),  # 30: STATUS_FIELD
-                safe_string(row.get('DeletionUserId'), 1000, allow_null=True),  # 31: DELETION_USER_ID
-                safe_datetime(row.get('DeletionDateTime')),  # 32: DELETION_DATE_TIME (TIMESTAMP)
-                safe_int(row.get('OverpaymentId'), 0),  # 33: OVERPAYMENT_ID
-                safe_string(row.get('VoidUser'), 1000, allow_null=True),  # 34: VOID_USER
-                safe_datetime(row.get('VoidDateTime')),  # 35: VOID_DATE_TIME (TIMESTAMP)
-                safe_string(row.get('Misc2'), 1000, allow_null=True),  # 36: MISC2
-                safe_int(row.get('PrepaymentId'), 0),  # 37: PREPAYMENT_ID
-                safe_int(row.get('CreditInvoiceId'), 0),  # 38: CREDIT_INVOICE_ID
-                safe_string(row.get('AllocationType'), 1000, allow_null=True),  # 39: ALLOCATION_TYPE
-                safe_int(row.get('Reservation_Id'), 0),  # 40: RESERVATION_ID
-                safe_int(row.get('ItemMaster_Id'), 0),  # 41: ITEM_MASTER_ID
-                safe_string(row.get('AspNetUser_Id'), 256, allow_null=True),  # 42: ASPNET_USER_ID
-                safe_int(row.get('InvoiceItemType_Id'), 0),  # 43: INVOICE_ITEM_TYPE_ID
-                safe_int(row.get('SeasonalPrice_Id'), 0),  # 44: SEASONAL_PRICE_ID
-                safe_int(row.get('TransientPrice_Id'), 0),  # 45: TRANSIENT_PRICE_ID
-                safe_int(row.get('SVJobId'), 0),  # 46: SV_JOB_ID
-                safe_int(row.get('OriginalCreditItem'), 0),  # 47: ORIGINAL_CREDIT_ITEM
-                safe_bool_as_int(row.get('TaxExempt'), 0),  # 48: TAX_EXEMPT
-                safe_datetime(row.get('LastModifiedDateTime')),  # 49: LAST_MODIFIED_DATE_TIME (TIMESTAMP)
-                safe_string(row.get('LastModifiedAspNetUser'), 1000, allow_null=True),  # 50: LAST_MODIFIED_ASPNET_USER
-                safe_string(row.get('DeletionReason'), 1000, allow_null=True),  # 51: DELETION_REASON
-                safe_string(row.get('VoidReason'), 1000, allow_null=True),  # 52: VOID_REASON
-                safe_datetime(row.get('StartDateTime')),  # 53: START_DATE_TIME (TIMESTAMP)
-                safe_datetime(row.get('EndDateTime')),  # 54: END_DATE_TIME (TIMESTAMP)
-                safe_int(row.get('CreationPartnerId'), 0),  # 55: CREATION_PARTNER_ID
-                safe_int(row.get('DeletePartnerId'), 0),  # 56: DELETE_PARTNER_ID
-                safe_int(row.get('VoidPartnerId'), 0),  # 57: VOID_PARTNER_ID
-                safe_float(row.get('OriginalPrice'), 0.0),  # 58: ORIGINAL_PRICE
-                safe_int(row.get('OverrideXeroTaxRate'), 0),  # 59: OVERRIDE_XERO_TAX_RATE
-                safe_int(row.get('OverrideXeroSalesAccount'), 0),  # 60: OVERRIDE_XERO_SALES_ACCOUNT
-                safe_float(row.get('OriginalReservationPrice'), 0.0),  # 61: ORIGINAL_RESERVATION_PRICE
-                safe_int(row.get('NumberOfDecimals'), 0),  # 62: NUMBER_OF_DECIMALS
-                safe_int(row.get('StripeTransactionData_Id'), 0),  # 63: STRIPE_TRANSACTION_DATA_ID
-                safe_float(row.get('ValueAlternative'), 0.0),  # 64: VALUE_ALTERNATIVE
-                safe_int(row.get('StripeTerminalId'), 0),  # 65: STRIPE_TERMINAL_ID
-                safe_string(row.get('StripeApplicationName'), 1000, allow_null=True),  # 66: STRIPE_APPLICATION_NAME
-                safe_string(row.get('StripeAID'), 1000, allow_null=True),  # 67: STRIPE_AID
-                safe_float(row.get('EnteredAmount'), 0.0),  # 68: ENTERED_AMOUNT
-                safe_float(row.get('ExchangeRate'), 0.0),  # 69: EXCHANGE_RATE
-                safe_int(row.get('Currencies_Id'), 0),  # 70: CURRENCIES_ID
-                safe_int(row.get('SV_ChargeInstance_Id'), 0),  # 71: SV_CHARGE_INSTANCE_ID
-                safe_int(row.get('SV_LaborInstance_Id'), 0),  # 72: SV_LABOR_INSTANCE_ID
-                safe_int(row.get('SV_PartInstance_Id'), 0),  # 73: SV_PART_INSTANCE_ID
-                safe_string(row.get('RevenueGLCode'), 1000, allow_null=True),  # 74: REVENUE_GL_CODE
-                safe_string(row.get('ARGLCode'), 1000, allow_null=True),  # 75: AR_GL_CODE
-                safe_string(row.get('PaymentGLCode'), 1000, allow_null=True),  # 76: PAYMENT_GL_CODE
-                safe_string(row.get('COGSGLCode'), 1000, allow_null=True),  # 77: COGS_GL_CODE
-                safe_string(row.get('InventoryGLCode'), 1000, allow_null=True),  # 78: INVENTORY_GL_CODE
-                safe_string(row.get('SalesTaxGLCode'), 1000, allow_null=True),  # 79: SALES_TAX_GL_CODE
-                safe_string(row.get('PrepaymentGLCode'), 1000, allow_null=True),  # 80: PREPAYMENT_GL_CODE
-                safe_string(row.get('AccountType'), 1000, allow_null=True),  # 81: ACCOUNT_TYPE
-                safe_string(row.get('ApplicationCryptogram'), 1000, allow_null=True),  # 82: APPLICATION_CRYPTOGRAM
-                safe_string(row.get('AuthorizationCode'), 1000, allow_null=True),  # 83: AUTHORIZATION_CODE
-                safe_string(row.get('AuthorizationResponseCode'), 1000, allow_null=True),  # 84: AUTHORIZATION_RESPONSE_CODE
-                safe_string(row.get('CardholderVerificationMethod'), 1000, allow_null=True),  # 85: CARDHOLDER_VERIFICATION_METHOD
-                safe_string(row.get('TerminalVerificationResults'), 1000, allow_null=True),  # 86: TERMINAL_VERIFICATION_RESULTS
-                safe_string(row.get('TransactionStatusInformation'), 1000, allow_null=True),  # 87: TRANSACTION_STATUS_INFORMATION
-                safe_string(row.get('TrackingCode'), 1000, allow_null=True),  # 88: TRACKING_CODE
-                safe_string(row.get('DiscountGLCode'), 1000, allow_null=True),  # 89: DISCOUNT_GL_CODE
-                safe_string(row.get('OverrideTrackingCategory1'), 1000, allow_null=True),  # 90: OVERRIDE_TRACKING_CATEGORY1
-                safe_string(row.get('OverrideTrackingCategory2'), 1000, allow_null=True),  # 91: OVERRIDE_TRACKING_CATEGORY2
-                safe_string(row.get('QuickbooksPaymentId'), 1000, allow_null=True),  # 92: QUICKBOOKS_PAYMENT_ID
-                safe_bool_as_int(row.get('AllowTotalPriceEntry'), 0),  # 93: ALLOW_TOTAL_PRICE_ENTRY
-                safe_bool_as_int(row.get('AddedAutomatically'), 0),  # 94: ADDED_AUTOMATICALLY
-                safe_datetime(row.get('AllocationPerformedDate')),  # 95: ALLOCATION_PERFORMED_DATE (TIMESTAMP)
-                safe_datetime(row.get('CreatedDate'))  # 96: CREATED_DATE (TIMESTAMP)
-            )
-            invoice_items.append(invoice_item_data)
-        except Exception as e:
-            logger.warning(f"Error parsing invoice item row {row.get('Id', 'Unknown')}: {e}")
-            logger.warning(f"Problematic row data: {row}")
-            continue
+    This function:
+    1. Finds and downloads the latest ZIP file from S3
+    2. Extracts only the target CSV files (marina-related data)
+    3. Parses each CSV file into database-ready format
+    4. Uses INSERT operations into staging tables to synchronize data without duplication
+    5. Optionally validates field-level data integrity (if enabled)
     
-    logger.info(f"✅ Parsed {len(invoice_items):,} invoice items total")
-    if invoice_items:
-        logger.info(f"Number of columns in parsed data: {len(invoice_items[0])}")
-    sys.stdout.flush()
-    return invoice_items
-
-
-def parse_transactions_data(csv_content):
-    """
-    Parse transactions CSV data with robust numeric field handling.
-    
-    Args:
-        csv_content (str): Raw CSV content for transactions
-        
-    Returns:
-        list: List of tuples containing parsed transaction data
-    """
-    try:
-        reader = csv.DictReader(io.StringIO(csv_content))
-        parsed_data = []
-        
-        for row in reader:
-            try:
-                # Helper function to safely convert to number
-                def safe_number(value, default=None):
-                    if not value or str(value).strip().upper() in ['NULL', 'N/A', '', 'NONE']:
-                        return default
-                    try:
-                        # Handle decimal values
-                        if '.' in str(value):
-                            return float(value)
-                        return int(value)
-                    except (ValueError, TypeError):
-                        return default
-                
-                # Helper function to safely convert to integer
-                def safe_int(value, default=None):
-                    if not value or str(value).strip().upper() in ['NULL', 'N/A', '', 'NONE']:
-                        return default
-                    try:
-                        return int(float(value))  # Handle "1.0" format
-                    except (ValueError, TypeError):
-                        return default
-                
-                # Helper function to safely convert to float
-                def safe_float(value, default=None):
-                    if not value or str(value).strip().upper() in ['NULL', 'N/A', '', 'NONE']:
-                        return default
-                    try:
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return default
-                
-                # Helper function to safely convert boolean-like fields
-                def safe_bool_as_int(value, default=0):
-                    if not value or str(value).strip().upper() in ['NULL', 'N/A', '', 'NONE']:
-                        return default
-                    try:
-                        val_str = str(value).strip().upper()
-                        if val_str in ['TRUE', '1', 'YES', 'Y']:
-                            return 1
-                        elif val_str in ['FALSE', '0', 'NO', 'N']:
-                            return 0
-                        else:
-                            return int(float(value))
-                    except (ValueError, TypeError):
-                        return default
-                
-                # Helper function to safely handle strings
-                def safe_string(value, max_length=None):
-                    if not value:
-                        return None
-                    result = str(value).strip()
-                    if max_length and len(result) > max_length:
-                        result = result[:max_length]
-                    return result if result else None
-                
-                parsed_row = (
-                    safe_int(row.get('Id')),
-                    safe_int(row.get('MarinaLocationId')),
-                    parse_datetime(row.get('CreationTime')),
-                    safe_int(row.get('InvoiceId')),
-                    safe_int(row.get('TransactionTypeId')),
-                    safe_int(row.get('TransactionMethodId')),
-                    safe_float(row.get('Value')),
-                    safe_bool_as_int(row.get('IsRefunded')),
-                    safe_string(row.get('CustomerIPAddress'), 1000),
-                    safe_string(row.get('CustomerDevice'), 1000),
-                    safe_string(row.get('RefundReason'), 1000),
-                    safe_string(row.get('Aux'), 1000),
-                    safe_string(row.get('CheckNumber'), 1000),
-                    safe_string(row.get('CCType'), 1000),
-                    safe_int(row.get('InvoiceItemId')),
-                    safe_bool_as_int(row.get('SentToXero')),
-                    safe_string(row.get('OverpaymentID'), 1000),
-                    safe_bool_as_int(row.get('PaymentCollectedOffline')),
-                    safe_bool_as_int(row.get('PartOfOverpayment')),
-                    safe_string(row.get('PrepaymentID'), 1000),
-                    safe_int(row.get('AccountTransaction_Transaction_Id')),
-                    safe_int(row.get('Payment_Id')),
-                    parse_datetime(row.get('CreationDate')),
-                    safe_string(row.get('AspNetUser_Id'), 256),
-                    safe_string(row.get('HashID'), 1000),
-                    safe_int(row.get('CustomTransactionMethodsId')),
-                    safe_string(row.get('Reference'), 1000),
-                    safe_bool_as_int(row.get('IsVoid')),
-                    safe_float(row.get('AmountRefunded')),
-                    safe_int(row.get('StripeTransactionDataId')),
-                    safe_string(row.get('PaymentIntentId'), 1000),
-                    safe_bool_as_int(row.get('SentToPayout')),
-                    safe_int(row.get('StripeAuthorizations_Id')),
-                    safe_int(row.get('StripeResponse_Id')),
-                    safe_string(row.get('StripeReaderSerialNumber'), 1000),
-                    safe_string(row.get('StripeTerminalId'), 1000),
-                    safe_bool_as_int(row.get('CreatedOnMobile')),
-                    safe_float(row.get('OnlinePercentFee')),
-                    safe_float(row.get('OnlineFeeAmount')),
-                    safe_bool_as_int(row.get('ScheduledForOnlineFeeCron')),
-                    safe_int(row.get('OnlinePaymentFee_Id')),
-                    safe_string(row.get('BankName'), 1000),
-                    safe_string(row.get('Last4'), 1000),
-                    safe_int(row.get('StripeBankAccountId')),
-                    safe_int(row.get('StripeBatchId')),
-                    safe_string(row.get('RoutingNumber'), 1000),
-                    safe_bool_as_int(row.get('FullyRefunded')),
-                    parse_datetime(row.get('LastUpdated')),
-                    safe_string(row.get('PaymentSource'), 1000)
-                )
-                
-                parsed_data.append(parsed_row)
-                
-            except Exception as e:
-                logger.warning(f"Skipping invalid transaction row: {e}")
-                continue
-                
-        logger.info(f"Successfully parsed {len(parsed_data)} transaction records")
-        return parsed_data
-        
-    except Exception as e:
-        logger.error(f"Failed to parse transactions data: {e}")
-        return []
-
-
-def parse_item_masters_data(csv_content):
-    """
-    Parse ItemMasters CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing item master data for database insertion
-    """
-    def safe_int(value, default=0):
-        """Safely convert value to integer with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            # Handle "1.0" format integers
-            if isinstance(value, str) and '.' in value:
-                float_val = float(value.strip())
-                if float_val.is_integer():
-                    return int(float_val)
-            return int(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_float(value, default=0.0):
-        """Safely convert value to float with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        try:
-            return float(str(value).strip())
-        except (ValueError, TypeError):
-            return default
-
-    def safe_bool_as_int(value, default=0):
-        """Safely convert boolean value to integer (1/0) with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return default
-        str_value = str(value).strip().upper()
-        if str_value in ['TRUE', '1', 'YES', 'Y']:
-            return 1
-        elif str_value in ['FALSE', '0', 'NO', 'N']:
-            return 0
-        else:
-            return default
-
-    def safe_string(value, max_length=None, allow_null=False):
-        """Safely convert value to string with optional length limit and NULL handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None if allow_null else ''
-        result = str(value).strip()
-        return result[:max_length] if max_length else result
-
-    def safe_datetime(value):
-        """Safely convert value to datetime with robust error handling."""
-        if value is None or str(value).strip() in ['', 'NULL', 'N/A', 'NONE']:
-            return None
-        try:
-            from datetime import datetime
-            str_value = str(value).strip()
-            # Try parsing common datetime formats (including MM/DD/YYYY for Molo exports)
-            for fmt in [
-                '%m/%d/%Y %H:%M:%S',  # MM/DD/YYYY HH:MM:SS (Molo format)
-                '%Y-%m-%d %H:%M:%S',  # YYYY-MM-DD HH:MM:SS
-                '%Y-%m-%dT%H:%M:%S',  # ISO format
-                '%m/%d/%Y',           # MM/DD/YYYY date only
-                '%Y-%m-%d'            # YYYY-MM-DD date only
-            ]:
-                try:
-                    return datetime.strptime(str_value, fmt)
-                except ValueError:
-                    continue
-            return None
-        except Exception:
-            return None
-
-    item_masters = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            item_master_data = (
-                safe_string(row.get('Id'), allow_null=False) or '',  # 1
-                safe_string(row.get('Name'), 255, allow_null=False) or 'Unknown Item',  # 2
-                safe_float(row.get('Amount'), 0.0),  # 3
-                safe_int(row.get('ItemChargeMethodId'), 0),  # 4
-                safe_bool_as_int(row.get('Taxable'), 0),  # 5
-                safe_bool_as_int(row.get('AvailableAsAddOn'), 0),  # 6
-                safe_int(row.get('MarinaLocationId'), 0),  # 7
-                safe_float(row.get('Price'), 0.0),  # 8
-                safe_float(row.get('Tax'), 0.0),  # 9
-                safe_bool_as_int(row.get('Single'), 0),  # 10
-                safe_string(row.get('ChargeCategory'), 100, allow_null=False) or '',  # 11
-                safe_bool_as_int(row.get('AmountIsDecimal'), 0),  # 12
-                safe_int(row.get('NumberOfDecimals'), 0),  # 13
-                safe_string(row.get('ItemShortName'), 100, allow_null=False) or '',  # 14
-                safe_string(row.get('ItemCode'), 100, allow_null=False) or '',  # 15
-                safe_bool_as_int(row.get('TrackedInventory'), 0),  # 16
-                safe_float(row.get('QuantityOnHand'), 0.0),  # 17
-                safe_float(row.get('PurchasePrice'), 0.0),  # 18
-                safe_string(row.get('FirstTrackingCategory'), 255, allow_null=False) or '',  # 19
-                safe_string(row.get('SecondTrackingCategory'), 255, allow_null=False) or '',  # 20
-                safe_string(row.get('XeroID'), 255, allow_null=False) or '',  # 21
-                safe_float(row.get('SaleFrequency'), 0.0),  # 22
-                safe_float(row.get('LowQuantityWarning'), 0.0),  # 23
-                safe_int(row.get('MarinaLocation1Id'), None),  # 24
-                safe_int(row.get('MarinaLocation2Id'), None),  # 25
-                safe_int(row.get('PedestalId'), None),  # 26
-                safe_int(row.get('Pedestal1Id'), None),  # 27
-                safe_int(row.get('QbItemId'), None),  # 28
-                safe_int(row.get('XeroItemId'), None),  # 29
-                safe_string(row.get('Barcode'), 100, allow_null=True),  # 30
-                safe_bool_as_int(row.get('DistributeToOwners'), 0),  # 31
-                safe_string(row.get('FuelCloudProductId'), 100, allow_null=True),  # 32
-                safe_string(row.get('HashId'), 50, allow_null=False) or '',  # 33
-                safe_bool_as_int(row.get('RequiresAgeVerification'), 0),  # 34
-                safe_int(row.get('MinimumAge'), None),  # 35
-                safe_datetime(row.get('CreationDateTime')),  # 36 - DATETIME FIELD!
-                safe_string(row.get('CreationAspNetUserId'), 256, allow_null=True),  # 37
-                safe_int(row.get('RecordStatusId'), 0),  # 38
-                safe_string(row.get('UpdateHash'), 100, allow_null=True),  # 39
-                safe_bool_as_int(row.get('SubletItem'), 0),  # 40
-                safe_int(row.get('InternalRevenueXeroAccountId'), None),  # 41
-                safe_int(row.get('InternalCogsXeroAccountId'), None),  # 42
-                safe_int(row.get('WipXeroAccountId'), None),  # 43
-                safe_int(row.get('InventoryRevaluationId'), None),  # 44
-                safe_int(row.get('MarinaLocation6Id'), None),  # 45
-                safe_string(row.get('FinaleProductUrl'), 500, allow_null=True),  # 46
-                safe_string(row.get('RevenueGLCode'), 50, allow_null=True),  # 47
-                safe_string(row.get('CogsGLCode'), 50, allow_null=True),  # 48
-                safe_string(row.get('InventoryGLCode'), 50, allow_null=True),  # 49
-                safe_string(row.get('ARGLCode'), 50, allow_null=True),  # 50
-                safe_string(row.get('SalesTaxGLCode'), 50, allow_null=True),  # 51
-                safe_bool_as_int(row.get('OnlyUseLast2Average'), 0),  # 52
-                safe_bool_as_int(row.get('DeferredRevenueRecognition'), 0),  # 53
-                safe_string(row.get('DeferredRecognitionGLCode'), 50, allow_null=True),  # 54
-                safe_string(row.get('TrackingCode'), 100, allow_null=True),  # 55
-                safe_bool_as_int(row.get('AddDescriptionToInvoiceNote'), 0),  # 56
-                safe_int(row.get('MarinaLocation7Id'), None),  # 57
-                safe_bool_as_int(row.get('IgnoreInventoryQoh'), 0),  # 58
-                safe_float(row.get('QohCommitted'), 0.0),  # 59
-                safe_float(row.get('QohOnOrder'), 0.0),  # 60
-                safe_bool_as_int(row.get('AllowTotalPriceEntry'), 0),  # 61
-                safe_int(row.get('MarinaLocation9Id'), None),  # 62
-                safe_bool_as_int(row.get('AllowPostingToNonIncomeAccounts'), 0),  # 63
-                safe_int(row.get('OrderColumn'), None),  # 64
-                safe_bool_as_int(row.get('EnableNegativeInventory'), 0),  # 65
-                safe_float(row.get('Wip'), 0.0)  # 66
-            )
-            
-            # DEBUG: Log CreationDateTime for first 3 rows
-            if len(item_masters) < 3:
-                creation_dt_raw = row.get('CreationDateTime')
-                creation_dt_parsed = item_master_data[35]  # Position 36 (0-indexed)
-                logger.info(f"DEBUG ItemMaster ID={row.get('Id')}: CreationDateTime raw='{creation_dt_raw}' parsed={creation_dt_parsed}")
-            
-            item_masters.append(item_master_data)
-        except Exception as e:
-            logger.warning(f"Error parsing item master row {row.get('Id', 'Unknown')}: {e}")
-            logger.warning(f"Problematic row data: {row}")
-            continue
-    
-    return item_masters
-
-
-def parse_seasonal_prices_data(csv_content):
-    """
-    Parse SeasonalPrices CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing seasonal price data for database insertion
-    """
-    seasonal_prices = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            seasonal_price_data = (
-                parse_int(row.get('Id', '')),
-                row.get('SeasonName', '').strip()[:255],
-                parse_datetime(row.get('StartDate', '')),
-                parse_datetime(row.get('EndDate', '')),
-                parse_int(row.get('SeasonalChargeMethodId', '')),
-                parse_float(row.get('PricePerFoot', '0')),
-                parse_float(row.get('FlatRate', '0')),
-                parse_boolean(row.get('Taxable', '')),  # Convert TRUE/FALSE to 1/0
-                parse_int(row.get('MarinaLocationId', '')),
-                parse_boolean(row.get('Active', '')),  # Convert TRUE/FALSE to 1/0
-                parse_float(row.get('Tax', '0')),
-                row.get('RateDetails', '').strip()[:500] if row.get('RateDetails') else '',
-                row.get('RateShortName', '').strip()[:100],
-                row.get('OnlinePaymentPlaceholder', '').strip()[:255],
-                row.get('XeroItemCode', '').strip()[:100],
-                row.get('XeroId', '').strip()[:255],
-                row.get('FirstTrackingCategory', '').strip()[:255],
-                row.get('SecondTrackingCategory', '').strip()[:255],
-                parse_int(row.get('SeasonalInvoicingMethod_Id', '')),
-                parse_datetime(row.get('CreationDateTime', '')),
-                row.get('AspNetUser_Id', '').strip()[:255],
-                row.get('CheckInTerms', '').strip()[:2000] if row.get('CheckInTerms') else '',
-                row.get('CheckOutTerms', '').strip()[:2000] if row.get('CheckOutTerms') else '',
-                row.get('OnlinePaymentCompletion', '').strip()[:500],
-                parse_int(row.get('DueDateDays', '')),
-                parse_int(row.get('DueDateSettings_Id', '')),
-                row.get('ChargeCategory', '').strip()[:100],
-                row.get('IntroText', '').strip()[:1000] if row.get('IntroText') else '',
-                row.get('RevenueGLCode', '').strip()[:50],
-                row.get('ARGLCode', '').strip()[:50],
-                row.get('SalesTaxGLCode', '').strip()[:50]
-            )
-            seasonal_prices.append(seasonal_price_data)
-        except Exception as e:
-            logger.warning(f"Error parsing seasonal price row: {e}")
-            continue
-    
-    return seasonal_prices
-
-
-def parse_transient_prices_data(csv_content):
-    """
-    Parse TransientPrices CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing transient price data for database insertion
-    """
-    # Helper function to safely parse datetime values with MM/DD/YYYY format support
-    def safe_datetime(value):
-        """Parse datetime with multiple format support including MM/DD/YYYY for Molo exports."""
-        if not value or value in ('', 'NULL', None):
-            return None
-        try:
-            # Try multiple datetime formats, including MM/DD/YYYY for Molo exports
-            for fmt in [
-                '%m/%d/%Y %H:%M:%S',  # MM/DD/YYYY HH:MM:SS (Molo format)
-                '%Y-%m-%d %H:%M:%S',  # YYYY-MM-DD HH:MM:SS
-                '%Y-%m-%dT%H:%M:%S',  # ISO format
-                '%m/%d/%Y',           # MM/DD/YYYY date only
-                '%Y-%m-%d'            # YYYY-MM-DD date only
-            ]:
-                try:
-                    return datetime.strptime(str(value).strip(), fmt)
-                except ValueError:
-                    continue
-            return None
-        except:
-            return None
-    
-    transient_prices = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            transient_price_data = (
-                parse_int(row.get('Id', '')),                                           # 1
-                safe_datetime(row.get('StartDate')),                                    # 2
-                safe_datetime(row.get('EndDate')),                                      # 3
-                parse_float(row.get('Fee', '0')),                                       # 4
-                row.get('RateName', '').strip()[:1000] if row.get('RateName') else '',  # 5
-                parse_int(row.get('TransientChargeMethodId', '')),                      # 6
-                parse_int(row.get('MarinaLocationId', '')),                             # 7
-                parse_boolean(row.get('Taxable', '')),                                  # 8
-                parse_float(row.get('Tax', '0')),                                       # 9
-                row.get('RateDetails', '').strip()[:1000] if row.get('RateDetails') else '',  # 10
-                row.get('RateShortName', '').strip()[:1000] if row.get('RateShortName') else '',  # 11
-                row.get('OnlinePaymentPlaceholder', '').strip()[:1000] if row.get('OnlinePaymentPlaceholder') else '',  # 12
-                row.get('XeroItemCode', '').strip()[:1000] if row.get('XeroItemCode') else '',  # 13
-                row.get('XeroID', '').strip()[:1000] if row.get('XeroID') else '',      # 14
-                parse_int(row.get('FirstTrackingCategory', '')),                        # 15
-                parse_int(row.get('SecondTrackingCategory', '')),                       # 16
-                parse_int(row.get('TransientInvoicingMethod_Id', '')),                  # 17
-                parse_int(row.get('SV_InventoryCategory_Id', '')),                      # 18
-                parse_int(row.get('SV_InventorySubCategory_Id', '')),                   # 19
-                safe_datetime(row.get('CreationDateTime')),                             # 20
-                row.get('AspNetUser_Id', '').strip()[:256] if row.get('AspNetUser_Id') else '',  # 21
-                row.get('CheckInTerms', '').strip()[:1000] if row.get('CheckInTerms') else '',  # 22
-                row.get('CheckOutTerms', '').strip()[:1000] if row.get('CheckOutTerms') else '',  # 23
-                row.get('OnlinePaymentCompletion', '').strip()[:1000] if row.get('OnlinePaymentCompletion') else '',  # 24
-                parse_int(row.get('DueDateDays', '')),                                  # 25
-                parse_int(row.get('DueDateSettings_Id', '')),                           # 26
-                row.get('HourlyCalculation', '').strip()[:1000] if row.get('HourlyCalculation') else '',  # 27
-                parse_int(row.get('RoundMinutes', '')),                                 # 28
-                parse_int(row.get('MinimumHours', '')),                                 # 29
-                parse_int(row.get('NumHoursBlock', '')),                                # 30
-                row.get('ChargeCategory', '').strip()[:1000] if row.get('ChargeCategory') else '',  # 31
-                row.get('IntroText', '').strip()[:1000] if row.get('IntroText') else '',  # 32
-                row.get('RevenueGLCode', '').strip()[:1000] if row.get('RevenueGLCode') else '',  # 33
-                row.get('ARGLCode', '').strip()[:1000] if row.get('ARGLCode') else '',  # 34
-                row.get('SalesTaxGLCode', '').strip()[:1000] if row.get('SalesTaxGLCode') else '',  # 35
-                safe_datetime(row.get('DeletionDatetime')),                             # 36
-                row.get('DeletionAspNetUser_Id', '').strip()[:256] if row.get('DeletionAspNetUser_Id') else '',  # 37
-                parse_int(row.get('RecordStatus_Id', '')),                              # 38
-                parse_int(row.get('RecurringInvoiceOptions_Id', '')),                   # 39
-                parse_boolean(row.get('Recurring', '')),                                # 40
-                row.get('TrackingCode', '').strip()[:1000] if row.get('TrackingCode') else '',  # 41
-                row.get('AlternateReservationName', '').strip()[:1000] if row.get('AlternateReservationName') else '',  # 42
-                parse_boolean(row.get('ResourceRate', '')),                             # 43
-                parse_int(row.get('QuantityCap', '')),                                  # 44
-                parse_boolean(row.get('AllowPostingToNonIncomeAccounts', ''))           # 45
-            )
-            transient_prices.append(transient_price_data)
-        except Exception as e:
-            logger.warning(f"Error parsing transient price row: {e}")
-            continue
-    
-    return transient_prices
-
-
-def parse_record_status_data(csv_content):
-    """
-    Parse RecordStatusSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing record status data for database insertion
-    """
-    record_statuses = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            record_status_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            record_statuses.append(record_status_data)
-        except Exception as e:
-            logger.warning(f"Error parsing record status row: {e}")
-            continue
-    
-    return record_statuses
-
-
-def parse_boat_types_data(csv_content):
-    """
-    Parse BoatTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing boat type data for database insertion
-    """
-    boat_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            boat_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            boat_types.append(boat_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing boat type row: {e}")
-            continue
-    
-    return boat_types
-
-
-def parse_power_needs_data(csv_content):
-    """
-    Parse PowerNeeds CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing power need data for database insertion
-    """
-    power_needs = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            power_need_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            power_needs.append(power_need_data)
-        except Exception as e:
-            logger.warning(f"Error parsing power need row: {e}")
-            continue
-    
-    return power_needs
-
-
-def parse_reservation_status_data(csv_content):
-    """
-    Parse ReservationStatus CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing reservation status data for database insertion
-    """
-    reservation_statuses = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            reservation_status_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            reservation_statuses.append(reservation_status_data)
-        except Exception as e:
-            logger.warning(f"Error parsing reservation status row: {e}")
-            continue
-    
-    return reservation_statuses
-
-
-def parse_reservation_types_data(csv_content):
-    """
-    Parse ReservationTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing reservation type data for database insertion
-    """
-    reservation_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            reservation_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            reservation_types.append(reservation_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing reservation type row: {e}")
-            continue
-    
-    return reservation_types
-
-
-def parse_contact_types_data(csv_content):
-    """
-    Parse ContactTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing contact type data for database insertion
-    """
-    contact_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            contact_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            contact_types.append(contact_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing contact type row: {e}")
-            continue
-    
-    return contact_types
-
-
-def parse_invoice_status_data(csv_content):
-    """
-    Parse InvoiceStatusSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing invoice status data for database insertion
-    """
-    invoice_statuses = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            invoice_status_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            invoice_statuses.append(invoice_status_data)
-        except Exception as e:
-            logger.warning(f"Error parsing invoice status row: {e}")
-            continue
-    
-    return invoice_statuses
-
-
-def parse_invoice_types_data(csv_content):
-    """
-    Parse InvoiceTypeSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing invoice type data for database insertion
-    """
-    invoice_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            invoice_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            invoice_types.append(invoice_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing invoice type row: {e}")
-            continue
-    
-    return invoice_types
-
-
-def parse_transaction_types_data(csv_content):
-    """
-    Parse TransactionTypeSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing transaction type data for database insertion
-    """
-    transaction_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            transaction_type_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            transaction_types.append(transaction_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing transaction type row: {e}")
-            continue
-    
-    return transaction_types
-
-
-def parse_transaction_methods_data(csv_content):
-    """
-    Parse TransactionMethodSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing transaction method data for database insertion
-    """
-    transaction_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            transaction_method_data = (
-                row.get('Id', '').strip(),
-                row.get('Name', '').strip()[:255]
-            )
-            transaction_methods.append(transaction_method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing transaction method row: {e}")
-            continue
-    
-    return transaction_methods
-
-
-def parse_insurance_data(csv_content):
-    """
-    Parse InsuranceSet CSV content into database-ready format.
-    Maps to STG_MOLO_INSURANCE table structure.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing insurance data for database insertion
-    """
-    insurance_records = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            insurance_data = (
-                row.get('Id', '').strip()[:10] if row.get('Id', '').strip() else None,
-                row.get('Provider', '').strip()[:1000] if row.get('Provider', '').strip() else None,
-                row.get('ListedIndividual', '').strip()[:1000] if row.get('ListedIndividual', '').strip() else None,
-                row.get('AccountNumber', '').strip()[:1000] if row.get('AccountNumber', '').strip() else None,
-                row.get('PolicyNumber', '').strip()[:1000] if row.get('PolicyNumber', '').strip() else None,
-                row.get('GroupNumber', '').strip()[:1000] if row.get('GroupNumber', '').strip() else None,
-                float(row.get('LiabilityMaximum')) if row.get('LiabilityMaximum', '').strip() else None,
-                parse_datetime(row.get('EffectiveDate', '')),
-                parse_datetime(row.get('ExpirationDate', '')),
-                row.get('Notes', '').strip()[:1000] if row.get('Notes', '').strip() else None,
-                row.get('CreationUser', '').strip()[:1000] if row.get('CreationUser', '').strip() else None,
-                parse_datetime(row.get('CreationDateTime', '')),
-                row.get('LastEditUser', '').strip()[:1000] if row.get('LastEditUser', '').strip() else None,
-                parse_datetime(row.get('LastEditDateTime', '')),
-                row.get('DeleteUser', '').strip()[:1000] if row.get('DeleteUser', '').strip() else None,
-                parse_datetime(row.get('DeleteDateTime', '')),
-                row.get('InsuranceStatus_Id', '').strip()[:10] if row.get('InsuranceStatus_Id', '').strip() else None,
-                row.get('Boat_Id', '').strip()[:10] if row.get('Boat_Id', '').strip() else None,
-                row.get('HashID', '').strip()[:1000] if row.get('HashID', '').strip() else None
-            )
-            insurance_records.append(insurance_data)
-        except Exception as e:
-            logger.warning(f"Error parsing insurance row: {e}")
-            continue
-    
-    return insurance_records
-
-
-def parse_equipment_data(csv_content):
-    """
-    Parse Equipment CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing equipment data for database insertion
-    """
-    equipment_records = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            equipment_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100],
-                row.get('Description', '').strip()[:500],
-                row.get('EquipmentTypeId', '').strip()[:10],
-                row.get('FuelTypeId', '').strip()[:10],
-                row.get('Model', '').strip()[:50],
-                row.get('Manufacturer', '').strip()[:50],
-                int(row.get('YearBuilt', 0)) if row.get('YearBuilt') else None,
-                row.get('SerialNumber', '').strip()[:50],
-                row.get('Location', '').strip()[:100]
-            )
-            equipment_records.append(equipment_data)
-        except Exception as e:
-            logger.warning(f"Error parsing equipment row: {e}")
-            continue
-    
-    return equipment_records
-
-
-def parse_account_status_data(csv_content):
-    """
-    Parse AccountStatusSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing account status data for database insertion
-    """
-    account_statuses = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            status_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            account_statuses.append(status_data)
-        except Exception as e:
-            logger.warning(f"Error parsing account status row: {e}")
-            continue
-    
-    return account_statuses
-
-
-def parse_contact_auto_charge_data(csv_content):
-    """
-    Parse ContactAutoChargeSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing contact auto charge data for database insertion
-    """
-    auto_charges = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            charge_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            auto_charges.append(charge_data)
-        except Exception as e:
-            logger.warning(f"Error parsing contact auto charge row: {e}")
-            continue
-    
-    return auto_charges
-
-
-def parse_statements_preference_data(csv_content):
-    """
-    Parse StatementsPreferenceSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing statements preference data for database insertion
-    """
-    preferences = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            preference_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            preferences.append(preference_data)
-        except Exception as e:
-            logger.warning(f"Error parsing statements preference row: {e}")
-            continue
-    
-    return preferences
-
-
-def parse_invoice_item_types_data(csv_content):
-    """
-    Parse InvoiceItemTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing invoice item types data for database insertion
-    """
-    item_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            type_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            item_types.append(type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing invoice item type row: {e}")
-            continue
-    
-    return item_types
-
-
-def parse_payment_methods_data(csv_content):
-    """
-    Parse PaymentMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing payment methods data for database insertion
-    """
-    payment_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            payment_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing payment method row: {e}")
-            continue
-    
-    return payment_methods
-
-
-def parse_seasonal_charge_methods_data(csv_content):
-    """
-    Parse SeasonalChargeMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing seasonal charge methods data for database insertion
-    """
-    charge_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            charge_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing seasonal charge method row: {e}")
-            continue
-    
-    return charge_methods
-
-
-def parse_seasonal_invoicing_methods_data(csv_content):
-    """
-    Parse SeasonalInvoicingMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing seasonal invoicing methods data for database insertion
-    """
-    invoicing_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            invoicing_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing seasonal invoicing method row: {e}")
-            continue
-    
-    return invoicing_methods
-
-
-def parse_transient_charge_methods_data(csv_content):
-    """
-    Parse TransientChargeMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing transient charge methods data for database insertion
-    """
-    charge_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            charge_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing transient charge method row: {e}")
-            continue
-    
-    return charge_methods
-
-
-def parse_transient_invoicing_methods_data(csv_content):
-    """
-    Parse TransientInvoicingMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing transient invoicing methods data for database insertion
-    """
-    invoicing_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            invoicing_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing transient invoicing method row: {e}")
-            continue
-    
-    return invoicing_methods
-
-
-def parse_recurring_invoice_options_data(csv_content):
-    """
-    Parse RecurringInvoiceOptions CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing recurring invoice options data for database insertion
-    """
-    options = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            option_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            options.append(option_data)
-        except Exception as e:
-            logger.warning(f"Error parsing recurring invoice option row: {e}")
-            continue
-    
-    return options
-
-
-def parse_due_date_settings_data(csv_content):
-    """
-    Parse DueDateSettings CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing due date settings data for database insertion
-    """
-    settings = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            setting_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            settings.append(setting_data)
-        except Exception as e:
-            logger.warning(f"Error parsing due date setting row: {e}")
-            continue
-    
-    return settings
-
-
-def parse_item_charge_methods_data(csv_content):
-    """
-    Parse ItemChargeMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing item charge methods data for database insertion
-    """
-    charge_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            charge_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing item charge method row: {e}")
-            continue
-    
-    return charge_methods
-
-
-def parse_insurance_status_data(csv_content):
-    """
-    Parse InsuranceStatusSet CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing insurance status data for database insertion
-    """
-    statuses = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            status_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            statuses.append(status_data)
-        except Exception as e:
-            logger.warning(f"Error parsing insurance status row: {e}")
-            continue
-    
-    return statuses
-
-
-def parse_equipment_types_data(csv_content):
-    """
-    Parse EquipmentTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing equipment types data for database insertion
-    """
-    types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            type_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            types.append(type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing equipment type row: {e}")
-            continue
-    
-    return types
-
-
-def parse_equipment_fuel_types_data(csv_content):
-    """
-    Parse EquipmentFuelTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing equipment fuel types data for database insertion
-    """
-    fuel_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            fuel_type_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            fuel_types.append(fuel_type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing equipment fuel type row: {e}")
-            continue
-    
-    return fuel_types
-
-
-def parse_vessel_engine_class_data(csv_content):
-    """
-    Parse VesselEngineClass CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing vessel engine class data for database insertion
-    """
-    engine_classes = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            class_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            engine_classes.append(class_data)
-        except Exception as e:
-            logger.warning(f"Error parsing vessel engine class row: {e}")
-            continue
-    
-    return engine_classes
-
-
-def parse_cities_data(csv_content):
-    """
-    Parse Cities CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing cities data for database insertion
-    """
-    cities = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            city_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            cities.append(city_data)
-        except Exception as e:
-            logger.warning(f"Error parsing city row: {e}")
-            continue
-    
-    return cities
-
-
-def parse_countries_data(csv_content):
-    """
-    Parse Countries CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing countries data for database insertion
-    """
-    countries = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            country_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            countries.append(country_data)
-        except Exception as e:
-            logger.warning(f"Error parsing country row: {e}")
-            continue
-    
-    return countries
-
-
-def parse_currencies_data(csv_content):
-    """
-    Parse Currencies CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing currencies data for database insertion
-    """
-    currencies = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            currency_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100],
-                row.get('Code', '').strip()[:10] if row.get('Code') else None,
-                row.get('Symbol', '').strip()[:10] if row.get('Symbol') else None
-            )
-            currencies.append(currency_data)
-        except Exception as e:
-            logger.warning(f"Error parsing currency row: {e}")
-            continue
-    
-    return currencies
-
-
-def parse_phone_types_data(csv_content):
-    """
-    Parse PhoneTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing phone types data for database insertion
-    """
-    phone_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            type_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            phone_types.append(type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing phone type row: {e}")
-            continue
-    
-    return phone_types
-
-
-def parse_address_types_data(csv_content):
-    """
-    Parse AddressTypes CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing address types data for database insertion
-    """
-    address_types = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            type_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            address_types.append(type_data)
-        except Exception as e:
-            logger.warning(f"Error parsing address type row: {e}")
-            continue
-    
-    return address_types
-
-
-def parse_installments_payment_methods_data(csv_content):
-    """
-    Parse InstallmentsPaymentMethods CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing installments payment methods data for database insertion
-    """
-    payment_methods = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            method_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            payment_methods.append(method_data)
-        except Exception as e:
-            logger.warning(f"Error parsing installments payment method row: {e}")
-            continue
-    
-    return payment_methods
-
-
-def parse_payments_provider_data(csv_content):
-    """
-    Parse PaymentsProvider CSV content into database-ready format.
-    
-    Args:
-        csv_content (str): Raw CSV content as string
-        
-    Returns:
-        list: List of tuples containing payments provider data for database insertion
-    """
-    providers = []
-    csv_reader = csv.DictReader(io.StringIO(csv_content))
-    
-    for row in csv_reader:
-        try:
-            provider_data = (
-                row.get('Id', '').strip()[:10],
-                row.get('Name', '').strip()[:100]
-            )
-            providers.append(provider_data)
-        except Exception as e:
-            logger.warning(f"Error parsing payments provider row: {e}")
-            continue
-    
-    return providers
-
-
-# =============================================================================
-# UTILITY FUNCTIONS
-# =============================================================================
-
-def parse_datetime(datetime_str):
-    """
-    Parse datetime string using multiple format attempts.
-    
-    Args:
-        datetime_str (str): Date/time string in various formats
-        
-    Returns:
-        datetime: Parsed datetime object, or None if parsing fails
-    """
-    if not datetime_str:
-        return None
-    
-    datetime_formats = [
-        '%m/%d/%Y %H:%M:%S',
-        '%Y-%m-%d %H:%M:%S',
-        '%m/%d/%Y %H:%M',
-        '%Y-%m-%d %H:%M'
-    ]
-    
-    for fmt in datetime_formats:
-        try:
-            return datetime.strptime(datetime_str, fmt)
-        except ValueError:
-            continue
-    
-    logger.warning(f"Could not parse datetime: {datetime_str}")
-    return None
-
-
-def parse_date(date_str):
-    """
-    Parse date string using multiple format attempts.
-    
-    Args:
-        date_str (str): Date string in various formats
-        
-    Returns:
-        datetime: Parsed datetime object, or None if parsing fails
-    """
-    if not date_str:
-        return None
-    
-    date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%m-%d-%Y']
-    
-    for fmt in date_formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    
-    logger.warning(f"Could not parse date: {date_str}")
-    return None
-
-
-def parse_float(value_str):
-    """
-    Parse float value with error handling.
-    
-    Args:
-        value_str (str): String representation of a float value
-        
-    Returns:
-        float: Parsed float value, or 0.0 if parsing fails
-    """
-    if not value_str:
-        return 0.0
-    
-    try:
-        return float(value_str)
-    except ValueError:
-        logger.warning(f"Could not parse float: {value_str}")
-        return 0.0
-
-
-def parse_int(value_str):
-    """
-    Parse integer value with error handling.
-    
-    Args:
-        value_str (str): String representation of an integer value
-        
-    Returns:
-        int or None: Parsed integer value, or None if empty/invalid
-    """
-    if not value_str or not value_str.strip():
-        return None
-    
-    try:
-        return int(value_str)
-    except ValueError:
-        logger.warning(f"Could not parse int: {value_str}")
-        return None
-
-
-def parse_boolean(value_str):
-    """
-    Parse boolean value from CSV (TRUE/FALSE strings) to database format (1/0).
-    
-    Args:
-        value_str (str): String representation of a boolean ("TRUE", "FALSE", "1", "0", etc.)
-        
-    Returns:
-        int or None: 1 for true, 0 for false, None if empty/invalid
-    """
-    if not value_str or not value_str.strip():
-        return None
-    
-    value_upper = value_str.strip().upper()
-    
-    if value_upper in ('TRUE', 'T', '1', 'YES', 'Y'):
-        return 1
-    elif value_upper in ('FALSE', 'F', '0', 'NO', 'N'):
-        return 0
-    else:
-        logger.warning(f"Could not parse boolean: {value_str}")
-        return None
-
-
-# =============================================================================
-# S3 OPERATIONS
-# =============================================================================
-
-def find_latest_zip_in_s3(s3_client, bucket, prefix=None):
-    """
-    Find the most recently modified .zip file in an S3 bucket.
-    
-    Args:
-        s3_client: Boto3 S3 client instance
-        bucket (str): S3 bucket name
-        prefix (str, optional): S3 key prefix to search within
-        
-    Returns:
-        str: Key of the latest .zip file, or None if none found
-    """
-    if prefix:
-        logger.info(f"Searching for latest .zip file in s3://{bucket}/{prefix}...")
-    else:
-        logger.info(f"Searching for latest .zip file in entire bucket s3://{bucket}...")
-    
-    try:
-        paginator = s3_client.get_paginator('list_objects_v2')
-        if prefix:
-            pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
-        else:
-            pages = paginator.paginate(Bucket=bucket)
-        
-        latest_zip_file = None
-        total_files_checked = 0
-        zip_files_found = 0
-        
-        for page in pages:
-            if "Contents" in page:
-                for obj in page['Contents']:
-                    total_files_checked += 1
-                    if obj['Key'].lower().endswith('.zip'):
-                        zip_files_found += 1
-                        if (latest_zip_file is None or 
-                            obj['LastModified'] > latest_zip_file['LastModified']):
-                            latest_zip_file = obj
-        
-        logger.info(
-            f"Checked {total_files_checked} total files, "
-            f"found {zip_files_found} .zip files"
-        )
-        
-        if latest_zip_file:
-            logger.info(
-                f"Found latest file: {latest_zip_file['Key']} "
-                f"(Last Modified: {latest_zip_file['LastModified']})"
-            )
-            return latest_zip_file['Key']
-        else:
-            logger.warning(f"No .zip files found in bucket '{bucket}'.")
-            return None
-            
-    except ClientError as e:
-        logger.exception(f"An error occurred accessing S3: {e}")
-        return None
-
-
-# =============================================================================
-# VALIDATION HELPER FUNCTION
-# =============================================================================
-
-def perform_table_validation(
-    validator,
-    csv_content,
-    table_name,
-    staging_table,
-    dw_table,
-    id_column,
-    key_columns,
-    validate_fields,
-    validate_merge_changes,
-    validation_sample_size,
-    record_count=None
-):
-    """
-    Perform field-level validation on imported table data.
-    
-    Args:
-        validator: DataValidator instance
-        csv_content: Raw CSV content
-        table_name: Display name for logging
-        staging_table: Staging table name (STG_MOLO_*)
-        dw_table: Data warehouse table name (DW_MOLO_*)
-        id_column: Primary key column name
-        key_columns: List of important columns to validate
-        validate_fields: Enable CSV vs DB validation
-        validate_merge_changes: Enable staging vs DW validation
-        validation_sample_size: Number of records to sample
-        record_count: Number of records inserted (optional)
-    """
-    if not validator:
-        return
-    
-    validation_issues = []
-    
-    # Log staging insert summary
-    if record_count:
-        try:
-            # Get staging table count
-            staging_count = validator._get_row_count(staging_table)
-            logger.info(
-                f"   📥 Staging: {record_count} records inserted "
-                f"({staging_count} total in {staging_table})"
-            )
-        except Exception as e:
-            logger.debug(f"Could not get staging count for {table_name}: {e}")
-    
-    # Validate CSV vs Database field values
-    if validate_fields:
-        try:
-            passed, issues = validator.validate_field_values(
-                csv_content=csv_content,
-                dw_table=dw_table,
-                id_column=id_column,
-                columns_to_check=key_columns,
-                sample_size=validation_sample_size
-            )
-            if not passed:
-                logger.warning(f"⚠️  Field validation issues in {table_name}:")
-                for issue in issues[:5]:  # Show first 5 issues
-                    logger.warning(f"    {issue}")
-                if len(issues) > 5:
-                    logger.warning(f"    ... and {len(issues) - 5} more issues")
-                validation_issues.extend(issues)
-        except Exception as e:
-            logger.warning(f"Field validation failed for {table_name}: {e}")
-    
-    # Validate staging vs DW after merge
-    if validate_merge_changes:
-        try:
-            passed, issues, stats = validator.validate_field_changes(
-                staging_table=staging_table,
-                dw_table=dw_table,
-                id_column=id_column,
-                columns_to_check=key_columns,
-                sample_size=validation_sample_size
-            )
-            if not passed:
-                logger.warning(
-                    f"⚠️  Merge validation for {table_name}: "
-                    f"{stats['records_with_changes']} records changed, "
-                    f"{stats['fields_changed']} fields modified"
-                )
-                for issue in issues[:3]:  # Show first 3 issues
-                    logger.warning(f"    {issue}")
-                if len(issues) > 3:
-                    logger.warning(f"    ... and {len(issues) - 3} more issues")
-                validation_issues.extend(issues)
-        except Exception as e:
-            logger.warning(f"Merge validation failed for {table_name}: {e}")
-    
-    return len(validation_issues) == 0
-
-
-# =============================================================================
-# MAIN PROCESSING FUNCTION
-# =============================================================================
-
-def read_s3_zip_and_insert_to_db(
-    bucket,
-    s3_prefix,
-    region,
-    db_user,
-    db_password,
-    db_dsn,
-    aws_access_key_id=None,
-    aws_secret_access_key=None,
-    validate_fields=False,
-    validate_merge_changes=False,
-    validation_sample_size=10
-):
-    """
-    Main processing function: Download latest ZIP from S3, extract target CSVs,
-    and synchronize data with Oracle database using INSERT operations into staging tables.
-    
-    This function:
-    1. Finds and downloads the latest ZIP file from S3
-    2. Extracts only the target CSV files (marina-related data)
-    3. Parses each CSV file into database-ready format
-    4. Uses INSERT operations into staging tables to synchronize data without duplication
-    5. Optionally validates field-level data integrity (if enabled)
+    With load_workers > 1 the tables are loaded concurrently over an Oracle
+    connection pool (see parallel_loader.py), largest first, honoring each
+    spec's depends_on.
+    
+    Each table's merge procedure runs exactly once (see merge_scheduler.py):
+    with merge_mode 'streamed' right after its staging load, with 'deferred'
+    in STEP 3 once every table is loaded, side by side in dependency order;
+    'auto' streams the tables the registry marks merge_inline and defers
+    the rest.
+    
+    With skip_unchanged, a table whose CSV member hashes to the digest in the
+    load manifest (see load_manifest.py) is not parsed, loaded or merged.
+    
+    With load_deltas, only rows that are new or changed since the last merged
+    snapshot (see row_delta.py) are inserted into staging, and keys that
+    disappeared from a CSV are recorded as deletes.
+    
+    With incremental, tables with a watermark_column only load rows edited
+    after their high-water mark minus watermark_overlap (see watermarks.py);
+    a table gets a full load when its last one is older than full_refresh_days.
+    
+    A ZIP whose key and ETag are in the processed-object ledger (see
+    object_ledger.py) is not downloaded again unless force is set; the
+    result then only reports 'already_processed'.
+    
+    Downloaded ZIPs are kept in the archive cache under archive_cache_dir
+    (see archive_cache.py), so a retry of the same object skips the
+    download. With from_local, the ZIP is read from that file or directory
+    instead and S3 is not accessed at all.
+    
+    Tables parsed in full are also kept in the parsed-table cache under
+    parsed_cache_dir (see parsed_cache.py); loading the same CSV again binds
+    the cached columns instead of running its parser.
+    
+    Every table's progress is checkpointed as it commits (see
+    checkpoints.py). With resume, a load of the same ZIP that failed or was
+    stopped continues where it left off: tables already loaded are skipped
+    and their staging tables are not truncated, and a partly loaded table
+    continues after its last committed batch.
+    
+    With bulk_mode 'append' or 'direct', the tables the registry marks
+    bulk_load load through the bulk-load engine (see bulk_load.py); the
+    others always load with conventional inserts. Direct Path Load needs
+    python-oracledb Thin mode, so with 'direct' every connection of the MOLO
+    pipeline is opened in Thin mode.
+    
+    Staging rows are bound batch_size rows at a time, or in arrays sized per
+    table from its row width, and committed per commit_mode (see
+    load_policy.py): after every batch, once per table, or once per run.
+    Commit per run loads every table on one connection with conventional
+    inserts and defers every merge; if any table fails, the staging load of
+    the whole run is rolled back and nothing is merged.
+    
+    With reject_bad_rows, a row the database rejects no longer fails its
+    table: it is quarantined in ETL_REJECTED_ROWS, or in quarantine_dir if
+    that table does not exist (see row_quarantine.py), and the other rows
+    are loaded and merged.
     
     Args:
         bucket (str): S3 bucket name
-        s3_prefix (str): S3 prefix (unused - searches entire bucket)
+        s3_prefix (str): S3 prefix the ZIP exports live under ('' for the bucket root)
         region (str): AWS region
         db_user (str): Oracle database username
         db_password (str): Oracle database password
@@ -3034,95 +2124,220 @@ def read_s3_zip_and_insert_to_db(
         validate_fields (bool): Enable field-level validation (CSV vs DB comparison)
         validate_merge_changes (bool): Enable staging vs DW merge validation
         validation_sample_size (int): Number of records to sample for field validation (default: 10)
-    """
+        load_workers (int): Tables loaded at the same time (1 = one connection, registry order)
+        skip_unchanged (bool): Skip tables whose CSV matches the last successful load
+        load_deltas (bool): Stage only new and changed rows (False loads every row)
+        incremental (bool): Skip rows not edited since the table's high-water mark
+        watermark_overlap (timedelta): Safety overlap subtracted from the mark
+        full_refresh_days (int): Days between full loads of an incremental table
+        force (bool): Process the latest ZIP even if it was already processed
+        download_workers (int): Byte ranges of the ZIP downloaded at the same time
+        archive_cache_dir (str): Archive cache directory (None disables the cache)
+        archive_cache_gb (float): Size bound of the archive cache in GB
+        from_local (str): Replay this local ZIP, or the newest one in this directory
+        parsed_cache_dir (str): Parsed-table cache directory (None disables the cache)
+        resume (bool): Continue the interrupted load of the latest ZIP
+        merge_mode (str): 'auto', 'streamed' or 'deferred' merges
+        bulk_mode (str): 'conventional', 'append' or 'direct' loads of the bulk_load tables
+        commit_mode (str): 'auto', 'batch', 'table' or 'run' commits of the staging loads
+        batch_size (int): Rows per executemany() call (None tunes it per table)
+        reject_bad_rows (bool): Quarantine rows the database rejects instead of
+                                failing their table
+        quarantine_dir (str): Directory for rejected rows without ETL_REJECTED_ROWS
+    """
+    # A run committed as a whole is one transaction: it needs a single
+    # connection, and merge procedures and bulk arrays commit by themselves
+    load_policy = LoadPolicy(commit_mode, batch_size)
+    if load_policy.commit == PER_RUN:
+        if load_workers > 1 or merge_mode != DEFERRED or bulk_mode != CONVENTIONAL:
+            logger.info(
+                "💾 Commit per run: tables load on one connection with conventional "
+                "inserts, and every merge is deferred"
+            )
+        load_workers, merge_mode, bulk_mode = 1, DEFERRED, CONVENTIONAL
+    # Instant Client (Thick mode) has no Direct Path Load interface
+    thin = bulk_mode == DIRECT
+    
     latest_zip_key = None
+    zip_spool = None
+    zip_archive = None
+    pool = None
     
     try:
-        # Initialize S3 client with appropriate credentials
-        if aws_access_key_id and aws_secret_access_key:
-            logger.info("Using AWS credentials provided from OCI Vault.")
-            s3_client = boto3.client(
-                's3',
-                region_name=region,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key
+        # Connect to Oracle database. With several load workers each table
+        # gets its own pooled session; one more session runs the truncate
+        # and the final merges
+        if load_workers > 1:
+            pool = OracleConnector.create_pool(
+                db_user, db_password, db_dsn, load_workers + 1, thin=thin
             )
+            db = OracleConnector.from_pool(pool, load_policy)
+            connect = partial(OracleConnector.from_pool, pool, load_policy)
         else:
-            logger.info(
-                "Using Boto3's default credential discovery "
-                "(~/.aws/credentials or IAM roles)."
-            )
-            s3_client = boto3.client('s3', region_name=region)
-
-        # Find the latest ZIP file in the bucket
-        latest_zip_key = find_latest_zip_in_s3(s3_client, bucket)
-        if not latest_zip_key:
-            return
+            db = OracleConnector(db_user, db_password, db_dsn, load_policy, thin=thin)
+            connect = partial(nullcontext, db)
+
+        ledger = ProcessedObjectLedger('MOLO')
+        zip_etag = None
+        if from_local:
+            # Replay a local archive: S3 is not accessed and the ledger is
+            # neither checked nor updated
+            latest_zip_key = find_local_archive(from_local, MOLO_BACKUP_KEYS)
+            if not latest_zip_key:
+                logger.error(f"No MOLO .zip archive found in {from_local}")
+                db.close()
+                return
+            logger.info(f"📂 Replaying local archive {latest_zip_key} (S3 is not accessed)")
+            zip_spool = open(latest_zip_key, 'rb')
+        else:
+            # Initialize S3 client with appropriate credentials
+            if aws_access_key_id and aws_secret_access_key:
+                logger.info("Using AWS credentials provided from OCI Vault.")
+                s3_client = boto3.client(
+                    's3',
+                    region_name=region,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key
+                )
+            else:
+                logger.info(
+                    "Using Boto3's default credential discovery "
+                    "(~/.aws/credentials or IAM roles)."
+                )
+                s3_client = boto3.client('s3', region_name=region)
 
-        # Download the ZIP file from S3
-        logger.info(f"Connecting to S3 in region: {region}...")
-        logger.info(
-            f"Attempting to download '{latest_zip_key}' from bucket '{bucket}'..."
-        )
+            # Find the latest ZIP file, listing only the keys after the last one loaded
+            latest_zip_key = find_latest_zip_in_s3(
+                s3_client, bucket, s3_prefix,
+                start_after=ledger.last_key(db, bucket, s3_prefix or '')
+            )
+            if not latest_zip_key:
+                db.close()
+                return
+
+            # Stop here if this exact object (key and ETag) was already loaded
+            zip_etag = object_etag(s3_client, bucket, latest_zip_key)
+            processed_at = ledger.processed_at(db, bucket, latest_zip_key, zip_etag)
+            if processed_at is not None:
+                if not force:
+                    logger.info(
+                        f"⏭️  s3://{bucket}/{latest_zip_key} (ETag {zip_etag}) was already "
+                        f"processed at {processed_at} - nothing to do (use --force to reload)"
+                    )
+                    db.close()
+                    return {
+                        'already_processed': True,
+                        'zip_file': latest_zip_key,
+                        'processed_at': str(processed_at)
+                    }
+                logger.info(f"🔁 --force: reprocessing {latest_zip_key} (processed at {processed_at})")
+
+            # A retry or backfill of the same object reads it from the archive cache
+            cache = ArchiveCache.open(archive_cache_dir, archive_cache_gb)
+            cached_zip = cache.lookup(zip_etag, latest_zip_key) if cache else None
+            if cached_zip:
+                zip_spool = open(cached_zip, 'rb')
+            else:
+                # Download the ZIP file from S3
+                logger.info(f"Connecting to S3 in region: {region}...")
+                logger.info(
+                    f"Attempting to download '{latest_zip_key}' from bucket '{bucket}'..."
+                )
 
-        response = s3_client.get_object(Bucket=bucket, Key=latest_zip_key)
-        zip_content = response['Body'].read()
-        logger.info(
-            f"Successfully downloaded '{latest_zip_key}' from S3 bucket '{bucket}'."
-        )
+                # Spool the archive to a temporary file rather than reading it into
+                # memory; members are then decompressed one at a time during STEP 2
+                zip_spool = spool_s3_object(
+                    s3_client, bucket, latest_zip_key, download_workers, zip_etag
+                )
+                zip_size_mb = os.fstat(zip_spool.fileno()).st_size / (1024 * 1024)
+                logger.info(
+                    f"Successfully downloaded '{latest_zip_key}' from S3 bucket '{bucket}' "
+                    f"({zip_size_mb:.2f} MB spooled to disk)."
+                )
+                if cache:
+                    cache.store(zip_etag, latest_zip_key, zip_spool)
 
-        # Extract target CSV files from the ZIP archive
-        extracted_csv_data = {}
+        # Locate target CSV members in the ZIP archive (nothing is extracted yet)
+        target_members = {}
         
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
-            logger.info(f"Archive contents: {z.namelist()}")
-            
-            for filename in z.namelist():
-                if filename.lower().endswith('.csv'):
-                    # Extract base filename without extension for matching
-                    base_name = os.path.splitext(os.path.basename(filename))[0]
-                    
-                    # Check if this CSV file is one of our targets
-                    if base_name in TARGET_CSV_FILES:
-                        logger.info(
-                            f"Found target CSV file '{filename}' in the zip archive."
-                        )
-                        csv_content = z.read(filename).decode('utf-8')
-                        extracted_csv_data[base_name] = csv_content
-                    else:
-                        logger.info(
-                            f"Skipping CSV file '{filename}' (not in target list)."
-                        )
+        zip_archive = zipfile.ZipFile(zip_spool)
+        logger.info(f"Archive contents: {zip_archive.namelist()}")
+        
+        for member in zip_archive.infolist():
+            filename = member.filename
+            if filename.lower().endswith('.csv'):
+                # Extract base filename without extension for matching
+                base_name = os.path.splitext(os.path.basename(filename))[0]
+                
+                # Check if this CSV file is one of our targets
+                if base_name in TARGET_CSV_FILES:
+                    logger.info(
+                        f"Found target CSV file '{filename}' in the zip archive."
+                    )
+                    target_members[base_name] = member
+                else:
+                    logger.info(
+                        f"Skipping CSV file '{filename}' (not in target list)."
+                    )
 
         # Validate that we found the expected CSV files
-        if not extracted_csv_data:
+        if not target_members:
             logger.warning(
                 "None of the target CSV files were found in the zip archive."
             )
             logger.info(f"Looking for: {TARGET_CSV_FILES}")
+            db.close()
             return
 
         logger.info(
-            f"Successfully extracted {len(extracted_csv_data)} target CSV files: "
-            f"{list(extracted_csv_data.keys())}"
+            f"Found {len(target_members)} target CSV files: "
+            f"{list(target_members.keys())}"
+        )
+        
+        # Content digests of the last successful load per table
+        manifest = LoadManifest.load(db, 'MOLO')
+        if not skip_unchanged:
+            logger.info("🔁 Full reload requested - unchanged tables are loaded too")
+        
+        # Primary key -> row digest snapshots of the last merged load per table
+        snapshots = RowSnapshotStore.open(db, 'MOLO')
+        
+        # Newest last-edited timestamp merged per table
+        watermarks = WatermarkStore.load(db, 'MOLO', watermark_overlap, full_refresh_days)
+        
+        # Typed columns of tables parsed before, by CSV content hash
+        parsed_cache = ParsedTableCache.open(parsed_cache_dir, 'MOLO')
+        
+        # Per-table and per-batch progress, to resume an interrupted load
+        journal = CheckpointJournal.open(
+            db, 'MOLO',
+            os.path.basename(latest_zip_key) if from_local else latest_zip_key,
+            zip_etag, resume=resume
         )
         
-        # Connect to Oracle database for all operations
-        db = OracleConnector(db_user, db_password, db_dsn)
+        # Rows the database rejects are set aside instead of failing their table
+        quarantine = None
+        if reject_bad_rows:
+            quarantine = RowQuarantine.open(db, 'MOLO', journal.object_key, quarantine_dir)
+            load_policy.quarantine = quarantine
         
-        # Initialize validator if validation is enabled
-        validator = None
+        # Validators are created per table, on the session that loaded it
+        validation_enabled = False
         if (validate_fields or validate_merge_changes) and VALIDATION_AVAILABLE:
-            validator = DataValidator(db, logger)
-            logger.info(f"✅ DataValidator initialized (sample size: {validation_sample_size})")
+            validation_enabled = True
+            logger.info(f"✅ DataValidator enabled (sample size: {validation_sample_size})")
         elif (validate_fields or validate_merge_changes) and not VALIDATION_AVAILABLE:
             logger.warning("⚠️  Validation requested but DataValidator not available")
         
-        # STEP 1: Truncate all staging tables before loading new data
+        # STEP 1: Truncate all staging tables before loading new data; when
+        # resuming, the tables the interrupted run started keep their rows
         logger.info("\n" + "="*70)
         logger.info("STEP 1: TRUNCATING STAGING TABLES")
         logger.info("="*70)
-        db.truncate_staging_tables()
+        db.truncate_staging_tables([
+            spec.staging_table for spec in MOLO_TABLES
+            if not journal.started(spec.table_name)
+        ])
         logger.info("✅ All staging tables truncated successfully\n")
         
         # STEP 2: Process each CSV file and insert into staging tables
@@ -3135,439 +2350,269 @@ def read_s3_zip_and_insert_to_db(
         skipped_count = 0
         error_count = 0
         table_record_counts = {}  # Track records per table like Stellar does
+        unchanged_tables = {}  # Tables skipped because their CSV did not change
+        row_deltas = {}  # {table_name: TableDelta} for tables loaded as a delta
+        incremental_tables = {}  # {table_name: rows skipped by the watermark}
+        
+        # Process tables in registry order
+        table_queue = [
+            (spec, target_members[spec.source_name])
+            for spec in MOLO_TABLES if spec.source_name in target_members
+        ]
         
         # Log all files and their sizes BEFORE processing
         logger.info("\n📋 Files to process:")
-        for csv_name in extracted_csv_data.keys():
-            size_bytes = len(extracted_csv_data[csv_name])
-            size_mb = size_bytes / (1024 * 1024)
-            logger.info(f"   {csv_name:<30} {size_mb:>8.2f} MB")
+        for spec, member in table_queue:
+            size_mb = member.file_size / (1024 * 1024)
+            logger.info(f"   {spec.source_name:<30} {size_mb:>8.2f} MB")
         logger.info("")
         sys.stdout.flush()
         
-        for csv_name, csv_content in extracted_csv_data.items():
-            logger.info(f"\n--- Processing {csv_name}.csv ---")
-            
-            try:
-                # Route to appropriate parser and MERGE function
-                if csv_name == 'MarinaLocations':
-                    parsed_data = parse_marina_locations_data(csv_content)
-                    db.insert_marina_locations(parsed_data)
-                    table_record_counts['MARINA_LOCATIONS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} marina location records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Piers':
-                    parsed_data = parse_piers_data(csv_content)
-                    db.insert_piers(parsed_data)
-                    table_record_counts['PIERS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} pier records")
-                    processed_count += 1
-                    
-                elif csv_name == 'SlipTypes':
-                    parsed_data = parse_slip_types_data(csv_content)
-                    db.insert_slip_types(parsed_data)
-                    table_record_counts['SLIP_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} slip type records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Slips':
-                    parsed_data = parse_slips_data(csv_content)
-                    db.insert_slips(parsed_data)
-                    table_record_counts['SLIPS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} slip records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Reservations':
-                    parsed_data = parse_reservations_data(csv_content)
-                    db.insert_reservations(parsed_data)
-                    table_record_counts['RESERVATIONS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} reservation records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Companies':
-                    parsed_data = parse_companies_data(csv_content)
-                    db.insert_companies(parsed_data)
-                    table_record_counts['COMPANIES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} company records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Contacts':
-                    parsed_data = parse_contacts_data(csv_content)
-                    db.insert_contacts(parsed_data)
-                    table_record_counts['CONTACTS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} contact records")
-                    processed_count += 1
-                    
-                elif csv_name == 'Boats':
-                    parsed_data = parse_boats_data(csv_content)
-                    db.insert_boats(parsed_data)
-                    table_record_counts['BOATS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} boat records")
-                    
-                    # Validate boats data if enabled
-                    if validator:
-                        perform_table_validation(
-                            validator, csv_content, 'BOATS',
-                            'STG_MOLO_BOATS', 'DW_MOLO_BOATS', 'BOAT_ID',
-                            ['BOAT_NAME', 'LENGTH', 'WIDTH', 'BOAT_TYPE_ID'],
-                            validate_fields, validate_merge_changes,
-                            validation_sample_size, len(parsed_data)
-                        )
-                    
-                    processed_count += 1
-                elif csv_name == 'Accounts':
-                    parsed_data = parse_accounts_data(csv_content)
-                    db.insert_accounts(parsed_data)
-                    table_record_counts['ACCOUNTS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} account records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InvoiceSet':
-                    parsed_data = parse_invoices_data(csv_content)
-                    db.insert_invoices(parsed_data)
-                    table_record_counts['INVOICES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} invoice records")
-                    
-                    # Validate invoices data
-                    if validator:
-                        perform_table_validation(
-                            validator, csv_content, 'INVOICES',
-                            'STG_MOLO_INVOICES', 'DW_MOLO_INVOICES',
-                            'INVOICE_ID',
-                            ['INVOICE_NUMBER', 'TOTAL_AMOUNT', 'INVOICE_DATE',
-                             'INVOICE_STATUS_ID'],
-                            validate_fields, validate_merge_changes,
-                            validation_sample_size, len(parsed_data)
-                        )
-                    
-                    processed_count += 1
-                elif csv_name == 'InvoiceItemSet':
-                    logger.info(f"   File size: {len(csv_content):,} bytes")
-                    logger.info(f"   Starting InvoiceItemSet parse at {datetime.now().strftime('%H:%M:%S')}...")
-                    sys.stdout.flush()
-                    
-                    parsed_data = parse_invoice_items_data(csv_content)
-                    
-                    if parsed_data:
-                        logger.info(f"   ✅ Parsed {len(parsed_data):,} invoice items")
-                        logger.info(f"   Columns per tuple: {len(parsed_data[0])}")
-                    
-                    logger.info(f"   Parse completed. Starting database insert at {datetime.now().strftime('%H:%M:%S')}...")
-                    sys.stdout.flush()
-                    
-                    db.insert_invoice_items(parsed_data)
-                    table_record_counts['INVOICE_ITEMS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} invoice item records")
-                    sys.stdout.flush()
-                    
-                    processed_count += 1
-                elif csv_name == 'Transactions':
-                    parsed_data = parse_transactions_data(csv_content)
-                    db.insert_transactions(parsed_data)
-                    table_record_counts['TRANSACTIONS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transaction records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ItemMasters':
-                    parsed_data = parse_item_masters_data(csv_content)
-                    db.insert_item_masters(parsed_data)
-                    table_record_counts['ITEM_MASTERS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} item master records")
-                    
-                    # Validate item masters data (especially datetime fields)
-                    if validator:
-                        perform_table_validation(
-                            validator, csv_content, 'ITEM_MASTERS',
-                            'STG_MOLO_ITEM_MASTERS', 'DW_MOLO_ITEM_MASTERS',
-                            'ITEM_MASTER_ID',
-                            ['DESCRIPTION', 'ITEM_TYPE', 'UNIT_PRICE',
-                             'CREATION_DATE_TIME'],
-                            validate_fields, validate_merge_changes,
-                            validation_sample_size, len(parsed_data)
-                        )
-                    
-                    processed_count += 1
-                elif csv_name == 'SeasonalPrices':
-                    parsed_data = parse_seasonal_prices_data(csv_content)
-                    db.insert_seasonal_prices(parsed_data)
-                    table_record_counts['SEASONAL_PRICES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} seasonal price records")
-                    
-                    processed_count += 1
-                elif csv_name == 'TransientPrices':
-                    parsed_data = parse_transient_prices_data(csv_content)
-                    db.insert_transient_prices(parsed_data)
-                    table_record_counts['TRANSIENT_PRICES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transient price records")
-                    
-                    processed_count += 1
-                elif csv_name == 'RecordStatusSet':
-                    parsed_data = parse_record_status_data(csv_content)
-                    db.insert_record_status(parsed_data)
-                    table_record_counts['RECORD_STATUS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} record status records")
-                    
-                    processed_count += 1
-                elif csv_name == 'BoatTypes':
-                    parsed_data = parse_boat_types_data(csv_content)
-                    db.insert_boat_types(parsed_data)
-                    table_record_counts['BOAT_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} boat type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'PowerNeeds':
-                    parsed_data = parse_power_needs_data(csv_content)
-                    db.insert_power_needs(parsed_data)
-                    table_record_counts['POWER_NEEDS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} power need records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ReservationStatus':
-                    parsed_data = parse_reservation_status_data(csv_content)
-                    db.insert_reservation_status(parsed_data)
-                    table_record_counts['RESERVATION_STATUS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} reservation status records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ReservationTypes':
-                    parsed_data = parse_reservation_types_data(csv_content)
-                    db.insert_reservation_types(parsed_data)
-                    table_record_counts['RESERVATION_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} reservation type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ContactTypes':
-                    parsed_data = parse_contact_types_data(csv_content)
-                    db.insert_contact_types(parsed_data)
-                    table_record_counts['CONTACT_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} contact type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InvoiceStatusSet':
-                    parsed_data = parse_invoice_status_data(csv_content)
-                    db.insert_invoice_status(parsed_data)
-                    table_record_counts['INVOICE_STATUS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} invoice status records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InvoiceTypeSet':
-                    parsed_data = parse_invoice_types_data(csv_content)
-                    db.insert_invoice_types(parsed_data)
-                    table_record_counts['INVOICE_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} invoice type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'TransactionTypeSet':
-                    parsed_data = parse_transaction_types_data(csv_content)
-                    db.insert_transaction_types(parsed_data)
-                    table_record_counts['TRANSACTION_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transaction type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'TransactionMethodSet':
-                    parsed_data = parse_transaction_methods_data(csv_content)
-                    db.insert_transaction_methods(parsed_data)
-                    table_record_counts['TRANSACTION_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transaction method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InsuranceSet':
-                    parsed_data = parse_insurance_data(csv_content)
-                    db.insert_insurance(parsed_data)
-                    table_record_counts['INSURANCE_STATUS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} insurance records")
-                    
-                    processed_count += 1
-                elif csv_name == 'EquipmentSet':
-                    parsed_data = parse_equipment_data(csv_content)
-                    db.insert_equipment(parsed_data)
-                    table_record_counts['EQUIPMENT'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} equipment records")
-                    
-                    processed_count += 1
-                elif csv_name == 'AccountStatus':
-                    parsed_data = parse_account_status_data(csv_content)
-                    db.insert_account_status(parsed_data)
-                    table_record_counts['ACCOUNT_STATUS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} account status records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ContactAutoChargeSet':
-                    parsed_data = parse_contact_auto_charge_data(csv_content)
-                    db.insert_contact_auto_charge(parsed_data)
-                    table_record_counts['CONTACT_AUTO_CHARGE'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} contact auto charge records")
-                    
-                    processed_count += 1
-                elif csv_name == 'StatementsPreferenceSet':
-                    parsed_data = parse_statements_preference_data(csv_content)
-                    db.insert_statements_preference(parsed_data)
-                    table_record_counts['STATEMENTS_PREFERENCE'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} statements preference records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InvoiceItemTypeSet':
-                    parsed_data = parse_invoice_item_types_data(csv_content)
-                    db.insert_invoice_item_types(parsed_data)
-                    table_record_counts['INVOICE_ITEM_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} invoice item type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'PaymentMethods':
-                    parsed_data = parse_payment_methods_data(csv_content)
-                    db.insert_payment_methods(parsed_data)
-                    table_record_counts['PAYMENT_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} payment method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'SeasonalChargeMethods':
-                    parsed_data = parse_seasonal_charge_methods_data(csv_content)
-                    db.insert_seasonal_charge_methods(parsed_data)
-                    table_record_counts['SEASONAL_CHARGE_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} seasonal charge method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'SeasonalInvoicingMethodSet':
-                    parsed_data = parse_seasonal_invoicing_methods_data(csv_content)
-                    db.insert_seasonal_invoicing_methods(parsed_data)
-                    table_record_counts['SEASONAL_INVOICING_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} seasonal invoicing method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'TransientChargeMethods':
-                    parsed_data = parse_transient_charge_methods_data(csv_content)
-                    db.insert_transient_charge_methods(parsed_data)
-                    table_record_counts['TRANSIENT_CHARGE_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transient charge method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'TransientInvoicingMethodSet':
-                    parsed_data = parse_transient_invoicing_methods_data(csv_content)
-                    db.insert_transient_invoicing_methods(parsed_data)
-                    table_record_counts['TRANSIENT_INVOICING_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} transient invoicing method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'RecurringInvoiceOptionsSet':
-                    parsed_data = parse_recurring_invoice_options_data(csv_content)
-                    db.insert_recurring_invoice_options(parsed_data)
-                    table_record_counts['RECURRING_INVOICE_OPTIONS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} recurring invoice option records")
-                    
-                    processed_count += 1
-                elif csv_name == 'DueDateSettingsSet':
-                    parsed_data = parse_due_date_settings_data(csv_content)
-                    db.insert_due_date_settings(parsed_data)
-                    table_record_counts['DUE_DATE_SETTINGS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} due date setting records")
-                    
-                    processed_count += 1
-                elif csv_name == 'ItemChargeMethods':
-                    parsed_data = parse_item_charge_methods_data(csv_content)
-                    db.insert_item_charge_methods(parsed_data)
-                    table_record_counts['ITEM_CHARGE_METHODS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} item charge method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InsuranceStatusSet':
-                    parsed_data = parse_insurance_status_data(csv_content)
-                    db.insert_insurance_status(parsed_data)
-                    table_record_counts['INSURANCE_STATUS_ALT'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} insurance status records")
-                    
-                    processed_count += 1
-                elif csv_name == 'EquipmentTypeSet':
-                    parsed_data = parse_equipment_types_data(csv_content)
-                    db.insert_equipment_types(parsed_data)
-                    table_record_counts['EQUIPMENT_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} equipment type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'EquipmentFuelTypeSet':
-                    parsed_data = parse_equipment_fuel_types_data(csv_content)
-                    db.insert_equipment_fuel_types(parsed_data)
-                    table_record_counts['EQUIPMENT_FUEL_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} equipment fuel type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'VesselEngineClassSet':
-                    parsed_data = parse_vessel_engine_class_data(csv_content)
-                    db.insert_vessel_engine_class(parsed_data)
-                    table_record_counts['VESSEL_ENGINE_CLASS'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} vessel engine class records")
-                    
-                    processed_count += 1
-                elif csv_name == 'Cities':
-                    parsed_data = parse_cities_data(csv_content)
-                    db.insert_cities(parsed_data)
-                    table_record_counts['CITIES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} city records")
-                    
-                    processed_count += 1
-                elif csv_name == 'Countries':
-                    parsed_data = parse_countries_data(csv_content)
-                    db.insert_countries(parsed_data)
-                    table_record_counts['COUNTRIES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} country records")
-                    
-                    processed_count += 1
-                elif csv_name == 'CurrenciesSet':
-                    parsed_data = parse_currencies_data(csv_content)
-                    db.insert_currencies(parsed_data)
-                    table_record_counts['CURRENCIES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} currency records")
-                    
-                    processed_count += 1
-                elif csv_name == 'PhoneTypes':
-                    parsed_data = parse_phone_types_data(csv_content)
-                    db.insert_phone_types(parsed_data)
-                    table_record_counts['PHONE_TYPES'] = len(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} phone type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'AddressTypeSet':
-                    parsed_data = parse_address_types_data(csv_content)
-                    db.insert_address_types(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} address type records")
-                    
-                    processed_count += 1
-                elif csv_name == 'InstalmentsPaymentMethodSet':
-                    parsed_data = parse_installments_payment_methods_data(csv_content)
-                    db.insert_installments_payment_methods(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} installments payment method records")
-                    
-                    processed_count += 1
-                elif csv_name == 'PaymentsProviderSet':
-                    parsed_data = parse_payments_provider_data(csv_content)
-                    db.insert_payments_provider(parsed_data)
-                    logger.info(f"✅ Processed {len(parsed_data)} payments provider records")
-                    processed_count += 1
-                    
-                else:
-                    logger.warning(f"⚠️  No parser available for {csv_name}.csv, skipping...")
-                    skipped_count += 1
-                    
-            except Exception as e:
-                logger.error(f"❌ Error processing {csv_name}.csv: {e}")
-                logger.exception(e)
-                error_count += 1
+        def merge_table(connector, task):
+            """Run one table's merge procedure and checkpoint it as merged."""
+            stats = connector.merge_single_table(task.name)
+            checkpoint = journal.checkpoint(task.name)
+            checkpoint.record(connector, MERGED, checkpoint.rows_done)
+            return stats
+        
+        # Every table's merge runs once, streamed after its load or deferred
+        # to STEP 3
+        merges = MergeScheduler.plan(
+            connect, merge_table,
+            [
+                (spec.table_name, spec.merge_procedure, spec.depends_on, spec.merge_inline)
+                for spec in MOLO_TABLES
+            ],
+            mode=merge_mode, max_workers=load_workers
+        )
+        
+        def load_table(spec, member, connector):
+            """Load (and optionally validate) one member on the given connector."""
+            logger.info(f"\n--- Processing {spec.source_name}.csv → {spec.staging_table} ---")
+            
+            # Skip the table if the interrupted run loaded it completely;
+            # a merge that did not run yet is scheduled now
+            checkpoint = journal.checkpoint(spec.table_name)
+            if checkpoint.loaded:
+                if checkpoint.status != MERGED:
+                    merges.staged(connector, spec.table_name)
+                logger.info(
+                    f"⏩ {spec.source_name}.csv was loaded by the interrupted run "
+                    f"({checkpoint.rows_done:,} records) - skipped"
+                )
+                return checkpoint.rows_done
+            
+            # Skip the table if its member's data and its parser are
+            # identical to the last load
+            content_hash = hash_zip_member(
+                zip_archive, member,
+                salt=spec.insert_sql + parser_fingerprint(spec.parser)
+            )
+            if skip_unchanged and manifest.is_unchanged(spec.table_name, content_hash):
+                logger.info(f"⏭️  {spec.source_name}.csv unchanged since the last load - skipped")
+                unchanged_tables[spec.table_name] = manifest.last_row_count(spec.table_name)
+                return 0
+            
+            # Compare rows with the last merged snapshot so that only new
+            # and changed rows reach staging and the merge procedure
+            delta = None
+            if snapshots.enabled and spec.key_index is not None:
+                delta = snapshots.delta(
+                    connector, spec.table_name, spec.key_index,
+                    pass_unchanged=not load_deltas
+                )
+            
+            # Track the last-edited timestamp; incrementally, rows edited
+            # before the watermark are dropped before they are converted
+            watermark = None
+            if watermarks.enabled and spec.watermark_column:
+                since = watermarks.cutoff(spec.table_name) if incremental else None
+                watermark = WatermarkFilter(
+                    spec.watermark_column, since,
+                    DateColumnParser(MOLO_DATETIME_FORMATS).parse, key_field='Id'
+                )
+                if delta is not None:
+                    delta.carried_keys = watermark.skipped_keys
+            
+            # Only the registry's largest tables load through a bulk mode
+            table_bulk_mode = bulk_mode if spec.bulk_load else CONVENTIONAL
+            
+            # A full read of a CSV parsed before binds the cached columns;
+            # an incremental read depends on the watermark and is not cached
+            cacheable = parsed_cache is not None and not (
+                watermark is not None and watermark.incremental
+            )
+            parsed = None
+            if cacheable:
+                parsed = parsed_cache.lookup(spec.table_name, content_hash, spec.parser)
+            if parsed is not None:
+                if watermark is not None:
+                    watermark.restore(parsed.high_water, parsed.row_count)
+                data_rows = parsed.rows()
+                if delta is not None:
+                    data_rows = delta.filter(data_rows)
+                record_count = connector.load_staging_table(
+                    spec, data_rows, checkpoint, table_bulk_mode
+                )
+            else:
+                # The parser reads straight from the decompressing stream and
+                # the engine binds its rows batch by batch; the member is
+                # released as soon as it has been loaded
+                parsed_writer = None
+                if cacheable:
+                    parsed_writer = parsed_cache.writer(spec.table_name, content_hash, spec.parser)
+                try:
+                    with open_zip_member_text(zip_archive, member) as csv_content:
+                        source = watermark.reader(csv_content) if watermark is not None else csv_content
+                        data_rows = spec.parser(source)
+                        if parsed_writer is not None:
+                            data_rows = parsed_writer.capture(data_rows)
+                        if delta is not None:
+                            data_rows = delta.filter(data_rows)
+                        record_count = connector.load_staging_table(
+                            spec, data_rows, checkpoint, table_bulk_mode
+                        )
+                except BaseException:
+                    if parsed_writer is not None:
+                        parsed_writer.abort()
+                    raise
+                if parsed_writer is not None:
+                    parsed_writer.commit(watermark.high_water if watermark is not None else None)
+            merges.staged(connector, spec.table_name)
+            logger.info(f"✅ Processed {record_count:,} {spec.description} records")
+            
+            if watermark is not None:
+                if watermark.incremental:
+                    logger.info(
+                        f"   🕒 Incremental since {watermark.since}: "
+                        f"{watermark.skipped:,} older rows skipped"
+                    )
+                    incremental_tables[spec.table_name] = watermark.skipped
+            
+            # A table with rejected rows keeps its watermark and manifest
+            # entry, so that the next load reads the rejected rows again
+            rejected = quarantine is not None and quarantine.has_rejected(spec.staging_table)
+            if watermark is not None and not rejected:
+                watermarks.stage(spec.table_name, watermark)
+            total_rows = record_count + (watermark.skipped if watermark is not None else 0)
+            if delta is not None:
+                logger.info(f"   🔍 Row delta: {delta.describe()}")
+                if rejected:
+                    delta.reject(quarantine.rejected_keys.get(spec.staging_table, ()))
+                snapshots.stage(delta)
+                row_deltas[spec.table_name] = delta
+                total_rows = delta.total
+            if not rejected:
+                manifest.stage(spec.table_name, content_hash, total_rows)
+            
+            if validation_enabled and spec.validation:
+                id_column, validation_fields = spec.validation
+                perform_table_validation(
+                    DataValidator(connector, logger),
+                    read_zip_member_text(zip_archive, member),
+                    spec.table_name, spec.staging_table, spec.dw_table,
+                    id_column, validation_fields,
+                    validate_fields, validate_merge_changes,
+                    validation_sample_size, record_count
+                )
+            
+            sys.stdout.flush()
+            return record_count
+        
+        # Start the largest tables first when loading in parallel, so the
+        # run is bounded by the slowest table rather than by whichever big
+        # table happened to be queued last
+        if load_workers > 1:
+            job_order = sorted(table_queue, key=lambda item: item[1].file_size, reverse=True)
+            logger.info(f"🔀 Loading up to {load_workers} tables in parallel")
+        else:
+            job_order = table_queue
+        
+        loader = ParallelTableLoader(connect, max_workers=load_workers)
+        results = loader.run(
+            TableJob(spec.table_name, partial(load_table, spec, member), spec.depends_on)
+            for spec, member in job_order
+        )
+        log_table_timings(results, loader.wall_seconds, 'MOLO')
+        
+        for spec, _ in table_queue:
+            result = results[spec.table_name]
+            if spec.table_name in unchanged_tables:
                 continue
+            if result.ok:
+                table_record_counts[spec.table_name] = result.record_count
+                processed_count += 1
+            else:
+                logger.error(f"❌ Error processing {spec.source_name}.csv: {result.error}")
+                error_count += 1
+        
+        # Committed per run, the staging load commits as a whole - or, if a
+        # table failed, is rolled back as a whole and nothing is merged
+        staging_rolled_back = False
+        if load_policy.commit == PER_RUN:
+            if error_count:
+                db.connection.rollback()
+                if quarantine is not None:
+                    quarantine.rollback()
+                staging_rolled_back = True
+                logger.error(
+                    f"❌ {error_count} table(s) failed - staging load of the whole run "
+                    f"rolled back"
+                )
+                error_count += processed_count
+                processed_count = 0
+                table_record_counts.clear()
+            else:
+                db.connection.commit()
+                if quarantine is not None:
+                    quarantine.commit()
+                logger.info(f"💾 Committed the staging load of {processed_count} tables")
         
-        # STEP 3: Run stored procedures to merge staging data into data warehouse
+        # STEP 3: Run the deferred merges of staging data into data warehouse
         logger.info("\n" + "="*70)
         logger.info("STEP 3: MERGING STAGING DATA TO DATA WAREHOUSE")
         logger.info("="*70)
         logger.info("Calling stored procedures to merge STG_MOLO_* → DW_MOLO_*...")
         
-        # Run all merge procedures
-        merge_stats = db.run_all_merges()
-        logger.info("✅ All merge stored procedures completed successfully")
+        deferred = {} if staging_rolled_back else merges.run_deferred()
+        for table_name, result in deferred.items():
+            if not result.ok:
+                logger.error(f"❌ Error merging {table_name}: {result.error}")
+                processed_count -= 1
+                error_count += 1
+        log_merge_timings(merges, 'MOLO')
+        if quarantine is not None:
+            quarantine.log_summary('MOLO')
+        if merges.failed:
+            logger.warning(f"⚠️  {len(merges.failed)} merge procedure(s) failed")
+        else:
+            logger.info("✅ All merge stored procedures completed successfully")
+        merge_stats = {
+            f"DW_MOLO_{table_name}": stats for table_name, stats in merges.stats().items()
+        }
+        
+        # Record loaded tables whose data is known to be merged
+        merged_tables = [
+            spec.table_name for spec, _ in table_queue
+            if merges.merged(spec.table_name) and not staging_rolled_back
+        ]
+        manifest.save(db, merged_tables)
+        snapshots.save(db, merged_tables)
+        watermarks.save(db, merged_tables)
+        
+        # The object counts as processed once every table loaded and merged
+        if error_count == 0:
+            if zip_etag is not None:
+                ledger.record(
+                    db, bucket, latest_zip_key, zip_etag,
+                    sum(table_record_counts.values())
+                )
+            journal.clear(db)
         
         # Log merge statistics (inserts vs updates)
         if merge_stats:
             logger.info("\n📊 Data Warehouse Merge Summary:")
-            logger.info("   (Showing results from stored procedures with OUT parameters)")
+            logger.info("   (Row counts logged by the merge procedures in ETL_MERGE_LOG)")
             for table in sorted(merge_stats.keys()):
                 try:
                     stats = merge_stats[table]
@@ -3593,7 +2638,8 @@ def read_s3_zip_and_insert_to_db(
                         )
                     else:
                         logger.info(
-                            f"   • {table}: No changes (data already up to date)"
+                            f"   • {table}: No changes "
+                            f"({stats['unchanged']:,} record(s) already up to date)"
                         )
                 except Exception as e:
                     logger.warning(f"   ⚠ {table}: Could not retrieve statistics - {e}")
@@ -3609,6 +2655,7 @@ def read_s3_zip_and_insert_to_db(
         logger.info("="*70)
         logger.info(f"✅ Successfully processed: {processed_count} files")
         logger.info(f"⚠️  Skipped: {skipped_count} files")
+        logger.info(f"⏭️  Unchanged since the last load: {len(unchanged_tables)} files")
         logger.info(f"❌ Errors: {error_count} files")
         
         # Display table-level statistics
@@ -3621,6 +2668,22 @@ def read_s3_zip_and_insert_to_db(
                 table_display = f"DW_MOLO_{table_name}"
                 logger.info(f"   ✅ {table_display:<35} → {record_count:>6,} records")
         
+        # Rows left out of staging and keys that disappeared from the CSVs
+        if incremental_tables:
+            logger.info(
+                f"🕒 Loaded incrementally: {len(incremental_tables)} tables "
+                f"({sum(incremental_tables.values()):,} rows older than the watermark skipped)"
+            )
+        if row_deltas:
+            unchanged_rows = sum(delta.unchanged for delta in row_deltas.values())
+            logger.info(f"🔍 Unchanged rows not re-staged: {unchanged_rows:,}")
+            for table_name, delta in sorted(row_deltas.items()):
+                if delta.deleted_keys:
+                    logger.info(
+                        f"   🗑️  DW_MOLO_{table_name}: {len(delta.deleted_keys):,} "
+                        f"record(s) deleted at the source"
+                    )
+        
         logger.info("="*70)
         
         if skipped_count > 0:
@@ -3636,9 +2699,25 @@ def read_s3_zip_and_insert_to_db(
             'processed_count': processed_count,
             'skipped_count': skipped_count,
             'error_count': error_count,
-            'files_processed': list(extracted_csv_data.keys()),
-            'zip_file': latest_zip_key,
-            'table_record_counts': table_record_counts  # Add table-level stats
+            'files_processed': [spec.source_name for spec, _ in table_queue],
+            'zip_file': os.path.basename(latest_zip_key) if from_local else latest_zip_key,
+            'table_record_counts': table_record_counts,  # Add table-level stats
+            'unchanged_tables': unchanged_tables,
+            'incremental_tables': incremental_tables,
+            'row_deltas': {
+                table_name: {
+                    'inserted': delta.inserted,
+                    'updated': delta.updated,
+                    'unchanged': delta.unchanged,
+                    'deleted': len(delta.deleted_keys)
+                }
+                for table_name, delta in row_deltas.items()
+            },
+            'table_timings': {
+                table_name: result.seconds for table_name, result in results.items()
+            },
+            'merge_timings': merges.timings(),
+            'rejected_rows': dict(quarantine.rejected) if quarantine is not None else {}
         }
     
     except NoCredentialsError:
@@ -3664,6 +2743,13 @@ def read_s3_zip_and_insert_to_db(
     except Exception as e:
         logger.exception(f"An unexpected error occurred: {e}")
         return None
+    finally:
+        if pool is not None:
+            pool.close(force=True)
+        if zip_archive is not None:
+            zip_archive.close()
+        if zip_spool is not None:
+            zip_spool.close()
 
 
 # =============================================================================
@@ -3766,6 +2852,8 @@ def create_html_report(summary_data, is_error=False):
     duration = summary_data.get('duration', 'Unknown')
     molo_stats = summary_data.get('molo_stats', {})
     stellar_stats = summary_data.get('stellar_stats', {})
+    unchanged_tables = summary_data.get('unchanged_tables', {})
+    skipped_objects = summary_data.get('skipped_objects', [])
     errors = summary_data.get('errors', [])
     warnings = summary_data.get('warnings', [])
     
@@ -3860,6 +2948,33 @@ def create_html_report(summary_data, is_error=False):
                 </div>
             </div>"""
     
+    # Add source objects skipped because they were already processed
+    if skipped_objects:
+        html += """
+            <div class="section">
+                <div class="section-header">⏭️ Already Processed (skipped)</div>
+                <div class="subsection">"""
+        for skipped in skipped_objects:
+            html += (
+                f'<p><strong>{skipped["system"]}:</strong> {skipped["object"]} '
+                f'(processed at {skipped["processed_at"]})</p>'
+            )
+        html += """
+                </div>
+            </div>"""
+    
+    # Add tables skipped because their data did not change
+    if unchanged_tables:
+        html += """
+            <div class="section">
+                <div class="section-header">⏭️ Unchanged Tables (skipped)</div>
+                <div class="subsection">"""
+        for system, tables in unchanged_tables.items():
+            html += f'<p><strong>{system} ({len(tables)}):</strong> {", ".join(tables)}</p>'
+        html += """
+                </div>
+            </div>"""
+    
     # Add errors section if there are errors
     if errors:
         html += f"""
@@ -3905,6 +3020,8 @@ def create_plain_text_report(summary_data, is_error=False):
     duration = summary_data.get('duration', 'Unknown')
     molo_stats = summary_data.get('molo_stats', {})
     stellar_stats = summary_data.get('stellar_stats', {})
+    unchanged_tables = summary_data.get('unchanged_tables', {})
+    skipped_objects = summary_data.get('skipped_objects', [])
     errors = summary_data.get('errors', [])
     warnings = summary_data.get('warnings', [])
     
@@ -3954,6 +3071,19 @@ Table                                    Records
             if isinstance(count, int):
                 text += f"{table:<40} {count:>10,}\n"
     
+    if skipped_objects:
+        text += f"\n\nAlready Processed (skipped)\n{'-'*70}\n"
+        for skipped in skipped_objects:
+            text += (
+                f"{skipped['system']}: {skipped['object']} "
+                f"(processed at {skipped['processed_at']})\n"
+            )
+    
+    if unchanged_tables:
+        text += f"\n\nUnchanged Tables (skipped)\n{'-'*70}\n"
+        for system, tables in unchanged_tables.items():
+            text += f"{system} ({len(tables)}): {', '.join(tables)}\n"
+    
     if errors:
         text += f"\n\nErrors ({len(errors)}):\n{'-'*70}\n"
         for error in errors[:10]:
@@ -4001,7 +3131,7 @@ if __name__ == "__main__":
         "--s3-prefix",
         default=os.getenv("S3_PREFIX", ""),
         help=(
-            "(UNUSED) S3 prefix - script now searches entire bucket. "
+            "S3 prefix the MOLO ZIP exports live under (default: bucket root). "
             "(Env: S3_PREFIX)"
         )
     )
@@ -4060,6 +3190,183 @@ if __name__ == "__main__":
         default=10,
         help="Number of records to sample for field validation (default: 10)"
     )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help=(
+            "Byte ranges of each S3 archive downloaded in parallel "
+            f"(default: {DEFAULT_DOWNLOAD_WORKERS})"
+        )
+    )
+    parser.add_argument(
+        "--archive-cache",
+        default=os.getenv("ARCHIVE_CACHE_DIR", "archive_cache"),
+        help=(
+            "Directory downloaded archives are kept in, keyed by ETag, so a retry "
+            "or backfill skips the download (default: ARCHIVE_CACHE_DIR or ./archive_cache)"
+        )
+    )
+    parser.add_argument(
+        "--archive-cache-gb",
+        type=float,
+        default=DEFAULT_ARCHIVE_CACHE_GB,
+        help=(
+            "Size bound of the archive cache; least recently used archives are "
+            f"evicted first, 0 disables the cache (default: {DEFAULT_ARCHIVE_CACHE_GB:g})"
+        )
+    )
+    parser.add_argument(
+        "--parsed-cache",
+        default=os.getenv("PARSED_CACHE_DIR", "parsed_cache"),
+        help=(
+            "Directory parsed tables are kept in as typed columns, keyed by CSV "
+            "content hash, so loading the same CSV again skips its parser; an "
+            "empty value disables it (default: PARSED_CACHE_DIR or ./parsed_cache)"
+        )
+    )
+    parser.add_argument(
+        "--from-local",
+        metavar="PATH",
+        help=(
+            "Replay a local archive instead of reading S3: a .zip or -DATA.sql.gz "
+            "file, or a directory (such as the archive cache) searched for the "
+            "newest archive of each source. The processed-object ledger is not used"
+        )
+    )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=DEFAULT_LOAD_WORKERS,
+        help=(
+            "Tables loaded in parallel per source over an Oracle connection "
+            f"pool; 1 loads them one at a time (default: {DEFAULT_LOAD_WORKERS})"
+        )
+    )
+    parser.add_argument(
+        "--merge-mode",
+        choices=MERGE_MODES,
+        default=AUTO,
+        help=(
+            "When each table's merge procedure runs: 'streamed' right after its "
+            "staging load, 'deferred' once every table is loaded (in parallel, in "
+            "dependency order), 'auto' streams the tables the registry marks "
+            "for an inline merge and defers the rest (default: auto)"
+        )
+    )
+    parser.add_argument(
+        "--bulk-load",
+        choices=BULK_LOAD_MODES,
+        default=CONVENTIONAL,
+        help=(
+            "How the largest staging tables (MOLO invoices, invoice items and "
+            "transactions, Stellar bookings and booking payments) are inserted: "
+            "'conventional' INSERTs, 'append' direct-path INSERTs (APPEND_VALUES) "
+            "or 'direct' python-oracledb Direct Path Load (MOLO connects in Thin "
+            "mode; falls back to 'append' where unavailable, e.g. for Stellar) "
+            "(default: conventional)"
+        )
+    )
+    parser.add_argument(
+        "--commit",
+        choices=COMMIT_MODES,
+        default=AUTO_COMMIT,
+        help=(
+            "When staging loads commit: after every 'batch' (a partly loaded MOLO "
+            "table resumes after its last batch), once per 'table' (--resume "
+            "reloads a partly loaded table from its first row), once per 'run' "
+            "for all MOLO tables, rolled back entirely if one fails, or 'auto': "
+            "per batch for the largest tables (InvoiceItemSet), per table for the "
+            "others (default: auto)"
+        )
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=(
+            "Rows bound per INSERT round trip (default: tuned per table from its "
+            "row width)"
+        )
+    )
+    parser.add_argument(
+        "--reject-bad-rows",
+        action="store_true",
+        default=False,
+        help=(
+            "Load the good rows of a batch and quarantine the rows the database "
+            "rejects (ETL_REJECTED_ROWS, or --quarantine-dir) instead of failing "
+            "the whole table"
+        )
+    )
+    parser.add_argument(
+        "--quarantine-dir",
+        default=os.getenv("QUARANTINE_DIR", "quarantine"),
+        help=(
+            "Directory for rejected rows (JSON lines per table) when the "
+            "ETL_REJECTED_ROWS table does not exist (default: $QUARANTINE_DIR or "
+            "./quarantine)"
+        )
+    )
+    parser.add_argument(
+        "--full-reload",
+        action="store_true",
+        default=False,
+        help="Load every table and every row even if unchanged since the last successful load"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Process the latest S3 objects even if they were already processed"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help=(
+            "Continue an interrupted load of the latest S3 objects from the first "
+            "table or batch that did not complete (run with the same options); "
+            "only tables that commit per batch (--commit batch, or the largest "
+            "tables with --commit auto) resume mid-table"
+        )
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Only load rows edited since each table's high-water mark (tables with a last-edited column)"
+    )
+    parser.add_argument(
+        "--watermark-overlap-hours",
+        type=float,
+        default=DEFAULT_WATERMARK_OVERLAP.total_seconds() / 3600,
+        help="Hours before the high-water mark that are loaded again in incremental mode (default: 24)"
+    )
+    parser.add_argument(
+        "--full-refresh-days",
+        type=int,
+        default=DEFAULT_FULL_REFRESH_DAYS,
+        help="Days after which an incremental table is loaded in full again (default: 7)"
+    )
+    parser.add_argument(
+        "--sequential-sources",
+        action="store_true",
+        default=False,
+        help="Run the MOLO and Stellar pipelines one after the other instead of side by side"
+    )
+    parser.add_argument(
+        "--molo-timeout",
+        type=int,
+        default=1800,
+        help="Seconds the MOLO pipeline may run before it is stopped (default: 1800)"
+    )
+    parser.add_argument(
+        "--stellar-timeout",
+        type=int,
+        default=1800,
+        help="Seconds the Stellar pipeline may run before it is stopped (default: 1800)"
+    )
 
     args = parser.parse_args()
 
@@ -4122,6 +3429,37 @@ if __name__ == "__main__":
     logger.info(f"  Merge change validation: {'ENABLED' if args.validate_merge_changes else 'DISABLED'}")
     if args.validate_fields or args.validate_merge_changes:
         logger.info(f"  Sample size: {args.validation_sample_size} records")
+    logger.info(f"Parallel table loads per source: {args.load_workers}")
+    logger.info(f"Parallel S3 range downloads per archive: {args.download_workers}")
+    logger.info(f"Merge mode: {args.merge_mode}")
+    logger.info(f"Bulk load of the largest tables: {args.bulk_load}")
+    logger.info(f"Staging load policy: {LoadPolicy(args.commit, args.batch_size).describe()}")
+    if args.reject_bad_rows:
+        logger.info("Rejected rows: quarantined (the rest of their batch is loaded)")
+    if args.from_local:
+        logger.info(f"Source archives: LOCAL replay from {args.from_local} (S3 not accessed)")
+    elif args.archive_cache_gb > 0:
+        logger.info(f"Archive cache: {args.archive_cache} (up to {args.archive_cache_gb:g} GB)")
+    else:
+        logger.info("Archive cache: DISABLED")
+    logger.info(f"Parsed-table cache: {args.parsed_cache or 'DISABLED'}")
+    logger.info(f"Unchanged tables: {'RELOADED (full reload)' if args.full_reload else 'SKIPPED'}")
+    logger.info(f"Already processed S3 objects: {'REPROCESSED (--force)' if args.force else 'SKIPPED'}")
+    logger.info(f"Interrupted loads: {'RESUMED (--resume)' if args.resume else 'STARTED OVER'}")
+    incremental = args.incremental and not args.full_reload
+    watermark_overlap = timedelta(hours=args.watermark_overlap_hours)
+    if incremental:
+        logger.info(
+            f"Incremental loads: ENABLED (overlap {args.watermark_overlap_hours:g} hours, "
+            f"full refresh every {args.full_refresh_days} days)"
+        )
+    else:
+        logger.info("Incremental loads: DISABLED")
+    logger.info(f"Sources run: {'one at a time' if args.sequential_sources else 'side by side'}")
+    logger.info(
+        f"Timeouts: MOLO {describe_duration(args.molo_timeout)}, "
+        f"Stellar {describe_duration(args.stellar_timeout)}"
+    )
     logger.info("=" * 80)
     
     # Initialize processing tracking
@@ -4131,28 +3469,20 @@ if __name__ == "__main__":
     warnings = []
     molo_stats = {}
     stellar_stats = {}
+    unchanged_tables = {}  # {system: [tables skipped because their data did not change]}
+    skipped_objects = []  # Latest S3 objects skipped because they were already processed
     zip_files_processed = []
     has_errors = False
     
-    # Execute MOLO processing (ZIP files from main bucket)
+    # Each enabled source runs in its own process with its own S3 client,
+    # database connections and timeout, so a hang in one source cannot hold
+    # up the other
+    pipelines = []
     if args.process_molo:
-        logger.info("\n" + "=" * 80)
-        logger.info("STEP 1: Processing MOLO Data")
-        logger.info("=" * 80)
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError("MOLO processing exceeded 30 minute timeout")
-        
-        try:
-            # Set 30 minute timeout for MOLO processing
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(1800)  # 30 minutes in seconds
-            
-            logger.info("⏱️  MOLO processing timeout set to 30 minutes")
-            sys.stdout.flush()
-            sys.stderr.flush()
-            
-            molo_results = read_s3_zip_and_insert_to_db(
+        pipelines.append(Pipeline(
+            'MOLO',
+            partial(
+                read_s3_zip_and_insert_to_db,
                 bucket,
                 args.s3_prefix,
                 args.region,
@@ -4163,116 +3493,72 @@ if __name__ == "__main__":
                 aws_secret_access_key=aws_secret_key,
                 validate_fields=args.validate_fields,
                 validate_merge_changes=args.validate_merge_changes,
-                validation_sample_size=args.validation_sample_size
-            )
-            
-            # Cancel alarm if completed successfully
-            signal.alarm(0)
-            
-            if molo_results:
-                # Capture MOLO table-level statistics (like Stellar does)
-                molo_stats = molo_results.get('table_record_counts', {})
-                
-                # Track ZIP file for email attachment
-                if molo_results.get('zip_file'):
-                    zip_files_processed.append(molo_results['zip_file'])
-                
-                logger.info("✅ MOLO data processing completed successfully")
-                sys.stdout.flush()
-            else:
-                error_msg = "MOLO processing returned no results"
-                errors.append(error_msg)
-                has_errors = True
-                logger.warning(f"⚠️ {error_msg} - Continuing to Stellar processing...")
-                sys.stdout.flush()
-                
-        except TimeoutError as e:
-            signal.alarm(0)  # Cancel alarm
-            error_msg = f"MOLO processing timed out after 30 minutes at {datetime.now().strftime('%H:%M:%S')}"
-            logger.error(f"❌ {error_msg}")
-            logger.error("   Last file being processed may have caused the hang")
-            errors.append(error_msg)
-            has_errors = True
-            logger.info("⏭️  Continuing to Stellar processing despite MOLO timeout...")
-            sys.stdout.flush()
-            sys.stderr.flush()
-            
-        except Exception as e:
-            signal.alarm(0)  # Cancel alarm
-            error_msg = f"Error processing MOLO data: {str(e)}"
-            logger.exception(f"❌ {error_msg}")
-            errors.append(error_msg)
-            has_errors = True
-            logger.info("⏭️  Continuing to Stellar processing despite MOLO error...")
-            sys.stdout.flush()
-            sys.stderr.flush()
+                validation_sample_size=args.validation_sample_size,
+                load_workers=args.load_workers,
+                skip_unchanged=not args.full_reload,
+                load_deltas=not args.full_reload,
+                incremental=incremental,
+                watermark_overlap=watermark_overlap,
+                full_refresh_days=args.full_refresh_days,
+                force=args.force,
+                download_workers=args.download_workers,
+                archive_cache_dir=args.archive_cache,
+                archive_cache_gb=args.archive_cache_gb,
+                from_local=args.from_local,
+                parsed_cache_dir=args.parsed_cache,
+                resume=args.resume,
+                merge_mode=args.merge_mode,
+                bulk_mode=args.bulk_load,
+                commit_mode=args.commit,
+                batch_size=args.batch_size,
+                reject_bad_rows=args.reject_bad_rows,
+                quarantine_dir=args.quarantine_dir
+            ),
+            timeout=args.molo_timeout
+        ))
     else:
         logger.info("\n⏭️  Skipping MOLO data processing (disabled)")
     
-    # Execute Stellar processing (gzipped DATA files from resilient-ims-backups)
     if args.process_stellar:
         if STELLAR_AVAILABLE:
-            logger.info("\n" + "=" * 80)
-            logger.info("STEP 2: Processing Stellar Business Data")
-            logger.info("=" * 80)
             logger.info("")
-            logger.info("📊 Processing Stellar Business data from S3...")
+            logger.info("📊 Stellar Business data from S3:")
             logger.info(f"   Bucket: {stellar_bucket}")
             logger.info(f"   Region: {args.region}")
-            logger.info("")
             logger.info("📊 Expected tables in backup: 29 tables")
             logger.info("   (Reference data, bookings, boats, pricing, POS, etc.)")
-            logger.info("")
-            
-            try:
-                stellar_results = process_stellar_data_from_s3(
+            pipelines.append(Pipeline(
+                'Stellar',
+                partial(
+                    process_stellar_data_from_s3,
                     bucket=stellar_bucket,
                     region=args.region,
                     db_user=db_user,
                     db_password=db_password,
                     db_dsn=db_dsn,
                     aws_access_key_id=aws_access_key,
-                    aws_secret_access_key=aws_secret_key
-                )
-                
-                # Capture Stellar statistics
-                stellar_stats = stellar_results.get('successful_tables', {})
-                
-                # Display results dynamically
-                logger.info("")
-                logger.info("=" * 80)
-                logger.info("✅ STELLAR DATA PROCESSING COMPLETED")
-                logger.info("=" * 80)
-                
-                successful_count = len(stellar_results['successful_tables'])
-                total_records = stellar_results['total_records']
-                total_tables = stellar_results['total_tables']
-                
-                logger.info(f"📊 Successfully processed: {successful_count}/{total_tables} tables")
-                logger.info(f"📊 Total records loaded: {total_records:,}")
-                logger.info("")
-                
-                if stellar_results['successful_tables']:
-                    logger.info("✅ Successfully processed tables:")
-                    for table_name, record_count in sorted(stellar_results['successful_tables'].items()):
-                        table_display = f"DW_STELLAR_{table_name.upper()}"
-                        logger.info(f"   ✅ {table_display:<35} → {record_count:>6,} records")
-                
-                if stellar_results['failed_tables']:
-                    logger.info("")
-                    logger.info("⚠️  Failed/Missing tables:")
-                    for table_name, reason in sorted(stellar_results['failed_tables'].items()):
-                        table_display = f"DW_STELLAR_{table_name.upper()}"
-                        logger.info(f"   ❌ {table_display:<35} → {reason}")
-                        warnings.append(f"Failed to process {table_display}: {reason}")
-                
-                logger.info("")
-                logger.info("=" * 80)
-            except Exception as e:
-                error_msg = f"Error processing Stellar data: {str(e)}"
-                logger.exception(f"❌ {error_msg}")
-                errors.append(error_msg)
-                has_errors = True
+                    aws_secret_access_key=aws_secret_key,
+                    load_workers=args.load_workers,
+                    skip_unchanged=not args.full_reload,
+                    incremental=incremental,
+                    watermark_overlap=watermark_overlap,
+                    full_refresh_days=args.full_refresh_days,
+                    force=args.force,
+                    download_workers=args.download_workers,
+                    archive_cache_dir=args.archive_cache,
+                    archive_cache_gb=args.archive_cache_gb,
+                    from_local=args.from_local,
+                    parsed_cache_dir=args.parsed_cache,
+                    resume=args.resume,
+                    merge_mode=args.merge_mode,
+                    bulk_mode=args.bulk_load,
+                    commit_mode=args.commit,
+                    batch_size=args.batch_size,
+                    reject_bad_rows=args.reject_bad_rows,
+                    quarantine_dir=args.quarantine_dir
+                ),
+                timeout=args.stellar_timeout
+            ))
         else:
             warning_msg = "Stellar processing module not available"
             logger.warning(f"\n⚠️  {warning_msg}. Install download_stellar_from_s3.py to enable Stellar processing.")
@@ -4280,6 +3566,156 @@ if __name__ == "__main__":
     else:
         logger.info("\n⏭️  Skipping Stellar data processing (disabled)")
     
+    logger.info("\n" + "=" * 80)
+    if args.sequential_sources:
+        logger.info("STEP 1: Processing Source Data (one source at a time)")
+    else:
+        logger.info("STEP 1: Processing Source Data (sources side by side)")
+    logger.info("=" * 80)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    
+    outcomes = run_pipelines(pipelines, concurrent=not args.sequential_sources)
+    
+    # Collect MOLO results (ZIP files from main bucket)
+    molo_outcome = outcomes.get('MOLO')
+    if molo_outcome is not None:
+        logger.info("\n" + "=" * 80)
+        logger.info("MOLO DATA PROCESSING RESULTS")
+        logger.info("=" * 80)
+        molo_results = molo_outcome.result
+        
+        if molo_outcome.timed_out:
+            error_msg = (
+                f"MOLO processing timed out after {describe_duration(args.molo_timeout)} "
+                f"at {datetime.now().strftime('%H:%M:%S')}"
+            )
+            logger.error(f"❌ {error_msg}")
+            logger.error("   Last file being processed may have caused the hang")
+            errors.append(error_msg)
+            has_errors = True
+        elif not molo_outcome.ok:
+            error_msg = f"Error processing MOLO data: {molo_outcome.error}"
+            logger.error(f"❌ {error_msg}")
+            errors.append(error_msg)
+            has_errors = True
+        elif molo_results and molo_results.get('already_processed'):
+            logger.info(
+                f"⏭️  MOLO: {molo_results['zip_file']} was already processed at "
+                f"{molo_results['processed_at']} - nothing loaded"
+            )
+            skipped_objects.append({
+                'system': 'MOLO',
+                'object': molo_results['zip_file'],
+                'processed_at': molo_results['processed_at']
+            })
+        elif molo_results:
+            # Capture MOLO table-level statistics (like Stellar does)
+            molo_stats = molo_results.get('table_record_counts', {})
+            if molo_results.get('unchanged_tables'):
+                unchanged_tables['MOLO'] = sorted(molo_results['unchanged_tables'])
+            if molo_results.get('rejected_rows'):
+                warnings.append(
+                    f"MOLO: {sum(molo_results['rejected_rows'].values()):,} row(s) rejected "
+                    f"and quarantined ({', '.join(sorted(molo_results['rejected_rows']))})"
+                )
+            
+            # Track ZIP file for email attachment
+            if molo_results.get('zip_file'):
+                zip_files_processed.append(molo_results['zip_file'])
+            
+            logger.info(
+                f"✅ MOLO data processing completed successfully "
+                f"in {molo_outcome.seconds:.0f}s"
+            )
+        else:
+            error_msg = "MOLO processing returned no results"
+            errors.append(error_msg)
+            has_errors = True
+            logger.warning(f"⚠️ {error_msg}")
+        sys.stdout.flush()
+    
+    # Collect Stellar results (gzipped DATA files from resilient-ims-backups)
+    stellar_outcome = outcomes.get('Stellar')
+    if stellar_outcome is not None:
+        stellar_results = stellar_outcome.result
+        
+        if stellar_outcome.timed_out:
+            error_msg = (
+                f"Stellar processing timed out after {describe_duration(args.stellar_timeout)} "
+                f"at {datetime.now().strftime('%H:%M:%S')}"
+            )
+            logger.error(f"❌ {error_msg}")
+            errors.append(error_msg)
+            has_errors = True
+        elif not stellar_outcome.ok or not stellar_results:
+            error_msg = (
+                f"Error processing Stellar data: "
+                f"{stellar_outcome.error or 'no DATA file processed'}"
+            )
+            logger.error(f"❌ {error_msg}")
+            errors.append(error_msg)
+            has_errors = True
+        elif stellar_results.get('already_processed'):
+            logger.info(
+                f"⏭️  Stellar: {stellar_results['data_file']} was already processed at "
+                f"{stellar_results['processed_at']} - nothing loaded"
+            )
+            skipped_objects.append({
+                'system': 'Stellar',
+                'object': stellar_results['data_file'],
+                'processed_at': stellar_results['processed_at']
+            })
+        else:
+            # Capture Stellar statistics
+            stellar_stats = stellar_results.get('successful_tables', {})
+            if stellar_results.get('unchanged_tables'):
+                unchanged_tables['Stellar'] = sorted(stellar_results['unchanged_tables'])
+            if stellar_results.get('rejected_rows'):
+                warnings.append(
+                    f"Stellar: {sum(stellar_results['rejected_rows'].values()):,} row(s) rejected "
+                    f"and quarantined ({', '.join(sorted(stellar_results['rejected_rows']))})"
+                )
+            
+            # Display results dynamically
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info(
+                f"✅ STELLAR DATA PROCESSING COMPLETED "
+                f"in {stellar_outcome.seconds:.0f}s"
+            )
+            logger.info("=" * 80)
+            
+            successful_count = len(stellar_results['successful_tables'])
+            total_records = stellar_results['total_records']
+            total_tables = stellar_results['total_tables']
+            
+            logger.info(f"📊 Successfully processed: {successful_count}/{total_tables} tables")
+            logger.info(f"📊 Total records loaded: {total_records:,}")
+            if stellar_results.get('unchanged_tables'):
+                logger.info(
+                    f"⏭️  Unchanged since the last load (skipped): "
+                    f"{len(stellar_results['unchanged_tables'])} tables"
+                )
+            logger.info("")
+            
+            if stellar_results['successful_tables']:
+                logger.info("✅ Successfully processed tables:")
+                for table_name, record_count in sorted(stellar_results['successful_tables'].items()):
+                    table_display = f"DW_STELLAR_{table_name.upper()}"
+                    logger.info(f"   ✅ {table_display:<35} → {record_count:>6,} records")
+            
+            if stellar_results['failed_tables']:
+                logger.info("")
+                logger.info("⚠️  Failed/Missing tables:")
+                for table_name, reason in sorted(stellar_results['failed_tables'].items()):
+                    table_display = f"DW_STELLAR_{table_name.upper()}"
+                    logger.info(f"   ❌ {table_display:<35} → {reason}")
+                    warnings.append(f"Failed to process {table_display}: {reason}")
+            
+            logger.info("")
+            logger.info("=" * 80)
+    
     # Calculate end time and duration
     end_time = datetime.now()
     end_time_str = end_time.strftime('%Y-%m-%d %H:%M:%S')
@@ -4318,6 +3754,14 @@ if __name__ == "__main__":
         if len(stellar_stats) > 5:
             logger.info(f"   ... and {len(stellar_stats) - 5} more tables")
     
+    for skipped in skipped_objects:
+        logger.info(f"\n⏭️  {skipped['system']}: latest S3 object already processed (skipped)")
+        logger.info(f"   {skipped['object']} (processed at {skipped['processed_at']})")
+    
+    for system, tables in unchanged_tables.items():
+        logger.info(f"\n⏭️  {system} tables unchanged since the last load (skipped): {len(tables)}")
+        logger.info(f"   {', '.join(tables)}")
+    
     if errors:
         logger.info(f"\n❌ Errors: {len(errors)}")
         for error in errors[:3]:
@@ -4342,6 +3786,8 @@ if __name__ == "__main__":
             'duration': duration_str,
             'molo_stats': molo_stats,
             'stellar_stats': stellar_stats,
+            'unchanged_tables': unchanged_tables,
+            'skipped_objects': skipped_objects,
             'errors': errors,
             'warnings': warnings
         }
@@ -14,8 +14,39 @@ import boto3
 import logging
 import csv
 import io
+import itertools
+import os
+import re
 import sys
+import tarfile
+from contextlib import nullcontext
+from functools import partial
 from stellar_db_functions import OracleConnector
+from sql_dump_tokenizer import dispatch_rows
+from parallel_loader import ParallelTableLoader, TableJob, log_table_timings
+from load_manifest import LoadManifest, hash_bytes
+from object_ledger import ProcessedObjectLedger, object_etag
+from s3_discovery import STELLAR_BACKUP_KEYS, find_latest_key
+from s3_download import DEFAULT_DOWNLOAD_WORKERS, ParallelRangeStream
+from archive_cache import (
+    DEFAULT_ARCHIVE_CACHE_GB,
+    ArchiveCache,
+    CachingReader,
+    find_local_archive,
+)
+from parsed_cache import ParsedTableCache, parser_fingerprint
+from checkpoints import MERGED, STAGED, CheckpointJournal
+from merge_scheduler import AUTO, MergeScheduler, log_merge_timings
+from bulk_load import CONVENTIONAL
+from load_policy import AUTO_COMMIT, PER_RUN, PER_TABLE, LoadPolicy
+from row_quarantine import RowQuarantine
+from date_parsing import DateColumnParser
+from watermarks import (
+    DEFAULT_FULL_REFRESH_DAYS,
+    DEFAULT_WATERMARK_OVERLAP,
+    WatermarkFilter,
+    WatermarkStore
+)
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +68,8 @@ logger = logging.getLogger(__name__)
 # are NO LONGER USED. They were designed for CSV files in S3 subdirectories.
 # 
 # The new approach (as of Nov 2025) parses SQL dump files directly using
-# extract_table_data_from_sql() function. The SQL dumps are downloaded as
+# extract_table_data_from_sql(), which streams the dump through
+# sql_dump_tokenizer.py. The SQL dumps are downloaded as
 # prod_resilient_YYYY-MM-DD_HH_MM-DATA.sql.gz files from the bucket root.
 #
 # These CSV parsing functions are kept for reference only and may be removed
@@ -71,6 +103,13 @@ def parse_date(value):
     return value
 
 
+def csv_dict_reader(csv_content):
+    """Create a csv.DictReader over CSV text; an open reader (e.g. a watermark filter) is used as is."""
+    if isinstance(csv_content, csv.DictReader):
+        return csv_content
+    return csv.DictReader(io.StringIO(csv_content))
+
+
 def parse_customers_data(csv_content):
     """Parse customers CSV - 52 columns matching actual CSV structure."""
     from datetime import datetime
@@ -93,11 +132,10 @@ def parse_customers_data(csv_content):
         except:
             return None
     
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('user_id')),
             parse_int(row.get('club_principal_user_id')),
             parse_int(row.get('coupon_id')),
@@ -150,19 +188,15 @@ def parse_customers_data(csv_content):
             row.get('external_id'),
             convert_timestamp(row.get('created_at')),
             convert_timestamp(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} customer records")
-    return data_rows
+        )
 
 
 def parse_locations_data(csv_content):
     """Parse locations CSV - 22 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             row.get('code'),
             row.get('location_name'),
@@ -185,19 +219,15 @@ def parse_locations_data(csv_content):
             parse_int(row.get('is_active')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} location records")
-    return data_rows
+        )
 
 
 def parse_seasons_data(csv_content):
     """Parse seasons CSV - 20 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('season_name'),
@@ -218,16 +248,12 @@ def parse_seasons_data(csv_content):
             row.get('holiday_max_end_time'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} season records")
-    return data_rows
+        )
 
 
 def parse_accessories_data(csv_content):
     """Parse accessories CSV - 19 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     def convert_yes_no(value):
         """Convert boolean-like value to Yes/No string."""
@@ -236,7 +262,7 @@ def parse_accessories_data(csv_content):
         return 'Yes' if value == '1' else 'No'
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('accessory_name'),
@@ -256,16 +282,12 @@ def parse_accessories_data(csv_content):
             parse_int(row.get('max_same_departures')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} accessory records")
-    return data_rows
+        )
 
 
 def parse_accessory_options_data(csv_content):
     """Parse accessory_options CSV - 6 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     def convert_yes_no(value):
         """Convert boolean-like value to Yes/No string."""
@@ -274,30 +296,26 @@ def parse_accessory_options_data(csv_content):
         return 'Yes' if value == '1' else 'No'
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('accessory_id')),
             row.get('value'),
             convert_yes_no(row.get('use_striped_background')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} accessory option records")
-    return data_rows
+        )
 
 
 def parse_accessory_tiers_data(csv_content):
     """Parse accessory_tiers CSV - 8 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
         # Default min_hours and max_hours to 0 if NULL
         min_hours = parse_int(row.get('min_hours'))
         max_hours = parse_int(row.get('max_hours'))
         
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('accessory_id')),
             min_hours if min_hours is not None else 0,
@@ -306,16 +324,12 @@ def parse_accessory_tiers_data(csv_content):
             parse_int(row.get('accessory_option_id')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} accessory tier records")
-    return data_rows
+        )
 
 
 def parse_amenities_data(csv_content):
     """Parse amenities CSV - 16 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     def convert_yes_no(value):
         """Convert boolean-like value to Yes/No string."""
@@ -324,7 +338,7 @@ def parse_amenities_data(csv_content):
         return 'Yes' if value == '1' else 'No'
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('amenity_name'),
@@ -341,16 +355,12 @@ def parse_amenities_data(csv_content):
             row.get('description'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} amenity records")
-    return data_rows
+        )
 
 
 def parse_categories_data(csv_content):
     """Parse categories CSV - 15 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     def convert_yes_no(value):
         """Convert boolean-like value to Yes/No string."""
@@ -369,7 +379,7 @@ def parse_categories_data(csv_content):
         if min_nights is None:
             min_nights = 1
         
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('category_name'),
@@ -385,34 +395,26 @@ def parse_categories_data(csv_content):
             row.get('description'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} category records")
-    return data_rows
+        )
 
 
 def parse_holidays_data(csv_content):
     """Parse holidays CSV - 2 columns (no ID column)."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('location_id')),
             parse_date(row.get('holiday_date'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} holiday records")
-    return data_rows
+        )
 
 
 def parse_bookings_data(csv_content):
     """Parse bookings CSV - 82 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_int(row.get('customer_id')),
@@ -495,10 +497,7 @@ def parse_bookings_data(csv_content):
             parse_date(parse_date(row.get('updated_at'))),
             parse_date(row.get('finalized_at')),
             parse_date(parse_date(row.get('deleted_at')))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} booking records")
-    return data_rows
+        )
 
 
 def parse_booking_boats_data(csv_content):
@@ -519,8 +518,7 @@ def parse_booking_boats_data(csv_content):
             except:
                 return None
     
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
         # Strip non-numeric characters from boat_id (e.g., "BOAT-123" -> "123")
@@ -541,7 +539,7 @@ def parse_booking_boats_data(csv_content):
                 if boat_id_parsed is None:
                     boat_id_parsed = 0
         
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('booking_id')),
             parse_int(row.get('style_id')),
@@ -599,19 +597,15 @@ def parse_booking_boats_data(csv_content):
             convert_timestamp(row.get('created_at')),
             convert_timestamp(row.get('updated_at')),
             convert_timestamp(row.get('deleted_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} booking boat records")
-    return data_rows
+        )
 
 
 def parse_booking_payments_data(csv_content):
     """Parse booking_payments CSV - 56 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('booking_id')),
             parse_int(row.get('customer_id')),
@@ -668,19 +662,15 @@ def parse_booking_payments_data(csv_content):
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at')),
             parse_date(row.get('deleted_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} booking payment records")
-    return data_rows
+        )
 
 
 def parse_booking_accessories_data(csv_content):
     """Parse booking_accessories CSV - 8 columns (no ID, composite key)."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('booking_id')),
             parse_int(row.get('accessory_id')),
             parse_int(row.get('qty')),
@@ -689,19 +679,15 @@ def parse_booking_accessories_data(csv_content):
             parse_int(row.get('accessory_option_id')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} booking accessory records")
-    return data_rows
+        )
 
 
 def parse_style_groups_data(csv_content):
     """Parse style_groups CSV - 11 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('group_name'),
@@ -713,19 +699,15 @@ def parse_style_groups_data(csv_content):
             row.get('safety_video_link'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style group records")
-    return data_rows
+        )
 
 
 def parse_styles_data(csv_content):
     """Parse styles CSV - 98 columns (matches database schema exactly)."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_int(row.get('style_group_id')),
@@ -824,19 +806,15 @@ def parse_styles_data(csv_content):
             row.get('billable_unit_type'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style records")
-    return data_rows
+        )
 
 
 def parse_style_boats_data(csv_content):
     """Parse style_boats CSV - 39 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('style_id')),
             row.get('boat_number'),
@@ -876,19 +854,15 @@ def parse_style_boats_data(csv_content):
             row.get('buoy_insurance_status'),
             parse_date(parse_date(row.get('created_at'))),
             parse_date(parse_date(row.get('updated_at')))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style boat records")
-    return data_rows
+        )
 
 
 def parse_customer_boats_data(csv_content):
     """Parse customer_boats CSV - 9 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('customer_id')),
             parse_int(row.get('slip_id')),
@@ -898,36 +872,28 @@ def parse_customer_boats_data(csv_content):
             parse_float(row.get('width')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} customer boat records")
-    return data_rows
+        )
 
 
 def parse_season_dates_data(csv_content):
     """Parse season_dates CSV - 4 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('season_id')),
             parse_date(row.get('start_date')),
             parse_date(row.get('end_date'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} season date records")
-    return data_rows
+        )
 
 
 def parse_style_hourly_prices_data(csv_content):
     """Parse style_hourly_prices CSV - 22 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('style_id')),
             parse_int(row.get('season_id')),
@@ -950,19 +916,15 @@ def parse_style_hourly_prices_data(csv_content):
             parse_float(row.get('max_hours')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style hourly price records")
-    return data_rows
+        )
 
 
 def parse_style_times_data(csv_content):
     """Parse style_times CSV - 26 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('style_id')),
             parse_int(row.get('season_id')),
@@ -989,19 +951,15 @@ def parse_style_times_data(csv_content):
             parse_int(row.get('mapped_time_id')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style time records")
-    return data_rows
+        )
 
 
 def parse_style_prices_data(csv_content):
     """Parse style_prices CSV - 12 columns, uses TIME_ID as PK (not ID)."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('time_id')),
             parse_float(row.get('default_price')),
             parse_float(row.get('holiday')),
@@ -1014,19 +972,15 @@ def parse_style_prices_data(csv_content):
             parse_float(row.get('friday')),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} style price records")
-    return data_rows
+        )
 
 
 def parse_club_tiers_data(csv_content):
     """Parse club_tiers CSV - 28 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('tier_name'),
@@ -1055,19 +1009,15 @@ def parse_club_tiers_data(csv_content):
             row.get('status'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} club tier records")
-    return data_rows
+        )
 
 
 def parse_coupons_data(csv_content):
     """Parse coupons CSV - 30 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('code'),
@@ -1098,19 +1048,15 @@ def parse_coupons_data(csv_content):
             row.get('valid_styles'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} coupon records")
-    return data_rows
+        )
 
 
 def parse_pos_items_data(csv_content):
     """Parse pos_items CSV - 9 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('sku'),
@@ -1120,19 +1066,15 @@ def parse_pos_items_data(csv_content):
             row.get('tax_exempt'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} POS item records")
-    return data_rows
+        )
 
 
 def parse_pos_sales_data(csv_content):
     """Parse pos_sales CSV - 11 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_int(row.get('admin_id')),
@@ -1144,19 +1086,15 @@ def parse_pos_sales_data(csv_content):
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at')),
             parse_date(row.get('deleted_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} POS sale records")
-    return data_rows
+        )
 
 
 def parse_fuel_sales_data(csv_content):
     """Parse fuel_sales CSV - 14 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_int(row.get('admin_id')),
@@ -1171,19 +1109,15 @@ def parse_fuel_sales_data(csv_content):
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at')),
             parse_date(row.get('deleted_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} fuel sale records")
-    return data_rows
+        )
 
 
 def parse_waitlists_data(csv_content):
     """Parse waitlists CSV - 18 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_int(row.get('category_id')),
@@ -1202,19 +1136,15 @@ def parse_waitlists_data(csv_content):
             parse_date(row.get('fulfilled_date')),
             parse_date(parse_date(row.get('created_at'))),
             parse_date(parse_date(row.get('updated_at')))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} waitlist records")
-    return data_rows
+        )
 
 
 def parse_closed_dates_data(csv_content):
     """Parse closed_dates CSV - 9 columns matching actual CSV structure."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             parse_date(row.get('closed_date')),
@@ -1224,19 +1154,15 @@ def parse_closed_dates_data(csv_content):
             row.get('allow_frontend_returns'),
             parse_date(row.get('created_at')),
             parse_date(row.get('updated_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} closed date records")
-    return data_rows
+        )
 
 
 def parse_blacklists_data(csv_content):
     """Parse blacklists CSV - 10 columns (no updated_at in CSV)."""
-    reader = csv.DictReader(io.StringIO(csv_content))
-    data_rows = []
+    reader = csv_dict_reader(csv_content)
     
     for row in reader:
-        data_rows.append((
+        yield (
             parse_int(row.get('id')),
             parse_int(row.get('location_id')),
             row.get('firstname'),
@@ -1247,40 +1173,42 @@ def parse_blacklists_data(csv_content):
             row.get('dl_number'),
             row.get('notes'),
             parse_date(row.get('created_at'))
-        ))
-    
-    logger.info(f"Parsed {len(data_rows)} blacklist records")
-    return data_rows
+        )
 
 
-def find_latest_data_file_in_s3(s3_client, bucket):
+# Last-edited column of the Stellar tables and its layouts, for incremental loads
+STELLAR_WATERMARK_COLUMN = 'updated_at'
+STELLAR_TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d')
+
+# Tables merged right after their load in the 'auto' merge mode (the ones
+# whose insert methods used to merge inline); the others are deferred
+STELLAR_INLINE_MERGES = frozenset({
+    'customers', 'bookings', 'booking_boats', 'booking_payments', 'styles',
+    'style_boats', 'style_hourly_prices', 'style_times', 'style_prices',
+    'pos_items', 'pos_sales'
+})
+
+# Largest tables, whose insert methods take a bulk mode (see bulk_load.py)
+STELLAR_BULK_LOAD_TABLES = frozenset({'bookings', 'booking_payments'})
+
+
+def find_latest_data_file_in_s3(s3_client, bucket, start_after=None):
     """
     Find the most recent -DATA.sql.gz file in S3 bucket root.
     Files are named like: prod_resilient_2025-10-01_16_03-DATA.sql.gz
+    
+    Only recent keys are listed (see s3_discovery.py): those after
+    start_after, or else the current month's, stepping back month by month.
     """
     try:
-        response = s3_client.list_objects_v2(Bucket=bucket)
-        
-        if 'Contents' not in response:
-            logger.warning(f"No files found in bucket: {bucket}")
-            return None
+        latest_file = find_latest_key(s3_client, bucket, STELLAR_BACKUP_KEYS, start_after=start_after)
         
-        # Filter for -DATA.sql.gz files only
-        data_files = [obj for obj in response['Contents'] 
-                      if obj['Key'].endswith('-DATA.sql.gz')]
-        
-        if not data_files:
+        if not latest_file:
             logger.warning(f"No -DATA.sql.gz files found in bucket: {bucket}")
             return None
         
-        # Sort by last modified date (most recent first)
-        data_files.sort(key=lambda x: x['LastModified'], reverse=True)
-        latest_file = data_files[0]
-        
-        logger.info(f"Found latest DATA file: {latest_file['Key']}")
-        logger.info(f"  Last Modified: {latest_file['LastModified']}")
-        logger.info(f"  Size: {latest_file['Size']:,} bytes")
-        return latest_file['Key']
+        logger.info(f"Found latest DATA file: {latest_file}")
+        return latest_file
         
     except Exception as e:
         logger.error(f"Error finding latest DATA file: {e}")
@@ -1289,69 +1217,171 @@ def find_latest_data_file_in_s3(s3_client, bucket):
 
 def extract_table_data_from_sql(sql_content, table_name):
     """
-    Extract INSERT statements for a specific table from SQL dump.
-    Returns list of tuples containing the data rows.
+    Extract the INSERT rows of one table from a SQL dump.
+
+    The dump is streamed once through SqlDumpTokenizer, so extended
+    (multi-row) inserts, escapes and binary strings are handled without
+    regex backtracking over the whole dump.
+
+    Args:
+        sql_content: Binary file-like object (e.g. a GzipFile), bytes, or str
+        table_name (str): Table to extract
+
+    Returns:
+        list: Row tuples of the table
     """
-    import re
-    
     logger.info(f"Extracting data for table: {table_name.upper()}")
-    
-    # Pattern to match INSERT INTO statements for this table
-    # Example: INSERT INTO `customers` VALUES (1,'John',...);
-    pattern = rf"INSERT INTO `{table_name}` VALUES\s*\((.*?)\);"
-    
-    matches = re.findall(pattern, sql_content, re.IGNORECASE | re.DOTALL)
-    
-    if not matches:
+
+    data_rows = []
+    row_counts = dispatch_rows(sql_content, {table_name: data_rows.append})
+
+    if not row_counts[table_name]:
         logger.warning(f"No INSERT statements found for table: {table_name}")
         return []
-    
-    data_rows = []
-    for match in matches:
-        # Split by comma, but respect quotes and parentheses
-        # This is a simplified parser - may need enhancement
-        values = []
-        current_value = ""
-        in_quotes = False
-        paren_depth = 0
+
+    logger.info(f"Extracted {row_counts[table_name]} rows from {table_name}")
+    return data_rows
+
+
+def load_stellar_table(
+    table_name,
+    parser_func,
+    insert_func,
+    csv_content,
+    connector,
+    watermark=None,
+    parsed_cache=None,
+    content_hash=None,
+    checkpoint=None,
+    merges=None,
+    bulk_mode=CONVENTIONAL
+):
+    """
+    Parse one Stellar CSV member and load it through the given connector.
+    
+    The staging table is truncated and reloaded, and the table's merge is
+    handed to the merge scheduler, which runs it right away (streamed) or
+    once every table is loaded (deferred). A full read of a member
+    that was parsed before takes its rows from the parsed-table cache. Rows
+    stream from the parser (or the cache) to the insert batches, so only one
+    batch of the table is held as row tuples at a time. A
+    table the checkpoint shows as loaded by an interrupted run is skipped;
+    its merge is still scheduled if that run did not get to it.
+    
+    Args:
+        table_name (str): Stellar table name (e.g. 'customers')
+        parser_func (callable): Parser turning CSV content into row tuples
+        insert_func (callable): Unbound OracleConnector insert method
+        csv_content (str): Decoded CSV member content
+        connector (OracleConnector): Connector (or pooled session) to load with
+        watermark (WatermarkFilter): Filter to read the CSV through, or None
+        parsed_cache (ParsedTableCache): Cache of parsed tables, or None
+        content_hash (str): Digest of the member, the parsed-table cache key
+        checkpoint (TableCheckpoint): The table's checkpoint, or None
+        merges (MergeScheduler): Scheduler of the table's merge, or None
+        bulk_mode (str): Bulk mode for a table in STELLAR_BULK_LOAD_TABLES
         
-        for char in match + ',':
-            if char == "'" and (not current_value or current_value[-1] != '\\'):
-                in_quotes = not in_quotes
-                current_value += char
-            elif char == '(' and not in_quotes:
-                paren_depth += 1
-                current_value += char
-            elif char == ')' and not in_quotes:
-                paren_depth -= 1
-                current_value += char
-            elif char == ',' and not in_quotes and paren_depth == 0:
-                # End of value
-                val = current_value.strip()
-                # Remove quotes and handle NULL
-                if val.upper() == 'NULL':
-                    values.append(None)
-                elif val.startswith("'") and val.endswith("'"):
-                    # Remove quotes and unescape
-                    values.append(val[1:-1].replace("\\'", "'").replace("\\\\", "\\"))
-                else:
-                    # Try to convert to int or float
-                    try:
-                        if '.' in val:
-                            values.append(float(val))
-                        else:
-                            values.append(int(val))
-                    except:
-                        values.append(val)
-                current_value = ""
-            else:
-                current_value += char
+    Returns:
+        int: Number of records loaded (0 if the CSV had no data rows, or
+             none changed since the watermark), without rejected rows
+    """
+    if checkpoint is not None and checkpoint.loaded:
+        if merges is not None and checkpoint.status != MERGED and checkpoint.rows_done:
+            merges.staged(connector, table_name)
+        logger.info(
+            f"⏩ {table_name} was loaded by the interrupted run "
+            f"({checkpoint.rows_done:,} records) - skipped"
+        )
+        return checkpoint.rows_done
+    
+    cacheable = parsed_cache is not None and not (
+        watermark is not None and watermark.incremental
+    )
+    parsed = parsed_cache.lookup(table_name, content_hash, parser_func) if cacheable else None
+    parsed_writer = None
+    if parsed is not None:
+        if watermark is not None:
+            watermark.restore(parsed.high_water, parsed.row_count)
+        data_rows = parsed.rows()
+    else:
+        source = watermark.reader(csv_content) if watermark is not None else csv_content
+        data_rows = parser_func(source)
+        if cacheable:
+            parsed_writer = parsed_cache.writer(table_name, content_hash, parser_func)
+            data_rows = parsed_writer.capture(data_rows)
+    
+    # Rows stream from the parser (or the cache) into the insert batches;
+    # the first row tells whether there are any before the table is truncated
+    data_rows = iter(data_rows)
+    first_row = next(data_rows, None)
+    if first_row is None and not (watermark is not None and watermark.skipped):
+        if parsed_writer is not None:
+            parsed_writer.commit(watermark.high_water if watermark is not None else None)
+        logger.warning(f"No data rows parsed for {table_name}")
+        return 0
+    
+    staging_table = f"STG_STELLAR_{table_name.upper()}"
+    # Rows the database rejected (see row_quarantine.py) are not counted
+    loaded = 0
+    try:
+        logger.info(f"Truncating {staging_table}...")
+        connector.cursor.execute(f"TRUNCATE TABLE {staging_table}")
+        connector.connection.commit()
         
-        if values:
-            data_rows.append(tuple(values))
+        if first_row is not None:
+            data_rows = itertools.chain((first_row,), data_rows)
+            if table_name in STELLAR_BULK_LOAD_TABLES:
+                loaded = insert_func(connector, data_rows, bulk_mode=bulk_mode)
+            else:
+                loaded = insert_func(connector, data_rows)
+    except BaseException:
+        if parsed_writer is not None:
+            parsed_writer.abort()
+        raise
+    if parsed_writer is not None:
+        parsed_writer.commit(watermark.high_water if watermark is not None else None)
+    
+    skipped = watermark.skipped if watermark is not None else 0
+    if skipped:
+        logger.info(
+            f"🕒 {table_name}: incremental since {watermark.since}, "
+            f"{skipped:,} older rows skipped"
+        )
+    if checkpoint is not None:
+        checkpoint.record(connector, STAGED, loaded)
+    if merges is not None and first_row is not None:
+        merges.staged(connector, table_name)
     
-    logger.info(f"Extracted {len(data_rows)} rows from {table_name}")
-    return data_rows
+    logger.info(
+        f"✅ Successfully processed {table_name}: "
+        f"{loaded} records"
+    )
+    return loaded
+
+
+def describe_load_error(error):
+    """
+    Categorize a table load error for the processing report.
+    
+    Args:
+        error (Exception): Exception raised while loading the table
+        
+    Returns:
+        str: Short description of the failure
+    """
+    error_msg = str(error)
+    if 'ORA-01843' in error_msg:
+        return "Date format error"
+    if 'ORA-01400' in error_msg:
+        # Extract column name from error
+        match = re.search(r'"([^"]+)"', error_msg)
+        col = match.group(1) if match else "unknown column"
+        return f"NULL constraint: {col}"
+    if 'ORA-00932' in error_msg:
+        return "Data type mismatch"
+    if 'ORA-01036' in error_msg:
+        return "Bind variable count mismatch"
+    return error_msg[:100]
 
 
 def process_stellar_data_from_s3(
@@ -1361,7 +1391,25 @@ def process_stellar_data_from_s3(
     db_password,
     db_dsn,
     aws_access_key_id=None,
-    aws_secret_access_key=None
+    aws_secret_access_key=None,
+    load_workers=1,
+    skip_unchanged=True,
+    incremental=False,
+    watermark_overlap=DEFAULT_WATERMARK_OVERLAP,
+    full_refresh_days=DEFAULT_FULL_REFRESH_DAYS,
+    force=False,
+    download_workers=DEFAULT_DOWNLOAD_WORKERS,
+    archive_cache_dir=None,
+    archive_cache_gb=DEFAULT_ARCHIVE_CACHE_GB,
+    from_local=None,
+    parsed_cache_dir=None,
+    resume=False,
+    merge_mode=AUTO,
+    bulk_mode=CONVENTIONAL,
+    commit_mode=AUTO_COMMIT,
+    batch_size=None,
+    reject_bad_rows=False,
+    quarantine_dir=None
 ):
     """
     Main Stellar data processing function.
@@ -1370,9 +1418,65 @@ def process_stellar_data_from_s3(
     
     The backup file is a .tar.gz containing CSV files in data/ directory.
     Example: prod_resilient_2025-11-12_09_52-DATA.sql.gz
+    
+    With load_workers > 1 the tables are loaded concurrently over a
+    connection pool of that size (see parallel_loader.py) while the tarball
+    keeps streaming; per-table load times are logged and returned.
+    
+    With skip_unchanged, a table whose CSV member hashes to the digest in the
+    load manifest (see load_manifest.py) is not parsed, loaded or merged; its
+    staging table keeps the data of the load that produced that digest.
+    
+    With incremental, only rows whose updated_at is after the table's
+    high-water mark minus watermark_overlap are loaded (see watermarks.py);
+    a table gets a full load when its last one is older than full_refresh_days.
+    
+    A DATA file whose key and ETag are in the processed-object ledger (see
+    object_ledger.py) is not streamed again unless force is set; the result
+    then only reports 'already_processed'.
+    
+    The DATA file is downloaded as download_workers concurrent byte ranges
+    ahead of the tarball reader and checked against its ETag at the end
+    (see s3_download.py).
+    
+    The streamed DATA file is copied into the archive cache under
+    archive_cache_dir (see archive_cache.py), so a retry of the same object
+    reads it from disk. With from_local, that file (or the newest DATA file
+    in that directory) is replayed instead, without S3 or the ledger.
+    
+    Tables read in full are kept in the parsed-table cache under
+    parsed_cache_dir (see parsed_cache.py), so the same member is not parsed
+    again on a retry or backfill.
+    
+    Each loaded table is checkpointed (see checkpoints.py); with resume, a
+    load of the same DATA file that failed or was stopped skips the tables
+    it already loaded.
+    
+    Each loaded table's merge procedure runs exactly once (see
+    merge_scheduler.py): with merge_mode 'streamed' right after its load,
+    with 'deferred' once the whole tarball is loaded, in parallel; 'auto'
+    streams the tables in STELLAR_INLINE_MERGES and defers the rest.
+    
+    With bulk_mode 'append' or 'direct', the tables in
+    STELLAR_BULK_LOAD_TABLES are inserted with APPEND_VALUES (see
+    bulk_load.py; their inserts convert timestamps in SQL, so direct path
+    does not apply).
+    
+    The insert methods bind batch_size rows at a time (None sizes the arrays
+    from each table's width) and commit per commit_mode (see load_policy.py).
+    Every table is truncated right before its load, and a TRUNCATE commits,
+    so 'run' commits per table here; 'auto' commits per table as well.
+    
+    With reject_bad_rows, rows the database rejects are quarantined (see
+    row_quarantine.py) and the rest of their table is loaded.
     """
-    import tarfile
-    import gzip as gzip_module
+    if commit_mode == PER_RUN:
+        logger.info(
+            "💾 Commit per run does not apply to Stellar (each table is truncated "
+            "before its load) - committing per table"
+        )
+        commit_mode = PER_TABLE
+    load_policy = LoadPolicy(commit_mode, batch_size)
     
     logger.info("=" * 80)
     logger.info("STELLAR BUSINESS DATA PROCESSING - START")
@@ -1396,170 +1500,369 @@ def process_stellar_data_from_s3(
         logger.exception(f"Failed to initialize S3 client: {e}")
         raise
     
-    # Find and download latest DATA file
-    latest_file = find_latest_data_file_in_s3(s3_client, bucket)
-    if not latest_file:
-        logger.error("No DATA file found in S3 bucket")
-        return
-    
+    # Initialize Oracle database before streaming, so each table is loaded
+    # as soon as its CSV member arrives. With several load workers every
+    # table gets its own session from a pool; otherwise all tables share
+    # one connection and load in archive order.
+    db_connector = None
+    pool = None
     try:
-        logger.info(f"Downloading: s3://{bucket}/{latest_file}")
-        response = s3_client.get_object(Bucket=bucket, Key=latest_file)
-        
-        # Decompress gzip
-        with gzip_module.GzipFile(fileobj=response['Body']) as gzipfile:
-            tar_content = gzipfile.read()
-        
-        logger.info(f"Downloaded and decompressed {len(tar_content):,} bytes")
-        
-        # Extract tarball
-        tar_like = io.BytesIO(tar_content)
-        tar = tarfile.open(fileobj=tar_like)
-        
-        logger.info(f"Tarball contains {len(tar.getnames())} files")
-        
-    except Exception as e:
-        logger.exception(f"Failed to download/extract tarball: {e}")
-        raise
-    
-    # Initialize Oracle database
-    try:
-        db_connector = OracleConnector(db_user, db_password, db_dsn)
+        if load_workers > 1:
+            pool = OracleConnector.create_pool(db_user, db_password, db_dsn, load_workers)
+            connect = partial(OracleConnector.from_pool, pool, load_policy)
+        else:
+            db_connector = OracleConnector(db_user, db_password, db_dsn, load_policy)
+            connect = partial(nullcontext, db_connector)
         logger.info("Connected to Oracle database")
     except Exception as e:
         logger.exception(f"Failed to connect to Oracle: {e}")
         raise
     
-    # Define tables to process with their insert functions and parsers
+    ledger = ProcessedObjectLedger('STELLAR')
+    data_etag = None
+    archive_path = None
+    processed_at = None
+    if from_local:
+        # Replay a local archive: S3 is not accessed and the ledger is
+        # neither checked nor updated
+        latest_file = archive_path = find_local_archive(from_local, STELLAR_BACKUP_KEYS)
+        if not latest_file:
+            logger.error(f"No Stellar DATA file found in {from_local}")
+            if db_connector is not None:
+                db_connector.close()
+            if pool is not None:
+                pool.close()
+            return
+        logger.info(f"📂 Replaying local archive {latest_file} (S3 is not accessed)")
+    else:
+        # Find latest DATA file, listing only the keys after the last one loaded
+        with connect() as connector:
+            last_key = ledger.last_key(connector, bucket)
+        latest_file = find_latest_data_file_in_s3(s3_client, bucket, start_after=last_key)
+        if not latest_file:
+            logger.error("No DATA file found in S3 bucket")
+            if db_connector is not None:
+                db_connector.close()
+            if pool is not None:
+                pool.close()
+            return
+        
+        # Stop here if this exact object (key and ETag) was already loaded
+        data_etag = object_etag(s3_client, bucket, latest_file)
+        with connect() as connector:
+            processed_at = ledger.processed_at(connector, bucket, latest_file, data_etag)
+    if processed_at is not None:
+        if not force:
+            logger.info(
+                f"⏭️  s3://{bucket}/{latest_file} (ETag {data_etag}) was already "
+                f"processed at {processed_at} - nothing to do (use --force to reload)"
+            )
+            if db_connector is not None:
+                db_connector.close()
+            if pool is not None:
+                pool.close()
+            return {
+                'already_processed': True,
+                'data_file': latest_file,
+                'processed_at': str(processed_at)
+            }
+        logger.info(f"🔁 --force: reprocessing {latest_file} (processed at {processed_at})")
+    
+    # Content digests of the last successful load per table
+    with connect() as connector:
+        manifest = LoadManifest.load(connector, 'STELLAR')
+        watermarks = WatermarkStore.load(
+            connector, 'STELLAR', watermark_overlap, full_refresh_days
+        )
+    if not skip_unchanged:
+        logger.info("🔁 Full reload requested - unchanged tables are loaded too")
+    
+    # Typed columns of tables parsed before, by member content hash
+    parsed_cache = ParsedTableCache.open(parsed_cache_dir, 'STELLAR')
+    
+    # Tables loaded so far, to resume an interrupted load
+    with connect() as connector:
+        journal = CheckpointJournal.open(
+            connector, 'STELLAR',
+            os.path.basename(latest_file) if from_local else latest_file,
+            data_etag, resume=resume
+        )
+        
+        # Rows the database rejects are set aside instead of failing their table
+        quarantine = None
+        if reject_bad_rows:
+            quarantine = RowQuarantine.open(
+                connector, 'STELLAR', journal.object_key, quarantine_dir
+            )
+            load_policy.quarantine = quarantine
+    
+    # Define tables to process with their parsers and insert methods; the
+    # insert method is called on whichever connector loads the table
     tables_to_process = [
-        ('customers', parse_customers_data, db_connector.insert_customers),
-        ('locations', parse_locations_data, db_connector.insert_locations),
-        ('seasons', parse_seasons_data, db_connector.insert_seasons),
-        ('accessories', parse_accessories_data, db_connector.insert_accessories),
+        ('customers', parse_customers_data, OracleConnector.insert_customers),
+        ('locations', parse_locations_data, OracleConnector.insert_locations),
+        ('seasons', parse_seasons_data, OracleConnector.insert_seasons),
+        ('accessories', parse_accessories_data, OracleConnector.insert_accessories),
         ('accessory_options', parse_accessory_options_data,
-         db_connector.insert_accessory_options),
+         OracleConnector.insert_accessory_options),
         ('accessory_tiers', parse_accessory_tiers_data,
-         db_connector.insert_accessory_tiers),
-        ('amenities', parse_amenities_data, db_connector.insert_amenities),
-        ('categories', parse_categories_data, db_connector.insert_categories),
-        ('holidays', parse_holidays_data, db_connector.insert_holidays),
-        ('bookings', parse_bookings_data, db_connector.insert_bookings),
+         OracleConnector.insert_accessory_tiers),
+        ('amenities', parse_amenities_data, OracleConnector.insert_amenities),
+        ('categories', parse_categories_data, OracleConnector.insert_categories),
+        ('holidays', parse_holidays_data, OracleConnector.insert_holidays),
+        ('bookings', parse_bookings_data, OracleConnector.insert_bookings),
         ('booking_boats', parse_booking_boats_data,
-         db_connector.insert_booking_boats),
+         OracleConnector.insert_booking_boats),
         ('booking_payments', parse_booking_payments_data,
-         db_connector.insert_booking_payments),
+         OracleConnector.insert_booking_payments),
         ('booking_accessories', parse_booking_accessories_data,
-         db_connector.insert_booking_accessories),
+         OracleConnector.insert_booking_accessories),
         ('style_groups', parse_style_groups_data,
-         db_connector.insert_style_groups),
-        ('styles', parse_styles_data, db_connector.insert_styles),
+         OracleConnector.insert_style_groups),
+        ('styles', parse_styles_data, OracleConnector.insert_styles),
         ('style_boats', parse_style_boats_data,
-         db_connector.insert_style_boats),
+         OracleConnector.insert_style_boats),
         ('customer_boats', parse_customer_boats_data,
-         db_connector.insert_customer_boats),
+         OracleConnector.insert_customer_boats),
         ('season_dates', parse_season_dates_data,
-         db_connector.insert_season_dates),
+         OracleConnector.insert_season_dates),
         ('style_hourly_prices', parse_style_hourly_prices_data,
-         db_connector.insert_style_hourly_prices),
+         OracleConnector.insert_style_hourly_prices),
         ('style_times', parse_style_times_data,
-         db_connector.insert_style_times),
+         OracleConnector.insert_style_times),
         ('style_prices', parse_style_prices_data,
-         db_connector.insert_style_prices),
-        ('club_tiers', parse_club_tiers_data, db_connector.insert_club_tiers),
-        ('coupons', parse_coupons_data, db_connector.insert_coupons),
-        ('pos_items', parse_pos_items_data, db_connector.insert_pos_items),
-        ('pos_sales', parse_pos_sales_data, db_connector.insert_pos_sales),
-        ('fuel_sales', parse_fuel_sales_data, db_connector.insert_fuel_sales),
-        ('waitlists', parse_waitlists_data, db_connector.insert_waitlists),
+         OracleConnector.insert_style_prices),
+        ('club_tiers', parse_club_tiers_data, OracleConnector.insert_club_tiers),
+        ('coupons', parse_coupons_data, OracleConnector.insert_coupons),
+        ('pos_items', parse_pos_items_data, OracleConnector.insert_pos_items),
+        ('pos_sales', parse_pos_sales_data, OracleConnector.insert_pos_sales),
+        ('fuel_sales', parse_fuel_sales_data, OracleConnector.insert_fuel_sales),
+        ('waitlists', parse_waitlists_data, OracleConnector.insert_waitlists),
         ('closed_dates', parse_closed_dates_data,
-         db_connector.insert_closed_dates),
-        ('blacklists', parse_blacklists_data, db_connector.insert_blacklists),
+         OracleConnector.insert_closed_dates),
+        ('blacklists', parse_blacklists_data, OracleConnector.insert_blacklists),
     ]
     
-    # Process each table
+    def merge_table(connector, task):
+        """Run one table's merge procedure and checkpoint it as merged."""
+        stats = connector.merge_single_table(task.name)
+        checkpoint = journal.checkpoint(task.name)
+        checkpoint.record(connector, MERGED, checkpoint.rows_done)
+        return stats
+    
+    # Every loaded table is merged once, streamed after its load or
+    # deferred until the tarball is done
+    merges = MergeScheduler.plan(
+        connect, merge_table,
+        [
+            (table_name, f"SP_MERGE_STELLAR_{table_name.upper()}", (),
+             table_name in STELLAR_INLINE_MERGES)
+            for table_name, _, _ in tables_to_process
+        ],
+        mode=merge_mode, max_workers=load_workers
+    )
+    
+    # Map archive member names to their tables
+    tables_by_member = {
+        f"data/{table_name}.csv": (table_name, parser_func, insert_func)
+        for table_name, parser_func, insert_func in tables_to_process
+    }
+    
+    # Process each table as its member streams out of the tarball
     total_records = 0
     successful_tables = 0
     successful_tables_details = {}  # Track successful tables with record counts
     failed_tables = []
     failed_tables_details = {}  # Track error details for each failed table
-    
-    for table_name, parser_func, insert_func in tables_to_process:
-        try:
+    found_tables = set()
+    unchanged_tables = {}  # Tables skipped because their CSV did not change
+    content_hashes = {}
+    watermark_filters = {}  # {table_name: WatermarkFilter}
+    member_count = 0
+    
+    def table_jobs():
+        """Yield a load job per target member as the tarball streams in."""
+        nonlocal member_count
+        for member in tar:
+            member_count += 1
+            table = tables_by_member.get(member.name)
+            if table is None or not member.isfile():
+                continue
+            
+            table_name, parser_func, insert_func = table
+            found_tables.add(table_name)
+            
             logger.info(f"\nProcessing table: {table_name.upper()}")
+            csv_bytes = tar.extractfile(member).read()
+            logger.info(f"Extracted {len(csv_bytes):,} bytes from {member.name}")
             
-            # Look for CSV file in tarball
-            csv_filename = f"data/{table_name}.csv"
-            try:
-                csv_file = tar.extractfile(csv_filename)
-                if csv_file is None:
-                    logger.warning(f"File not found in tarball: {csv_filename}")
-                    failed_tables.append(table_name)
-                    continue
-                
-                csv_content = csv_file.read().decode('utf-8', errors='ignore')
-                logger.info(f"Extracted {len(csv_content):,} bytes from {csv_filename}")
-                
-            except KeyError:
-                logger.warning(f"File not found in tarball: {csv_filename}")
-                failed_tables.append(table_name)
+            # Skip the table if its member, parser and INSERT are identical
+            # to the last load
+            content_hash = hash_bytes(
+                csv_bytes, salt=parser_fingerprint(parser_func) + parser_fingerprint(insert_func)
+            )
+            if skip_unchanged and manifest.is_unchanged(table_name, content_hash):
+                logger.info(f"⏭️  {table_name} unchanged since the last load - skipped")
+                unchanged_tables[table_name] = manifest.last_row_count(table_name)
                 continue
+            content_hashes[table_name] = content_hash
+            csv_content = csv_bytes.decode('utf-8', errors='ignore')
+            csv_bytes = None
             
-            # Parse CSV content
-            data_rows = parser_func(csv_content)
-            
-            if data_rows:
-                staging_table = f"STG_STELLAR_{table_name.upper()}"
-                logger.info(f"Truncating {staging_table}...")
-                db_connector.cursor.execute(
-                    f"TRUNCATE TABLE {staging_table}"
+            # Track updated_at; incrementally, rows edited before the
+            # watermark are dropped before they are converted
+            watermark = None
+            if watermarks.enabled:
+                watermark = WatermarkFilter(
+                    STELLAR_WATERMARK_COLUMN,
+                    watermarks.cutoff(table_name) if incremental else None,
+                    DateColumnParser(STELLAR_TIMESTAMP_FORMATS).parse
                 )
-                db_connector.connection.commit()
-                
-                insert_func(data_rows)
-                
-                total_records += len(data_rows)
-                successful_tables += 1
-                successful_tables_details[table_name] = len(data_rows)
-                logger.info(
-                    f"✅ Successfully processed {table_name}: "
-                    f"{len(data_rows)} records"
+                watermark_filters[table_name] = watermark
+            
+            yield TableJob(
+                table_name,
+                partial(
+                    load_stellar_table, table_name, parser_func, insert_func,
+                    csv_content, watermark=watermark,
+                    parsed_cache=parsed_cache, content_hash=content_hash,
+                    checkpoint=journal.checkpoint(table_name), merges=merges,
+                    bulk_mode=bulk_mode
                 )
-            else:
-                logger.warning(f"No data rows parsed for {table_name}")
-                failed_tables.append(table_name)
-                failed_tables_details[table_name] = "No data rows in CSV file"
-                
-        except Exception as e:
-            error_msg = str(e)
-            logger.exception(f"Failed to process {table_name}: {e}")
+            )
+    
+    stream = None
+    tar = None
+    loader = ParallelTableLoader(connect, max_workers=load_workers)
+    cache = None if from_local else ArchiveCache.open(archive_cache_dir, archive_cache_gb)
+    if cache:
+        # A retry or backfill of the same object reads it from the archive cache
+        archive_path = cache.lookup(data_etag, latest_file)
+    try:
+        # Stream mode decompresses and walks the tarball sequentially while
+        # byte ranges further ahead download in parallel; the loader pulls
+        # the next member only when a worker is free, so at most one member
+        # per worker is held in memory
+        if archive_path:
+            logger.info(f"Streaming: {archive_path}")
+            stream = open(archive_path, 'rb')
+        else:
+            logger.info(f"Streaming: s3://{bucket}/{latest_file}")
+            stream = ParallelRangeStream(
+                s3_client, bucket, latest_file, download_workers, expected_etag=data_etag
+            )
+            if cache:
+                stream = CachingReader(stream, cache.writer(data_etag, latest_file))
+        tar = tarfile.open(fileobj=stream, mode='r|gz')
+        
+        results = loader.run(table_jobs())
+        
+        if archive_path:
+            compressed_bytes = os.fstat(stream.fileno()).st_size
+        else:
+            # Read the tarball's trailing padding and check the ETag
+            stream.finish()
+            compressed_bytes = stream.bytes_read
+        
+        logger.info(
+            f"Streamed {member_count} tarball members "
+            f"({compressed_bytes:,} compressed bytes)"
+        )
+        
+    except Exception as e:
+        logger.exception(f"Failed to download/extract tarball: {e}")
+        try:
+            if db_connector is not None:
+                db_connector.close()
+            if pool is not None:
+                pool.close(force=True)
+        except Exception:
+            pass
+        raise
+    
+    finally:
+        if tar is not None:
+            try:
+                tar.close()
+            except Exception as e:
+                logger.warning(f"Error closing tarball: {e}")
+        if stream is not None:
+            stream.close()
+    
+    log_table_timings(results, loader.wall_seconds, 'Stellar')
+    
+    # Merge the tables whose merge waited for the whole tarball
+    merges.run_deferred()
+    log_merge_timings(merges, 'Stellar')
+    if quarantine is not None:
+        quarantine.log_summary('Stellar')
+    failed_merges = merges.failed
+    
+    incremental_tables = {}  # {table_name: rows skipped by the watermark}
+    for table_name, result in results.items():
+        watermark = watermark_filters.get(table_name)
+        skipped = watermark.skipped if watermark is not None else 0
+        staging_table = f"STG_STELLAR_{table_name.upper()}"
+        if not result.ok:
             failed_tables.append(table_name)
-            
-            # Categorize the error for the report
-            if 'ORA-01843' in error_msg:
-                failed_tables_details[table_name] = "Date format error"
-            elif 'ORA-01400' in error_msg:
-                # Extract column name from error
-                import re
-                match = re.search(r'"([^"]+)"', error_msg)
-                col = match.group(1) if match else "unknown column"
-                failed_tables_details[table_name] = f"NULL constraint: {col}"
-            elif 'ORA-00932' in error_msg:
-                failed_tables_details[table_name] = "Data type mismatch"
-            elif 'ORA-01036' in error_msg:
-                failed_tables_details[table_name] = "Bind variable count mismatch"
-            else:
-                failed_tables_details[table_name] = error_msg[:100]
+            failed_tables_details[table_name] = describe_load_error(result.error)
+        elif table_name in failed_merges:
+            failed_tables.append(table_name)
+            failed_tables_details[table_name] = (
+                f"Merge failed: {describe_load_error(failed_merges[table_name].error)}"
+            )
+        elif result.record_count or skipped:
+            total_records += result.record_count
+            successful_tables += 1
+            successful_tables_details[table_name] = result.record_count
+            if watermark is not None and watermark.incremental:
+                incremental_tables[table_name] = skipped
+            # A table with rejected rows keeps its manifest entry and
+            # watermark, so that the next load reads the rejected rows again
+            if quarantine is not None and quarantine.has_rejected(staging_table):
+                continue
+            manifest.stage(
+                table_name, content_hashes[table_name], result.record_count + skipped
+            )
+            if watermark is not None:
+                watermarks.stage(table_name, watermark)
+        elif quarantine is not None and quarantine.has_rejected(staging_table):
+            # The CSV had rows, but the database rejected every one of them
+            failed_tables.append(table_name)
+            failed_tables_details[table_name] = (
+                f"All {quarantine.rejected[staging_table]:,} rows rejected (quarantined)"
+            )
+        else:
+            failed_tables.append(table_name)
+            failed_tables_details[table_name] = "No data rows in CSV file"
     
-    # Close tarball and connection
+    # Tables whose CSV never appeared in the tarball
+    for table_name, _, _ in tables_to_process:
+        if table_name not in found_tables:
+            logger.warning(f"File not found in tarball: data/{table_name}.csv")
+            failed_tables.append(table_name)
+    
+    # Record the tables loaded and merged in this run
     try:
-        tar.close()
+        with connect() as connector:
+            manifest.save(connector)
+            watermarks.save(connector)
+            
+            # The object counts as processed once every table in it loaded
+            if not failed_tables:
+                if data_etag is not None:
+                    ledger.record(connector, bucket, latest_file, data_etag, total_records)
+                journal.clear(connector)
     except Exception as e:
-        logger.warning(f"Error closing tarball: {e}")
+        logger.warning(f"Could not update load manifest: {e}")
     
+    # Close connection
     try:
-        db_connector.cursor.close()
-        db_connector.connection.close()
-        logger.info("Database connection closed")
+        if db_connector is not None:
+            db_connector.close()
+        if pool is not None:
+            pool.close()
+            logger.info("Database connection pool closed")
     except Exception as e:
         logger.warning(f"Error closing connection: {e}")
     
@@ -1572,6 +1875,15 @@ def process_stellar_data_from_s3(
         f"{len(tables_to_process)} tables"
     )
     logger.info(f"Total records loaded: {total_records}")
+    if unchanged_tables:
+        logger.info(
+            f"Unchanged since the last load (skipped): {len(unchanged_tables)} tables"
+        )
+    if incremental_tables:
+        logger.info(
+            f"Loaded incrementally: {len(incremental_tables)} tables "
+            f"({sum(incremental_tables.values()):,} rows older than the watermark skipped)"
+        )
     
     if failed_tables:
         logger.warning(f"Failed tables: {', '.join(failed_tables)}")
@@ -1582,8 +1894,16 @@ def process_stellar_data_from_s3(
     
     # Return processing results for caller to display
     return {
+        'data_file': os.path.basename(latest_file) if from_local else latest_file,
         'successful_tables': successful_tables_details,
         'failed_tables': failed_tables_details,
         'total_records': total_records,
-        'total_tables': len(tables_to_process)
+        'total_tables': len(tables_to_process),
+        'unchanged_tables': unchanged_tables,
+        'incremental_tables': incremental_tables,
+        'table_timings': {
+            table_name: result.seconds for table_name, result in results.items()
+        },
+        'merge_timings': merges.timings(),
+        'rejected_rows': dict(quarantine.rejected) if quarantine is not None else {}
     }
@@ -0,0 +1,224 @@
+"""
+Load Manifest Module
+
+Content-hash change detection for the staging loads.
+
+The ETL_LOAD_MANIFEST control table (tables/oracle_etl_control_tables.sql)
+records, per source system and table, the SHA-256 digest of the source data
+that was last loaded and merged successfully. When a table's digest matches
+the manifest, the pipelines skip it entirely: no parse, no staging load and
+no merge. Digests are salted with the table's INSERT statement and the
+fingerprint of its parser (see parsed_cache.parser_fingerprint), so a column
+change or a parser fix forces a reload even if the CSV did not change.
+
+A MOLO member is digested by streaming its decompressed bytes, chunk by
+chunk, so an unchanged table costs one decompression pass instead of a
+parse, staging load and merge; a Stellar table is digested from the dump
+data already in memory.
+
+A digest is only recorded once the table's data has reached the data
+warehouse: right after the load for tables merged inline, after the final
+merge procedure for the others. A failed or interrupted run therefore never
+causes a table to be skipped the next time.
+
+If the control table does not exist the manifest is disabled with a warning
+and every table loads as before.
+"""
+
+import hashlib
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_TABLE = 'ETL_LOAD_MANIFEST'
+
+# Bytes of a ZIP member digested at a time
+HASH_CHUNK_SIZE = 1024 * 1024
+
+MANIFEST_SELECT_SQL = f"""
+    SELECT TABLE_NAME, CONTENT_HASH, ROW_COUNT
+    FROM {MANIFEST_TABLE}
+    WHERE SOURCE_SYSTEM = :1"""
+
+MANIFEST_MERGE_SQL = f"""
+    MERGE INTO {MANIFEST_TABLE} tgt
+    USING (
+        SELECT :1 AS SOURCE_SYSTEM, :2 AS TABLE_NAME,
+               :3 AS CONTENT_HASH, :4 AS ROW_COUNT
+        FROM DUAL
+    ) src
+    ON (tgt.SOURCE_SYSTEM = src.SOURCE_SYSTEM AND tgt.TABLE_NAME = src.TABLE_NAME)
+    WHEN MATCHED THEN
+        UPDATE SET
+            tgt.CONTENT_HASH = src.CONTENT_HASH,
+            tgt.ROW_COUNT = src.ROW_COUNT,
+            tgt.LOADED_AT = SYSTIMESTAMP
+    WHEN NOT MATCHED THEN
+        INSERT (SOURCE_SYSTEM, TABLE_NAME, CONTENT_HASH, ROW_COUNT, LOADED_AT)
+        VALUES (src.SOURCE_SYSTEM, src.TABLE_NAME, src.CONTENT_HASH,
+                src.ROW_COUNT, SYSTIMESTAMP)"""
+
+
+def hash_bytes(data, salt=''):
+    """
+    Digest a table's source data held in memory.
+
+    Args:
+        data (bytes): Raw source data (e.g. a CSV member)
+        salt (str): Text mixed into the digest, typically the INSERT statement
+                    and parser fingerprint
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def hash_zip_member(archive, info, salt=''):
+    """
+    Digest a ZIP member's uncompressed data, streamed from the archive.
+
+    Args:
+        archive (zipfile.ZipFile): Open archive
+        info (zipfile.ZipInfo): Member entry
+        salt (str): Text mixed into the digest (INSERT statement and parser
+                    fingerprint)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    with archive.open(info) as member:
+        for chunk in iter(lambda: member.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LoadManifest:
+    """
+    Last successfully loaded content digest per table of one source system.
+
+    Lookups and staging are thread-safe, so parallel table loads can share
+    one manifest; reading and saving use whichever connector is passed in.
+
+    Attributes:
+        system (str): Source system ('MOLO' or 'STELLAR')
+        enabled (bool): False if the control table could not be read
+        entries (dict): {table_name: (content_hash, row_count)} from the last runs
+    """
+
+    def __init__(self, system, entries=None, enabled=True):
+        self.system = system
+        self.enabled = enabled
+        self.entries = dict(entries or {})
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, connector, system):
+        """
+        Read the manifest of a source system from the control table.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            system (str): Source system ('MOLO' or 'STELLAR')
+
+        Returns:
+            LoadManifest: Manifest (disabled if the control table is unavailable)
+        """
+        try:
+            connector.cursor.execute(MANIFEST_SELECT_SQL, [system])
+            entries = {
+                table_name: (content_hash, row_count)
+                for table_name, content_hash, row_count in connector.cursor.fetchall()
+            }
+        except Exception as e:
+            logger.warning(f"⚠️  Load manifest unavailable, loading every table: {e}")
+            logger.warning(
+                f"   Create {MANIFEST_TABLE} (tables/oracle_etl_control_tables.sql) "
+                "to skip unchanged tables."
+            )
+            connector.connection.rollback()
+            return cls(system, enabled=False)
+
+        logger.info(f"📋 Load manifest: {len(entries)} {system} tables recorded")
+        return cls(system, entries)
+
+    def is_unchanged(self, table_name, content_hash):
+        """
+        Check whether a table's source data matches the last successful load.
+
+        Args:
+            table_name (str): Table name (TableSpec.table_name or Stellar table)
+            content_hash (str): Digest of the current source data
+
+        Returns:
+            bool: True if the table can be skipped
+        """
+        entry = self.entries.get(table_name)
+        return self.enabled and entry is not None and entry[0] == content_hash
+
+    def last_row_count(self, table_name):
+        """
+        Row count recorded for a table at its last successful load.
+
+        Args:
+            table_name (str): Table name
+
+        Returns:
+            int: Recorded row count, or None if the table is not in the manifest
+        """
+        entry = self.entries.get(table_name)
+        return entry[1] if entry else None
+
+    def stage(self, table_name, content_hash, row_count):
+        """
+        Remember a successfully loaded table until save() records it.
+
+        Args:
+            table_name (str): Table name
+            content_hash (str): Digest of the loaded source data
+            row_count (int): Rows loaded
+        """
+        with self._lock:
+            self._pending[table_name] = (content_hash, row_count)
+
+    def save(self, connector, table_names=None):
+        """
+        Record staged tables in the control table.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            table_names (iterable): Only record these staged tables (e.g. the
+                                    ones whose merge is known to have run);
+                                    None records every staged table
+
+        Returns:
+            int: Number of tables recorded
+        """
+        with self._lock:
+            names = self._pending.keys() if table_names is None else table_names
+            rows = [
+                (self.system, name) + self._pending.pop(name)
+                for name in list(names) if name in self._pending
+            ]
+        if not self.enabled or not rows:
+            return 0
+
+        try:
+            connector.cursor.executemany(MANIFEST_MERGE_SQL, rows)
+            connector.connection.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not update load manifest: {e}")
+            connector.connection.rollback()
+            return 0
+
+        for _, name, content_hash, row_count in rows:
+            self.entries[name] = (content_hash, row_count)
+        logger.info(f"📋 Load manifest updated for {len(rows)} {self.system} tables")
+        return len(rows)
@@ -0,0 +1,166 @@
+"""
+Load Policy Module
+
+Array size and commit granularity of the staging loads.
+
+Staging loads used to bind a hard-coded 5,000 rows per executemany() call,
+whether a row had 96 columns (InvoiceItemSet) or 2 (the lookup tables), and
+only InvoiceItemSet committed after every batch. A LoadPolicy, held by
+each OracleConnector, decides both for every table:
+
+- batch size: fixed, or tuned per table from its row width so that one
+  array binds about TARGET_ARRAY_BYTES - a few thousand rows of a wide
+  table, a single round trip for most lookup tables
+- commit granularity:
+  - auto (default): the registry's large tables (TableSpec.commit_per_batch,
+    i.e. InvoiceItemSet) commit per batch, the others per table - as the
+    loads committed before there was a policy
+  - batch: commit after every batch; a MOLO table interrupted mid-load
+    resumes after its last batch (see checkpoints.py)
+  - table: commit once, when the table is completely staged; a failed
+    table leaves nothing behind and is reloaded from its first row by
+    --resume
+  - run: commit the staging load of every MOLO table at once, after the
+    last one, or roll all of it back if any table failed. One transaction
+    spans the run, so tables load on one connection and every merge is
+    deferred; Stellar, which truncates each table (DDL, an implicit commit)
+    right before loading it, commits per table instead
+
+The bulk modes (see bulk_load.py) commit every array whatever the policy.
+With a quarantine (see row_quarantine.py), rows the database rejects are
+set aside and the rest of their batch is loaded.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+AUTO_COMMIT = 'auto'
+PER_BATCH = 'batch'
+PER_TABLE = 'table'
+PER_RUN = 'run'
+
+COMMIT_MODES = (AUTO_COMMIT, PER_BATCH, PER_TABLE, PER_RUN)
+
+# Bind buffer size an auto-tuned array aims for
+TARGET_ARRAY_BYTES = 64 * 1024 * 1024
+
+# Bounds of an auto-tuned array
+MIN_BATCH_ROWS = 1000
+MAX_BATCH_ROWS = 50000
+
+# Bytes bound per value of the TableSpec bind type names; sized VARCHARs
+# take their declared size, untyped columns DEFAULT_COLUMN_BYTES
+BIND_TYPE_BYTES = {'NUMBER': 22, 'DATE': 7, 'TIMESTAMP': 11}
+DEFAULT_COLUMN_BYTES = 64
+
+
+def row_width(bind_types=None, column_count=0):
+    """
+    Estimate the bytes one row binds.
+
+    Args:
+        bind_types (tuple): (type_name, size) per column, or None
+        column_count (int): Number of columns, used when there are no bind types
+
+    Returns:
+        int: Estimated row width in bytes (at least 1)
+    """
+    if bind_types is None:
+        return max(column_count, 1) * DEFAULT_COLUMN_BYTES
+    width = 0
+    for type_name, size in bind_types:
+        if type_name == 'VARCHAR' and size:
+            width += size
+        else:
+            width += BIND_TYPE_BYTES.get(type_name, DEFAULT_COLUMN_BYTES)
+    return max(width, 1)
+
+
+def auto_batch_size(bind_types=None, column_count=0):
+    """
+    Rows per array for a table, from its row width.
+
+    Args:
+        bind_types (tuple): (type_name, size) per column, or None
+        column_count (int): Number of columns, used when there are no bind types
+
+    Returns:
+        int: TARGET_ARRAY_BYTES worth of rows, within MIN_BATCH_ROWS..MAX_BATCH_ROWS
+    """
+    rows = TARGET_ARRAY_BYTES // row_width(bind_types, column_count)
+    return min(max(rows, MIN_BATCH_ROWS), MAX_BATCH_ROWS)
+
+
+class LoadPolicy:
+    """
+    How a connector batches and commits staging rows.
+
+    Attributes:
+        commit (str): 'auto', 'batch', 'table' or 'run' (see the module docstring)
+        batch_size (int): Rows per array, or None to tune it per table
+        quarantine (RowQuarantine): Destination of rejected rows, or None to
+                                    fail a batch on its first bad row
+    """
+
+    def __init__(self, commit=AUTO_COMMIT, batch_size=None, quarantine=None):
+        if commit not in COMMIT_MODES:
+            raise ValueError(f"Unknown commit mode {commit!r}, expected one of {COMMIT_MODES}")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.commit = commit
+        self.batch_size = batch_size
+        self.quarantine = quarantine
+
+    def batch_rows(self, bind_types=None, column_count=0):
+        """
+        Rows per array for one table.
+
+        Args:
+            bind_types (tuple): (type_name, size) per column, or None
+            column_count (int): Number of columns, used when there are no bind types
+
+        Returns:
+            int: The fixed batch size, or one tuned from the row width
+        """
+        if self.batch_size is not None:
+            return self.batch_size
+        return auto_batch_size(bind_types, column_count)
+
+    @property
+    def batch_errors(self):
+        """bool: True if bad rows are quarantined instead of failing their batch."""
+        return self.quarantine is not None
+
+    def commit_per_batch(self, large_table=False):
+        """
+        Whether every batch of a table is committed.
+
+        Args:
+            large_table (bool): The registry commits the table per batch
+                                (TableSpec.commit_per_batch), which decides
+                                in the 'auto' mode
+
+        Returns:
+            bool: True if every batch is committed
+        """
+        if self.commit == AUTO_COMMIT:
+            return large_table
+        return self.commit == PER_BATCH
+
+    @property
+    def commit_per_table(self):
+        """bool: True if a table commits once it is staged (False per run)."""
+        return self.commit != PER_RUN
+
+    def describe(self):
+        """str: One-line description for the logs."""
+        size = f"{self.batch_size:,} rows" if self.batch_size else "auto-sized"
+        if self.commit == AUTO_COMMIT:
+            return f"commit per batch for the largest tables, per table otherwise, {size} arrays"
+        return f"commit per {self.commit}, {size} arrays"
+
+    def __repr__(self):
+        return f"LoadPolicy(commit={self.commit!r}, batch_size={self.batch_size!r})"
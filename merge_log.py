@@ -0,0 +1,108 @@
+"""
+Merge Log Module
+
+Row counts and timings of the merge procedures, read from the
+ETL_MERGE_LOG control table (tables/oracle_etl_control_tables.sql).
+
+Every SP_MERGE_* procedure calls SP_LOG_MERGE
+(stored_procedures/sp_log_merge.sql) just before it commits, which records
+one row per run in the merge's own transaction: rows staged, inserted,
+updated and left unchanged, and the seconds the procedure took.
+
+call_merge() runs a merge procedure and reads its log row back in the same
+anonymous block, so a merge and its statistics cost one round trip. It
+replaces the connectors' call with OUT parameters that no procedure has
+(a failed round trip before every merge) and the parsing of DBMS_OUTPUT
+text, whose format differed from procedure to procedure.
+
+If the control table does not exist the merges still run (SP_LOG_MERGE
+skips the insert), report no statistics, and a warning says so once.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+MERGE_LOG_TABLE = 'ETL_MERGE_LOG'
+
+# Runs the procedure, then fetches the log row it wrote in this session. The
+# read is dynamic SQL inside its own block, so the call compiles and the
+# merge runs whether or not the control table exists; an error of the merge
+# itself still propagates.
+MERGE_CALL_SQL = """
+    DECLARE
+        v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
+    BEGIN
+        {procedure};
+        :logged := 0;
+        BEGIN
+            EXECUTE IMMEDIATE '
+                SELECT ROWS_STAGED, ROWS_INSERTED, ROWS_UPDATED, ROWS_UNCHANGED,
+                       ELAPSED_SECONDS
+                FROM {table}
+                WHERE PROCEDURE_NAME = :1
+                  AND SESSION_ID = SYS_CONTEXT(''USERENV'', ''SID'')
+                  AND STARTED_AT >= :2
+                ORDER BY LOG_ID DESC
+                FETCH FIRST 1 ROW ONLY'
+            INTO :staged, :inserted, :updated, :unchanged, :seconds
+            USING :procedure_name, v_started;
+            :logged := 1;
+        EXCEPTION
+            WHEN OTHERS THEN
+                NULL;
+        END;
+    END;"""
+
+_warned = False
+
+
+def _stats(staged, inserted, updated, unchanged, seconds):
+    return {
+        'staged': int(staged or 0),
+        'inserted': int(inserted or 0),
+        'updated': int(updated or 0),
+        'unchanged': int(unchanged or 0),
+        'seconds': float(seconds or 0)
+    }
+
+
+def _warn_unavailable(reason):
+    global _warned
+    if _warned:
+        return
+    _warned = True
+    logger.warning(f"⚠️  Merge statistics unavailable: {reason}")
+    logger.warning(
+        f"   Create {MERGE_LOG_TABLE} (tables/oracle_etl_control_tables.sql) and deploy "
+        "the merge procedures (deploy_procedures.py) to record them."
+    )
+
+
+def call_merge(cursor, procedure_name):
+    """
+    Run a merge procedure and read the statistics it logged.
+
+    The procedure commits its own work; errors it raises propagate.
+
+    Args:
+        cursor: Oracle cursor of the session to run the merge in
+        procedure_name (str): Merge procedure name (e.g. 'SP_MERGE_MOLO_BOATS')
+
+    Returns:
+        dict: {'staged', 'inserted', 'updated', 'unchanged': int,
+               'seconds': float}, or None if the merge logged nothing
+    """
+    logged = cursor.var(int)
+    counts = {name: cursor.var(int) for name in ('staged', 'inserted', 'updated', 'unchanged')}
+    seconds = cursor.var(float)
+    cursor.execute(
+        MERGE_CALL_SQL.format(procedure=procedure_name, table=MERGE_LOG_TABLE),
+        procedure_name=procedure_name, logged=logged, seconds=seconds, **counts
+    )
+    if not logged.getvalue():
+        _warn_unavailable(f"{procedure_name} left no row in {MERGE_LOG_TABLE}")
+        return None
+    return _stats(*(var.getvalue() for var in counts.values()), seconds.getvalue())
@@ -0,0 +1,306 @@
+"""
+Merge Scheduler Module
+
+Runs each table's STG_* -> DW_* merge procedure exactly once per load.
+
+The pipelines used to merge some tables inline from their insert methods
+and then call SP_RUN_ALL_MOLO_STELLAR_MERGES, which merged every MOLO and
+Stellar table again - including Stellar staging tables left over from an
+earlier run, while the Stellar pipeline itself never merged most of its
+tables. The scheduler replaces both: every table that is staged in a run is
+registered with its merge procedure and dependencies, and its merge runs
+once, in one of two ways:
+
+- streamed: right after the table's staging load, on the connector that
+  loaded it, before the load job finishes (so tables that depend on it
+  start after it is merged)
+- deferred: once every table is loaded, on a ParallelTableLoader over the
+  pipeline's connections; a merge starts as soon as the merges it depends
+  on have finished, so independent merges run side by side in waves
+
+The merge mode picks between them per run: 'auto' streams the tables the
+registry marks for an inline merge and defers the rest, 'streamed' and
+'deferred' apply to every table. The time and row counts of each merge
+procedure (logged by the procedure itself, see merge_log.py) are recorded
+in its MergeResult and logged by log_merge_timings().
+"""
+
+import logging
+import threading
+import time
+
+from parallel_loader import DEFAULT_LOAD_WORKERS, ParallelTableLoader, TableJob
+
+
+logger = logging.getLogger(__name__)
+
+
+AUTO = 'auto'
+STREAMED = 'streamed'
+DEFERRED = 'deferred'
+
+MERGE_MODES = (AUTO, STREAMED, DEFERRED)
+
+
+class MergeTask:
+    """
+    Merge of one table.
+
+    Attributes:
+        name (str): Table name, as used by the load jobs
+        procedure (str): Merge procedure name (e.g. 'SP_MERGE_MOLO_BOATS')
+        depends_on (tuple): Names of tables whose merges must finish first
+        streamed (bool): Merge right after the staging load instead of deferring
+    """
+
+    def __init__(self, name, procedure, depends_on=(), streamed=False):
+        self.name = name
+        self.procedure = procedure
+        self.depends_on = tuple(depends_on)
+        self.streamed = streamed
+
+    def __repr__(self):
+        return f"MergeTask({self.procedure!r})"
+
+
+class MergeResult:
+    """
+    Outcome of one merge procedure.
+
+    Attributes:
+        name (str): Table name
+        procedure (str): Merge procedure name
+        stats (dict): {'staged', 'inserted', 'updated', 'unchanged', 'seconds'}
+                      logged by the procedure, or None if it logged nothing
+        seconds (float): Time spent in the procedure
+        streamed (bool): True if it ran right after the staging load
+        error (Exception): Exception raised by the merge, or None on success
+    """
+
+    def __init__(self, name, procedure, stats, seconds, streamed, error=None):
+        self.name = name
+        self.procedure = procedure
+        self.stats = stats
+        self.seconds = seconds
+        self.streamed = streamed
+        self.error = error
+
+    @property
+    def ok(self):
+        """bool: True if the merge completed."""
+        return self.error is None
+
+
+class MergeScheduler:
+    """
+    Merges every staged table once, streamed or deferred.
+
+    Attributes:
+        connect (callable): Factory returning a context manager that yields a
+                            connector for one deferred merge
+        run_merge (callable): Function taking a connector and a MergeTask,
+                              running its procedure and returning its stats
+        max_workers (int): Deferred merges run at the same time
+        tasks (dict): {table name: MergeTask} of the tables that have a merge
+        results (dict): {table name: MergeResult} of the merges run so far
+        wall_seconds (float): Wall-clock duration of the deferred merges
+    """
+
+    def __init__(self, connect, run_merge, tasks, max_workers=DEFAULT_LOAD_WORKERS):
+        self.connect = connect
+        self.run_merge = run_merge
+        self.max_workers = max_workers
+        self.tasks = {task.name: task for task in tasks}
+        self.results = {}
+        self.wall_seconds = 0.0
+        self._pending = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def plan(cls, connect, run_merge, tables, mode=AUTO, max_workers=DEFAULT_LOAD_WORKERS):
+        """
+        Schedule the merges of a pipeline's tables.
+
+        Args:
+            connect (callable): Connector factory for the deferred merges
+            run_merge (callable): Function taking a connector and a MergeTask
+            tables (iterable): (name, procedure, depends_on, inline) per table;
+                               tables without a procedure (None) are not merged
+            mode (str): 'auto' (inline tables streamed), 'streamed' or 'deferred'
+            max_workers (int): Deferred merges run at the same time
+
+        Returns:
+            MergeScheduler: Scheduler with a MergeTask per merged table
+        """
+        if mode not in MERGE_MODES:
+            raise ValueError(f"Unknown merge mode {mode!r}, expected one of {MERGE_MODES}")
+        tasks = [
+            MergeTask(
+                name, procedure, depends_on,
+                streamed=mode == STREAMED or (mode == AUTO and inline)
+            )
+            for name, procedure, depends_on, inline in tables
+            if procedure is not None
+        ]
+        streamed = sum(1 for task in tasks if task.streamed)
+        logger.info(
+            f"🔗 Merge mode {mode}: {streamed} merges streamed after their load, "
+            f"{len(tasks) - streamed} deferred until every table is loaded"
+        )
+        return cls(connect, run_merge, tasks, max_workers)
+
+    def staged(self, connector, name):
+        """
+        Report that a table's staging load finished.
+
+        A streamed merge runs now, on the connector that loaded the table;
+        a deferred one is queued for run_deferred(). A table without a merge
+        procedure, or one already merged in this run, is left alone.
+
+        Args:
+            connector: Connector the table was loaded with
+            name (str): Table name
+
+        Raises:
+            Exception: The error of a failed streamed merge, which fails the load
+        """
+        task = self.tasks.get(name)
+        with self._lock:
+            if task is None or name in self.results or name in self._pending:
+                return
+            if not task.streamed:
+                self._pending.append(name)
+                return
+        result = self._merge(connector, task)
+        if not result.ok:
+            raise result.error
+
+    def run_deferred(self):
+        """
+        Run the queued merges in dependency order and wait for them.
+
+        A failed merge is logged and recorded in its result; the merges that
+        depend on it still run, as the master procedure did.
+
+        Returns:
+            dict: {table name: MergeResult} of the deferred merges
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return {}
+
+        logger.info(
+            f"🔗 Running {len(pending)} deferred merges, up to {self.max_workers} at a time"
+        )
+        loader = ParallelTableLoader(self.connect, max_workers=self.max_workers)
+        loader.run(
+            TableJob(name, self._deferred_job(self.tasks[name]), self.tasks[name].depends_on)
+            for name in pending
+        )
+        self.wall_seconds = loader.wall_seconds
+        return {name: self.results[name] for name in pending if name in self.results}
+
+    def _deferred_job(self, task):
+        """Load callable running one deferred merge on the loader's connector."""
+        def job(connector):
+            self._merge(connector, task)
+        return job
+
+    def _merge(self, connector, task):
+        """Run one merge procedure, time it and record the result."""
+        logger.info(f"Executing merge for {task.name}...")
+        started = time.perf_counter()
+        try:
+            stats = self.run_merge(connector, task)
+            result = MergeResult(
+                task.name, task.procedure, stats, time.perf_counter() - started, task.streamed
+            )
+        except Exception as e:
+            logger.error(f"❌ Merge {task.procedure} failed: {e}")
+            result = MergeResult(
+                task.name, task.procedure, None, time.perf_counter() - started,
+                task.streamed, error=e
+            )
+        with self._lock:
+            self.results[task.name] = result
+        return result
+
+    @property
+    def failed(self):
+        """dict: {table name: MergeResult} of the merges that failed."""
+        return {name: result for name, result in self.results.items() if not result.ok}
+
+    def merged(self, name):
+        """
+        Check whether a table's data reached the data warehouse in this run.
+
+        Args:
+            name (str): Table name
+
+        Returns:
+            bool: True if its merge succeeded, or it has no merge procedure
+        """
+        if name not in self.tasks:
+            return True
+        result = self.results.get(name)
+        return result is not None and result.ok
+
+    def stats(self):
+        """
+        Row counts reported by the merges.
+
+        Returns:
+            dict: {table name: {'inserted': int, 'updated': int, 'unchanged': int}}
+                  of the successful merges whose procedure logged counts
+        """
+        return {
+            name: {
+                'inserted': result.stats['inserted'],
+                'updated': result.stats['updated'],
+                'unchanged': result.stats['unchanged']
+            }
+            for name, result in self.results.items()
+            if result.ok and result.stats
+        }
+
+    def timings(self):
+        """
+        Time spent per merge procedure.
+
+        Returns:
+            dict: {procedure name: seconds}
+        """
+        return {result.procedure: result.seconds for result in self.results.values()}
+
+
+def log_merge_timings(scheduler, label):
+    """
+    Log per-procedure merge times, slowest first.
+
+    Args:
+        scheduler (MergeScheduler): Scheduler whose merges have run
+        label (str): Pipeline label for the heading (e.g. 'MOLO')
+    """
+    results = scheduler.results
+    if not results:
+        return
+    logger.info(f"\n⏱️  {label} merge times (slowest first):")
+    for result in sorted(results.values(), key=lambda r: r.seconds, reverse=True):
+        how = 'streamed' if result.streamed else 'deferred'
+        if not result.ok:
+            logger.info(f"   {result.procedure:<45} {result.seconds:>8.2f}s {how:<9} FAILED")
+        elif result.stats:
+            logger.info(
+                f"   {result.procedure:<45} {result.seconds:>8.2f}s {how:<9} "
+                f"{result.stats['inserted']:>8,} inserted {result.stats['updated']:>8,} updated "
+                f"{result.stats['unchanged']:>8,} unchanged"
+            )
+        else:
+            logger.info(f"   {result.procedure:<45} {result.seconds:>8.2f}s {how}")
+    total_seconds = sum(result.seconds for result in results.values())
+    deferred = sum(1 for result in results.values() if not result.streamed)
+    logger.info(
+        f"📊 {len(results)} merges in {total_seconds:.2f}s summed across procedures"
+        + (f" ({deferred} deferred, {scheduler.wall_seconds:.2f}s wall clock)" if deferred else "")
+    )
@@ -0,0 +1,165 @@
+"""
+Object Ledger Module
+
+Processed-object ledger for the S3 source files.
+
+Every source object that was loaded and merged successfully is recorded in
+the ETL_PROCESSED_OBJECTS control table (tables/oracle_etl_control_tables.sql)
+under its bucket, key and ETag. When the newest object in a bucket is
+already in the ledger the pipeline stops before downloading anything, so a
+container restart (docker-compose restarts the service unless it was
+stopped) or a second scheduled run on the same export is a near-instant
+no-op. A re-uploaded object gets a new ETag and is processed again. The
+newest key in the ledger also tells s3_discovery.py where to start listing.
+
+If the control table does not exist the ledger is disabled with a warning
+and every run processes the newest object as before.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+LEDGER_TABLE = 'ETL_PROCESSED_OBJECTS'
+
+LEDGER_SELECT_SQL = f"""
+    SELECT MAX(PROCESSED_AT)
+    FROM {LEDGER_TABLE}
+    WHERE SOURCE_SYSTEM = :1 AND BUCKET = :2 AND OBJECT_KEY = :3 AND ETAG = :4"""
+
+LEDGER_LAST_KEY_SQL = f"""
+    SELECT MAX(OBJECT_KEY)
+    FROM {LEDGER_TABLE}
+    WHERE SOURCE_SYSTEM = :1 AND BUCKET = :2 AND OBJECT_KEY LIKE :3"""
+
+LEDGER_MERGE_SQL = f"""
+    MERGE INTO {LEDGER_TABLE} tgt
+    USING (
+        SELECT :1 AS SOURCE_SYSTEM, :2 AS BUCKET, :3 AS OBJECT_KEY,
+               :4 AS ETAG, :5 AS ROW_COUNT
+        FROM DUAL
+    ) src
+    ON (tgt.SOURCE_SYSTEM = src.SOURCE_SYSTEM AND tgt.BUCKET = src.BUCKET
+        AND tgt.OBJECT_KEY = src.OBJECT_KEY AND tgt.ETAG = src.ETAG)
+    WHEN MATCHED THEN
+        UPDATE SET
+            tgt.ROW_COUNT = src.ROW_COUNT,
+            tgt.PROCESSED_AT = SYSTIMESTAMP
+    WHEN NOT MATCHED THEN
+        INSERT (SOURCE_SYSTEM, BUCKET, OBJECT_KEY, ETAG, ROW_COUNT, PROCESSED_AT)
+        VALUES (src.SOURCE_SYSTEM, src.BUCKET, src.OBJECT_KEY, src.ETAG,
+                src.ROW_COUNT, SYSTIMESTAMP)"""
+
+
+def object_etag(s3_client, bucket, key):
+    """
+    Look up the ETag of an S3 object.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        key (str): Object key
+
+    Returns:
+        str: ETag without the surrounding quotes
+    """
+    return s3_client.head_object(Bucket=bucket, Key=key)['ETag'].strip('"')
+
+
+class ProcessedObjectLedger:
+    """
+    Ledger of the S3 objects a source system has loaded successfully.
+
+    Attributes:
+        system (str): Source system ('MOLO' or 'STELLAR')
+        enabled (bool): False once the control table turned out to be unavailable
+    """
+
+    def __init__(self, system):
+        self.system = system
+        self.enabled = True
+
+    def _disable(self, connector, error):
+        """Turn the ledger off after the control table could not be read."""
+        logger.warning(f"⚠️  Processed-object ledger unavailable: {error}")
+        logger.warning(
+            f"   Create {LEDGER_TABLE} (tables/oracle_etl_control_tables.sql) "
+            "to skip objects that were already processed."
+        )
+        connector.connection.rollback()
+        self.enabled = False
+
+    def processed_at(self, connector, bucket, key, etag):
+        """
+        Check whether an object was already processed.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            bucket (str): S3 bucket name
+            key (str): Object key
+            etag (str): Object ETag
+
+        Returns:
+            datetime: When the object was last processed, or None if it never was
+        """
+        if not self.enabled:
+            return None
+        try:
+            connector.cursor.execute(LEDGER_SELECT_SQL, [self.system, bucket, key, etag])
+            row = connector.cursor.fetchone()
+        except Exception as e:
+            self._disable(connector, e)
+            return None
+        return row[0] if row else None
+
+    def last_key(self, connector, bucket, prefix=''):
+        """
+        Newest key processed from a bucket (keys are named after the export time).
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            bucket (str): S3 bucket name
+            prefix (str): Only consider keys under this prefix
+
+        Returns:
+            str: Highest object key in the ledger, or None
+        """
+        if not self.enabled:
+            return None
+        try:
+            connector.cursor.execute(LEDGER_LAST_KEY_SQL, [self.system, bucket, f"{prefix}%"])
+            row = connector.cursor.fetchone()
+        except Exception as e:
+            self._disable(connector, e)
+            return None
+        return row[0] if row else None
+
+    def record(self, connector, bucket, key, etag, row_count):
+        """
+        Record an object as processed.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            bucket (str): S3 bucket name
+            key (str): Object key
+            etag (str): Object ETag
+            row_count (int): Rows loaded from the object
+
+        Returns:
+            bool: True if the object was recorded
+        """
+        if not self.enabled:
+            return False
+        try:
+            connector.cursor.execute(
+                LEDGER_MERGE_SQL, [self.system, bucket, key, etag, row_count]
+            )
+            connector.connection.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not record s3://{bucket}/{key} as processed: {e}")
+            connector.connection.rollback()
+            return False
+        logger.info(f"📋 Recorded s3://{bucket}/{key} (ETag {etag}) as processed")
+        return True
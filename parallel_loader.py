@@ -0,0 +1,215 @@
+"""
+Parallel Table Loader Module
+
+Runs the per-table parse + insert + merge work of a pipeline on a thread
+pool, so independent tables load side by side and the wall-clock time of a
+run follows the slowest table instead of the sum of all tables.
+
+Each table is described by a TableJob whose load callable receives a
+database connector and returns the number of rows it loaded. The loader
+takes a connector from its connect() factory for every job - typically
+OracleConnector.from_pool() over a pool created with
+OracleConnector.create_pool() - and gives it back when the job finishes.
+With a single worker and a factory that hands out one shared connector the
+same code path loads tables one at a time.
+
+Jobs may declare the names of tables that must finish first (depends_on);
+a job only starts once those tables have finished, whether they succeeded
+or failed, which matches the sequential behavior of loading in registry
+order. Dependencies that never appear among the jobs are ignored.
+
+Jobs are pulled from the iterable only when a worker is free, so a lazy
+source (such as a tarball streamed member by member) holds at most about
+one table per worker in memory.
+
+Parsing is CPU-bound Python and shares the GIL, but most of a table's time
+goes to executemany() round trips and merge procedures, which release it.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+logger = logging.getLogger(__name__)
+
+
+# Tables loaded concurrently when the caller does not choose a width: one
+# connection, tables in registry order; deployments opt in to parallel loads
+DEFAULT_LOAD_WORKERS = 1
+
+
+class TableJob:
+    """
+    One table to load.
+
+    Attributes:
+        name (str): Table name, used for dependencies, logging and results
+        load (callable): Function taking a connector and returning the row count
+        depends_on (tuple): Names of tables that must finish before this one starts
+    """
+
+    def __init__(self, name, load, depends_on=()):
+        self.name = name
+        self.load = load
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self):
+        return f"TableJob({self.name!r})"
+
+
+class TableLoadResult:
+    """
+    Outcome of one TableJob.
+
+    Attributes:
+        name (str): Table name
+        record_count (int): Rows loaded, or None if the load failed
+        seconds (float): Time spent on the table, including connection acquire
+        error (Exception): Exception raised by the load, or None on success
+    """
+
+    def __init__(self, name, record_count, seconds, error=None):
+        self.name = name
+        self.record_count = record_count
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def ok(self):
+        """bool: True if the table loaded without an error."""
+        return self.error is None
+
+
+class ParallelTableLoader:
+    """
+    Dependency-aware thread pool for loading tables.
+
+    Attributes:
+        connect (callable): Factory returning a context manager that yields a
+                            connector for one job (and releases it on exit)
+        max_workers (int): Number of tables loaded at the same time
+        wall_seconds (float): Wall-clock duration of the last run()
+    """
+
+    def __init__(self, connect, max_workers=DEFAULT_LOAD_WORKERS):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.connect = connect
+        self.max_workers = max_workers
+        self.wall_seconds = 0.0
+
+    def run(self, jobs):
+        """
+        Load every job and wait for all of them to finish.
+
+        A failing job is logged and recorded in its result; the other jobs
+        keep running. If the calling thread is interrupted (for example by a
+        timeout signal), queued jobs are cancelled and the exception is
+        re-raised without waiting for the jobs already running.
+
+        Args:
+            jobs (iterable): TableJob objects, in the order they should start
+
+        Returns:
+            dict: {table name: TableLoadResult} in completion order
+
+        Raises:
+            ValueError: If the remaining jobs wait on each other in a cycle
+        """
+        started = time.perf_counter()
+        results = {}
+        seen = set()
+        waiting = []
+        running = {}
+        job_iter = iter(jobs)
+        exhausted = False
+
+        def ready(job):
+            return all(
+                name in results or (exhausted and name not in seen)
+                for name in job.depends_on
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='table-loader'
+        )
+        try:
+            while True:
+                for job in [job for job in waiting if ready(job)]:
+                    if len(running) >= self.max_workers:
+                        break
+                    waiting.remove(job)
+                    running[executor.submit(self._run_job, job)] = job
+
+                while not exhausted and len(running) < self.max_workers:
+                    job = next(job_iter, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    seen.add(job.name)
+                    if ready(job):
+                        running[executor.submit(self._run_job, job)] = job
+                    else:
+                        waiting.append(job)
+
+                if not running:
+                    if not waiting:
+                        break
+                    if not any(ready(job) for job in waiting):
+                        raise ValueError(
+                            "Circular table dependencies between: "
+                            f"{', '.join(job.name for job in waiting)}"
+                        )
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = running.pop(future)
+                    results[job.name] = future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        self.wall_seconds = time.perf_counter() - started
+        return results
+
+    def _run_job(self, job):
+        """Run one job on its own connector and time it."""
+        started = time.perf_counter()
+        try:
+            with self.connect() as connector:
+                record_count = job.load(connector)
+            return TableLoadResult(job.name, record_count, time.perf_counter() - started)
+        except Exception as e:
+            logger.exception(f"❌ Error loading {job.name}: {e}")
+            return TableLoadResult(job.name, None, time.perf_counter() - started, error=e)
+
+
+def log_table_timings(results, wall_seconds, label):
+    """
+    Log per-table load times, slowest first, with the overall speedup.
+
+    Args:
+        results (dict): {table name: TableLoadResult} from ParallelTableLoader.run()
+        wall_seconds (float): Wall-clock duration of the run
+        label (str): Pipeline label for the heading (e.g. 'MOLO')
+    """
+    if not results:
+        return
+    total_seconds = sum(result.seconds for result in results.values())
+    logger.info(f"\n⏱️  {label} table load times (slowest first):")
+    for result in sorted(results.values(), key=lambda r: r.seconds, reverse=True):
+        if result.ok:
+            logger.info(
+                f"   {result.name:<30} {result.seconds:>8.2f}s "
+                f"{result.record_count or 0:>10,} records"
+            )
+        else:
+            logger.info(f"   {result.name:<30} {result.seconds:>8.2f}s     FAILED")
+    speedup = total_seconds / wall_seconds if wall_seconds else 1.0
+    logger.info(
+        f"📊 {len(results)} tables in {wall_seconds:.2f}s wall clock "
+        f"({total_seconds:.2f}s summed across tables, {speedup:.1f}x)"
+    )
@@ -0,0 +1,570 @@
+"""
+Parsed Table Cache Module
+
+On-disk cache of parsed tables in a compact, typed columnar format.
+
+The parse_*_data functions turn CSV text into row tuples of Python values
+on every run, including retries and backfills of a CSV that was parsed
+before. Each table the pipelines parse in full is also written column by
+column to <cache dir>/<system>/<table>/<key>.cols, where the key combines
+the CSV's content hash (as in the load manifest) with a fingerprint of the
+parser's code - including the helper functions and row converters it calls
+and the settings bound into them - so a changed parser never reuses stale
+rows. The next load of
+the same CSV binds its rows straight from those columns instead of parsing.
+
+Rows are written as they stream past, in blocks of CACHE_BLOCK_ROWS rows,
+and read back one block at a time, so neither side ever holds more than one
+block of a table in memory.
+
+File layout: a magic line, a fixed-size JSON header line (row count, block
+count and the high-water mark read while parsing, filled in once the table
+is complete) and then the blocks. Each block is a JSON line (its row count
+and each column's kind and compressed sizes) followed by one
+zlib-compressed buffer per column:
+
+- int, float, datetime, date: array module buffer plus a NULL mask
+- str: UTF-8 text plus an array of end offsets, plus a NULL mask
+- object: pickled list, for mixed or other types (Decimal, bool, ...)
+
+Incremental loads parse only the rows after the watermark and are neither
+written to nor served from the cache. Only the newest entries per table
+are kept.
+"""
+
+import array
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import zlib
+from datetime import date, datetime, timedelta
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the file layout or the meaning of cached rows changes
+PARSED_CACHE_VERSION = 2
+
+# Cached parses kept per table (older source data is rarely reloaded)
+DEFAULT_PARSED_ENTRIES_PER_TABLE = 3
+
+FILE_MAGIC = b'ETLCOLS2\n'
+FILE_SUFFIX = '.cols'
+
+# Size of the header line, padded so it can be rewritten in place
+HEADER_SIZE = 256
+
+# Rows encoded and written (or read and decoded) at a time
+CACHE_BLOCK_ROWS = 10000
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+INT64_RANGE = (-(1 << 63), (1 << 63) - 1)
+
+
+def _code_fingerprint(code, digest, names=None):
+    """Feed a code object, including nested functions, into a digest."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    if names is not None:
+        names.update(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _code_fingerprint(const, digest, names)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+def _value_fingerprint(value, digest, seen):
+    """
+    Feed a value a parser depends on into a digest.
+
+    Functions contribute their code, the values bound in their closures
+    (e.g. a converter's max_length) and the module-level functions they
+    call, so editing a helper or a row converter changes the fingerprint.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        digest.update(repr(value).encode('utf-8'))
+    elif isinstance(value, (set, frozenset)):
+        digest.update(repr(sorted(map(repr, value))).encode('utf-8'))
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _value_fingerprint(item, digest, seen)
+    elif id(value) in seen:
+        digest.update(b'<seen>')
+    elif hasattr(value, '__func__'):
+        seen.add(id(value))
+        _value_fingerprint(value.__func__, digest, seen)
+        _value_fingerprint(value.__self__, digest, seen)
+    elif hasattr(value, '__code__'):
+        seen.add(id(value))
+        names = set()
+        _code_fingerprint(value.__code__, digest, names)
+        for cell in value.__closure__ or ():
+            try:
+                _value_fingerprint(cell.cell_contents, digest, seen)
+            except ValueError:  # empty cell
+                pass
+        for name in sorted(names):
+            called = value.__globals__.get(name)
+            if called is not None and hasattr(called, '__code__'):
+                _value_fingerprint(called, digest, seen)
+    else:
+        # Other objects (a converter's DateColumnParser) by their type and
+        # formats; their run-time state does not change the parsed rows
+        seen.add(id(value))
+        digest.update(type(value).__qualname__.encode('utf-8'))
+        _value_fingerprint(getattr(value, 'formats', None), digest, seen)
+
+
+@functools.lru_cache(maxsize=None)
+def parser_fingerprint(parser):
+    """
+    Fingerprint of a parser's code, so edited parsers invalidate their entries.
+
+    Covers the helper functions and row converters the parser calls and the
+    settings bound into them, not only the parser's own code.
+
+    Args:
+        parser (callable): parse_*_data function
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256(f"{PARSED_CACHE_VERSION}:{parser.__name__}".encode('utf-8'))
+    _value_fingerprint(parser, digest, set())
+    return digest.hexdigest()
+
+
+def _column_kind(values):
+    """Pick the storage kind of a column from its non-NULL values."""
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        value_type = type(value)
+        if value_type is int:
+            if not INT64_RANGE[0] <= value <= INT64_RANGE[1]:
+                return 'object'
+            kinds.add('int')
+        elif value_type is float:
+            kinds.add('float')
+        elif value_type is str:
+            kinds.add('str')
+        elif value_type is datetime and value.tzinfo is None:
+            kinds.add('datetime')
+        elif value_type is date:
+            kinds.add('date')
+        else:
+            return 'object'
+        if len(kinds) > 1:
+            return 'object'
+    return kinds.pop() if kinds else 'object'
+
+
+def encode_column(values):
+    """
+    Encode one column.
+
+    Args:
+        values (list): Column values, None for NULL
+
+    Returns:
+        tuple: (kind, list of uncompressed buffers)
+    """
+    kind = _column_kind(values)
+    if kind == 'object':
+        return kind, [pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)]
+
+    nulls = bytes(value is None for value in values)
+    if kind == 'str':
+        offsets = array.array('q')
+        text = bytearray()
+        for value in values:
+            if value is not None:
+                text += value.encode('utf-8', 'surrogatepass')
+            offsets.append(len(text))
+        return kind, [nulls, offsets.tobytes(), bytes(text)]
+
+    if kind == 'int':
+        data = array.array('q', (0 if value is None else value for value in values))
+    elif kind == 'float':
+        data = array.array('d', (0.0 if value is None else value for value in values))
+    elif kind == 'datetime':
+        data = array.array('q', (
+            0 if value is None else (value - EPOCH) // ONE_MICROSECOND for value in values
+        ))
+    else:  # date
+        data = array.array('q', (0 if value is None else value.toordinal() for value in values))
+    return kind, [nulls, data.tobytes()]
+
+
+def decode_column(kind, buffers):
+    """
+    Decode one column written by encode_column().
+
+    Args:
+        kind (str): Storage kind
+        buffers (list): Uncompressed buffers
+
+    Returns:
+        list: Column values, None for NULL
+    """
+    if kind == 'object':
+        return pickle.loads(buffers[0])
+
+    nulls = buffers[0]
+    if kind == 'str':
+        offsets = array.array('q')
+        offsets.frombytes(buffers[1])
+        text = buffers[2]
+        values = []
+        start = 0
+        for is_null, end in zip(nulls, offsets):
+            values.append(None if is_null else text[start:end].decode('utf-8', 'surrogatepass'))
+            start = end
+        return values
+
+    data = array.array('d' if kind == 'float' else 'q')
+    data.frombytes(buffers[1])
+    if kind == 'datetime':
+        values = [EPOCH + value * ONE_MICROSECOND for value in data]
+    elif kind == 'date':
+        values = [date.fromordinal(value) if value else None for value in data]
+    else:
+        values = data.tolist()
+    if any(nulls):
+        values = [None if is_null else value for is_null, value in zip(nulls, values)]
+    return values
+
+
+class ParsedTable:
+    """
+    A cached parse, read back block by block.
+
+    Attributes:
+        path (str): Cache file
+        row_count (int): Number of rows
+        high_water (datetime): Newest last-edited timestamp seen while parsing, or None
+    """
+
+    def __init__(self, path, row_count, high_water=None):
+        self.path = path
+        self.row_count = row_count
+        self.high_water = high_water
+
+    def rows(self):
+        """
+        Row tuples in parser order, decoded one block at a time.
+
+        Yields:
+            tuple: Row tuples
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(len(FILE_MAGIC) + HEADER_SIZE)
+            while True:
+                line = f.readline()
+                if not line:
+                    return
+                block = json.loads(line)
+                columns = []
+                for column in block['columns']:
+                    buffers = [zlib.decompress(f.read(size)) for size in column['sizes']]
+                    columns.append(decode_column(column['kind'], buffers))
+                yield from zip(*columns)
+
+
+def _header_line(header):
+    """Encode the file header as a line of exactly HEADER_SIZE bytes."""
+    line = json.dumps(header).encode('utf-8')
+    if len(line) >= HEADER_SIZE:
+        raise ValueError(f"Parsed-table cache header exceeds {HEADER_SIZE} bytes")
+    return line.ljust(HEADER_SIZE - 1) + b'\n'
+
+
+def read_parsed_table(path):
+    """
+    Open a cache file written by a ParsedTableWriter.
+
+    The block structure is checked against the header (without decompressing
+    anything), so a truncated file is rejected before any of it is loaded.
+
+    Args:
+        path (str): Cache file
+
+    Returns:
+        ParsedTable: Cached rows
+
+    Raises:
+        ValueError: If the file is not a complete parsed-table cache file
+    """
+    with open(path, 'rb') as f:
+        if f.readline() != FILE_MAGIC:
+            raise ValueError(f"{path} is not a parsed-table cache file")
+        header = json.loads(f.read(HEADER_SIZE))
+        rows = blocks = 0
+        end = os.fstat(f.fileno()).st_size
+        while f.tell() < end:
+            block = json.loads(f.readline())
+            f.seek(sum(sum(column['sizes']) for column in block['columns']), os.SEEK_CUR)
+            rows += block['rows']
+            blocks += 1
+        if f.tell() != end or rows != header['rows'] or blocks != header['blocks']:
+            raise ValueError(f"{path} is truncated")
+    high_water = header['high_water']
+    return ParsedTable(
+        path,
+        header['rows'],
+        datetime.fromisoformat(high_water) if high_water else None
+    )
+
+
+class ParsedTableCache:
+    """
+    Cache of one source system's parsed tables.
+
+    Attributes:
+        directory (str): <cache dir>/<system>
+        system (str): Source system ('MOLO' or 'STELLAR')
+        entries_per_table (int): Cached parses kept per table
+    """
+
+    def __init__(self, directory, system, entries_per_table=DEFAULT_PARSED_ENTRIES_PER_TABLE):
+        self.directory = os.path.join(directory, system.lower())
+        self.system = system
+        self.entries_per_table = entries_per_table
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def open(cls, directory, system):
+        """
+        Open the cache, or return None if it is disabled.
+
+        Args:
+            directory (str): Cache directory (None or '' disables the cache)
+            system (str): Source system
+
+        Returns:
+            ParsedTableCache: Cache, or None
+        """
+        if not directory:
+            return None
+        try:
+            return cls(directory, system)
+        except OSError as e:
+            logger.warning(f"⚠️  Parsed-table cache disabled, cannot use {directory}: {e}")
+            return None
+
+    def entry_path(self, table_name, content_hash, parser):
+        """
+        Location of a table's cached parse.
+
+        Args:
+            table_name (str): Table name
+            content_hash (str): Digest of the table's source data
+            parser (callable): Parser the rows came from
+
+        Returns:
+            str: <cache dir>/<system>/<table>/<key>.cols
+        """
+        key = hashlib.sha256(
+            f"{content_hash}:{parser_fingerprint(parser)}".encode('utf-8')
+        ).hexdigest()[:32]
+        return os.path.join(self.directory, table_name.lower(), key + FILE_SUFFIX)
+
+    def lookup(self, table_name, content_hash, parser):
+        """
+        Read a table's cached parse.
+
+        Args:
+            table_name (str): Table name
+            content_hash (str): Digest of the table's source data
+            parser (callable): Parser the rows would come from
+
+        Returns:
+            ParsedTable: Cached rows, or None on a miss
+        """
+        path = self.entry_path(table_name, content_hash, parser)
+        if not os.path.exists(path):
+            return None
+        try:
+            parsed = read_parsed_table(path)
+            os.utime(path)
+        except (OSError, ValueError, KeyError, zlib.error, pickle.UnpicklingError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable parsed-table cache entry {path}: {e}")
+            return None
+        logger.info(f"💾 {table_name}: {parsed.row_count:,} parsed rows read from the cache")
+        return parsed
+
+    def writer(self, table_name, content_hash, parser):
+        """
+        Start capturing a table's parse.
+
+        Args:
+            table_name (str): Table name
+            content_hash (str): Digest of the table's source data
+            parser (callable): Parser the rows come from
+
+        Returns:
+            ParsedTableWriter: Writer; call commit() once the table loaded
+        """
+        return ParsedTableWriter(self, table_name, self.entry_path(table_name, content_hash, parser))
+
+    def prune(self, table_name, keep):
+        """
+        Remove all but the newest cached parses of a table.
+
+        Args:
+            table_name (str): Table name
+            keep (str): Path that is never removed (the entry just written)
+        """
+        table_dir = os.path.join(self.directory, table_name.lower())
+        try:
+            paths = [
+                os.path.join(table_dir, name) for name in os.listdir(table_dir)
+                if name.endswith(FILE_SUFFIX)
+            ]
+            paths.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for path in paths[self.entries_per_table:]:
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class ParsedTableWriter:
+    """
+    Writes a table's rows to the cache as the loader consumes them.
+
+    Rows are collected into columns CACHE_BLOCK_ROWS at a time and each full
+    block is encoded and appended to a temporary file, which commit() moves
+    into place. Writing is skipped silently on any error, so caching never
+    fails a load.
+    """
+
+    def __init__(self, cache, table_name, path):
+        self.cache = cache
+        self.table_name = table_name
+        self.path = path
+        self.columns = None
+        self.row_count = 0
+        self.block_count = 0
+        self.complete = True
+        self._file = None
+
+    def capture(self, rows):
+        """
+        Pass rows through while writing a copy of them block by block.
+
+        Args:
+            rows (iterable): Row tuples from the parser, consumed lazily
+
+        Yields:
+            tuple: The same rows
+        """
+        for row in rows:
+            if self.columns is None:
+                self.columns = [[] for _ in row]
+            if len(row) != len(self.columns):
+                self._stop()
+            elif self.complete:
+                for column, value in zip(self.columns, row):
+                    column.append(value)
+                if len(self.columns[0]) >= CACHE_BLOCK_ROWS:
+                    self._write_block()
+            yield row
+
+    def _open_file(self):
+        """Start the temporary file, with room for the header."""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        self._file = tempfile.NamedTemporaryFile(dir=directory, suffix='.part', delete=False)
+        self._file.write(FILE_MAGIC)
+        self._file.write(b' ' * (HEADER_SIZE - 1) + b'\n')
+
+    def _write_block(self):
+        """Encode the collected columns and append them to the temporary file."""
+        block_rows = len(self.columns[0]) if self.columns else 0
+        if not block_rows:
+            return
+        try:
+            if self._file is None:
+                self._open_file()
+            block = {'rows': block_rows, 'columns': []}
+            payload = []
+            for values in self.columns:
+                kind, buffers = encode_column(values)
+                compressed = [zlib.compress(buffer, 1) for buffer in buffers]
+                block['columns'].append({'kind': kind, 'sizes': [len(c) for c in compressed]})
+                payload.extend(compressed)
+            self._file.write(json.dumps(block).encode('utf-8') + b'\n')
+            for buffer in payload:
+                self._file.write(buffer)
+        except (OSError, TypeError, ValueError, pickle.PicklingError) as e:
+            logger.warning(f"⚠️  Could not cache parsed {self.table_name}: {e}")
+            self._stop()
+            return
+        self.row_count += block_rows
+        self.block_count += 1
+        for column in self.columns:
+            column.clear()
+
+    def _stop(self):
+        """Give up on caching this table and remove the partial file."""
+        self.complete = False
+        self.columns = None
+        self.abort()
+
+    def abort(self):
+        """Discard the rows written so far (e.g. when the table failed to load)."""
+        if self._file is None:
+            return
+        self._file.close()
+        try:
+            os.remove(self._file.name)
+        except OSError:
+            pass
+        self._file = None
+
+    def commit(self, high_water=None):
+        """
+        Write the last block and the header, and move the file into place.
+
+        Args:
+            high_water (datetime): High-water mark read while parsing
+        """
+        if not self.complete:
+            return
+        self._write_block()
+        if not self.complete:
+            return
+        header = {
+            'rows': self.row_count,
+            'blocks': self.block_count,
+            'high_water': high_water.isoformat() if high_water is not None else None
+        }
+        try:
+            if self._file is None:
+                # A table without rows still gets an (empty) entry
+                self._open_file()
+            self._file.seek(len(FILE_MAGIC))
+            self._file.write(_header_line(header))
+            self._file.close()
+            os.replace(self._file.name, self.path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Could not cache parsed {self.table_name}: {e}")
+            self.abort()
+            return
+        finally:
+            self.columns = None
+        self._file = None
+        self.cache.prune(self.table_name, keep=self.path)
+
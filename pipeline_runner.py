@@ -0,0 +1,205 @@
+"""
+Pipeline Runner Module
+
+Runs the MOLO and Stellar source pipelines in separate processes, side by
+side or one after the other, each under its own timeout.
+
+Every pipeline gets its own process and therefore its own S3 client and
+Oracle connections, so a hang in one source cannot hold up the other. When
+a pipeline overruns its timeout its process is terminated and the run goes
+on with whatever the other pipeline produced. A SIGALRM timeout could only
+interrupt the main thread and left a hung pipeline holding the process.
+
+A pipeline's return value is sent back to the parent over a pipe, so it has
+to be picklable (the processing functions return plain dicts).
+"""
+
+import logging
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a pipeline process gets to exit after it has sent its result, or
+# after it was asked to terminate, before it is killed
+EXIT_GRACE_SECONDS = 10
+
+
+class Pipeline:
+    """
+    One source pipeline to run in its own process.
+
+    Attributes:
+        name (str): Pipeline label (e.g. 'MOLO')
+        target (callable): Function taking no arguments; its return value is
+                           the pipeline result
+        timeout (float): Seconds the pipeline may run, or None for no limit
+    """
+
+    def __init__(self, name, target, timeout=None):
+        self.name = name
+        self.target = target
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"Pipeline({self.name!r})"
+
+
+class PipelineOutcome:
+    """
+    Result of running one Pipeline.
+
+    Attributes:
+        name (str): Pipeline label
+        result: Value returned by the pipeline target, or None
+        error (str): Description of the failure, or None on success
+        timed_out (bool): True if the pipeline was stopped at its timeout
+        seconds (float): Wall-clock run time of the pipeline
+    """
+
+    def __init__(self, name, result=None, error=None, timed_out=False, seconds=0.0):
+        self.name = name
+        self.result = result
+        self.error = error
+        self.timed_out = timed_out
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        """bool: True if the pipeline finished without an error."""
+        return self.error is None
+
+
+def describe_duration(seconds):
+    """
+    Describe a timeout for log messages.
+
+    Args:
+        seconds (float): Duration in seconds
+
+    Returns:
+        str: e.g. "30 minutes" or "45 seconds"
+    """
+    if seconds >= 60:
+        return f"{seconds / 60:g} minutes"
+    return f"{seconds:g} seconds"
+
+
+def _run_target(target, sender):
+    """Pipeline process entry point: run the target and send back its outcome."""
+    try:
+        result = target()
+        sender.send((result, None))
+    except BaseException as e:
+        logger.exception(f"❌ Pipeline failed: {e}")
+        sender.send((None, f"{type(e).__name__}: {e}"))
+    finally:
+        sender.close()
+
+
+def _stop(process):
+    """Terminate a pipeline process, killing it if it does not exit in time."""
+    process.terminate()
+    process.join(EXIT_GRACE_SECONDS)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _run_batch(pipelines):
+    """
+    Run pipelines in parallel processes until each finishes or times out.
+
+    Args:
+        pipelines (list): Pipeline objects to start together
+
+    Returns:
+        dict: {pipeline name: PipelineOutcome}
+    """
+    outcomes = {}
+    active = {}
+
+    for pipeline in pipelines:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_run_target, args=(pipeline.target, sender), name=pipeline.name
+        )
+        process.start()
+        sender.close()
+
+        started = time.monotonic()
+        deadline = started + pipeline.timeout if pipeline.timeout else None
+        active[receiver] = (pipeline, process, started, deadline)
+        limit = f"timeout {describe_duration(pipeline.timeout)}" if pipeline.timeout else "no timeout"
+        logger.info(f"🚀 {pipeline.name} pipeline started (pid {process.pid}, {limit})")
+
+    while active:
+        deadlines = [deadline for _, _, _, deadline in active.values() if deadline is not None]
+        wait_seconds = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+        for receiver in wait(list(active), wait_seconds):
+            pipeline, process, started, _ = active.pop(receiver)
+            try:
+                result, error = receiver.recv()
+            except EOFError:
+                result, error = None, None
+            receiver.close()
+
+            process.join(EXIT_GRACE_SECONDS)
+            if process.is_alive():
+                logger.warning(f"⚠️ {pipeline.name} pipeline did not exit after finishing; stopping it")
+                _stop(process)
+            elif error is None and result is None and process.exitcode != 0:
+                error = f"Pipeline process exited with code {process.exitcode}"
+
+            seconds = time.monotonic() - started
+            outcomes[pipeline.name] = PipelineOutcome(
+                pipeline.name, result=result, error=error, seconds=seconds
+            )
+            status = "finished" if error is None else "failed"
+            logger.info(f"🏁 {pipeline.name} pipeline {status} in {seconds:.1f}s")
+
+        now = time.monotonic()
+        for receiver, (pipeline, process, started, deadline) in list(active.items()):
+            if deadline is None or now < deadline:
+                continue
+            del active[receiver]
+            logger.error(
+                f"❌ {pipeline.name} pipeline exceeded its "
+                f"{describe_duration(pipeline.timeout)} timeout; terminating it"
+            )
+            _stop(process)
+            receiver.close()
+            outcomes[pipeline.name] = PipelineOutcome(
+                pipeline.name,
+                error=f"Timed out after {describe_duration(pipeline.timeout)}",
+                timed_out=True,
+                seconds=now - started
+            )
+
+    return outcomes
+
+
+def run_pipelines(pipelines, concurrent=True):
+    """
+    Run source pipelines, each in its own process under its own timeout.
+
+    Args:
+        pipelines (list): Pipeline objects, in the order to report (and, when
+                          not concurrent, to run) them
+        concurrent (bool): Run all pipelines side by side instead of one after
+                           the other
+
+    Returns:
+        dict: {pipeline name: PipelineOutcome} in pipeline order
+    """
+    outcomes = {}
+    if concurrent:
+        outcomes.update(_run_batch(pipelines))
+    else:
+        for pipeline in pipelines:
+            outcomes.update(_run_batch([pipeline]))
+    return {pipeline.name: outcomes[pipeline.name] for pipeline in pipelines}
@@ -0,0 +1,341 @@
+"""
+Row Delta Module
+
+Row-level change detection for the MOLO staging loads.
+
+For every table the ETL_ROW_SNAPSHOT control table
+(tables/oracle_etl_control_tables.sql) keeps a compact snapshot of the last
+successfully merged data: primary key -> 64-bit row digest, JSON encoded and
+zlib compressed in one BLOB per table. While a CSV is parsed, TableDelta
+compares every row with that snapshot and passes on only the rows that are
+new or changed, so staging - and with it the merge procedure - only sees the
+delta instead of the whole table.
+
+Keys in the snapshot that no longer appear in the CSV are reported as
+deletes and recorded in ETL_DELETED_KEYS, since the merge procedures only
+insert and update. The DW tables themselves are left untouched.
+
+Like the load manifest, a snapshot is only replaced once the table's data
+has been merged, so a failed run simply sends the same rows again. Without
+the control tables every row is loaded as before.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import zlib
+
+import oracledb
+
+
+logger = logging.getLogger(__name__)
+
+
+SNAPSHOT_TABLE = 'ETL_ROW_SNAPSHOT'
+DELETED_KEYS_TABLE = 'ETL_DELETED_KEYS'
+
+# Bytes per row digest; 64 bits keeps a 50k row snapshot well under 1 MB
+ROW_DIGEST_SIZE = 8
+
+SNAPSHOT_LIST_SQL = f"""
+    SELECT TABLE_NAME
+    FROM {SNAPSHOT_TABLE}
+    WHERE SOURCE_SYSTEM = :1"""
+
+SNAPSHOT_SELECT_SQL = f"""
+    SELECT SNAPSHOT
+    FROM {SNAPSHOT_TABLE}
+    WHERE SOURCE_SYSTEM = :1 AND TABLE_NAME = :2"""
+
+SNAPSHOT_DELETE_SQL = f"""
+    DELETE FROM {SNAPSHOT_TABLE}
+    WHERE SOURCE_SYSTEM = :1 AND TABLE_NAME = :2"""
+
+SNAPSHOT_INSERT_SQL = f"""
+    INSERT INTO {SNAPSHOT_TABLE} (SOURCE_SYSTEM, TABLE_NAME, ROW_COUNT, SNAPSHOT, SAVED_AT)
+    VALUES (:1, :2, :3, :4, SYSTIMESTAMP)"""
+
+DELETED_KEYS_INSERT_SQL = f"""
+    INSERT INTO {DELETED_KEYS_TABLE} (SOURCE_SYSTEM, TABLE_NAME, ROW_KEY, DETECTED_AT)
+    VALUES (:1, :2, :3, SYSTIMESTAMP)"""
+
+
+def row_digest(row):
+    """
+    Digest one parsed row.
+
+    Args:
+        row (tuple): Row tuple as produced by the table's parser
+
+    Returns:
+        str: Hex digest of the row values
+    """
+    return hashlib.blake2b(repr(row).encode('utf-8'), digest_size=ROW_DIGEST_SIZE).hexdigest()
+
+
+def encode_snapshot(digests):
+    """
+    Serialize a snapshot for the SNAPSHOT BLOB column.
+
+    Args:
+        digests (dict): {row key: row digest}
+
+    Returns:
+        bytes: Compressed snapshot
+    """
+    return zlib.compress(json.dumps(digests, separators=(',', ':')).encode('utf-8'))
+
+
+def decode_snapshot(data):
+    """
+    Deserialize a snapshot read from the SNAPSHOT BLOB column.
+
+    Args:
+        data (bytes): Compressed snapshot
+
+    Returns:
+        dict: {row key: row digest}
+    """
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+class TableDelta:
+    """
+    Filters one table's rows down to the ones that differ from its snapshot.
+
+    Iterate over filter() to get the changed rows; once it is exhausted the
+    counters, deleted_keys and the new snapshot (digests) are complete.
+
+    Attributes:
+        table_name (str): Table name (TableSpec.table_name)
+        key_index (int): Position of the primary key in the row tuples
+        previous (dict): Snapshot of the last merged load, or None to pass every row
+        pass_unchanged (bool): Pass unchanged rows on as well (full reload); the
+                               counters and deleted keys are still computed
+        digests (dict): {row key: row digest} of the current data
+        inserted (int): Rows whose key is not in the snapshot
+        updated (int): Rows whose digest differs from the snapshot
+        unchanged (int): Rows filtered out
+        deleted_keys (list): Snapshot keys missing from the current data
+        carried_keys (list): Keys of rows dropped before the delta (e.g. by a
+                             watermark); they keep their snapshot digest
+        complete (bool): True once every row has been read
+    """
+
+    def __init__(self, table_name, key_index, previous=None, pass_unchanged=False):
+        self.table_name = table_name
+        self.key_index = key_index
+        self.previous = previous
+        self.pass_unchanged = pass_unchanged
+        self.digests = {}
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.deleted_keys = []
+        self.carried_keys = []
+        self.complete = False
+
+    @property
+    def total(self):
+        """int: Rows read from the source, changed or not."""
+        return self.inserted + self.updated + self.unchanged
+
+    def filter(self, rows):
+        """
+        Yield the rows that are new or changed since the snapshot.
+
+        Rows without a key are always passed on and are not recorded.
+
+        Args:
+            rows (iterable): Row tuples, consumed lazily
+
+        Yields:
+            tuple: Rows to load into staging
+        """
+        previous = self.previous or {}
+        for row in rows:
+            key = row[self.key_index]
+            if key is None:
+                self.inserted += 1
+                yield row
+                continue
+
+            key = str(key)
+            digest = row_digest(row)
+            self.digests[key] = digest
+            known = previous.get(key)
+            if known == digest:
+                self.unchanged += 1
+                if self.pass_unchanged:
+                    yield row
+                continue
+            if known is None:
+                self.inserted += 1
+            else:
+                self.updated += 1
+            yield row
+
+        for key in self.carried_keys:
+            if key in previous and key not in self.digests:
+                self.digests[key] = previous[key]
+                self.unchanged += 1
+        self.deleted_keys = [key for key in previous if key not in self.digests]
+        self.complete = True
+
+    def reject(self, keys):
+        """
+        Leave rows that staging rejected out of the new snapshot.
+
+        Their keys keep the digest of the last merged load (or none, if
+        they are new), so the next load sends them again.
+
+        Args:
+            keys (iterable): Keys of the rejected rows (see row_quarantine.py)
+        """
+        previous = self.previous or {}
+        for key in keys:
+            if key in previous:
+                self.digests[key] = previous[key]
+            else:
+                self.digests.pop(key, None)
+
+    def describe(self):
+        """
+        Summarize the delta for log messages.
+
+        Returns:
+            str: e.g. "12 new, 3 changed, 43,120 unchanged, 1 deleted"
+        """
+        return (
+            f"{self.inserted:,} new, {self.updated:,} changed, "
+            f"{self.unchanged:,} unchanged, {len(self.deleted_keys):,} deleted"
+        )
+
+
+class RowSnapshotStore:
+    """
+    Row snapshots of one source system's tables.
+
+    Reads happen per table on the loading connector; completed deltas are
+    staged (thread-safely) and written together by save().
+
+    Attributes:
+        system (str): Source system ('MOLO')
+        enabled (bool): False if the control tables could not be read
+        tables (set): Tables that have a stored snapshot
+    """
+
+    def __init__(self, system, tables=(), enabled=True):
+        self.system = system
+        self.enabled = enabled
+        self.tables = set(tables)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, connector, system):
+        """
+        List the stored snapshots of a source system.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            system (str): Source system ('MOLO')
+
+        Returns:
+            RowSnapshotStore: Store (disabled if the control table is unavailable)
+        """
+        try:
+            connector.cursor.execute(SNAPSHOT_LIST_SQL, [system])
+            tables = [table_name for (table_name,) in connector.cursor.fetchall()]
+        except Exception as e:
+            logger.warning(f"⚠️  Row snapshots unavailable, loading every row: {e}")
+            logger.warning(
+                f"   Create {SNAPSHOT_TABLE} and {DELETED_KEYS_TABLE} "
+                "(tables/oracle_etl_control_tables.sql) to load only changed rows."
+            )
+            connector.connection.rollback()
+            return cls(system, enabled=False)
+
+        logger.info(f"📋 Row snapshots: {len(tables)} {system} tables recorded")
+        return cls(system, tables)
+
+    def delta(self, connector, table_name, key_index, pass_unchanged=False):
+        """
+        Start the delta of one table against its stored snapshot.
+
+        Args:
+            connector: Database connector to read the snapshot with
+            table_name (str): Table name
+            key_index (int): Position of the primary key in the row tuples
+            pass_unchanged (bool): Load unchanged rows too (full reload)
+
+        Returns:
+            TableDelta: Delta; it passes every row if there is no usable snapshot
+        """
+        previous = None
+        if self.enabled and table_name in self.tables:
+            try:
+                connector.cursor.execute(SNAPSHOT_SELECT_SQL, [self.system, table_name])
+                row = connector.cursor.fetchone()
+                if row is not None:
+                    data = row[0].read() if hasattr(row[0], 'read') else row[0]
+                    previous = decode_snapshot(data)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not read row snapshot of {table_name}, loading every row: {e}")
+                connector.connection.rollback()
+        return TableDelta(table_name, key_index, previous, pass_unchanged)
+
+    def stage(self, delta):
+        """
+        Remember a fully loaded table's delta until save() records it.
+
+        Args:
+            delta (TableDelta): Delta whose filter() has been exhausted
+        """
+        if not delta.complete:
+            return
+        with self._lock:
+            self._pending[delta.table_name] = delta
+
+    def save(self, connector, table_names=None):
+        """
+        Replace the snapshots of staged tables and record their deleted keys.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            table_names (iterable): Only record these staged tables (the ones
+                                    whose merge is known to have run); None
+                                    records every staged table
+
+        Returns:
+            int: Number of tables recorded
+        """
+        with self._lock:
+            names = self._pending.keys() if table_names is None else table_names
+            deltas = [self._pending.pop(name) for name in list(names) if name in self._pending]
+        if not self.enabled or not deltas:
+            return 0
+
+        try:
+            cursor = connector.cursor
+            for delta in deltas:
+                cursor.execute(SNAPSHOT_DELETE_SQL, [self.system, delta.table_name])
+                snapshot = cursor.var(oracledb.DB_TYPE_BLOB)
+                snapshot.setvalue(0, encode_snapshot(delta.digests))
+                cursor.execute(SNAPSHOT_INSERT_SQL, [
+                    self.system, delta.table_name, len(delta.digests), snapshot
+                ])
+                if delta.deleted_keys:
+                    cursor.executemany(DELETED_KEYS_INSERT_SQL, [
+                        (self.system, delta.table_name, key) for key in delta.deleted_keys
+                    ])
+            connector.connection.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not update row snapshots: {e}")
+            connector.connection.rollback()
+            return 0
+
+        self.tables.update(delta.table_name for delta in deltas)
+        logger.info(f"📋 Row snapshots updated for {len(deltas)} {self.system} tables")
+        return len(deltas)
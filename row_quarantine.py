@@ -0,0 +1,294 @@
+"""
+Row Quarantine Module
+
+Error-tolerant staging loads: rows the database rejects are set aside
+instead of failing their table.
+
+By default one bad row (a value too large for its column, an invalid
+number) fails the executemany() call of its batch, the table is rolled back
+and lost for the run. With a RowQuarantine on the connector's load policy
+(see load_policy.py) the staging inserts run with batcherrors=True: the
+good rows of a batch are inserted, and the rejected ones - their position,
+ORA error and values - are read back with cursor.getbatcherrors() and
+written to the ETL_REJECTED_ROWS control table
+(tables/oracle_etl_control_tables.sql) in the same transaction as the
+batch, so they commit with the good rows.
+
+If the control table does not exist, rejected rows are appended as JSON
+lines to <quarantine dir>/<system>_<table>.jsonl instead, with a warning.
+The loaders report their commits and rollbacks (commit() / rollback()), so
+the file records of a batch are only written once the batch is committed,
+and the rejections of a rolled back table are forgotten in either case.
+
+Rejected rows do not count as loaded: their key keeps the digest of its
+last merged version in the row snapshot (see row_delta.py), and a table
+with rejected rows advances neither its load manifest entry nor its
+watermark, so the next load of the table sends them again. Batch errors
+only cover conventional inserts, so the bulk modes (see bulk_load.py) load
+conventionally while a quarantine is set.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+
+import oracledb
+
+
+logger = logging.getLogger(__name__)
+
+
+REJECTED_ROWS_TABLE = 'ETL_REJECTED_ROWS'
+
+REJECTED_ROWS_CHECK_SQL = f"SELECT COUNT(*) FROM {REJECTED_ROWS_TABLE} WHERE 1 = 0"
+
+REJECTED_ROWS_INSERT_SQL = f"""
+    INSERT INTO {REJECTED_ROWS_TABLE} (SOURCE_SYSTEM, OBJECT_KEY, TABLE_NAME, ROW_KEY,
+                                       ERROR_CODE, ERROR_MESSAGE, ROW_DATA, REJECTED_AT)
+    VALUES (:1, :2, :3, :4, :5, :6, :7, SYSTIMESTAMP)"""
+
+# Longest error message stored; ORA messages are far shorter
+MAX_ERROR_MESSAGE = 4000
+
+_INSERT_TABLE = re.compile(r'^\s*INSERT\s+(?:/\*.*?\*/\s*)?INTO\s+(\w+)', re.IGNORECASE)
+
+
+def insert_table(insert_sql):
+    """
+    Name of the table an INSERT statement writes to.
+
+    Args:
+        insert_sql (str): INSERT INTO <table> ... statement
+
+    Returns:
+        str: Table name, or 'UNKNOWN' if the statement does not match
+    """
+    match = _INSERT_TABLE.match(insert_sql)
+    return match.group(1).upper() if match else 'UNKNOWN'
+
+
+def _json_value(value):
+    """JSON representation of a bound value."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    return value
+
+
+def row_json(row, columns=None):
+    """
+    Serialize a rejected row.
+
+    Args:
+        row (tuple): Bound values
+        columns (tuple): Column names in row order, or None
+
+    Returns:
+        str: JSON object {column: value}, or a JSON array without columns
+    """
+    values = [_json_value(value) for value in row]
+    if columns is not None:
+        return json.dumps(dict(zip(columns, values)), default=str)
+    return json.dumps(values, default=str)
+
+
+class RowQuarantine:
+    """
+    Destination of the rows rejected during one source object's load.
+
+    Attributes:
+        system (str): Source system ('MOLO' or 'STELLAR')
+        object_key (str): Key of the object being loaded
+        quarantine_dir (str): Directory of the JSON lines files used when
+                              the control table is unavailable
+        use_table (bool): True if rejected rows go to ETL_REJECTED_ROWS
+        rejected (dict): {table name: rows rejected}, including rows of
+                         batches not committed yet
+        rejected_keys (dict): {table name: [row keys]} of the rejected rows
+                              that have a key
+    """
+
+    def __init__(self, system, object_key, quarantine_dir, use_table=True):
+        self.system = system
+        self.object_key = object_key
+        self.quarantine_dir = quarantine_dir
+        self.use_table = use_table
+        self.rejected = {}
+        self.rejected_keys = {}
+        # {table name: [(records, keys)]} rejected since the table's last commit
+        self._uncommitted = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, connector, system, object_key, quarantine_dir):
+        """
+        Start the quarantine of an object's load.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            system (str): Source system ('MOLO' or 'STELLAR')
+            object_key (str): Key of the object being loaded
+            quarantine_dir (str): Directory for the fallback JSON lines files
+
+        Returns:
+            RowQuarantine: Quarantine writing to the control table, or to
+                           files if the table is missing
+        """
+        try:
+            connector.cursor.execute(REJECTED_ROWS_CHECK_SQL)
+            connector.cursor.fetchall()
+            return cls(system, object_key, quarantine_dir)
+        except Exception as e:
+            logger.warning(f"⚠️  {REJECTED_ROWS_TABLE} unavailable: {e}")
+            logger.warning(
+                f"   Rejected rows go to {quarantine_dir}/ instead. Create "
+                f"{REJECTED_ROWS_TABLE} (tables/oracle_etl_control_tables.sql) to keep them "
+                "in the database."
+            )
+            connector.connection.rollback()
+            return cls(system, object_key, quarantine_dir, use_table=False)
+
+    def reject(self, connector, table_name, batch, errors, columns=None, key_index=None):
+        """
+        Set aside the rows of a batch that the database rejected.
+
+        Rows written to the control table are part of the connector's open
+        transaction and commit with the batch's good rows; file records are
+        held until the loader reports the commit.
+
+        Args:
+            connector: Connector the batch was inserted with
+            table_name (str): Staging table name
+            batch (list): Row tuples bound in the executemany() call
+            errors (list): cursor.getbatcherrors() of that call
+            columns (tuple): Column names in row order, or None
+            key_index (int): Position of the row's primary key, or None
+
+        Returns:
+            int: Number of rows rejected
+        """
+        records = []
+        keys = []
+        for error in errors:
+            row = batch[error.offset]
+            key = None
+            if key_index is not None and row[key_index] is not None:
+                key = str(row[key_index])
+                keys.append(key)
+            records.append((
+                self.system, self.object_key, table_name, key, error.full_code,
+                error.message[:MAX_ERROR_MESSAGE], row_json(row, columns),
+                datetime.now().isoformat(timespec='seconds')
+            ))
+
+        first = errors[0]
+        logger.warning(
+            f"⚠️  {table_name}: {len(records)} row(s) rejected and quarantined "
+            f"(first: {first.message.strip()})"
+        )
+        if self.use_table:
+            # A cursor of its own keeps the staging cursor's bind sizes intact
+            with connector.connection.cursor() as cursor:
+                cursor.setinputsizes(None, None, None, None, None, None, oracledb.DB_TYPE_CLOB)
+                cursor.executemany(
+                    REJECTED_ROWS_INSERT_SQL, [record[:7] for record in records]
+                )
+
+        with self._lock:
+            self.rejected[table_name] = self.rejected.get(table_name, 0) + len(records)
+            self.rejected_keys.setdefault(table_name, []).extend(keys)
+            self._uncommitted.setdefault(table_name, []).append((records, keys))
+        return len(records)
+
+    def has_rejected(self, table_name):
+        """
+        Check whether rows of a table were rejected.
+
+        Args:
+            table_name (str): Staging table name
+
+        Returns:
+            bool: True if the table has rejected rows in this load
+        """
+        return bool(self.rejected.get(table_name))
+
+    def commit(self, table_name=None):
+        """
+        Report that the rows loaded so far were committed.
+
+        Writes the file records held for the table (or every table).
+
+        Args:
+            table_name (str): Staging table that committed, or None for all
+        """
+        with self._lock:
+            names = [table_name] if table_name is not None else list(self._uncommitted)
+            held = [(name, self._uncommitted.pop(name, [])) for name in names]
+        if self.use_table:
+            return
+        for name, batches in held:
+            records = [record for batch_records, _ in batches for record in batch_records]
+            if records:
+                self._write_file(name, records)
+
+    def rollback(self, table_name=None):
+        """
+        Report that the uncommitted rows of a table (or every table) were
+        rolled back: their rejections are forgotten.
+
+        Args:
+            table_name (str): Staging table that rolled back, or None for all
+        """
+        with self._lock:
+            names = [table_name] if table_name is not None else list(self._uncommitted)
+            for name in names:
+                for records, keys in self._uncommitted.pop(name, []):
+                    self.rejected[name] -= len(records)
+                    table_keys = self.rejected_keys[name]
+                    del table_keys[len(table_keys) - len(keys):]
+                if not self.rejected.get(name):
+                    self.rejected.pop(name, None)
+                    self.rejected_keys.pop(name, None)
+
+    def _write_file(self, table_name, records):
+        """Append rejected rows to the table's JSON lines file."""
+        os.makedirs(self.quarantine_dir, exist_ok=True)
+        path = os.path.join(self.quarantine_dir, f"{self.system}_{table_name}.jsonl")
+        with self._lock, open(path, 'a', encoding='utf-8') as f:
+            for system, object_key, table, key, code, message, data, rejected_at in records:
+                f.write(json.dumps({
+                    'source_system': system,
+                    'object_key': object_key,
+                    'table_name': table,
+                    'row_key': key,
+                    'error_code': code,
+                    'error_message': message,
+                    'row': json.loads(data),
+                    'rejected_at': rejected_at
+                }) + '\n')
+
+    @property
+    def total(self):
+        """int: Rows rejected across all tables."""
+        return sum(self.rejected.values())
+
+    def log_summary(self, label):
+        """
+        Log the rejected row counts per table.
+
+        Args:
+            label (str): Pipeline label for the heading (e.g. 'MOLO')
+        """
+        if not self.rejected:
+            return
+        where = REJECTED_ROWS_TABLE if self.use_table else f"{self.quarantine_dir}/"
+        logger.warning(f"\n🚧 {label}: {self.total:,} row(s) rejected, quarantined in {where}:")
+        for table_name in sorted(self.rejected):
+            logger.warning(f"   {table_name:<40} {self.rejected[table_name]:>8,}")
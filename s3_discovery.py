@@ -0,0 +1,253 @@
+"""
+S3 Discovery Module
+
+Finds the newest backup object in an S3 bucket without listing the whole
+bucket.
+
+Both sources name their backups after the export time, so S3's listing
+order (ascending by key) is also their chronological order:
+
+- MOLO:    [prefix]YYYYMMDDhhmmss.zip
+- Stellar: prod_resilient_YYYY-MM-DD_HH_MM-DATA.sql.gz
+
+The newest key is found by listing only the keys after the last object that
+was loaded (StartAfter, taken from the processed-object ledger), or, without
+one, only the current month's keys (Prefix), stepping back a month at a time.
+Either way a run lists the recent backups only, however many years of them
+the bucket holds. If nothing in the lookback window follows the naming
+scheme, the whole bucket is listed and the newest matching file by
+LastModified is used, as before.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import takewhile
+
+from botocore.exceptions import ClientError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Months stepped back from the current one before listing the whole bucket
+DEFAULT_LOOKBACK_MONTHS = 3
+
+
+@dataclass(frozen=True)
+class BackupKeyScheme:
+    """
+    Naming scheme of a source's timestamped backup objects.
+
+    Attributes:
+        description (str): What the objects are, for log messages
+        stem (str): Fixed text between the prefix and the timestamp
+        pattern (str): Regex for the key after the prefix; group 1 is the timestamp
+        timestamp_format (str): strptime format of the timestamp
+        month_format (str): strftime format of one month's key prefix after the stem
+        suffix (str): File ending accepted by the full-bucket fallback
+    """
+    description: str
+    stem: str
+    pattern: str
+    timestamp_format: str
+    month_format: str
+    suffix: str
+
+    def timestamp(self, key, prefix=''):
+        """
+        Export time encoded in a key.
+
+        Args:
+            key (str): S3 object key
+            prefix (str): Key prefix the backups live under
+
+        Returns:
+            datetime: Export time, or None if the key does not follow the scheme
+        """
+        if not key.startswith(prefix):
+            return None
+        match = re.fullmatch(self.pattern, key[len(prefix):])
+        if match is None:
+            return None
+        try:
+            return datetime.strptime(match.group(1), self.timestamp_format)
+        except ValueError:
+            return None
+
+
+MOLO_BACKUP_KEYS = BackupKeyScheme(
+    description='.zip file',
+    stem='',
+    pattern=r'(\d{14})\.zip',
+    timestamp_format='%Y%m%d%H%M%S',
+    month_format='%Y%m',
+    suffix='.zip'
+)
+
+STELLAR_BACKUP_KEYS = BackupKeyScheme(
+    description='-DATA.sql.gz file',
+    stem='prod_resilient_',
+    pattern=r'prod_resilient_(\d{4}-\d{2}-\d{2}_\d{2}_\d{2})-DATA\.sql\.gz',
+    timestamp_format='%Y-%m-%d_%H_%M',
+    month_format='%Y-%m',
+    suffix='-DATA.sql.gz'
+)
+
+
+def list_objects(s3_client, bucket, prefix='', start_after=None):
+    """
+    List objects in key order, one page at a time.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        prefix (str): Only list keys starting with this prefix
+        start_after (str): Only list keys after this key
+
+    Yields:
+        dict: Object summaries (Key, LastModified, Size, ...)
+    """
+    params = {'Bucket': bucket}
+    if prefix:
+        params['Prefix'] = prefix
+    if start_after:
+        params['StartAfter'] = start_after
+    for page in s3_client.get_paginator('list_objects_v2').paginate(**params):
+        yield from page.get('Contents', [])
+
+
+def month_prefixes(scheme, prefix='', lookback_months=DEFAULT_LOOKBACK_MONTHS, now=None):
+    """
+    Key prefixes of the current month and the months before it, newest first.
+
+    Args:
+        scheme (BackupKeyScheme): Naming scheme
+        prefix (str): Key prefix the backups live under
+        lookback_months (int): Months before the current one to include
+        now (datetime): Current time (default: datetime.now())
+
+    Returns:
+        list: Key prefixes, e.g. ['prod_resilient_2025-10', 'prod_resilient_2025-09', ...]
+    """
+    now = now or datetime.now()
+    prefixes = []
+    year, month = now.year, now.month
+    for _ in range(lookback_months + 1):
+        month_start = datetime(year, month, 1)
+        prefixes.append(prefix + scheme.stem + month_start.strftime(scheme.month_format))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return prefixes
+
+
+def newest_key(objects, scheme, prefix=''):
+    """
+    Pick the newest key that follows the naming scheme.
+
+    Args:
+        objects (iterable): Object summaries from list_objects()
+        scheme (BackupKeyScheme): Naming scheme
+        prefix (str): Key prefix the backups live under
+
+    Returns:
+        tuple: (newest key or None, number of objects listed)
+    """
+    latest = None
+    latest_time = None
+    listed = 0
+    for obj in objects:
+        listed += 1
+        exported = scheme.timestamp(obj['Key'], prefix)
+        if exported is not None and (latest_time is None or exported > latest_time):
+            latest, latest_time = obj['Key'], exported
+    return latest, listed
+
+
+def object_exists(s3_client, bucket, key):
+    """
+    Check whether an object is still in the bucket.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        key (str): Object key
+
+    Returns:
+        bool: True if the object exists
+    """
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return False
+        raise
+
+
+def find_latest_key(
+    s3_client,
+    bucket,
+    scheme,
+    prefix='',
+    start_after=None,
+    lookback_months=DEFAULT_LOOKBACK_MONTHS,
+    now=None
+):
+    """
+    Find the newest backup object in a bucket.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        scheme (BackupKeyScheme): Naming scheme of the backups
+        prefix (str): Key prefix the backups live under
+        start_after (str): Last key loaded; only newer keys are listed
+        lookback_months (int): Months stepped back before listing the whole bucket
+        now (datetime): Current time (default: datetime.now())
+
+    Returns:
+        str: Key of the newest backup, or None if there is none
+    """
+    prefix = prefix or ''
+
+    # 1. Only the keys after the last one loaded; the timestamp starts with a
+    #    digit, so listing stops at the first key past the digits
+    if start_after and scheme.timestamp(start_after, prefix) is not None:
+        base = prefix + scheme.stem
+        ceiling = base + ':'  # ':' sorts right after '9'
+        recent = takewhile(
+            lambda obj: obj['Key'] < ceiling,
+            list_objects(s3_client, bucket, base, start_after)
+        )
+        latest, listed = newest_key(recent, scheme, prefix)
+        logger.info(f"Listed {listed} keys after {start_after}")
+        if latest:
+            return latest
+        if object_exists(s3_client, bucket, start_after):
+            return start_after
+        logger.warning(f"{start_after} is no longer in the bucket, searching by month")
+
+    # 2. Month by month, newest first
+    for month_prefix in month_prefixes(scheme, prefix, lookback_months, now):
+        latest, listed = newest_key(
+            list_objects(s3_client, bucket, month_prefix), scheme, prefix
+        )
+        logger.info(f"Listed {listed} keys under {month_prefix}")
+        if latest:
+            return latest
+
+    # 3. Whole bucket (or prefix), newest matching file by LastModified
+    logger.warning(
+        f"No {scheme.description} named after the export time in the last "
+        f"{lookback_months + 1} months, listing all of s3://{bucket}/{prefix}"
+    )
+    latest = None
+    listed = 0
+    for obj in list_objects(s3_client, bucket, prefix):
+        listed += 1
+        if obj['Key'].lower().endswith(scheme.suffix.lower()):
+            if latest is None or obj['LastModified'] > latest['LastModified']:
+                latest = obj
+    logger.info(f"Listed {listed} keys")
+    return latest['Key'] if latest else None
@@ -0,0 +1,437 @@
+"""
+S3 Download Module
+
+Parallel ranged-GET downloads of the source archives.
+
+A single get_object stream is limited by one TCP connection. Here an object
+is split into byte ranges that are fetched concurrently by a bounded thread
+pool, either
+
+- into a preallocated, memory-mapped temporary file (download_object), for
+  archives that need random access such as the MOLO ZIP, or
+- through ParallelRangeStream, a sequential file-like reader that keeps a
+  window of ranges in flight ahead of its consumer, for archives that are
+  streamed such as the Stellar tarball.
+
+Every range request carries If-Match with the ETag read up front, so a
+backup overwritten mid-download fails instead of mixing two versions. Once
+all bytes are in, the ETag is recomputed from the data (MD5, or the MD5 of
+the part MD5s for multipart uploads) and compared. Objects whose ETag is not
+an MD5 (SSE-KMS or SSE-C) are only checked for their size.
+"""
+
+import hashlib
+import logging
+import mmap
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from botocore.exceptions import BotoCoreError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes per ranged GET
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+# Ranged GETs in flight at once
+DEFAULT_DOWNLOAD_WORKERS = 8
+
+# Bytes copied from a response body (or hashed) per step
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Attempts per range before the download fails (network errors only)
+RANGE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class S3ObjectInfo:
+    """
+    Size and ETag of an S3 object, read once before the download.
+
+    Attributes:
+        bucket (str): S3 bucket name
+        key (str): Object key
+        size (int): Object size in bytes
+        etag (str): ETag without the surrounding quotes
+        upload_part_size (int): Part size of a multipart upload, else None
+        verifiable (bool): False if the ETag is not an MD5 (SSE-KMS / SSE-C)
+    """
+    bucket: str
+    key: str
+    size: int
+    etag: str
+    upload_part_size: int = None
+    verifiable: bool = True
+
+    def ranges(self, part_size=DEFAULT_PART_SIZE):
+        """
+        Split the object into inclusive byte ranges.
+
+        Args:
+            part_size (int): Bytes per range
+
+        Returns:
+            list: (first, last) byte offsets
+        """
+        return [
+            (start, min(start + part_size, self.size) - 1)
+            for start in range(0, self.size, part_size)
+        ]
+
+    def verifier(self):
+        """
+        Start recomputing the ETag.
+
+        Returns:
+            EtagVerifier: Verifier, or None if the ETag cannot be recomputed
+        """
+        return EtagVerifier(self) if self.verifiable else None
+
+
+def describe_object(s3_client, bucket, key, expected_etag=None):
+    """
+    Read the size, ETag and upload layout of an S3 object.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        key (str): Object key
+        expected_etag (str): ETag the object must still have (e.g. the one
+                             the archive cache entry will be stored under)
+
+    Returns:
+        S3ObjectInfo: Object description
+
+    Raises:
+        ValueError: If the object no longer has expected_etag
+    """
+    head = s3_client.head_object(Bucket=bucket, Key=key)
+    etag = head['ETag'].strip('"')
+    if expected_etag is not None and etag != expected_etag:
+        raise ValueError(
+            f"s3://{bucket}/{key} changed while the run started "
+            f"(ETag {expected_etag}, now {etag})"
+        )
+    verifiable = not (
+        head.get('ServerSideEncryption') == 'aws:kms' or head.get('SSECustomerAlgorithm')
+    )
+    upload_part_size = None
+    if verifiable and '-' in etag:
+        # Every part but the last has the size of the first one
+        first_part = s3_client.head_object(Bucket=bucket, Key=key, PartNumber=1)
+        upload_part_size = first_part['ContentLength']
+    return S3ObjectInfo(
+        bucket, key, head['ContentLength'], etag, upload_part_size, verifiable
+    )
+
+
+class EtagVerifier:
+    """
+    Recomputes an S3 ETag from the object's bytes, fed in order.
+
+    Single-part uploads have the MD5 of the content as ETag; multipart
+    uploads have the MD5 of the concatenated part MD5s followed by
+    "-<number of parts>".
+    """
+
+    def __init__(self, info):
+        self.info = info
+        self._part_digests = []
+        self._part = hashlib.md5()
+        self._part_filled = 0
+
+    def update(self, data):
+        """
+        Hash the next bytes of the object.
+
+        Args:
+            data (bytes or memoryview): Next bytes, in object order
+        """
+        part_size = self.info.upload_part_size
+        if part_size is None:
+            self._part.update(data)
+            return
+        view = memoryview(data)
+        while view:
+            take = min(len(view), part_size - self._part_filled)
+            self._part.update(view[:take])
+            self._part_filled += take
+            view = view[take:]
+            if self._part_filled == part_size:
+                self._part_digests.append(self._part.digest())
+                self._part = hashlib.md5()
+                self._part_filled = 0
+
+    def verify(self):
+        """
+        Compare the recomputed ETag with the one S3 reported.
+
+        Raises:
+            ValueError: If they differ
+        """
+        if self.info.upload_part_size is None:
+            etag = self._part.hexdigest()
+        else:
+            digests = list(self._part_digests)
+            if self._part_filled:
+                digests.append(self._part.digest())
+            etag = f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+        if etag != self.info.etag:
+            raise ValueError(
+                f"Checksum mismatch for s3://{self.info.bucket}/{self.info.key}: "
+                f"ETag {self.info.etag}, downloaded data hashes to {etag}"
+            )
+
+
+def _get_range(s3_client, info, first, last, sink):
+    """
+    Fetch one byte range and hand its body to sink chunk by chunk.
+
+    Network errors are retried; a changed object (If-Match failing) is not.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        info (S3ObjectInfo): Object being downloaded
+        first (int): First byte offset
+        last (int): Last byte offset (inclusive)
+        sink (callable): Called as sink(offset, chunk)
+    """
+    for attempt in range(1, RANGE_ATTEMPTS + 1):
+        try:
+            response = s3_client.get_object(
+                Bucket=info.bucket,
+                Key=info.key,
+                Range=f"bytes={first}-{last}",
+                IfMatch=f'"{info.etag}"'
+            )
+            offset = first
+            body = response['Body']
+            for chunk in iter(lambda: body.read(COPY_CHUNK_SIZE), b''):
+                sink(offset, chunk)
+                offset += len(chunk)
+            if offset != last + 1:
+                raise ValueError(
+                    f"Short read for bytes {first}-{last} of {info.key}: got {offset - first}"
+                )
+            return
+        except (BotoCoreError, OSError, ValueError) as e:
+            if attempt == RANGE_ATTEMPTS:
+                raise
+            logger.warning(
+                f"⚠️  Retrying bytes {first}-{last} of {info.key} "
+                f"(attempt {attempt} failed: {e})"
+            )
+
+
+def _log_transfer(info, seconds, ranges, workers, verb='Downloaded'):
+    """Log the size and throughput of a finished download."""
+    size_mb = info.size / (1024 * 1024)
+    rate = size_mb / seconds if seconds > 0 else 0.0
+    logger.info(
+        f"⬇️  {verb} {info.key}: {size_mb:.1f} MB in {seconds:.1f}s "
+        f"({rate:.1f} MB/s, {ranges} ranges, {workers} workers)"
+    )
+
+
+def download_object(
+    s3_client,
+    bucket,
+    key,
+    workers=DEFAULT_DOWNLOAD_WORKERS,
+    part_size=DEFAULT_PART_SIZE,
+    suffix=None,
+    expected_etag=None
+):
+    """
+    Download an S3 object into a temporary file with concurrent ranged GETs.
+
+    The file is preallocated to the object's size and memory-mapped, and
+    every range is written at its own offset as soon as it arrives. The
+    caller owns the returned file and must close it (the file is deleted
+    automatically on close).
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket (str): S3 bucket name
+        key (str): Object key
+        workers (int): Ranged GETs in flight at once
+        part_size (int): Bytes per ranged GET
+        suffix (str): Temporary file name suffix (e.g. '.zip')
+        expected_etag (str): ETag the object must still have
+
+    Returns:
+        file: Seekable binary temporary file positioned at offset 0
+
+    Raises:
+        ValueError: If the downloaded data does not match the object's ETag
+    """
+    started = time.perf_counter()
+    info = describe_object(s3_client, bucket, key, expected_etag)
+    ranges = info.ranges(part_size)
+    workers = max(1, min(workers, len(ranges)))
+
+    spool = tempfile.TemporaryFile(suffix=suffix)
+    try:
+        if info.size:
+            spool.truncate(info.size)
+            with mmap.mmap(spool.fileno(), info.size) as buffer:
+                def write(offset, chunk):
+                    buffer[offset:offset + len(chunk)] = chunk
+
+                with ThreadPoolExecutor(workers, thread_name_prefix='s3-range') as executor:
+                    futures = [
+                        executor.submit(_get_range, s3_client, info, first, last, write)
+                        for first, last in ranges
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+
+                verifier = info.verifier()
+                if verifier is not None:
+                    view = memoryview(buffer)
+                    try:
+                        for start in range(0, info.size, COPY_CHUNK_SIZE):
+                            verifier.update(view[start:start + COPY_CHUNK_SIZE])
+                    finally:
+                        view.release()
+                    verifier.verify()
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+
+    _log_transfer(info, time.perf_counter() - started, len(ranges), workers)
+    return spool
+
+
+class ParallelRangeStream:
+    """
+    Sequential file-like reader over an S3 object fetched in parallel ranges.
+
+    Up to `workers` ranges are downloading at any time, in object order, so
+    the transfer keeps running while the consumer decompresses and parses;
+    at most workers * part_size bytes are buffered. Call finish() after the
+    consumer is done to read any trailing bytes and check the ETag.
+
+    Attributes:
+        info (S3ObjectInfo): Object being read
+        bytes_read (int): Bytes handed to the consumer so far
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket,
+        key,
+        workers=DEFAULT_DOWNLOAD_WORKERS,
+        part_size=DEFAULT_PART_SIZE,
+        expected_etag=None
+    ):
+        self._started = time.perf_counter()
+        self._s3_client = s3_client
+        self.info = describe_object(s3_client, bucket, key, expected_etag)
+        self._range_count = len(self.info.ranges(part_size))
+        self._workers = max(1, min(workers, self._range_count))
+        self._ranges = iter(self.info.ranges(part_size))
+        self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix='s3-range')
+        self._pending = deque()
+        self._verifier = self.info.verifier()
+        self._buffer = b''
+        self._offset = 0
+        self._eof = False
+        self.bytes_read = 0
+        for _ in range(self._workers):
+            self._submit_next()
+
+    def _fetch(self, first, last):
+        """Worker: download one range into memory (a retry overwrites in place)."""
+        data = bytearray(last - first + 1)
+
+        def write(offset, chunk):
+            data[offset - first:offset - first + len(chunk)] = chunk
+
+        _get_range(self._s3_client, self.info, first, last, write)
+        return data
+
+    def _submit_next(self):
+        next_range = next(self._ranges, None)
+        if next_range is not None:
+            self._pending.append(self._executor.submit(self._fetch, *next_range))
+
+    def _next_range(self):
+        """Wait for the next range in order; returns b'' at the end of the object."""
+        if not self._pending:
+            return b''
+        data = self._pending.popleft().result()
+        self._submit_next()
+        if self._verifier is not None:
+            self._verifier.update(data)
+        return data
+
+    def read(self, size=-1):
+        """
+        Read up to size bytes (all remaining bytes if size is negative).
+
+        Raises:
+            Exception: Any error raised while fetching a range
+        """
+        parts = []
+        remaining = size
+        while remaining != 0:
+            if self._offset >= len(self._buffer):
+                if self._eof:
+                    break
+                self._buffer, self._offset = self._next_range(), 0
+                if not self._buffer:
+                    self._eof = True
+                    break
+
+            end = len(self._buffer) if remaining < 0 else self._offset + remaining
+            part = self._buffer[self._offset:end]
+            self._offset += len(part)
+            if remaining > 0:
+                remaining -= len(part)
+            parts.append(part)
+
+        data = b''.join(parts)
+        self.bytes_read += len(data)
+        return data
+
+    def finish(self):
+        """
+        Read the rest of the object and check it against its ETag.
+
+        Raises:
+            ValueError: If the object is incomplete or does not match its ETag
+        """
+        while self.read(COPY_CHUNK_SIZE):
+            pass
+        if self.bytes_read != self.info.size:
+            raise ValueError(
+                f"Incomplete download of {self.info.key}: "
+                f"{self.bytes_read} of {self.info.size} bytes"
+            )
+        if self._verifier is not None:
+            self._verifier.verify()
+        _log_transfer(
+            self.info, time.perf_counter() - self._started, self._range_count,
+            self._workers, verb='Streamed'
+        )
+
+    def close(self):
+        """Cancel outstanding ranges and release buffered data."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._buffer = b''
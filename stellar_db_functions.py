@@ -16,16 +16,28 @@ Contains 29 merge functions for Stellar Business data management including:
 - Operations: waitlists, closed_dates, holidays, blacklists
 - Reference data: categories, amenities
 
+Connections can also be drawn from a pool (OracleConnector.create_pool() and
+OracleConnector.from_pool()) so that several tables load at the same time;
+see parallel_loader.py. The insert methods bind their rows in arrays sized
+and committed by the connector's LoadPolicy (see load_policy.py).
+
 Dependencies:
     - oracledb: Oracle database connectivity
     - logging: For structured logging
     - os: For environment variable access
 """
 
+import itertools
 import os
 import logging
 import oracledb
 
+from bulk_load import CONVENTIONAL, append_insert, choose_mode
+from dbms_output import read_output
+from load_policy import LoadPolicy
+from merge_log import call_merge
+from row_quarantine import insert_table
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -40,9 +52,11 @@ class OracleConnector:
     Attributes:
         connection: Oracle database connection object
         cursor: Database cursor for executing SQL statements
+        pool: Connection pool the connection was acquired from, or None
+        load_policy (LoadPolicy): Array size and commit granularity of staging loads
     """
     
-    def __init__(self, user, password, dsn):
+    def __init__(self, user, password, dsn, load_policy=None):
         """
         Initialize Oracle database connection.
         
@@ -50,6 +64,8 @@ class OracleConnector:
             user (str): Database username
             password (str): Database password  
             dsn (str): Database data source name (connection string)
+            load_policy (LoadPolicy): Staging load policy (default: commit per
+                                      table, auto-sized arrays)
         """
         # Configure Oracle wallet for Autonomous Database
         self._setup_oracle_wallet()
@@ -68,9 +84,72 @@ class OracleConnector:
             dsn=dsn
         )
         logger.info("✅ Oracle database connection successful!")
+        self.pool = None
         self.cursor = self.connection.cursor()
+        self.load_policy = load_policy or LoadPolicy()
+    
+    @classmethod
+    def create_pool(cls, user, password, dsn, max_connections):
+        """
+        Create a connection pool for loading tables in parallel.
+        
+        Args:
+            user (str): Database username
+            password (str): Database password
+            dsn (str): Database data source name (connection string)
+            max_connections (int): Maximum number of pooled sessions
+            
+        Returns:
+            oracledb.ConnectionPool: Pool to pass to from_pool()
+        """
+        cls._setup_oracle_wallet()
+        cls._initialize_oracle_client()
+        
+        logger.info(f"Creating Oracle connection pool (up to {max_connections} sessions)...")
+        logger.info(f"   User: {user}")
+        logger.info(f"   DSN: {dsn}")
+        
+        pool = oracledb.create_pool(
+            user=user,
+            password=password,
+            dsn=dsn,
+            min=1,
+            max=max_connections,
+            increment=1
+        )
+        logger.info("✅ Oracle connection pool created!")
+        return pool
     
-    def _setup_oracle_wallet(self):
+    @classmethod
+    def from_pool(cls, pool, load_policy=None):
+        """
+        Create a connector on a session acquired from a pool.
+        
+        close() releases the session back to the pool instead of closing it.
+        
+        Args:
+            pool (oracledb.ConnectionPool): Pool from create_pool()
+            load_policy (LoadPolicy): Staging load policy (default: commit per
+                                      table, auto-sized arrays)
+            
+        Returns:
+            OracleConnector: Connector on the acquired session
+        """
+        connector = cls.__new__(cls)
+        connector.pool = pool
+        connector.connection = pool.acquire()
+        connector.cursor = connector.connection.cursor()
+        connector.load_policy = load_policy or LoadPolicy()
+        return connector
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @staticmethod
+    def _setup_oracle_wallet():
         """Set up Oracle wallet environment for Autonomous Database."""
         # Check if we're in a container by looking for /.dockerenv or checking if Oracle Instant Client has wallet files
         container_wallet = '/opt/oracle/instantclient/network/admin'
@@ -125,7 +204,8 @@ class OracleConnector:
             logger.error(f"❌ Wallet directory not found: {wallet_dir}")
             raise FileNotFoundError(f"Wallet directory not found: {wallet_dir}")
     
-    def _initialize_oracle_client(self):
+    @staticmethod
+    def _initialize_oracle_client():
         """Initialize Oracle Instant Client with common installation paths."""
         try:
             # Try different common paths for Oracle Instant Client
@@ -191,47 +271,20 @@ class OracleConnector:
             "Stellar staging tables"
         )
     
-    def run_all_merges(self):
-        """
-        Execute the master stored procedure that merges all staging tables.
-        
-        This calls SP_RUN_ALL_MOLO_STELLAR_MERGES which internally calls 
-        all individual merge procedures. The stored procedures handle:
-        - MERGE logic (UPDATE existing, INSERT new)
-        - INSERTED_DATE and UPDATED_DATE management
-        - Transaction commits
-        """
-        logger.info(
-            "Executing stored procedure to merge all Stellar staging "
-            "data to data warehouse..."
-        )
-        try:
-            self.cursor.execute("BEGIN SP_RUN_ALL_MOLO_STELLAR_MERGES; END;")
-            self.connection.commit()
-            logger.info("✅ Successfully completed all Stellar merge operations")
-        except Exception as e:
-            logger.warning(
-                f"⚠️  Stored procedure SP_RUN_ALL_MOLO_STELLAR_MERGES not found or failed: {e}"
-            )
-            logger.warning(
-                "   Data has been loaded into STG_STELLAR_* staging tables successfully."
-            )
-            logger.warning(
-                "   Create the stored procedures to merge STG_* → DW_* tables."
-            )
-            # Don't raise - let the process continue
-            self.connection.rollback()
-    
     def merge_single_table(self, table_name):
         """
         Execute a single merge stored procedure immediately after data load.
         
+        The procedure's row counts come back in the same round trip, from
+        the ETL_MERGE_LOG row it writes (see merge_log.py).
+        
         Args:
             table_name (str): Name of the table (e.g., 'CUSTOMERS', 'BOOKINGS', 'STYLES')
                             Will be converted to procedure name SP_MERGE_STELLAR_{table_name}
         
         Returns:
-            dict: Merge statistics {'inserted': int, 'updated': int, 'output': str}
+            dict: Merge statistics {'staged', 'inserted', 'updated', 'unchanged', 'seconds'}
+                  or None if the merge log is unavailable
         """
         procedure_name = f'SP_MERGE_STELLAR_{table_name.upper()}'
         
@@ -239,62 +292,114 @@ class OracleConnector:
             # Enable DBMS_OUTPUT to capture procedure logging
             self.cursor.callproc("dbms_output.enable")
             
-            # Call the procedure (no OUT parameters, uses DBMS_OUTPUT instead)
-            self.cursor.callproc(procedure_name)
-            
-            # Fetch DBMS_OUTPUT lines
-            output_lines = []
-            line_var = self.cursor.var(str)
-            status_var = self.cursor.var(int)
+            stats = call_merge(self.cursor, procedure_name)
             
-            while True:
-                self.cursor.callproc("dbms_output.get_line", (line_var, status_var))
-                if status_var.getvalue() != 0:
-                    break
-                output_line = line_var.getvalue()
+            # Fetch DBMS_OUTPUT lines in bulk; the procedure committed its own work
+            for output_line in read_output(self.cursor):
                 if output_line:
-                    output_lines.append(output_line)
                     logger.info(f"  📋 {output_line}")
             
-            self.connection.commit()
-            
-            # Parse the output to extract inserted/updated counts if present
-            result = {
-                'procedure': procedure_name,
-                'output': '\n'.join(output_lines),
-                'inserted': 0,
-                'updated': 0
-            }
-            
-            # Try to parse "X inserted, Y updated" format
-            for line in output_lines:
-                if 'inserted' in line.lower() and 'updated' in line.lower():
-                    try:
-                        parts = line.split(':')[-1].strip()  # Get after the colon
-                        nums = parts.split(',')
-                        if len(nums) >= 2:
-                            result['inserted'] = int(nums[0].split()[0])
-                            result['updated'] = int(nums[1].split()[0])
-                    except:
-                        pass
-            
-            logger.info(
-                f"✅ {procedure_name}: "
-                f"{result['inserted']} inserted, {result['updated']} updated"
-            )
+            if stats:
+                logger.info(
+                    f"✅ {procedure_name}: {stats['inserted']} inserted, "
+                    f"{stats['updated']} updated, {stats['unchanged']} unchanged"
+                )
+            else:
+                logger.info(f"✅ {procedure_name}: Merge completed")
             
-            return result
+            return stats
                 
         except Exception as e:
             logger.error(f"❌ Error executing {procedure_name}: {e}")
             self.connection.rollback()
             raise
     
+    def _insert_rows(self, insert_sql, data_rows):
+        """
+        Insert a table's rows in arrays sized by the load policy.
+        
+        Every array is committed with commit per batch; otherwise (including
+        the 'auto' default) the table commits once, after its last array
+        (Stellar tables are truncated right before their load, so they never
+        wait for the end of the run).
+        With a quarantine on the policy, rejected rows are set aside (see
+        row_quarantine.py) and the rest of their array is inserted; the
+        quarantine follows the commits, and forgets the rejections of an
+        array that fails and is rolled back.
+        
+        Args:
+            insert_sql (str): INSERT statement of the staging table
+            data_rows (iterable): Row tuples, pulled one array at a time
+            
+        Returns:
+            tuple: (rows read, rows rejected - 0 without a quarantine)
+        """
+        policy = self.load_policy
+        quarantine = policy.quarantine
+        table_name = insert_table(insert_sql)
+        row_count = rejected = 0
+        rows = iter(data_rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return row_count, rejected
+        batch_size = policy.batch_rows(column_count=len(first_row))
+        rows = itertools.chain((first_row,), rows)
+        try:
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                row_count += len(batch)
+                self.cursor.executemany(insert_sql, batch, batcherrors=quarantine is not None)
+                if quarantine is not None:
+                    errors = self.cursor.getbatcherrors()
+                    if errors:
+                        rejected += quarantine.reject(self, table_name, batch, errors)
+                if policy.commit_per_batch():
+                    self._commit(table_name)
+            if not policy.commit_per_batch():
+                self._commit(table_name)
+        except Exception:
+            self.connection.rollback()
+            if quarantine is not None:
+                quarantine.rollback(table_name)
+            raise
+        return row_count, rejected
+    
+    def _commit(self, table_name):
+        """Commit the open transaction and report it to the quarantine."""
+        self.connection.commit()
+        if self.load_policy.quarantine is not None:
+            self.load_policy.quarantine.commit(table_name)
+    
+    @staticmethod
+    def _log_inserted(inserted, rejected, description):
+        """
+        Log the rows an insert method staged.
+        
+        Args:
+            inserted (int): Rows inserted
+            rejected (int): Rows rejected and quarantined
+            description (str): Record label (e.g. 'booking')
+            
+        Returns:
+            int: inserted
+        """
+        logger.info(
+            f"✅ Inserted {inserted} {description} records"
+            + (f" ({rejected} rejected)" if rejected else "")
+        )
+        return inserted
+    
     def close(self):
-        """Close database cursor and connection."""
+        """Close database cursor and connection (pooled sessions are released)."""
         if self.cursor:
             self.cursor.close()
         if self.connection:
+            if self.pool is not None:
+                self.pool.release(self.connection)
+                logger.debug("Database session released to pool")
+                return
             self.connection.close()
         logger.info("Database connection closed")
 
@@ -309,11 +414,14 @@ class OracleConnector:
         All 22 columns.
         
         Args:
-            data_rows: List of tuples containing location data
+            data_rows: Iterable of tuples containing location data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No location data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_LOCATIONS (ID, CODE, LOCATION_NAME, LOCATION_TYPE, MINIMUM_1, MINIMUM_2,
@@ -324,9 +432,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, TO_DATE(:13, 'YYYY-MM-DD'), :14, :15, :16, :17, :18, :19, :20, TO_TIMESTAMP(:21, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:22, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} location records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'location')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging location data: {e}")
@@ -338,11 +445,14 @@ class OracleConnector:
         All 52 columns, using USER_ID as primary key (not ID!).
         
         Args:
-            data_rows: List of tuples containing customer data
+            data_rows: Iterable of tuples containing customer data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No customer data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_CUSTOMERS (USER_ID, CLUB_PRINCIPAL_USER_ID, COUPON_ID, CLUB_TIER_ID,
@@ -361,43 +471,44 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52)"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} customer records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for CUSTOMERS...")
-            self.merge_single_table('CUSTOMERS')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'customer')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging customer data: {e}")
             raise
 
-    def insert_bookings(self, data_rows):
+    def insert_bookings(self, data_rows, bulk_mode=CONVENTIONAL):
         """
         Insert booking data into STG_STELLAR_BOOKINGS table.
         
         Args:
-            data_rows: List of tuples containing booking data (82 columns)
+            data_rows: Iterable of tuples containing booking data (82 columns)
+            bulk_mode (str): 'conventional' (default), or 'append'/'direct' to
+                             insert with APPEND_VALUES (see bulk_load.py)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No booking data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_BOOKINGS (ID, LOCATION_ID, CUSTOMER_ID, CREATOR_ID, ADMIN_ID, BILLING_FIRST_NAME, BILLING_LAST_NAME, BILLING_STREET1, BILLING_STREET2, BILLING_CITY, BILLING_STATE, BILLING_COUNTRY, BILLING_ZIP, CC_SAVED_NAME, CC_SAVED_LAST4, CC_SAVED_PROFILE_ID, CC_SAVED_METHOD_ID, CC_SAVED_ADDRESS_ID, CC_PREAUTH_ID, CC_PREAUTH_AMOUNT, CC_CONNECT_TYPE, CC_CONNECT_ID, ACCESSORIES_CUSTOM_PRICE, ACCESSORIES_TOTAL, INSURANCE_AMOUNT, PETS, PARKING, PARKING_OVERRIDE, BOATS_TOTAL, POS_TOTAL, USE_CLUB_CREDITS, NO_SHOW_FEE, CANCELLATION_FEE, CLUB_FEES, CLUB_FEES_OVERRIDE, SUB_TOTAL, CONVENIENCE_FEE, CONVENIENCE_FEE_WAIVED, INTERNAL_APPLICATION_FEE, TAX_1, TAX_1_EXEMPT, TAX_1_RATE_OVERRIDE, TAX_2, TAX_2_EXEMPT, CHECK_IN_TAX_1, CHECK_IN_TAX_2, CHECK_IN_TOTAL, DEPOSIT_TOTAL, DEPOSIT_OVERRIDE, DEPOSIT_WAIVED, GRATUITY, GRAND_TOTAL, ADJUSTMENT_TOTAL, AMOUNT_PAID, NOTES, NOTES_CONTRACT, NOTES_FROM_CUSTOMER, NOTES_FROM_CUSTOMER_CONTRACT, NOTES_FOR_CUSTOMER, NOTES_FOR_CUSTOMER_CONTRACT, FRONTEND, IS_ON_HOLD, IS_LOCKED, IS_FINALIZED, IS_CANCELED, OVERRIDE_TURNAROUND_TIME, CANCELLATION_TYPE, BYPASS_CLUB_RESTRICTIONS, RENTERS_INSURANCE_INTEREST, COUPON_ID, COUPON_TYPE, COUPON_AMOUNT, DISCOUNT_TOTAL, AGENT_ID, AGENT_NAME, REFERRER_ID, SAFETY_REMINDER, DELETED_ADMIN_ID, CREATED_AT, UPDATED_AT, FINALIZED_AT, DELETED_AT)
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57, :58, :59, :60, :61, :62, :63, :64, :65, :66, :67, :68, :69, :70, :71, :72, :73, :74, :75, :76, :77, :78, TO_TIMESTAMP(:79, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:80, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:81, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:82, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKINGS...")
-            self.merge_single_table('BOOKINGS')
-            
+            mode = choose_mode(
+                bulk_mode, self.connection, 'STG_STELLAR_BOOKINGS', typed_rows=False,
+                batch_errors=self.load_policy.batch_errors
+            )
+            rejected = 0
+            if mode == CONVENTIONAL:
+                row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            else:
+                row_count = append_insert(self, insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'booking')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging booking data: {e}")
@@ -408,11 +519,14 @@ class OracleConnector:
         Insert booking boat data into STG_STELLAR_BOOKING_BOATS table.
         
         Args:
-            data_rows: List of tuples containing booking boat data (57 columns)
+            data_rows: Iterable of tuples containing booking boat data (57 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No booking boat data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_BOOKING_BOATS (ID, BOOKING_ID, STYLE_ID, BOAT_ID, TIME_ID, TIMEFRAME_ID,
@@ -431,29 +545,28 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57)"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking boat records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKING_BOATS...")
-            self.merge_single_table('BOOKING_BOATS')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'booking boat')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging booking boat data: {e}")
             raise
 
-    def insert_booking_payments(self, data_rows):
+    def insert_booking_payments(self, data_rows, bulk_mode=CONVENTIONAL):
         """
         Insert booking payment data into STG_STELLAR_BOOKING_PAYMENTS table.
         
         Args:
-            data_rows: List of tuples containing booking payment data (56 columns)
+            data_rows: Iterable of tuples containing booking payment data (56 columns)
+            bulk_mode (str): 'conventional' (default), or 'append'/'direct' to
+                             insert with APPEND_VALUES (see bulk_load.py)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No booking payment data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_BOOKING_PAYMENTS (ID, BOOKING_ID, CUSTOMER_ID, ADMIN_ID, FRONTEND, PAYMENT_FOR,
@@ -471,14 +584,16 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, TO_TIMESTAMP(:50, 'YYYY-MM-DD HH24:MI:SS'), :51, :52, :53, TO_TIMESTAMP(:54, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:55, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:56, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking payment records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKING_PAYMENTS...")
-            self.merge_single_table('BOOKING_PAYMENTS')
-            
+            mode = choose_mode(
+                bulk_mode, self.connection, 'STG_STELLAR_BOOKING_PAYMENTS', typed_rows=False,
+                batch_errors=self.load_policy.batch_errors
+            )
+            rejected = 0
+            if mode == CONVENTIONAL:
+                row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            else:
+                row_count = append_insert(self, insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'booking payment')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging booking payment data: {e}")
@@ -489,11 +604,14 @@ class OracleConnector:
         Insert style group data into STG_STELLAR_STYLE_GROUPS table (11 columns).
         
         Args:
-            data_rows: List of tuples containing style group data (11 values each)
+            data_rows: Iterable of tuples containing style group data (11 values each)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style group data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLE_GROUPS (ID, LOCATION_ID, GROUP_NAME, FRONTEND_MAX_SAME_DEPARTURES,
@@ -502,9 +620,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style group records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style group')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style group data: {e}")
@@ -515,11 +632,14 @@ class OracleConnector:
         Insert style data into STG_STELLAR_STYLES table (98 columns).
         
         Args:
-            data_rows: List of tuples containing style data
+            data_rows: Iterable of tuples containing style data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLES (ID, LOCATION_ID, STYLE_GROUP_ID, STYLE_NAME, BACKEND_DISPLAY, POSITION_ORDER,
@@ -554,14 +674,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57, :58, :59, :60, :61, :62, :63, :64, :65, :66, :67, :68, :69, :70, :71, :72, :73, :74, :75, :76, :77, :78, :79, :80, :81, :82, :83, :84, :85, :86, :87, :88, :89, :90, :91, :92, :93, :94, :95, :96, TO_TIMESTAMP(:97, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:98, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLES...")
-            self.merge_single_table('STYLES')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style data: {e}")
@@ -572,11 +686,14 @@ class OracleConnector:
         Insert style boat data into STG_STELLAR_STYLE_BOATS table.
         
         Args:
-            data_rows: List of tuples containing style boat data (39 columns)
+            data_rows: Iterable of tuples containing style boat data (39 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style boat data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLE_BOATS (ID, STYLE_ID, BOAT_NUMBER, PAPER_LESS_NUMBER, MOTOR, MANUFACTURER,
@@ -594,14 +711,8 @@ class OracleConnector:
                     TO_TIMESTAMP(:38, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:39, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style boat records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_BOATS...")
-            self.merge_single_table('STYLE_BOATS')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style boat')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style boat data: {e}")
@@ -613,11 +724,14 @@ class OracleConnector:
         Customer-owned boats - 9 columns.
         
         Args:
-            data_rows: List of tuples containing customer boat data (9 columns)
+            data_rows: Iterable of tuples containing customer boat data (9 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No customer boat data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_CUSTOMER_BOATS (ID, CUSTOMER_ID, SLIP_ID, BOAT_NAME, BOAT_NUMBER,
@@ -625,9 +739,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} customer boat records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'customer boat')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging customer boat data: {e}")
@@ -639,11 +752,14 @@ class OracleConnector:
         All 20 columns.
         
         Args:
-            data_rows: List of tuples containing season data
+            data_rows: Iterable of tuples containing season data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No season data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_SEASONS (ID, LOCATION_ID, SEASON_NAME, SEASON_START, SEASON_END,
@@ -655,9 +771,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, TO_DATE(:4, 'YYYY-MM-DD'), TO_DATE(:5, 'YYYY-MM-DD'), :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, TO_TIMESTAMP(:19, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:20, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} season records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'season')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging season data: {e}")
@@ -669,20 +784,22 @@ class OracleConnector:
         Season date ranges - 4 columns.
         
         Args:
-            data_rows: List of tuples containing season date data (4 columns)
+            data_rows: Iterable of tuples containing season date data (4 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No season date data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_SEASON_DATES (ID, SEASON_ID, START_DATE, END_DATE)
             VALUES (:1, :2, TO_DATE(:3, 'YYYY-MM-DD'), TO_DATE(:4, 'YYYY-MM-DD'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} season date records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'season date')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging season date data: {e}")
@@ -694,11 +811,14 @@ class OracleConnector:
         Hourly pricing by style and season - 22 columns.
         
         Args:
-            data_rows: List of tuples containing style hourly price data (22 columns)
+            data_rows: Iterable of tuples containing style hourly price data (22 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style hourly price data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLE_HOURLY_PRICES (ID, STYLE_ID, SEASON_ID, HOURLY_TYPE, DEFAULT_PRICE,
@@ -709,14 +829,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, TO_TIMESTAMP(:21, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:22, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style hourly price records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_HOURLY_PRICES...")
-            self.merge_single_table('STYLE_HOURLY_PRICES')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style hourly price')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style hourly price data: {e}")
@@ -728,11 +842,14 @@ class OracleConnector:
         Time slot availability by style - 26 columns.
         
         Args:
-            data_rows: List of tuples containing style time data (26 columns)
+            data_rows: Iterable of tuples containing style time data (26 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style time data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLE_TIMES (ID, STYLE_ID, SEASON_ID, DESCRIPTION_TEXT, FRONTEND_DISPLAY,
@@ -743,14 +860,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, TO_TIMESTAMP(:25, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:26, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style time records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_TIMES...")
-            self.merge_single_table('STYLE_TIMES')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style time')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style time data: {e}")
@@ -762,11 +873,14 @@ class OracleConnector:
         Uses TIME_ID as primary key (not ID). 12 columns total.
         
         Args:
-            data_rows: List of tuples containing style price data
+            data_rows: Iterable of tuples containing style price data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No style price data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_STYLE_PRICES (TIME_ID, DEFAULT_PRICE, HOLIDAY, SATURDAY, SUNDAY, MONDAY,
@@ -774,14 +888,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:12, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style price records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_PRICES...")
-            self.merge_single_table('STYLE_PRICES')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'style price')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging style price data: {e}")
@@ -793,11 +901,14 @@ class OracleConnector:
         All 19 columns.
         
         Args:
-            data_rows: List of tuples containing accessory data
+            data_rows: Iterable of tuples containing accessory data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No accessory data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_ACCESSORIES (ID, LOCATION_ID, ACCESSORY_NAME, POSITION_ORDER, FRONTEND_POSITION,
@@ -808,9 +919,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, TO_TIMESTAMP(:18, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:19, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'accessory')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging accessory data: {e}")
@@ -822,11 +932,14 @@ class OracleConnector:
         CSV 'value' → DB 'VALUE_TEXT', CSV 'use_striped_background' → DB 'USE_STRIPED_BACKGROUND'
         
         Args:
-            data_rows: List of tuples containing accessory option data (6 fields)
+            data_rows: Iterable of tuples containing accessory option data (6 fields)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No accessory option data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_ACCESSORY_OPTIONS (ID, ACCESSORY_ID, VALUE_TEXT, USE_STRIPED_BACKGROUND,
@@ -834,9 +947,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, TO_TIMESTAMP(:5, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:6, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory option records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'accessory option')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging accessory option data: {e}")
@@ -848,11 +960,14 @@ class OracleConnector:
         8 columns: ID, ACCESSORY_ID, MIN_HOURS, MAX_HOURS, PRICE, ACCESSORY_OPTION_ID, CREATED_AT, UPDATED_AT
         
         Args:
-            data_rows: List of tuples containing accessory tier data (8 fields)
+            data_rows: Iterable of tuples containing accessory tier data (8 fields)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No accessory tier data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_ACCESSORY_TIERS (ID, ACCESSORY_ID, MIN_HOURS, MAX_HOURS, PRICE, ACCESSORY_OPTION_ID,
@@ -860,9 +975,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:8, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory tier records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'accessory tier')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging accessory tier data: {e}")
@@ -874,11 +988,14 @@ class OracleConnector:
         Uses composite key (BOOKING_ID + ACCESSORY_ID) - no ID column.
         
         Args:
-            data_rows: List of tuples containing booking accessory data (8 columns)
+            data_rows: Iterable of tuples containing booking accessory data (8 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No booking accessory data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_BOOKING_ACCESSORIES (BOOKING_ID, ACCESSORY_ID, QTY, PRICE, PRICE_OVERRIDE,
@@ -886,9 +1003,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking accessory records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'booking accessory')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging booking accessory data: {e}")
@@ -900,11 +1016,14 @@ class OracleConnector:
         Complete 28-column membership tier structure.
         
         Args:
-            data_rows: List of tuples containing club tier data (28 columns)
+            data_rows: Iterable of tuples containing club tier data (28 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No club tier data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_CLUB_TIERS (ID, LOCATION_ID, TIER_NAME, FRONTEND_DISPLAY, FRONTEND_NAME,
@@ -918,9 +1037,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, TO_TIMESTAMP(:27, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:28, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} club tier records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'club tier')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging club tier data: {e}")
@@ -932,11 +1050,14 @@ class OracleConnector:
         Discount coupon management - 30 columns.
         
         Args:
-            data_rows: List of tuples containing coupon data (30 columns)
+            data_rows: Iterable of tuples containing coupon data (30 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No coupon data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_COUPONS (ID, LOCATION_ID, CODE, COUPON_NAME, COUPON_TYPE, COUPON_AMOUNT,
@@ -950,9 +1071,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_DATE(:10, 'YYYY-MM-DD'), TO_DATE(:11, 'YYYY-MM-DD'), TO_DATE(:12, 'YYYY-MM-DD'), TO_DATE(:13, 'YYYY-MM-DD'), :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, TO_TIMESTAMP(:29, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:30, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} coupon records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'coupon')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging coupon data: {e}")
@@ -964,11 +1084,14 @@ class OracleConnector:
         Point of sale inventory items - 9 columns.
         
         Args:
-            data_rows: List of tuples containing POS item data (9 columns)
+            data_rows: Iterable of tuples containing POS item data (9 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No POS item data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_POS_ITEMS (ID, LOCATION_ID, SKU, ITEM_NAME, COST, PRICE,
@@ -976,14 +1099,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} POS item records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for POS_ITEMS...")
-            self.merge_single_table('POS_ITEMS')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'POS item')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging POS item data: {e}")
@@ -995,11 +1112,14 @@ class OracleConnector:
         Point of sale transactions - 11 columns.
         
         Args:
-            data_rows: List of tuples containing POS sale data (11 columns)
+            data_rows: Iterable of tuples containing POS sale data (11 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No POS sale data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_POS_SALES (ID, LOCATION_ID, ADMIN_ID, CUSTOMER_NAME, SUB_TOTAL, TAX_1,
@@ -1007,14 +1127,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} POS sale records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for POS_SALES...")
-            self.merge_single_table('POS_SALES')
-            
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'POS sale')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging POS sale data: {e}")
@@ -1026,11 +1140,14 @@ class OracleConnector:
         Fuel sales transactions - 14 columns.
         
         Args:
-            data_rows: List of tuples containing fuel sale data (14 columns)
+            data_rows: Iterable of tuples containing fuel sale data (14 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No fuel sale data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_FUEL_SALES (ID, LOCATION_ID, ADMIN_ID, CUSTOMER_NAME, FUEL_TYPE, QTY,
@@ -1039,9 +1156,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, TO_TIMESTAMP(:12, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:13, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:14, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} fuel sale records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'fuel sale')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging fuel sale data: {e}")
@@ -1053,11 +1169,14 @@ class OracleConnector:
         Customer waitlists for boat reservations - 18 columns.
         
         Args:
-            data_rows: List of tuples containing waitlist data (18 columns)
+            data_rows: Iterable of tuples containing waitlist data (18 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No waitlist data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_WAITLISTS (ID, LOCATION_ID, CATEGORY_ID, STYLE_ID, CUSTOMER_ID, TIME_ID,
@@ -1067,9 +1186,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, TO_DATE(:12, 'YYYY-MM-DD'), :13, :14, :15, TO_DATE(:16, 'YYYY-MM-DD'), TO_TIMESTAMP(:17, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:18, 'YYYY-MM-DD HH24:MI:SS'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} waitlist records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'waitlist')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging waitlist data: {e}")
@@ -1081,11 +1199,14 @@ class OracleConnector:
         Business closure dates - 9 columns.
         
         Args:
-            data_rows: List of tuples containing closed date data (9 columns)
+            data_rows: Iterable of tuples containing closed date data (9 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No closed date data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_CLOSED_DATES (ID, LOCATION_ID, CLOSED_DATE, ALLOW_BACKEND_DEPARTURES,
@@ -1094,9 +1215,8 @@ class OracleConnector:
             VALUES (:1, :2, TO_DATE(:3, \'YYYY-MM-DD\'), :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} closed date records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'closed date')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging closed date data: {e}")
@@ -1108,20 +1228,22 @@ class OracleConnector:
         Table has NO ID column - uses composite key (LOCATION_ID + HOLIDAY_DATE)
         
         Args:
-            data_rows: List of tuples containing holiday data (2 fields: location_id, holiday_date)
+            data_rows: Iterable of tuples containing holiday data (2 fields: location_id, holiday_date)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No holiday data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_HOLIDAYS (LOCATION_ID, HOLIDAY_DATE)
             VALUES (:1, TO_DATE(:2, 'YYYY-MM-DD'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} holiday records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'holiday')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging holiday data: {e}")
@@ -1133,11 +1255,14 @@ class OracleConnector:
         Customer restriction list - 11 columns (note: missing UPDATED_AT in schema, has 10 total).
         
         Args:
-            data_rows: List of tuples containing blacklist data (10 columns)
+            data_rows: Iterable of tuples containing blacklist data (10 columns)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No blacklist data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_BLACKLISTS (ID, LOCATION_ID, FIRST_NAME, LAST_NAME, PHONE, CELL,
@@ -1145,9 +1270,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} blacklist records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'blacklist')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging blacklist data: {e}")
@@ -1162,11 +1286,14 @@ class OracleConnector:
         All 15 columns, CSV 'description' → DB 'DESCRIPTION_TEXT'
         
         Args:
-            data_rows: List of tuples containing category data (15 fields)
+            data_rows: Iterable of tuples containing category data (15 fields)
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No category data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_CATEGORIES (ID, LOCATION_ID, CATEGORY_NAME, 
@@ -1177,9 +1304,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, TO_TIMESTAMP(:14, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:15, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} category records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'category')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging category data: {e}")
@@ -1191,11 +1317,14 @@ class OracleConnector:
         All 16 columns.
         
         Args:
-            data_rows: List of tuples containing amenity data
+            data_rows: Iterable of tuples containing amenity data
+        
+        Returns:
+            int: Number of rows inserted (rejected rows excluded)
         """
         if not data_rows:
             logger.info("No amenity data to process")
-            return
+            return 0
         
         insert_sql = """
         INSERT INTO STG_STELLAR_AMENITIES (ID, LOCATION_ID, AMENITY_NAME, FRONTEND_DISPLAY, FRONTEND_NAME,
@@ -1205,9 +1334,8 @@ class OracleConnector:
             VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, TO_TIMESTAMP(:15, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:16, \'YYYY-MM-DD HH24:MI:SS\'))"""
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} amenity records")
+            row_count, rejected = self._insert_rows(insert_sql, data_rows)
+            return self._log_inserted(row_count - rejected, rejected, 'amenity')
         except Exception as e:
             self.connection.rollback()
             logger.exception(f"❌ Error merging amenity data: {e}")
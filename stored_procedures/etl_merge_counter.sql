@@ -0,0 +1,23 @@
+
+  CREATE OR REPLACE EDITIONABLE PACKAGE "API_USER"."ETL_MERGE_COUNTER" 
+IS
+    -- Counts the rows a MERGE inserts while the MERGE runs, so the merge
+    -- procedures report their inserts without scanning the DW table again
+    -- by insert timestamp (whose clock and time zone differed from one
+    -- procedure to another).
+    --
+    -- Usage in an SP_MERGE_* procedure:
+    --   ETL_MERGE_COUNTER.RESET before the MERGE,
+    --   ETL_MERGE_COUNTER.INSERTED(<DW_LAST_INSERTED value>) in its
+    --   WHEN NOT MATCHED values, and ETL_MERGE_COUNTER.INSERTED_COUNT after
+    --   it; the remaining SQL%ROWCOUNT rows were updated.
+    --
+    -- The counter is package state, so it is private to the session.
+    PROCEDURE RESET;
+    
+    -- Counts one inserted row and returns p_value unchanged
+    FUNCTION INSERTED(p_value IN TIMESTAMP WITH TIME ZONE) RETURN TIMESTAMP WITH TIME ZONE;
+    
+    FUNCTION INSERTED_COUNT RETURN NUMBER;
+END ETL_MERGE_COUNTER;
+/
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+  CREATE OR REPLACE EDITIONABLE PACKAGE BODY "API_USER"."ETL_MERGE_COUNTER" 
+IS
+    g_inserted NUMBER := 0;
+    
+    PROCEDURE RESET
+    IS
+    BEGIN
+        g_inserted := 0;
+    END RESET;
+    
+    FUNCTION INSERTED(p_value IN TIMESTAMP WITH TIME ZONE) RETURN TIMESTAMP WITH TIME ZONE
+    IS
+    BEGIN
+        g_inserted := g_inserted + 1;
+        RETURN p_value;
+    END INSERTED;
+    
+    FUNCTION INSERTED_COUNT RETURN NUMBER
+    IS
+    BEGIN
+        RETURN g_inserted;
+    END INSERTED_COUNT;
+END ETL_MERGE_COUNTER;
+/
\ No newline at end of file
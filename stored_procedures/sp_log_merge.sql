@@ -0,0 +1,46 @@
+
+  CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_LOG_MERGE" (
+    p_procedure IN VARCHAR2,
+    p_target_table IN VARCHAR2,
+    p_source_table IN VARCHAR2,
+    p_started IN TIMESTAMP WITH TIME ZONE,
+    p_inserted IN NUMBER,
+    p_updated IN NUMBER
+)
+IS
+    v_elapsed INTERVAL DAY(3) TO SECOND(6) := SYSTIMESTAMP - p_started;
+    v_seconds NUMBER;
+    v_staged NUMBER := 0;
+    v_unchanged NUMBER := 0;
+BEGIN
+    -- Records the statistics of one merge in ETL_MERGE_LOG. Called by every
+    -- SP_MERGE_* procedure just before its COMMIT, so the log row commits
+    -- with the merge it describes. Dynamic SQL keeps this procedure (and the
+    -- merge procedures calling it) valid while the control table does not
+    -- exist, and a failure to log never fails the merge.
+    v_seconds := EXTRACT(DAY FROM v_elapsed) * 86400
+               + EXTRACT(HOUR FROM v_elapsed) * 3600
+               + EXTRACT(MINUTE FROM v_elapsed) * 60
+               + EXTRACT(SECOND FROM v_elapsed);
+    
+    -- Staged rows the merge neither inserted nor updated were left unchanged
+    EXECUTE IMMEDIATE 'SELECT COUNT(*) FROM ' || DBMS_ASSERT.SIMPLE_SQL_NAME(p_source_table)
+    INTO v_staged;
+    v_unchanged := GREATEST(v_staged - NVL(p_inserted, 0) - NVL(p_updated, 0), 0);
+    
+    EXECUTE IMMEDIATE
+        'INSERT INTO ETL_MERGE_LOG (
+            PROCEDURE_NAME, TARGET_TABLE, SOURCE_TABLE, SESSION_ID,
+            ROWS_STAGED, ROWS_INSERTED, ROWS_UPDATED, ROWS_UNCHANGED,
+            ELAPSED_SECONDS, STARTED_AT
+        )
+        VALUES (:1, :2, :3, SYS_CONTEXT(''USERENV'', ''SID''), :4, :5, :6, :7, :8, :9)'
+    USING p_procedure, p_target_table, p_source_table,
+          v_staged, p_inserted, p_updated, v_unchanged,
+          v_seconds, p_started;
+    
+EXCEPTION
+    WHEN OTHERS THEN
+        DBMS_OUTPUT.PUT_LINE('SP_LOG_MERGE: ' || p_procedure || ' not logged: ' || SQLERRM);
+END SP_LOG_MERGE;
+/
\ No newline at end of file
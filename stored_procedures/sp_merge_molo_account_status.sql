@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_ACCOUNT_STATUS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_ACCOUNT_STATUS tgt
     USING STG_MOLO_ACCOUNT_STATUS src
     ON (tgt.ID = src.ID)
@@ -20,11 +24,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_ACCOUNT_STATUS', 'DW_MOLO_ACCOUNT_STATUS', 'STG_MOLO_ACCOUNT_STATUS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_ACCOUNT_STATUS: Merged ' || v_merged || ' records');
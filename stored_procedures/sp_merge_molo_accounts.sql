@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_ACCOUNTS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_ACCOUNTS tgt
     USING STG_MOLO_ACCOUNTS src
     ON (tgt.ID = src.ID)
@@ -26,18 +29,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.ACCOUNT_STATUS_ID, src.MARINA_LOCATION_ID, src.CONTACT_ID,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_ACCOUNTS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_ACCOUNTS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_ACCOUNTS', 'DW_MOLO_ACCOUNTS', 'STG_MOLO_ACCOUNTS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
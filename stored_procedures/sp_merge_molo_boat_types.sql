@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_BOAT_TYPES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_BOAT_TYPES tgt
     USING STG_MOLO_BOAT_TYPES src
     ON (tgt.ID = src.ID)
@@ -18,11 +22,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_BOAT_TYPES', 'DW_MOLO_BOAT_TYPES', 'STG_MOLO_BOAT_TYPES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_BOAT_TYPES: Merged ' || v_merged || ' records');
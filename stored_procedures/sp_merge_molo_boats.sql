@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_BOATS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_BOATS tgt
     USING STG_MOLO_BOATS src
     ON (tgt.ID = src.ID)
@@ -96,20 +99,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.PHOTO, src.MAKE, src.MODEL, src.NAME, src.LOA, src.BEAM, src.DRAFT, src.AIR_DRAFT, src.REGISTRATION_NUMBER, src.REGISTRATION_STATE, src.CREATION_TIME, src.BOAT_TYPE_ID, src.MARINA_LOCATION_ID, src.POWER_NEED_ID, src.NOTES, src.RECORD_STATUS_ID, src.ASPNET_USER_ID, src.MAST_LENGTH, src.WEIGHT, src.COLOR, src.HULL_ID, src.KEY_LOCATION_CODE, src.YEAR, src.HASH_ID, src.MOLO_API_PARTNER_ID, src.POWER_NEED1_ID, src.LAST_EDITED_DATE_TIME, src.LAST_EDITED_USER_ID, src.LAST_EDITED_MOLO_API_PARTNER_ID, src.FILESTACK_ID, src.TONNAGE, src.GALLON_CAPACITY, src.IS_ACTIVE, src.BOOKING_MERGING_DONE, src.DECAL_NUMBER, src.MANUFACTURER, src.SERIAL_NUMBER, src.REGISTRATION_EXPIRATION,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_BOATS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_BOATS
-    WHERE DW_LAST_UPDATED = v_timestamp
-      AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_BOATS', 'DW_MOLO_BOATS', 'STG_MOLO_BOATS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
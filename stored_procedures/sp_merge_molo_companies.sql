@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_COMPANIES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_COMPANIES tgt
     USING STG_MOLO_COMPANIES src
     ON (tgt.ID = src.ID)
@@ -34,11 +38,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME, src.OWNER, src.PRIMARY_FAX_NUMBER, src.PRIMARY_PHONE_NUMBER, src.CITY_ID, src.IMAGE, src.DESCRIPTION, src.PARTNER_ID, src.MOLO_API_PARTNER_ID, src.COMPANY_MOLO_API_PARTNER_COMPANY_ID, src.INVOICE_AT_COMPANY_LEVEL, src.MOLO_CONTACT_ID, src.STRIPE_CUSTOMER_ID, src.LOGIN_PROVIDER_ID, src.DEFAULT_CC_FEE, src.TIER1_PERCENT_ACH_FEE, src.TIER2_PERCENT_ACH_FEE,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_COMPANIES', 'DW_MOLO_COMPANIES', 'STG_MOLO_COMPANIES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_COMPANIES: Merged ' || v_merged || ' records');
@@ -1,6 +1,7 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_CONTACTS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
@@ -8,6 +9,8 @@ BEGIN
     -- Store current timestamp for tracking
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_CONTACTS tgt
     USING STG_MOLO_CONTACTS src
     ON (tgt.ID = src.ID)
@@ -109,22 +112,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.EMAILS, src.FIRST_NAME, src.MIDDLE_NAME, src.LAST_NAME, src.MARINA_LOCATION_ID, src.NOTES, src.RECORD_STATUS_ID, src.IS_SUPPLIER, src.IS_CUSTOMER, src.XERO_ID, src.COMPANY_CONTACT_NAME, src.CREATION_USER, src.CREATION_DATE_TIME, src.CIM_ID, src.MARINA_LOCATION1_ID, src.QB_CUSTOMER_ID, src.STATEMENTS_PREFERENCE_ID, src.HASH_ID, src.MOLO_API_PARTNER_ID, src.TAX_EXEMPT_STATUS, src.AUTOMATIC_DISCOUNT_PERCENT, src.COST_PLUS_DISCOUNT, src.LINKED_PARENT_CONTACT, src.CONTACT_AUTO_CHARGE_ID, src.LAST_EDITED_DATE_TIME, src.LAST_EDITED_USER_ID, src.LAST_EDITED_MOLO_API_PARTNER_ID, src.STRIPE_CUSTOMER_ID, src.ACCOUNT_LIMIT, src.FILESTACK_ID, src.SHOW_COMPANY_NAME_PRINTED, src.BOOKING_MERGING_DONE, src.DATE_OF_BIRTH, src.IDS_CUSTOMER_ID, src.DO_NOT_LAUNCH, src.DO_NOT_LAUNCH_REASON, src.DRIVER_LICENSE_ID, src.QUICKBOOKS_ID, src.QUICKBOOKS_NAME, src.QBO_VENDOR_ID, src.SKIP_FOR_FINANCE_CHARGES, src.MAIN_CONTACT_ID,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count records that were updated (DW_LAST_UPDATED = current timestamp and > DW_LAST_INSERTED)
-    SELECT COUNT(*)
-    INTO v_updated
-    FROM DW_MOLO_CONTACTS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count records that were inserted (DW_LAST_INSERTED = current timestamp)
-    SELECT COUNT(*)
-    INTO v_inserted
-    FROM DW_MOLO_CONTACTS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_CONTACTS', 'DW_MOLO_CONTACTS', 'STG_MOLO_CONTACTS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
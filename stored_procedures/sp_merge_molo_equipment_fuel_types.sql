@@ -1,7 +1,11 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_EQUIPMENT_FUEL_TYPES" AS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merge_count NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_EQUIPMENT_FUEL_TYPES tgt
     USING STG_MOLO_EQUIPMENT_FUEL_TYPES src
     ON (tgt.ID = src.ID)
@@ -21,11 +25,17 @@ BEGIN
         VALUES (
             src.ID,
             src.NAME,
-            CURRENT_TIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(CURRENT_TIMESTAMP),
             CURRENT_TIMESTAMP
         );
     
     v_merge_count := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_EQUIPMENT_FUEL_TYPES', 'DW_MOLO_EQUIPMENT_FUEL_TYPES', 'STG_MOLO_EQUIPMENT_FUEL_TYPES', v_started, v_inserted, v_merge_count - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_EQUIPMENT_FUEL_TYPES: Merged ' || v_merge_count || ' records');
@@ -1,6 +1,7 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_INVOICE_ITEMS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
@@ -8,6 +9,8 @@ BEGIN
     -- Store current timestamp for tracking
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_INVOICE_ITEMS tgt
     USING STG_MOLO_INVOICE_ITEMS src
     ON (tgt.ID = src.ID)
@@ -215,20 +218,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.PREFIX, src.QUANTITY, src.TITLE, src.TYPE_FIELD, src.VALUE_FIELD, src.DISCOUNT, src.DISCOUNT_TYPE, src.TAXABLE, src.TAX, src.MISC, src.DISCOUNT_TOTAL, src.PRICE_SUFFIX, src.SUB_TOTAL, src.SUBTOTAL_WO_DISCOUNT, src.TAX_TOTAL, src.TOTAL, src.INVOICE_ID, src.CHARGE_GROUP, src.PAYMENT_ACCOUNT, src.PRICE_STR, src.IS_VOID, src.DATE_FIELD, src.TEXT_AUX, src.TEXT_AUX2, src.DISCOUNT_DATE_TIME, src.DISCOUNT_USER_ID, src.NOTES, src.PR_TYPE, src.STATUS_FIELD, src.DELETION_USER_ID, src.DELETION_DATE_TIME, src.OVERPAYMENT_ID, src.VOID_USER, src.VOID_DATE_TIME, src.MISC2, src.PREPAYMENT_ID, src.CREDIT_INVOICE_ID, src.ALLOCATION_TYPE, src.RESERVATION_ID, src.ITEM_MASTER_ID, src.ASPNET_USER_ID, src.INVOICE_ITEM_TYPE_ID, src.SEASONAL_PRICE_ID, src.TRANSIENT_PRICE_ID, src.SV_JOB_ID, src.ORIGINAL_CREDIT_ITEM, src.TAX_EXEMPT, src.LAST_MODIFIED_DATE_TIME, src.LAST_MODIFIED_ASPNET_USER, src.DELETION_REASON, src.VOID_REASON, src.START_DATE_TIME, src.END_DATE_TIME, src.CREATION_PARTNER_ID, src.DELETE_PARTNER_ID, src.VOID_PARTNER_ID, src.ORIGINAL_PRICE, src.OVERRIDE_XERO_TAX_RATE, src.OVERRIDE_XERO_SALES_ACCOUNT, src.ORIGINAL_RESERVATION_PRICE, src.NUMBER_OF_DECIMALS, src.STRIPE_TRANSACTION_DATA_ID, src.VALUE_ALTERNATIVE, src.STRIPE_TERMINAL_ID, src.STRIPE_APPLICATION_NAME, src.STRIPE_AID, src.ENTERED_AMOUNT, src.EXCHANGE_RATE, src.CURRENCIES_ID, src.SV_CHARGE_INSTANCE_ID, src.SV_LABOR_INSTANCE_ID, src.SV_PART_INSTANCE_ID, src.REVENUE_GL_CODE, src.AR_GL_CODE, src.PAYMENT_GL_CODE, src.COGS_GL_CODE, src.INVENTORY_GL_CODE, src.SALES_TAX_GL_CODE, src.PREPAYMENT_GL_CODE, src.ACCOUNT_TYPE, src.APPLICATION_CRYPTOGRAM, src.AUTHORIZATION_CODE, src.AUTHORIZATION_RESPONSE_CODE, src.CARDHOLDER_VERIFICATION_METHOD, src.TERMINAL_VERIFICATION_RESULTS, src.TRANSACTION_STATUS_INFORMATION, src.TRACKING_CODE, src.DISCOUNT_GL_CODE, src.OVERRIDE_TRACKING_CATEGORY1, src.OVERRIDE_TRACKING_CATEGORY2, src.QUICKBOOKS_PAYMENT_ID, src.ALLOW_TOTAL_PRICE_ENTRY, src.ADDED_AUTOMATICALLY, src.ALLOCATION_PERFORMED_DATE, src.CREATED_DATE,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_INVOICE_ITEMS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_INVOICE_ITEMS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_INVOICE_ITEMS', 'DW_MOLO_INVOICE_ITEMS', 'STG_MOLO_INVOICE_ITEMS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
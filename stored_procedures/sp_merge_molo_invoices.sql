@@ -1,12 +1,15 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_INVOICES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_INVOICES tgt
     USING STG_MOLO_INVOICES src
     ON (tgt.ID = src.ID)
@@ -132,20 +135,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.DATE_FIELD, src.DOLLAR_DISCOUNT, src.PERCENT_DISCOUNT, src.ACTIVE, src.CLOSING_DATE, src.DISCOUNT_TOTAL, src.OPENED, src.PAYED, src.SUBTOTAL, src.SUBTOTAL_WO_DISCOUNT, src.TAX_TOTAL, src.TITLE, src.TOTAL, src.RESERVATION_ID, src.ACCOUNT_ID, src.SERVICE_PAID_AMOUNT, src.MARINA_PAID_AMOUNT, src.GAS_PAID_AMOUNT, src.INVOICE_STATUS_ID, src.START_DATE, src.INSTALLMENTS_PAYMENT_METHOD_ID, src.SCHEDULED_FOR_CRON, src.ORIGINAL_INVOICE, src.PAYMENTS_SENT_TO_XERO, src.WORK_ORDER_ID, src.IS_INSTALLMENT_INVOICE, src.VOID_USER, src.VOID_DATE_TIME, src.CREATION_USER, src.PAYMENT_ID, src.QB_INVOICE_ID, src.INVOICE_TYPE_ID, src.INVOICE_DATE, src.DUE_DATE, src.CURRENCY_CODE, src.LAST_MODIFIED_DATE_TIME, src.LAST_MODIFIED_ASPNET_USER, src.VOID_REASON, src.CREATE_PARTNER_ID, src.VOID_PARTNER_ID, src.UPDATE_HASH, src.SCHEDULED_FOR_INVENTORY_CRON, src.SCHEDULED_FOR_SUBLET_CRON, src.SCHEDULED_FOR_LABOR_CRON, src.CREATED_ON_MOBILE, src.STRIPE_INVOICE_ID, src.SENT_TO_STRIPE, src.RESOURCE_BOOKING_ID, src.MODIFIED_ON_MOBILE, src.NOTE, src.QUICKBOOKS_INVOICE_ID, src.TAX_CAP, src.IS_SURCHARGE, src.HASH_CHECK,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_INVOICES
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_INVOICES
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_INVOICES', 'DW_MOLO_INVOICES', 'STG_MOLO_INVOICES', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_ITEM_MASTERS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_ITEM_MASTERS tgt
     USING STG_MOLO_ITEM_MASTERS src
     ON (tgt.ID = src.ID)
@@ -82,11 +86,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME, src.AMOUNT, src.ITEM_CHARGE_METHOD_ID, src.TAXABLE, src.AVAILABLE_AS_ADD_ON, src.MARINA_LOCATION_ID, src.PRICE, src.TAX, src.SINGLE, src.CHARGE_CATEGORY, src.AMOUNT_IS_DECIMAL, src.NUMBER_OF_DECIMALS, src.ITEM_SHORT_NAME, src.ITEM_CODE, src.TRACKED_INVENTORY, src.QUANTITY_ON_HAND, src.PURCHASE_PRICE, src.FIRST_TRACKING_CATEGORY, src.SECOND_TRACKING_CATEGORY, src.XERO_ID, src.SALE_FREQUENCY, src.LOW_QUANTITY_WARNING, src.MARINA_LOCATION1_ID, src.MARINA_LOCATION2_ID, src.PEDESTAL_ID, src.PEDESTAL1_ID, src.QB_ITEM_ID, src.XERO_ITEM_ID, src.BARCODE, src.DISTRIBUTE_TO_OWNERS, src.FUEL_CLOUD_PRODUCT_ID, src.HASH_ID, src.REQUIRES_AGE_VERIFICATION, src.MINIMUM_AGE, src.CREATION_DATE_TIME, src.CREATION_ASPNET_USER_ID, src.RECORD_STATUS_ID, src.UPDATE_HASH, src.SUBLET_ITEM, src.INTERNAL_REVENUE_XERO_ACCOUNT_ID, src.INTERNAL_COGS_XERO_ACCOUNT_ID, src.WIP_XERO_ACCOUNT_ID, src.INVENTORY_REVALUATION_ID, src.MARINA_LOCATION6_ID, src.FINALE_PRODUCT_URL, src.REVENUE_GL_CODE, src.COGS_GL_CODE, src.INVENTORY_GL_CODE, src.AR_GL_CODE, src.SALES_TAX_GL_CODE, src.ONLY_USE_LAST2_AVERAGE, src.DEFERRED_REVENUE_RECOGNITION, src.DEFERRED_RECOGNITION_GL_CODE, src.TRACKING_CODE, src.ADD_DESCRIPTION_TO_INVOICE_NOTE, src.MARINA_LOCATION7_ID, src.IGNORE_INVENTORY_QOH, src.QOH_COMMITTED, src.QOH_ON_ORDER, src.ALLOW_TOTAL_PRICE_ENTRY, src.MARINA_LOCATION9_ID, src.ALLOW_POSTING_TO_NON_INCOME_ACCOUNTS, src.ORDER_COLUMN, src.ENABLE_NEGATIVE_INVENTORY, src.WIP,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_ITEM_MASTERS', 'DW_MOLO_ITEM_MASTERS', 'STG_MOLO_ITEM_MASTERS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_ITEM_MASTERS: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_MARINA_LOCATIONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_MARINA_LOCATIONS tgt
     USING STG_MOLO_MARINA_LOCATIONS src
     ON (tgt.ID = src.ID)
@@ -44,11 +48,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME, src.PRIMARY_PHONE_NUMBER, src.PRIMARY_FAX_NUMBER, src.RULES, src.ARRIVAL_GUIDE, src.DEPOSIT_PERCENTAGE, src.CITY_ID, src.ORGANIZATION_ID, src.MARINA_HASH, src.UNIT_SYSTEM, src.SAFETY_DISTANCE_W, src.SAFETY_DISTANCE_L, src.DEFAULT_ARRIVAL_TIME, src.DEFAULT_DEPARTURE_TIME, src.POLICY, src.MAP, src.RETURNS_REFUNDS_POLICY, src.DEFAULT_TAX_RATE, src.EMAIL_ADDRESS, src.INVOICE_WARNING_DAY_COUNT, src.MARINA_WEBSITE, src.VESSEL_DIMENSIONS_OPTIONS, src.ALLOW_MOLO_ONLINE_PAYMENT, src.TIME_ZONE, src.CURRENCIES_ID, src.HASH_ID, src.COUNTRY_ID,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_MARINA_LOCATIONS', 'DW_MOLO_MARINA_LOCATIONS', 'STG_MOLO_MARINA_LOCATIONS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_MARINA_LOCATIONS: Merged ' || v_merged || ' records');
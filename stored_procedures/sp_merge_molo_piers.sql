@@ -1,12 +1,15 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_PIERS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_PIERS tgt
     USING STG_MOLO_PIERS src
     ON (tgt.ID = src.ID)
@@ -28,20 +31,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME, src.MARINA_LOCATION_ID,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_PIERS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_PIERS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_PIERS', 'DW_MOLO_PIERS', 'STG_MOLO_PIERS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,12 +1,15 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_RESERVATIONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_RESERVATIONS tgt
     USING STG_MOLO_RESERVATIONS src
     ON (tgt.ID = src.ID)
@@ -144,20 +147,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.MARINA_LOCATION_ID, src.CREATION_TIME, src.RESERVATION_STATUS_ID, src.RESERVATION_TYPE_ID, src.ASPNET_USER_ID, src.CONTACT_ID, src.BOAT_ID, src.SCHEDULED_ARRIVAL_TIME, src.SCHEDULED_DEPARTURE_TIME, src.CANCELLATION_TIME, src.ACCOUNT_ID, src.SLIP_ID, src.SLIP_SLOT_INDEX, src.DISTANCE_FROM_THE_START, src.RATE, src.NAME, src.HAS_INSTALLMENTS, src.INSTALLMENT_FREQUENCY, src.INSTALLMENT_NUMBER, src.INSTALLMENT_PAYMENT_METHOD, src.ONLY_RESERVATION_INSTALLMENTS, src.NOTES, src.ACTUAL_ARRIVAL_DATE_TIME, src.ACTUAL_DEPARTURE_DATE_TIME, src.CONFIRMATION_EMAIL_DATE_TIME, src.TERMS_ACCEPTED_DATE_TIME, src.TERMS_ACCEPTED_LOCATION, src.CUSTOMER_IP_ADDRESS, src.CUSTOMER_DEVICE, src.CONFIRMATION_EMAIL_ASP_USER_ID, src.RATE_PRICE_OVERRIDE, src.HASH_ID, src.RESERVATION_SOURCE, src.RESERVATION_MEDIUM_ID, src.RESERVATION_CAMPAIGN_ID, src.MOLO_API_PARTNER_ID, src.CANCELATION_USER_ID, src.CONTACT_MERGED, src.TRANSIENT_PRICE_ID, src.SEASONAL_PRICE_ID, src.PRINTED_TERMS, src.ONLINE_TERMS, src.CHECK_IN_TERMS, src.CHECK_OUT_TERMS, src.ONLINE_PAYMENT_COMPLETION, src.MOLO_ONLINE_BOOKING, src.BOOKING_CONTACT_MERGED, src.SLIP_BLOCK_SET_ID, src.OFFERS_ID, src.RECURRING_INVOICE_DAY, src.ALTERNATE_RESERVATION_NAME, src.RECURRING_DISCOUNT_PERCENT, src.RECURRING_RATE_OVERRIDE, src.ONLINE_BOOKING_NOTES, src.ORIGINAL_OFFER_HOLD_ID, src.SCHEDULED_FOR_STATUS_CHANGE, src.TERMS_OFFLINE, src.TERMS_USER, src.ORIGINAL_START_DATE, src.ORIGINAL_END_DATE,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_RESERVATIONS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_RESERVATIONS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_RESERVATIONS', 'DW_MOLO_RESERVATIONS', 'STG_MOLO_RESERVATIONS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_SEASONAL_PRICES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_SEASONAL_PRICES tgt
     USING STG_MOLO_SEASONAL_PRICES src
     ON (tgt.ID = src.ID)
@@ -58,11 +62,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.SEASON_NAME, src.START_DATE, src.END_DATE, src.SEASONAL_CHARGE_METHOD_ID, src.PRICE_PER_FOOT, src.FLAT_RATE, src.TAXABLE, src.MARINA_LOCATION_ID, src.ACTIVE, src.TAX, src.RATE_DETAILS, src.RATE_SHORT_NAME, src.ONLINE_PAYMENT_PLACEHOLDER, src.XERO_ITEM_CODE, src.XERO_ID, src.FIRST_TRACKING_CATEGORY, src.SECOND_TRACKING_CATEGORY, src.SEASONAL_INVOICING_METHOD_ID, src.SV_INVENTORY_CATEGORY_ID, src.SV_INVENTORY_SUB_CATEGORY_ID, src.CREATION_DATE_TIME, src.ASPNET_USER_ID, src.CHECK_IN_TERMS, src.CHECK_OUT_TERMS, src.ONLINE_PAYMENT_COMPLETION, src.DUE_DATE_DAYS, src.DUE_DATE_SETTINGS_ID, src.CHARGE_CATEGORY, src.INTRO_TEXT, src.REVENUE_GL_CODE, src.AR_GL_CODE, src.SALES_TAX_GL_CODE, src.DELETION_DATETIME, src.DELETION_ASPNET_USER_ID, src.RECORD_STATUS_ID, src.DEFERRED_REVENUE_RECOGNITION, src.DEFERRED_RECOGNITION_GL_CODE, src.TRACKING_CODE, src.XERO_RECOGNITION_ACCOUNT_ID, src.REVENUE_XERO_ACCOUNT_ID, src.ALLOW_POSTING_TO_NON_INCOME_ACCOUNTS,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_SEASONAL_PRICES', 'DW_MOLO_SEASONAL_PRICES', 'STG_MOLO_SEASONAL_PRICES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_MOLO_SEASONAL_PRICES: Merged ' || v_merged || ' records');
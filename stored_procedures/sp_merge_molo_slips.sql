@@ -1,6 +1,7 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_SLIPS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
@@ -8,6 +9,8 @@ BEGIN
     -- Store current timestamp for tracking
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_SLIPS tgt
     USING STG_MOLO_SLIPS src
     ON (tgt.ID = src.ID)
@@ -99,22 +102,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.NAME, src.TYPE, src.RECOMMENDED_LOA, src.RECOMMENDED_BEAM, src.RECOMMENDED_DRAFT, src.RECOMMENDED_AIR_DRAFT, src.MAXIMUM_LOA, src.MAXIMUM_BEAM, src.MAXIMUM_DRAFT, src.MAXIMUM_AIR_DRAFT, src.MARINA_LOCATION_ID, src.PIER_ID, src.STATUS, src.START_DATE, src.END_DATE, src.DO_NOT_COUNT_IN_OCCUPANCY, src.ACTIVE, src.CREATION_DATE_TIME, src.CREATION_USER, src.SLIP_TYPE_ID, src.PAYMENT_PROCESSING_FEE, src.MANAGEMENT_FEE, src.OWNER_ID, src.PAYMENT_PROCESSING_FEE_TYPE_ID, src.MANAGEMENT_FEE_TYPE_ID, src.OVERRIDE_OCCUPANCY_LOA, src.HASH_ID, src.MAINTENANCE_FEE, src.SVG_ID, src.ASSESSMENT, src.LOAN, src.ORDER_COLUMN, src.SIGN_NAME, src.MAX_WEIGHT, src.MAX_REVENUE, src.TRANSIENT_PRICE_ID, src.SEASONAL_PRICE_ID,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count records that were updated (DW_LAST_UPDATED = current timestamp and > DW_LAST_INSERTED)
-    SELECT COUNT(*)
-    INTO v_updated
-    FROM DW_MOLO_SLIPS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count records that were inserted (DW_LAST_INSERTED = current timestamp)
-    SELECT COUNT(*)
-    INTO v_inserted
-    FROM DW_MOLO_SLIPS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_SLIPS', 'DW_MOLO_SLIPS', 'STG_MOLO_SLIPS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
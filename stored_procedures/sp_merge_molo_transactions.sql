@@ -1,12 +1,15 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_TRANSACTIONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_TRANSACTIONS tgt
     USING STG_MOLO_TRANSACTIONS src
     ON (tgt.ID = src.ID)
@@ -120,20 +123,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.MARINA_LOCATION_ID, src.CREATION_TIME, src.INVOICE_ID, src.TRANSACTION_TYPE_ID, src.TRANSACTION_METHOD_ID, src.VALUE_FIELD, src.IS_REFUNDED, src.CUSTOMER_IP_ADDRESS, src.CUSTOMER_DEVICE, src.REFUND_REASON, src.AUX, src.CHECK_NUMBER, src.CC_TYPE, src.INVOICE_ITEM_ID, src.SENT_TO_XERO, src.OVERPAYMENT_ID, src.PAYMENT_COLLECTED_OFFLINE, src.PART_OF_OVERPAYMENT, src.PREPAYMENT_ID, src.ACCOUNT_TRANSACTION_TRANSACTION_ID, src.PAYMENT_ID, src.CREATION_DATE, src.ASPNET_USER_ID, src.HASH_ID, src.CUSTOM_TRANSACTION_METHODS_ID, src.REFERENCE, src.IS_VOID, src.AMOUNT_REFUNDED, src.STRIPE_TRANSACTION_DATA_ID, src.PAYMENT_INTENT_ID, src.SENT_TO_PAYOUT, src.STRIPE_AUTHORIZATIONS_ID, src.STRIPE_RESPONSE_ID, src.STRIPE_READER_SERIAL_NUMBER, src.STRIPE_TERMINAL_ID, src.CREATED_ON_MOBILE, src.ONLINE_PERCENT_FEE, src.ONLINE_FEE_AMOUNT, src.SCHEDULED_FOR_ONLINE_FEE_CRON, src.ONLINE_PAYMENT_FEE_ID, src.BANK_NAME, src.LAST4, src.STRIPE_BANK_ACCOUNT_ID, src.STRIPE_BATCH_ID, src.ROUTING_NUMBER, src.FULLY_REFUNDED, src.LAST_UPDATED, src.PAYMENT_SOURCE,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_MOLO_TRANSACTIONS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_MOLO_TRANSACTIONS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_TRANSACTIONS', 'DW_MOLO_TRANSACTIONS', 'STG_MOLO_TRANSACTIONS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,9 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_MOLO_TRANSIENT_INVOICING_METHODS" AS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged_count NUMBER := 0;
     v_inserted_count NUMBER := 0;
     v_updated_count NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_MOLO_TRANSIENT_INVOICING_METHODS tgt
     USING STG_MOLO_TRANSIENT_INVOICING_METHODS src
     ON (tgt.ID = src.ID)
@@ -23,19 +26,20 @@ BEGIN
         VALUES (
             src.ID,
             src.NAME,
-            CURRENT_TIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(CURRENT_TIMESTAMP),
             CURRENT_TIMESTAMP
         );
     
     v_merged_count := SQL%ROWCOUNT;
-    COMMIT;
-    
-    SELECT COUNT(*) INTO v_inserted_count
-    FROM DW_MOLO_TRANSIENT_INVOICING_METHODS
-    WHERE DW_LAST_INSERTED = DW_LAST_UPDATED;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted_count := ETL_MERGE_COUNTER.INSERTED_COUNT;
     
     v_updated_count := v_merged_count - v_inserted_count;
     
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_MOLO_TRANSIENT_INVOICING_METHODS', 'DW_MOLO_TRANSIENT_INVOICING_METHODS', 'STG_MOLO_TRANSIENT_INVOICING_METHODS', v_started, v_inserted_count, v_updated_count);
+    COMMIT;
+    
     DBMS_OUTPUT.PUT_LINE('Transient Invoicing Methods merge completed:');
     DBMS_OUTPUT.PUT_LINE('  Total merged: ' || v_merged_count);
     DBMS_OUTPUT.PUT_LINE('  Inserted: ' || v_inserted_count);
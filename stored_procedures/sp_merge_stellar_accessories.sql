@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_ACCESSORIES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_ACCESSORIES tgt
     USING STG_STELLAR_ACCESSORIES src
     ON (tgt.ID = src.ID)
@@ -35,11 +39,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.ACCESSORY_NAME, src.POSITION_ORDER, src.FRONTEND_POSITION, src.SHORT_NAME, src.ABBREVIATION, src.IMAGE_URL, src.PRICE, src.DEPOSIT_AMOUNT, src.TAX_EXEMPT, src.MAX_OVERLAPPING_RENTALS, src.FRONTEND_QTY_LIMIT, src.USE_STRIPED_BACKGROUND, src.BACKEND_AVAILABLE_DAYS, src.FRONTEND_AVAILABLE_DAYS, src.MAX_SAME_DEPARTURES, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_ACCESSORIES', 'DW_STELLAR_ACCESSORIES', 'STG_STELLAR_ACCESSORIES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_ACCESSORIES: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_ACCESSORY_OPTIONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_ACCESSORY_OPTIONS tgt
     USING STG_STELLAR_ACCESSORY_OPTIONS src
     ON (tgt.ID = src.ID)
@@ -22,11 +26,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.ACCESSORY_ID, src.VALUE_TEXT, src.USE_STRIPED_BACKGROUND, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_ACCESSORY_OPTIONS', 'DW_STELLAR_ACCESSORY_OPTIONS', 'STG_STELLAR_ACCESSORY_OPTIONS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_ACCESSORY_OPTIONS: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_AMENITIES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_AMENITIES tgt
     USING STG_STELLAR_AMENITIES src
     ON (tgt.ID = src.ID)
@@ -32,11 +36,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.AMENITY_NAME, src.FRONTEND_DISPLAY, src.FRONTEND_NAME, src.FRONTEND_POSITION, src.FEATURED, src.FILTERABLE, src.ICON, src.AMENITY_TYPE, src.OPTIONS_TEXT, src.PREFIX_TEXT, src.SUFFIX_TEXT, src.DESCRIPTION_TEXT, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_AMENITIES', 'DW_STELLAR_AMENITIES', 'STG_STELLAR_AMENITIES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_AMENITIES: Merged ' || v_merged || ' records');
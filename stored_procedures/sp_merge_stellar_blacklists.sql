@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_BLACKLISTS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_BLACKLISTS tgt
     USING STG_STELLAR_BLACKLISTS src
     ON (tgt.ID = src.ID)
@@ -27,11 +31,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.FIRST_NAME, src.LAST_NAME, src.PHONE, src.CELL, src.EMAIL, src.DL_NUMBER, src.NOTES, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_BLACKLISTS', 'DW_STELLAR_BLACKLISTS', 'STG_STELLAR_BLACKLISTS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_BLACKLISTS: Merged ' || v_merged || ' records');
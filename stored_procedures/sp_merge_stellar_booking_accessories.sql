@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_BOOKING_ACCESSORIES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_BOOKING_ACCESSORIES tgt
     USING STG_STELLAR_BOOKING_ACCESSORIES src
     ON (tgt.BOOKING_ID = src.BOOKING_ID)
@@ -24,11 +28,17 @@ BEGIN
         )
         VALUES (
             src.BOOKING_ID, src.ACCESSORY_ID, src.QTY, src.PRICE, src.PRICE_OVERRIDE, src.ACCESSORY_OPTION_ID, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_BOOKING_ACCESSORIES', 'DW_STELLAR_BOOKING_ACCESSORIES', 'STG_STELLAR_BOOKING_ACCESSORIES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_BOOKING_ACCESSORIES: Merged ' || v_merged || ' records');
@@ -1,12 +1,15 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_BOOKING_BOATS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
     v_timestamp := SYSTIMESTAMP;
     
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_BOOKING_BOATS tgt
     USING STG_STELLAR_BOOKING_BOATS src
     ON (tgt.ID = src.ID)
@@ -129,20 +132,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.BOOKING_ID, src.STYLE_ID, src.BOAT_ID, src.TIME_ID, src.TIMEFRAME_ID, src.MAIN_BOAT, src.NUM_PASSENGERS, src.BOAT_DEPARTURE, src.BOAT_RETURN, src.STATUS_BOOKING, src.PRICE, src.PRICE_OVERRIDE, src.SIGNATURE_DATE, src.CHECK_OUT_DATE, src.CHECK_OUT_EQUIPMENT, src.CHECK_OUT_NOTES, src.CHECK_OUT_ENGINE_HOURS, src.CHECK_IN_DATE, src.CHECK_IN_EQUIPMENT, src.CHECK_IN_NOTES, src.CHECK_IN_ENGINE_HOURS, src.CHECK_IN_HOURS, src.CHECK_IN_DEPOSIT, src.CHECK_IN_WEATHER, src.CHECK_IN_LATE, src.CHECK_IN_MISC_NON_TAX, src.CHECK_IN_MISC_TAX, src.CHECK_IN_CLEANING, src.CHECK_IN_GALLONS, src.CHECK_IN_FUEL, src.CHECK_IN_DIESEL_GALLONS, src.CHECK_IN_DIESEL, src.CHECK_IN_TIP, src.CHECK_IN_TAX_1, src.CHECK_IN_TAX_2, src.CHECK_IN_TOTAL, src.QUEUE_ADMIN_ID, src.QUEUE_DATE, src.ATTENDANT_QUEUE_ADMIN_ID, src.ATTENDANT_WATER_ADMIN_ID, src.BOAT_ASSIGNED, src.ADDITIONAL_DRIVERS, src.ADDITIONAL_DRIVER_NAMES, src.ACCESSORIES_MIGRATED, src.PRICE_RULE_ID, src.PRICE_RULE_ORIGINAL_PRICE, src.PRICE_RULE_DYNAMIC_PRICE, src.PRICE_RULE_DIFFERENCE, src.EMERGENCY_NAME, src.EMERGENCY_PHONE, src.DATE_OF_BIRTH, src.CONTRACT_RETURN_PDF, src.CONTRACT_PDF, src.CREATED_AT, src.UPDATED_AT, src.DELETED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count updated records
-    SELECT COUNT(*) INTO v_updated
-    FROM DW_STELLAR_BOOKING_BOATS
-    WHERE DW_LAST_UPDATED = v_timestamp
-    AND DW_LAST_UPDATED > DW_LAST_INSERTED;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    -- Count inserted records
-    SELECT COUNT(*) INTO v_inserted
-    FROM DW_STELLAR_BOOKING_BOATS
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_BOOKING_BOATS', 'DW_STELLAR_BOOKING_BOATS', 'STG_STELLAR_BOOKING_BOATS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_BOOKING_PAYMENTS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_BOOKING_PAYMENTS tgt
     USING STG_STELLAR_BOOKING_PAYMENTS src
     ON (tgt.ID = src.ID)
@@ -130,19 +133,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.BOOKING_ID, src.CUSTOMER_ID, src.ADMIN_ID, src.FRONTEND, src.PAYMENT_FOR, src.PAYMENT_TYPE, src.CARD_TYPE, src.PAYMENT_TOTAL, src.CASH_TOTAL, src.CREDIT_TOTAL, src.AGENT_AR_TOTAL, src.CREDIT_LAST4, src.CREDIT_EXPIRY, src.BILLING_FIRST_NAME, src.BILLING_LAST_NAME, src.BILLING_STREET1, src.BILLING_STREET2, src.BILLING_CITY, src.BILLING_STATE, src.BILLING_COUNTRY, src.BILLING_ZIP, src.TRANS_ID, src.ORIGINAL_PAYMENT_ID, src.STATUS_PAYMENT, src.NOTES, src.IS_AGENT_AR, src.OFFLINE_TYPE, src.DOCK_MASTER_TICKET, src.MY_TASK_IT_ID, src.REPORT_BOATS, src.REPORT_PROPANE, src.REPORT_ACCESSORIES, src.REPORT_PARKING, src.REPORT_INSURANCE, src.REPORT_FUEL, src.REPORT_DAMAGES, src.REPORT_CLEANING, src.REPORT_LATE, src.REPORT_OTHER, src.REPORT_DISCOUNT, src.INTERNAL_APPLICATION_FEE, src.CC_PROCESSOR_FEE, src.CC_BRAND, src.CC_COUNTRY, src.CC_FUNDING, src.CC_CONNECT_TYPE, src.CC_CONNECT_ID, src.CC_PAYOUT_ID, src.CC_PAYOUT_DATE, src.EXTERNAL_CHARGE_ID, src.IS_SYNCED, src.STRIPE_READER_ID, src.CREATED_AT, src.UPDATED_AT, src.DELETED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count inserts and updates
-    SELECT COUNT(*) INTO v_inserted 
-    FROM DW_STELLAR_BOOKING_PAYMENTS 
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    SELECT COUNT(*) INTO v_updated 
-    FROM DW_STELLAR_BOOKING_PAYMENTS 
-    WHERE DW_LAST_UPDATED = v_timestamp 
-    AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_BOOKING_PAYMENTS', 'DW_STELLAR_BOOKING_PAYMENTS', 'STG_STELLAR_BOOKING_PAYMENTS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_BOOKINGS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_BOOKINGS tgt
     USING STG_STELLAR_BOOKINGS src
     ON (tgt.ID = src.ID)
@@ -181,19 +184,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.CUSTOMER_ID, src.CREATOR_ID, src.ADMIN_ID, src.BILLING_FIRST_NAME, src.BILLING_LAST_NAME, src.BILLING_STREET1, src.BILLING_STREET2, src.BILLING_CITY, src.BILLING_STATE, src.BILLING_COUNTRY, src.BILLING_ZIP, src.CC_SAVED_NAME, src.CC_SAVED_LAST4, src.CC_SAVED_PROFILE_ID, src.CC_SAVED_METHOD_ID, src.CC_SAVED_ADDRESS_ID, src.CC_PREAUTH_ID, src.CC_PREAUTH_AMOUNT, src.CC_CONNECT_TYPE, src.CC_CONNECT_ID, src.ACCESSORIES_CUSTOM_PRICE, src.ACCESSORIES_TOTAL, src.INSURANCE_AMOUNT, src.PETS, src.PARKING, src.PARKING_OVERRIDE, src.BOATS_TOTAL, src.POS_TOTAL, src.USE_CLUB_CREDITS, src.NO_SHOW_FEE, src.CANCELLATION_FEE, src.CLUB_FEES, src.CLUB_FEES_OVERRIDE, src.SUB_TOTAL, src.CONVENIENCE_FEE, src.CONVENIENCE_FEE_WAIVED, src.INTERNAL_APPLICATION_FEE, src.TAX_1, src.TAX_1_EXEMPT, src.TAX_1_RATE_OVERRIDE, src.TAX_2, src.TAX_2_EXEMPT, src.CHECK_IN_TAX_1, src.CHECK_IN_TAX_2, src.CHECK_IN_TOTAL, src.DEPOSIT_TOTAL, src.DEPOSIT_OVERRIDE, src.DEPOSIT_WAIVED, src.GRATUITY, src.GRAND_TOTAL, src.ADJUSTMENT_TOTAL, src.AMOUNT_PAID, src.NOTES, src.NOTES_CONTRACT, src.NOTES_FROM_CUSTOMER, src.NOTES_FROM_CUSTOMER_CONTRACT, src.NOTES_FOR_CUSTOMER, src.NOTES_FOR_CUSTOMER_CONTRACT, src.FRONTEND, src.IS_ON_HOLD, src.IS_LOCKED, src.IS_FINALIZED, src.IS_CANCELED, src.OVERRIDE_TURNAROUND_TIME, src.CANCELLATION_TYPE, src.BYPASS_CLUB_RESTRICTIONS, src.RENTERS_INSURANCE_INTEREST, src.COUPON_ID, src.COUPON_TYPE, src.COUPON_AMOUNT, src.DISCOUNT_TOTAL, src.AGENT_ID, src.AGENT_NAME, src.REFERRER_ID, src.SAFETY_REMINDER, src.DELETED_ADMIN_ID, src.CREATED_AT, src.UPDATED_AT, src.FINALIZED_AT, src.DELETED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count inserts and updates
-    SELECT COUNT(*) INTO v_inserted 
-    FROM DW_STELLAR_BOOKINGS 
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    SELECT COUNT(*) INTO v_updated 
-    FROM DW_STELLAR_BOOKINGS 
-    WHERE DW_LAST_UPDATED = v_timestamp 
-    AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_BOOKINGS', 'DW_STELLAR_BOOKINGS', 'STG_STELLAR_BOOKINGS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_CATEGORIES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_CATEGORIES tgt
     USING STG_STELLAR_CATEGORIES src
     ON (tgt.ID = src.ID)
@@ -31,11 +35,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.CATEGORY_NAME, src.FRONTEND_DISPLAY, src.FRONTEND_NAME, src.FRONTEND_TYPE, src.FRONTEND_POSITION, src.FILTER_UNIT_TYPE_ENABLED, src.FILTER_UNIT_TYPE_NAME, src.FILTER_UNIT_TYPE_POSITION, src.MIN_NIGHTS_MULTI_DAY, src.CALENDAR_BANNER_TEXT, src.DESCRIPTION_TEXT, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_CATEGORIES', 'DW_STELLAR_CATEGORIES', 'STG_STELLAR_CATEGORIES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_CATEGORIES: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_CLUB_TIERS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_CLUB_TIERS tgt
     USING STG_STELLAR_CLUB_TIERS src
     ON (tgt.ID = src.ID)
@@ -44,11 +48,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.TIER_NAME, src.FRONTEND_DISPLAY, src.FRONTEND_NAME, src.FRONTEND_POSITION, src.TERM_LENGTH, src.TERM_LENGTH_TYPE, src.TERM_AUTO_RENEW, src.TERM_FEE, src.PERIOD_LENGTH, src.PERIOD_LENGTH_TYPE, src.CREDITS_PER_PERIOD, src.HOURS_PER_CREDIT, src.PERIOD_FEE, src.FRONTEND_DISPLAY_PRICING, src.NO_SHOW_FEE, src.ALLOW_SELF_CANCELLATIONS, src.CANCELLATION_FEE, src.APPLICATION_FEE, src.BOAT_DAMAGE_RESPONSIBILITY_DEDUCTION, src.MAX_PENDING_WAIT_LIST_ENTRIES, src.FREE_ACCESSORIES, src.DESCRIPTION_TEXT, src.TERMS_TEXT, src.STATUS_TIER, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_CLUB_TIERS', 'DW_STELLAR_CLUB_TIERS', 'STG_STELLAR_CLUB_TIERS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_CLUB_TIERS: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_COUPONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_COUPONS tgt
     USING STG_STELLAR_COUPONS src
     ON (tgt.ID = src.ID)
@@ -46,11 +50,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.CODE, src.COUPON_NAME, src.COUPON_TYPE, src.COUPON_AMOUNT, src.COUNT_ALLOWED, src.COUNT_ALLOWED_DAILY, src.COUNT_USED, src.RENTAL_START, src.RENTAL_END, src.COUPON_START, src.COUPON_END, src.MIN_DEPARTURE_TIME, src.MAX_DEPARTURE_TIME, src.MIN_RETURN_TIME, src.MAX_RETURN_TIME, src.MIN_HOURS, src.MAX_HOURS, src.MIN_HOURS_BEFORE_DEPARTURE, src.MAX_HOURS_BEFORE_DEPARTURE, src.MAX_SAME_DAY_PER_CUSTOMER, src.MAX_ACTIVE_PER_CUSTOMER, src.DISABLE_CONSECUTIVE_PER_CUSTOMER, src.STATUS_COUPON, src.VALID_DAYS, src.HOLIDAYS_ONLY_IF_VALID_DAY, src.VALID_STYLES, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_COUPONS', 'DW_STELLAR_COUPONS', 'STG_STELLAR_COUPONS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_COUPONS: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_CUSTOMER_BOATS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_CUSTOMER_BOATS tgt
     USING STG_STELLAR_CUSTOMER_BOATS src
     ON (tgt.ID = src.ID)
@@ -25,11 +29,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.CUSTOMER_ID, src.SLIP_ID, src.BOAT_NAME, src.BOAT_NUMBER, src.LENGTH_FEET, src.WIDTH_FEET, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_CUSTOMER_BOATS', 'DW_STELLAR_CUSTOMER_BOATS', 'STG_STELLAR_CUSTOMER_BOATS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_CUSTOMER_BOATS: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_FUEL_SALES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_FUEL_SALES tgt
     USING STG_STELLAR_FUEL_SALES src
     ON (tgt.ID = src.ID)
@@ -30,11 +34,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.ADMIN_ID, src.CUSTOMER_NAME, src.FUEL_TYPE, src.QTY, src.PRICE, src.SUB_TOTAL, src.TIP, src.GRAND_TOTAL, src.AMOUNT_PAID, src.CREATED_AT, src.UPDATED_AT, src.DELETED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_FUEL_SALES', 'DW_STELLAR_FUEL_SALES', 'STG_STELLAR_FUEL_SALES', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_FUEL_SALES: Merged ' || v_merged || ' records');
@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_LOCATIONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_LOCATIONS tgt
     USING STG_STELLAR_LOCATIONS src
     ON (tgt.ID = src.ID)
@@ -38,11 +42,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.CODE, src.LOCATION_NAME, src.LOCATION_TYPE, src.MINIMUM_1, src.MINIMUM_2, src.DELIVERY, src.FRONTEND, src.PRICING, src.IS_INTERNAL, src.IS_CANCELED, src.CANCEL_REASON, src.CANCEL_DATE, src.IS_TRANSFERRED, src.TRANSFER_DESTINATION, src.MODULE_TYPE, src.OPERATING_LOCATION, src.ZOHO_ID, src.ZCRM_ID, src.IS_ACTIVE, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_LOCATIONS', 'DW_STELLAR_LOCATIONS', 'STG_STELLAR_LOCATIONS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_LOCATIONS: Merged ' || v_merged || ' records');
@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_POS_ITEMS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_POS_ITEMS tgt
     USING STG_STELLAR_POS_ITEMS src
     ON (tgt.ID = src.ID)
@@ -38,19 +41,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.SKU, src.ITEM_NAME, src.COST, src.PRICE, src.TAX_EXEMPT, src.CREATED_AT, src.UPDATED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count inserts and updates
-    SELECT COUNT(*) INTO v_inserted 
-    FROM DW_STELLAR_POS_ITEMS 
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    SELECT COUNT(*) INTO v_updated 
-    FROM DW_STELLAR_POS_ITEMS 
-    WHERE DW_LAST_UPDATED = v_timestamp 
-    AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_POS_ITEMS', 'DW_STELLAR_POS_ITEMS', 'STG_STELLAR_POS_ITEMS', v_started, v_inserted, v_updated);
     
     COMMIT;
     
@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_POS_SALES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_POS_SALES tgt
     USING STG_STELLAR_POS_SALES src
     ON (tgt.ID = src.ID)
@@ -42,19 +45,16 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.ADMIN_ID, src.CUSTOMER_NAME, src.SUB_TOTAL, src.TAX_1, src.GRAND_TOTAL, src.AMOUNT_PAID, src.CREATED_AT, src.UPDATED_AT, src.DELETED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    -- Count inserts and updates
-    SELECT COUNT(*) INTO v_inserted 
-    FROM DW_STELLAR_POS_SALES 
-    WHERE DW_LAST_INSERTED = v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
     
-    SELECT COUNT(*) INTO v_updated 
-    FROM DW_STELLAR_POS_SALES 
-    WHERE DW_LAST_UPDATED = v_timestamp 
-    AND DW_LAST_INSERTED < v_timestamp;
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_POS_SALES', 'DW_STELLAR_POS_SALES', 'STG_STELLAR_POS_SALES', v_started, v_inserted, v_updated);
     
     COMMIT;
     
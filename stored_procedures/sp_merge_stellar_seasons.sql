@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_SEASONS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_SEASONS tgt
     USING STG_STELLAR_SEASONS src
     ON (tgt.ID = src.ID)
@@ -36,11 +40,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.SEASON_NAME, src.SEASON_START, src.SEASON_END, src.STATUS_SEASON, src.WEEK_DAY_MIN_START_TIME, src.WEEK_DAY_MAX_START_TIME, src.WEEK_DAY_MIN_END_TIME, src.WEEK_DAY_MAX_END_TIME, src.WEEK_END_MIN_START_TIME, src.WEEK_END_MAX_START_TIME, src.WEEK_END_MIN_END_TIME, src.WEEK_END_MAX_END_TIME, src.HOLIDAY_MIN_START_TIME, src.HOLIDAY_MAX_START_TIME, src.HOLIDAY_MIN_END_TIME, src.HOLIDAY_MAX_END_TIME, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_SEASONS', 'DW_STELLAR_SEASONS', 'STG_STELLAR_SEASONS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_SEASONS: Merged ' || v_merged || ' records');
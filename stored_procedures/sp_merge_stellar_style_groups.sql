@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_STYLE_GROUPS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_STYLE_GROUPS tgt
     USING STG_STELLAR_STYLE_GROUPS src
     ON (tgt.ID = src.ID)
@@ -27,11 +31,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.GROUP_NAME, src.FRONTEND_MAX_SAME_DEPARTURES, src.SAFETY_TEST_ENABLED, src.SAFETY_TEST_INSTRUCTIONS, src.SAFETY_TEST_MIN_PERCENT_PASS, src.SAFETY_TEST_EXPIRATION_DAYS, src.SAFETY_VIDEO_LINK, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_STYLE_GROUPS', 'DW_STELLAR_STYLE_GROUPS', 'STG_STELLAR_STYLE_GROUPS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_STYLE_GROUPS: Merged ' || v_merged || ' records');
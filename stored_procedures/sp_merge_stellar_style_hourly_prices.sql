@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_STYLE_HOURLY_PRICES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_STYLE_HOURLY_PRICES tgt
     USING STG_STELLAR_STYLE_HOURLY_PRICES src
     ON (tgt.ID = src.ID)
@@ -64,12 +67,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.STYLE_ID, src.SEASON_ID, src.HOURLY_TYPE, src.DEFAULT_PRICE, src.HOLIDAY, src.SATURDAY, src.SUNDAY, src.MONDAY, src.TUESDAY, src.WEDNESDAY, src.THURSDAY, src.FRIDAY, src.DAY_DISCOUNT, src.UNDER_ONE_HOUR, src.FIRST_HOUR_AM, src.FIRST_HOUR_PM, src.MAX_PRICE, src.MIN_HOURS, src.MAX_HOURS, src.CREATED_AT, src.UPDATED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    SELECT COUNT(*) INTO v_inserted FROM DW_STELLAR_STYLE_HOURLY_PRICES WHERE DW_LAST_INSERTED = v_timestamp;
-    SELECT COUNT(*) INTO v_updated FROM DW_STELLAR_STYLE_HOURLY_PRICES WHERE DW_LAST_UPDATED = v_timestamp AND DW_LAST_INSERTED < v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_STYLE_HOURLY_PRICES', 'DW_STELLAR_STYLE_HOURLY_PRICES', 'STG_STELLAR_STYLE_HOURLY_PRICES', v_started, v_inserted, v_updated);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_STYLE_HOURLY_PRICES: ' || v_inserted || ' inserted, ' || v_updated || ' updated');
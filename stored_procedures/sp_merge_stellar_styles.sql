@@ -1,10 +1,13 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_STYLES" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_inserted NUMBER := 0;
     v_updated NUMBER := 0;
     v_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_STYLES tgt
     USING STG_STELLAR_STYLES src
     ON (tgt.ID = src.ID)
@@ -211,12 +214,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.STYLE_GROUP_ID, src.STYLE_NAME, src.BACKEND_DISPLAY, src.POSITION_ORDER, src.TURN_AROUND_TIME, src.DEPOSIT_AMOUNT, src.MULTI_DAY_DEPOSIT_AMOUNT, src.PRE_AUTH_AMOUNT, src.FUEL_BURN_RATIO, src.TAX_1_RATE, src.TAX_2_RATE, src.INSURANCE_ENABLED, src.INSURANCE_PRICING_TYPE, src.INSURANCE_PRICING_RATE, src.INSURANCE_FIRST_DAY_PRICE, src.GRATUITY_ENABLED, src.GRATUITY_PRICING_RATE, src.PARKING_QTY_MULTIPLIER, src.FRONTEND_DISPLAY, src.FRONTEND_NAME, src.FRONTEND_POSITION, src.FRONTEND_TYPE, src.FRONTEND_QTY_LIMIT, src.FRONTEND_UNIT_SELECTOR, src.FRONTEND_PARTIAL_PAYMENT_TYPE, src.FRONTEND_PARTIAL_PAYMENT_AMOUNT, src.BACKEND_MULTI_DAY_DISABLED, src.MAX_SAME_STYLE_PER_BOOKING, src.FRONTEND_MIN_HOURS_ADVANCE_DEPARTURE, src.BACKEND_HOURLY_ENABLED, src.WEEK_DAY_BACKEND_HOURLY_MIN_HOURS, src.WEEK_DAY_BACKEND_HOURLY_MAX_HOURS, src.WEEK_END_BACKEND_HOURLY_MIN_HOURS, src.WEEK_END_BACKEND_HOURLY_MAX_HOURS, src.HOLIDAY_BACKEND_HOURLY_MIN_HOURS, src.HOLIDAY_BACKEND_HOURLY_MAX_HOURS, src.FRONTEND_HOURLY_ENABLED, src.WEEK_DAY_FRONTEND_HOURLY_MIN_HOURS, src.WEEK_DAY_FRONTEND_HOURLY_MAX_HOURS, src.WEEK_DAY_FRONTEND_HOURLY_TIME_INCREMENT, src.WEEK_DAY_FRONTEND_HOURLY_LENGTH_INCREMENT, src.WEEK_END_FRONTEND_HOURLY_MIN_HOURS, src.WEEK_END_FRONTEND_HOURLY_MAX_HOURS, src.WEEK_END_FRONTEND_HOURLY_TIME_INCREMENT, src.WEEK_END_FRONTEND_HOURLY_LENGTH_INCREMENT, src.HOLIDAY_FRONTEND_HOURLY_MIN_HOURS, src.HOLIDAY_FRONTEND_HOURLY_MAX_HOURS, src.HOLIDAY_FRONTEND_HOURLY_TIME_INCREMENT, src.HOLIDAY_FRONTEND_HOURLY_LENGTH_INCREMENT, src.BACKEND_NIGHTLY_ENABLED, src.BACKEND_NIGHTLY_MIN_NIGHTS, src.BACKEND_NIGHTLY_MAX_NIGHTS, src.BACKEND_NIGHTLY_START, src.BACKEND_NIGHTLY_END, src.BACKEND_NIGHTLY_DISCOUNT_DAYS, src.BACKEND_NIGHTLY_DISCOUNT_TYPE, src.BACKEND_NIGHTLY_DISCOUNT_AMOUNT, src.FRONTEND_NIGHTLY_ENABLED, src.FRONTEND_NIGHTLY_MIN_NIGHTS, src.FRONTEND_NIGHTLY_MIN_NIGHTS_PEAK, src.FRONTEND_NIGHTLY_MAX_NIGHTS, src.FRONTEND_NIGHTLY_START, src.FRONTEND_NIGHTLY_END, src.FRONTEND_NIGHTLY_ADDL_TIMES, src.FRONTEND_NIGHTLY_DISCOUNT_DAYS, src.FRONTEND_NIGHTLY_DISCOUNT_TYPE, src.FRONTEND_NIGHTLY_DISCOUNT_AMOUNT, src.IMAGE_URL, src.PASSENGERS, src.WEIGHT_CAPACITY, src.HORSEPOWER, src.ENGINE_TYPE, src.LENGTH_FEET, src.WIDTH_FEET, src.DRAFT_FEET, src.FUEL_CAPACITY, src.BRAND, src.MODEL, src.TITLE, src.DESCRIPTION_TEXT, src.SUMMARY_TEXT, src.NOTES, src.VIDEO_LINK, src.SMARTWAIVER_WAIVER_LINK, src.ACCOUNTING_ITEM_ID, src.LOCAL_VIDEO_LINK, src.DOCKMASTER_PART_NUMBER, src.DOCKMASTER_TAX_CODE, src.END_HOURS, src.SEASONAL_BUFFER_DEFAULT_LOWER, src.SEASONAL_BUFFER_DEFAULT_UPPER, src.SEASONAL_BUFFER_PEAK_LOWER, src.SEASONAL_BUFFER_PEAK_UPPER, src.BILLABLE_UNIT_TYPE, src.CREATED_AT, src.UPDATED_AT,
-            v_timestamp,
+            ETL_MERGE_COUNTER.INSERTED(v_timestamp),
             v_timestamp
         );
     
-    SELECT COUNT(*) INTO v_inserted FROM DW_STELLAR_STYLES WHERE DW_LAST_INSERTED = v_timestamp;
-    SELECT COUNT(*) INTO v_updated FROM DW_STELLAR_STYLES WHERE DW_LAST_UPDATED = v_timestamp AND DW_LAST_INSERTED < v_timestamp;
+    -- Rows inserted, counted by the MERGE itself; the rest of its rows were updated
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    v_updated := SQL%ROWCOUNT - v_inserted;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_STYLES', 'DW_STELLAR_STYLES', 'STG_STELLAR_STYLES', v_started, v_inserted, v_updated);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_STYLES: ' || v_inserted || ' inserted, ' || v_updated || ' updated');
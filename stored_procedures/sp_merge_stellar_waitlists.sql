@@ -1,8 +1,12 @@
 
   CREATE OR REPLACE EDITIONABLE PROCEDURE "API_USER"."SP_MERGE_STELLAR_WAITLISTS" 
 IS
+    v_started TIMESTAMP WITH TIME ZONE := SYSTIMESTAMP;
     v_merged NUMBER := 0;
+    v_inserted NUMBER := 0;
 BEGIN
+    ETL_MERGE_COUNTER.RESET;
+    
     MERGE INTO DW_STELLAR_WAITLISTS tgt
     USING STG_STELLAR_WAITLISTS src
     ON (tgt.ID = src.ID)
@@ -34,11 +38,17 @@ BEGIN
         )
         VALUES (
             src.ID, src.LOCATION_ID, src.CATEGORY_ID, src.STYLE_ID, src.CUSTOMER_ID, src.TIME_ID, src.TIMEFRAME_ID, src.FIRST_NAME, src.LAST_NAME, src.EMAIL, src.PHONE, src.DEPARTURE_DATE, src.LENGTH_REQUESTED, src.WAIT_LIST_TIME, src.FULFILLED, src.FULFILLED_DATE, src.CREATED_AT, src.UPDATED_AT,
-            SYSTIMESTAMP,
+            ETL_MERGE_COUNTER.INSERTED(SYSTIMESTAMP),
             SYSTIMESTAMP
         );
     
     v_merged := SQL%ROWCOUNT;
+    -- Rows inserted, counted by the MERGE itself
+    v_inserted := ETL_MERGE_COUNTER.INSERTED_COUNT;
+    
+    -- Record the merge statistics (ETL_MERGE_LOG)
+    SP_LOG_MERGE('SP_MERGE_STELLAR_WAITLISTS', 'DW_STELLAR_WAITLISTS', 'STG_STELLAR_WAITLISTS', v_started, v_inserted, v_merged - v_inserted);
+    
     COMMIT;
     
     DBMS_OUTPUT.PUT_LINE('DW_STELLAR_WAITLISTS: Merged ' || v_merged || ' records');
@@ -0,0 +1,181 @@
+"""
+Table Registry Module
+
+Declarative description of the tables loaded by the marina ETL pipeline.
+
+Each TableSpec ties a source CSV file to its staging table, data warehouse
+table, column list, row parser and merge stored procedure. A single generic
+engine (OracleConnector.load_staging_table) drives every table from its spec,
+so adding, reordering or parallelizing tables no longer means writing another
+hand-coded insert method or dispatcher branch.
+
+The INSERT statement for each table is built once when the spec is created
+and reused for every batch and every run. Tables parsed through a
+column_converters row converter also carry its bind types, so the connector
+can declare typed binds with setinputsizes() instead of letting the driver
+infer (and re-infer) them from the data.
+
+A spec may name the tables that have to be loaded and merged before it
+(depends_on), which the parallel loader honors when it loads independent
+tables side by side.
+"""
+
+
+def build_insert_sql(table_name, columns):
+    """
+    Build a positional-bind INSERT statement for a table.
+
+    Args:
+        table_name (str): Target table name
+        columns (tuple): Column names in bind order
+
+    Returns:
+        str: INSERT statement using :1..:N bind placeholders
+    """
+    column_list = ', '.join(columns)
+    bind_list = ', '.join(f":{i}" for i in range(1, len(columns) + 1))
+    return f"INSERT INTO {table_name} ({column_list}) VALUES ({bind_list})"
+
+
+class TableSpec:
+    """
+    Declarative description of one source table and its load/merge path.
+
+    Attributes:
+        system (str): Source system prefix ('MOLO' or 'STELLAR')
+        source_name (str): Source CSV name without extension (e.g. 'InvoiceItemSet')
+        table_name (str): Base table name (e.g. 'INVOICE_ITEMS')
+        description (str): Singular record label used in log messages
+        parser (callable): Function turning CSV content into row tuples
+        columns (tuple): Staging column names in bind order
+        staging_table (str): Staging table name (STG_<system>_<table_name>)
+        dw_table (str): Data warehouse table name (DW_<system>_<table_name>)
+        merge_procedure (str): Merge procedure name, or None if there is none
+        merge_inline (bool): Stream the merge right after the staging load in
+                             the 'auto' merge mode (see merge_scheduler.py)
+        commit_per_batch (bool): Large table that commits after every batch in
+                                 the 'auto' commit mode (see load_policy.py)
+        bulk_load (bool): Large table that loads through the bulk-load engine
+                          when a bulk mode is selected (see bulk_load.py)
+        bind_types (tuple): Optional (type_name, size) per column for setinputsizes,
+                            e.g. ('VARCHAR', 255), ('NUMBER', None), ('DATE', None);
+                            None lets the driver infer types from the data
+        validation (tuple): Optional (id_column, [fields]) for DataValidator checks
+        depends_on (tuple): table_names of specs that must finish loading (and
+                            merging, when streamed) before this one starts;
+                            deferred merges follow the same order
+        key_column (str): Primary key column the merge procedure matches on
+        key_index (int): Position of key_column in the row tuples, or None if
+                         the table has no such column
+        watermark_column (str): CSV header of the row's last-edited timestamp,
+                                used for incremental loads, or None
+        insert_sql (str): Prebuilt INSERT statement for the staging table
+    """
+
+    def __init__(
+        self,
+        system,
+        source_name,
+        table_name,
+        description,
+        parser,
+        columns,
+        has_merge_procedure=True,
+        merge_inline=False,
+        commit_per_batch=False,
+        bulk_load=False,
+        bind_types=None,
+        validation=None,
+        depends_on=(),
+        key_column='ID',
+        watermark_column=None
+    ):
+        self.system = system
+        self.source_name = source_name
+        self.table_name = table_name
+        self.description = description
+        self.parser = parser
+        self.columns = tuple(columns)
+        self.staging_table = f"STG_{system}_{table_name}"
+        self.dw_table = f"DW_{system}_{table_name}"
+        self.merge_procedure = (
+            f"SP_MERGE_{system}_{table_name}" if has_merge_procedure else None
+        )
+        self.merge_inline = merge_inline
+        self.commit_per_batch = commit_per_batch
+        self.bulk_load = bulk_load
+        self.bind_types = tuple(bind_types) if bind_types is not None else None
+        self.validation = validation
+        self.depends_on = tuple(depends_on)
+        self.key_column = key_column
+        self.key_index = (
+            self.columns.index(key_column) if key_column in self.columns else None
+        )
+        self.watermark_column = watermark_column
+        self.insert_sql = build_insert_sql(self.staging_table, self.columns)
+
+        if self.bind_types is not None and len(self.bind_types) != len(self.columns):
+            raise ValueError(
+                f"{source_name}: {len(self.bind_types)} bind types for "
+                f"{len(self.columns)} columns"
+            )
+
+    def __repr__(self):
+        return f"TableSpec({self.source_name!r} -> {self.staging_table})"
+
+
+def index_by_source(table_specs):
+    """
+    Index a registry by source CSV name.
+
+    Args:
+        table_specs (list): List of TableSpec objects
+
+    Returns:
+        dict: {source_name: TableSpec}
+    """
+    index = {}
+    for spec in table_specs:
+        if spec.source_name in index:
+            raise ValueError(f"Duplicate table registration for {spec.source_name}")
+        index[spec.source_name] = spec
+    return index
+
+
+def check_dependencies(table_specs):
+    """
+    Check that every depends_on entry names a registered table and that the
+    dependencies contain no cycle.
+
+    Args:
+        table_specs (list): List of TableSpec objects
+
+    Raises:
+        ValueError: On an unknown dependency or a dependency cycle
+    """
+    by_name = {spec.table_name: spec for spec in table_specs}
+    for spec in table_specs:
+        for name in spec.depends_on:
+            if name not in by_name:
+                raise ValueError(f"{spec.table_name} depends on unknown table {name}")
+
+    # Depth-first search; a table met again while still on the path is a cycle
+    finished = set()
+    for spec in table_specs:
+        if spec.table_name in finished:
+            continue
+        stack = [(spec.table_name, iter(spec.depends_on))]
+        on_path = {spec.table_name}
+        while stack:
+            name, deps = stack[-1]
+            next_name = next(deps, None)
+            if next_name is None:
+                stack.pop()
+                on_path.discard(name)
+                finished.add(name)
+            elif next_name in on_path:
+                cycle = [entry for entry, _ in stack] + [next_name]
+                raise ValueError(f"Circular table dependency: {' -> '.join(cycle)}")
+            elif next_name not in finished:
+                on_path.add(next_name)
+                stack.append((next_name, iter(by_name[next_name].depends_on)))
@@ -0,0 +1,134 @@
+-- Oracle DDL Statements for ETL Control Tables
+-- Bookkeeping tables used by the pipeline itself, not by reporting
+-- Run once per schema before enabling the features that use them
+
+-- Load Manifest Table
+-- Content digest of the source data last loaded and merged per table;
+-- tables whose digest is unchanged are skipped on the next run (load_manifest.py)
+CREATE TABLE ETL_LOAD_MANIFEST (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    CONTENT_HASH VARCHAR2(64) NOT NULL,
+    ROW_COUNT NUMBER(12,0),
+    LOADED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_LOAD_MANIFEST PRIMARY KEY (SOURCE_SYSTEM, TABLE_NAME)
+);
+
+COMMENT ON TABLE ETL_LOAD_MANIFEST IS 'ETL control: content hash of the last successful load per source table';
+
+-- Row Snapshot Table
+-- Primary key -> row digest of the data last merged per table (zlib compressed JSON);
+-- only new and changed rows are staged on the next run (row_delta.py)
+CREATE TABLE ETL_ROW_SNAPSHOT (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    ROW_COUNT NUMBER(12,0),
+    SNAPSHOT BLOB,
+    SAVED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_ROW_SNAPSHOT PRIMARY KEY (SOURCE_SYSTEM, TABLE_NAME)
+);
+
+COMMENT ON TABLE ETL_ROW_SNAPSHOT IS 'ETL control: primary key to row hash snapshot of the last merged load per table';
+
+-- Deleted Keys Table
+-- Primary keys that disappeared from a source table since the previous load;
+-- the merge procedures only insert and update, so deletes are recorded here
+CREATE TABLE ETL_DELETED_KEYS (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    ROW_KEY VARCHAR2(200) NOT NULL,
+    DETECTED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IDX_ETL_DELETED_KEYS ON ETL_DELETED_KEYS (SOURCE_SYSTEM, TABLE_NAME, ROW_KEY);
+
+COMMENT ON TABLE ETL_DELETED_KEYS IS 'ETL control: source rows deleted since the previous load';
+
+-- Watermarks Table
+-- Newest last-edited timestamp merged per table and the time of its last full load;
+-- incremental runs only load rows edited after the mark (watermarks.py)
+CREATE TABLE ETL_WATERMARKS (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    HIGH_WATER_MARK TIMESTAMP,
+    LAST_FULL_LOAD TIMESTAMP,
+    SAVED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_WATERMARKS PRIMARY KEY (SOURCE_SYSTEM, TABLE_NAME)
+);
+
+COMMENT ON TABLE ETL_WATERMARKS IS 'ETL control: high-water mark of the last-edited column per source table';
+
+-- Processed Objects Table
+-- S3 objects (bucket, key and ETag) whose data was loaded and merged successfully;
+-- a run whose newest object is listed here stops before the download (object_ledger.py)
+CREATE TABLE ETL_PROCESSED_OBJECTS (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    BUCKET VARCHAR2(255) NOT NULL,
+    OBJECT_KEY VARCHAR2(1024) NOT NULL,
+    ETAG VARCHAR2(100) NOT NULL,
+    ROW_COUNT NUMBER(12,0),
+    PROCESSED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_PROCESSED_OBJECTS PRIMARY KEY (SOURCE_SYSTEM, BUCKET, OBJECT_KEY, ETAG)
+);
+
+COMMENT ON TABLE ETL_PROCESSED_OBJECTS IS 'ETL control: S3 source objects already loaded successfully';
+
+-- Load Checkpoints Table
+-- Progress of each table of the source object being loaded (batches and rows
+-- committed to staging, STAGED, MERGED); --resume continues from it (checkpoints.py)
+CREATE TABLE ETL_LOAD_CHECKPOINTS (
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    OBJECT_KEY VARCHAR2(1024) NOT NULL,
+    ETAG VARCHAR2(100) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    STATUS VARCHAR2(10) NOT NULL,
+    BATCHES_DONE NUMBER(10,0) DEFAULT 0,
+    ROWS_DONE NUMBER(12,0) DEFAULT 0,
+    UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_LOAD_CHECKPOINTS PRIMARY KEY (SOURCE_SYSTEM, OBJECT_KEY, ETAG, TABLE_NAME)
+);
+
+COMMENT ON TABLE ETL_LOAD_CHECKPOINTS IS 'ETL control: per-table progress of the source object being loaded';
+
+-- Merge Log Table
+-- One row per run of a merge procedure, written by SP_LOG_MERGE just before the
+-- merge commits: rows staged, inserted, updated and left unchanged, and elapsed time (merge_log.py)
+CREATE TABLE ETL_MERGE_LOG (
+    LOG_ID NUMBER GENERATED ALWAYS AS IDENTITY,
+    PROCEDURE_NAME VARCHAR2(128) NOT NULL,
+    TARGET_TABLE VARCHAR2(128) NOT NULL,
+    SOURCE_TABLE VARCHAR2(128) NOT NULL,
+    SESSION_ID NUMBER,
+    ROWS_STAGED NUMBER(12,0),
+    ROWS_INSERTED NUMBER(12,0),
+    ROWS_UPDATED NUMBER(12,0),
+    ROWS_UNCHANGED NUMBER(12,0),
+    ELAPSED_SECONDS NUMBER(12,3),
+    STARTED_AT TIMESTAMP WITH TIME ZONE NOT NULL,
+    LOGGED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_MERGE_LOG PRIMARY KEY (LOG_ID)
+);
+
+CREATE INDEX IDX_ETL_MERGE_LOG ON ETL_MERGE_LOG (STARTED_AT);
+
+COMMENT ON TABLE ETL_MERGE_LOG IS 'ETL control: row counts and elapsed time of each merge procedure run';
+
+-- Rejected Rows Table
+-- Staging rows the database rejected in an error-tolerant load (--reject-bad-rows):
+-- the ORA error and the row's values as JSON; the rest of their batch loads (row_quarantine.py)
+CREATE TABLE ETL_REJECTED_ROWS (
+    REJECT_ID NUMBER GENERATED ALWAYS AS IDENTITY,
+    SOURCE_SYSTEM VARCHAR2(20) NOT NULL,
+    OBJECT_KEY VARCHAR2(1024) NOT NULL,
+    TABLE_NAME VARCHAR2(128) NOT NULL,
+    ROW_KEY VARCHAR2(200),
+    ERROR_CODE VARCHAR2(20),
+    ERROR_MESSAGE VARCHAR2(4000),
+    ROW_DATA CLOB,
+    REJECTED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT PK_ETL_REJECTED_ROWS PRIMARY KEY (REJECT_ID)
+);
+
+CREATE INDEX IDX_ETL_REJECTED_ROWS ON ETL_REJECTED_ROWS (SOURCE_SYSTEM, TABLE_NAME, REJECTED_AT);
+
+COMMENT ON TABLE ETL_REJECTED_ROWS IS 'ETL control: staging rows rejected by the database and quarantined';
@@ -0,0 +1,169 @@
+"""
+Tests for s3_download.py against an in-memory S3 (moto).
+
+Run with:
+    python -m pytest test_s3_download.py
+"""
+
+import io
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from s3_download import ParallelRangeStream, download_object
+
+
+BUCKET = 'test-backups'
+
+# Smallest part size S3 (and moto) accept for all but the last part
+UPLOAD_PART_SIZE = 5 * 1024 * 1024
+
+# Download range size, deliberately not aligned with the upload parts
+RANGE_SIZE = 1024 * 1024 + 17
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client('s3', region_name='us-east-1')
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def _put_single_part(client, key, data):
+    client.put_object(Bucket=BUCKET, Key=key, Body=data)
+
+
+def _put_multipart(client, key, data, part_size=UPLOAD_PART_SIZE):
+    upload = client.create_multipart_upload(Bucket=BUCKET, Key=key)
+    parts = []
+    for number, start in enumerate(range(0, len(data), part_size), start=1):
+        response = client.upload_part(
+            Bucket=BUCKET, Key=key, UploadId=upload['UploadId'],
+            PartNumber=number, Body=data[start:start + part_size]
+        )
+        parts.append({'ETag': response['ETag'], 'PartNumber': number})
+    client.complete_multipart_upload(
+        Bucket=BUCKET, Key=key, UploadId=upload['UploadId'],
+        MultipartUpload={'Parts': parts}
+    )
+
+
+class _AlteringClient:
+    """
+    S3 client proxy that alters the body of selected get_object calls.
+
+    Attributes:
+        calls (int): get_object calls made so far
+    """
+
+    def __init__(self, client, alter, calls_to_alter=(1,)):
+        self._client = client
+        self._alter = alter
+        self._calls_to_alter = set(calls_to_alter)
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def get_object(self, **kwargs):
+        response = self._client.get_object(**kwargs)
+        self.calls += 1
+        if self.calls in self._calls_to_alter:
+            response['Body'] = io.BytesIO(self._alter(response['Body'].read()))
+        return response
+
+
+def _flip_first_byte(body):
+    return bytes([body[0] ^ 0xFF]) + body[1:]
+
+
+def _drop_second_half(body):
+    return body[:len(body) // 2]
+
+
+def _drop_last_byte(body):
+    return body[:-1]
+
+
+def _read_stream(stream):
+    data = stream.read()
+    stream.finish()
+    stream.close()
+    return data
+
+
+def test_single_part_download_matches_etag(s3_client):
+    data = os.urandom(3 * RANGE_SIZE + 5)
+    _put_single_part(s3_client, 'single.zip', data)
+
+    with download_object(
+        s3_client, BUCKET, 'single.zip', workers=4, part_size=RANGE_SIZE
+    ) as spool:
+        assert spool.read() == data
+
+
+def test_multipart_download_matches_etag(s3_client):
+    data = os.urandom(2 * UPLOAD_PART_SIZE + 12345)
+    _put_multipart(s3_client, 'multi.zip', data)
+    etag = s3_client.head_object(Bucket=BUCKET, Key='multi.zip')['ETag']
+    assert etag.strip('"').endswith('-3')
+
+    with download_object(
+        s3_client, BUCKET, 'multi.zip', workers=4, part_size=RANGE_SIZE
+    ) as spool:
+        assert spool.read() == data
+
+
+def test_multipart_stream_matches_etag(s3_client):
+    data = os.urandom(UPLOAD_PART_SIZE + 4321)
+    _put_multipart(s3_client, 'multi.sql.gz', data)
+
+    stream = ParallelRangeStream(
+        s3_client, BUCKET, 'multi.sql.gz', workers=3, part_size=RANGE_SIZE
+    )
+    assert _read_stream(stream) == data
+
+
+def test_etag_mismatch_is_rejected(s3_client):
+    data = os.urandom(2 * RANGE_SIZE)
+    _put_single_part(s3_client, 'corrupt.zip', data)
+
+    # Every range comes back with the right length but one flipped byte
+    client = _AlteringClient(s3_client, _flip_first_byte, calls_to_alter=(1, 2))
+
+    with pytest.raises(ValueError, match='Checksum mismatch'):
+        download_object(client, BUCKET, 'corrupt.zip', workers=1, part_size=RANGE_SIZE)
+
+
+def test_expected_etag_mismatch_is_rejected(s3_client):
+    _put_single_part(s3_client, 'replaced.zip', b'new backup')
+
+    with pytest.raises(ValueError, match='changed while the run started'):
+        download_object(s3_client, BUCKET, 'replaced.zip', expected_etag='0' * 32)
+
+
+def test_stream_retries_short_read(s3_client):
+    data = os.urandom(3 * RANGE_SIZE)
+    _put_single_part(s3_client, 'short.sql.gz', data)
+
+    # The first range request loses its tail; the retry gets it all
+    client = _AlteringClient(s3_client, _drop_second_half, calls_to_alter=(1,))
+
+    stream = ParallelRangeStream(client, BUCKET, 'short.sql.gz', workers=1, part_size=RANGE_SIZE)
+    assert _read_stream(stream) == data
+    assert client.calls == len(range(0, len(data), RANGE_SIZE)) + 1
+
+
+def test_stream_fails_after_repeated_short_reads(s3_client):
+    data = os.urandom(RANGE_SIZE)
+    _put_single_part(s3_client, 'truncated.sql.gz', data)
+
+    client = _AlteringClient(s3_client, _drop_last_byte, calls_to_alter=range(1, 10))
+
+    stream = ParallelRangeStream(client, BUCKET, 'truncated.sql.gz', workers=1, part_size=RANGE_SIZE)
+    with pytest.raises(ValueError, match='Short read'):
+        stream.read()
+    stream.close()
@@ -0,0 +1,297 @@
+"""
+Watermarks Module
+
+High-water marks for incremental extraction.
+
+Tables whose CSV carries a last-edited timestamp (LastEditedDateTime or
+LastModifiedDateTime in MOLO, updated_at in Stellar) get a per-table
+high-water mark in the ETL_WATERMARKS control table
+(tables/oracle_etl_control_tables.sql): the newest timestamp of the last
+merged load. In incremental mode a WatermarkFilter drops every row edited
+at or before that mark minus a safety overlap while the CSV is read, before
+any of the row's other columns are converted, so quiet rows cost one
+timestamp parse instead of a full parse, bind and merge.
+
+A table is loaded in full again when it has no mark yet or its last full
+load is older than the full-refresh interval, which reconciles rows that
+changed without their timestamp moving. Marks are advanced on every load,
+incremental or not, and only recorded once the table's data has been
+merged.
+"""
+
+import csv
+import io
+import logging
+import threading
+from datetime import datetime, timedelta
+
+
+logger = logging.getLogger(__name__)
+
+
+WATERMARK_TABLE = 'ETL_WATERMARKS'
+
+# Rows edited up to this long before the mark are loaded again, to catch
+# transactions committed after the export that produced the mark
+DEFAULT_WATERMARK_OVERLAP = timedelta(hours=24)
+
+# Days after which an incremental table gets a full load for reconciliation
+DEFAULT_FULL_REFRESH_DAYS = 7
+
+WATERMARK_SELECT_SQL = f"""
+    SELECT TABLE_NAME, HIGH_WATER_MARK, LAST_FULL_LOAD
+    FROM {WATERMARK_TABLE}
+    WHERE SOURCE_SYSTEM = :1"""
+
+WATERMARK_MERGE_SQL = f"""
+    MERGE INTO {WATERMARK_TABLE} tgt
+    USING (
+        SELECT :1 AS SOURCE_SYSTEM, :2 AS TABLE_NAME,
+               CAST(:3 AS TIMESTAMP) AS HIGH_WATER_MARK, :4 AS FULL_LOAD
+        FROM DUAL
+    ) src
+    ON (tgt.SOURCE_SYSTEM = src.SOURCE_SYSTEM AND tgt.TABLE_NAME = src.TABLE_NAME)
+    WHEN MATCHED THEN
+        UPDATE SET
+            tgt.HIGH_WATER_MARK = GREATEST(tgt.HIGH_WATER_MARK, src.HIGH_WATER_MARK),
+            tgt.LAST_FULL_LOAD = CASE WHEN src.FULL_LOAD = 1
+                                      THEN SYSTIMESTAMP ELSE tgt.LAST_FULL_LOAD END,
+            tgt.SAVED_AT = SYSTIMESTAMP
+    WHEN NOT MATCHED THEN
+        INSERT (SOURCE_SYSTEM, TABLE_NAME, HIGH_WATER_MARK, LAST_FULL_LOAD, SAVED_AT)
+        VALUES (src.SOURCE_SYSTEM, src.TABLE_NAME, src.HIGH_WATER_MARK,
+                CASE WHEN src.FULL_LOAD = 1 THEN SYSTIMESTAMP END, SYSTIMESTAMP)"""
+
+
+class WatermarkFilter:
+    """
+    Tracks one table's last-edited column while its CSV is read.
+
+    Hand reader(csv_content) to the table's parser in place of the CSV. Rows
+    without a parseable timestamp are always kept.
+
+    Attributes:
+        column (str): CSV header of the last-edited timestamp
+        since (datetime): Drop rows edited at or before this time, or None to
+                          keep every row (full load)
+        parse (callable): Turns the stripped column text into a datetime or None
+        key_field (str): CSV header of the primary key, to collect skipped_keys
+        high_water (datetime): Newest timestamp read so far
+        kept (int): Rows passed to the parser
+        skipped (int): Rows dropped by the watermark
+        skipped_keys (list): key_field values of the dropped rows
+    """
+
+    def __init__(self, column, since, parse, key_field=None):
+        self.column = column
+        self.since = since
+        self.parse = parse
+        self.key_field = key_field
+        self.high_water = None
+        self.kept = 0
+        self.skipped = 0
+        self.skipped_keys = []
+
+    @property
+    def incremental(self):
+        """bool: True if rows older than the watermark are dropped."""
+        return self.since is not None
+
+    def reader(self, csv_content):
+        """
+        Open the CSV through the filter.
+
+        Args:
+            csv_content (str or file): Raw CSV content or an open text stream
+
+        Returns:
+            WatermarkedDictReader: csv.DictReader yielding the rows to load
+        """
+        if isinstance(csv_content, str):
+            csv_content = io.StringIO(csv_content)
+        return WatermarkedDictReader(csv_content, self)
+
+    def restore(self, high_water, rows):
+        """
+        Take over the mark of an earlier full read of the same CSV (a cached
+        parse, see parsed_cache.py) instead of reading it again.
+
+        Args:
+            high_water (datetime): Newest timestamp of that read, or None
+            rows (int): Rows it passed to the parser
+        """
+        self.high_water = high_water
+        self.kept = rows
+
+    def accepts(self, row):
+        """
+        Record one CSV row and decide whether it is loaded.
+
+        Args:
+            row (dict): CSV row
+
+        Returns:
+            bool: True if the row changed after the watermark (or has no timestamp)
+        """
+        text = (row.get(self.column) or '').strip()
+        edited = self.parse(text) if text else None
+        if edited is not None:
+            if self.high_water is None or edited > self.high_water:
+                self.high_water = edited
+            if self.since is not None and edited <= self.since:
+                self.skipped += 1
+                if self.key_field:
+                    self.skipped_keys.append((row.get(self.key_field) or '').strip())
+                return False
+        self.kept += 1
+        return True
+
+
+class WatermarkedDictReader(csv.DictReader):
+    """csv.DictReader that leaves out the rows its WatermarkFilter drops."""
+
+    def __init__(self, f, watermark):
+        super().__init__(f)
+        self.watermark = watermark
+
+    def __next__(self):
+        while True:
+            row = super().__next__()
+            if self.watermark.accepts(row):
+                return row
+
+
+class WatermarkStore:
+    """
+    High-water marks of one source system's tables.
+
+    Attributes:
+        system (str): Source system ('MOLO' or 'STELLAR')
+        enabled (bool): False if the control table could not be read
+        entries (dict): {table_name: (high_water_mark, last_full_load)}
+        overlap (timedelta): Safety overlap subtracted from the mark
+        full_refresh_days (int): Days between full loads of an incremental table
+    """
+
+    def __init__(
+        self,
+        system,
+        entries=None,
+        enabled=True,
+        overlap=DEFAULT_WATERMARK_OVERLAP,
+        full_refresh_days=DEFAULT_FULL_REFRESH_DAYS
+    ):
+        self.system = system
+        self.enabled = enabled
+        self.entries = dict(entries or {})
+        self.overlap = overlap
+        self.full_refresh_days = full_refresh_days
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        connector,
+        system,
+        overlap=DEFAULT_WATERMARK_OVERLAP,
+        full_refresh_days=DEFAULT_FULL_REFRESH_DAYS
+    ):
+        """
+        Read the high-water marks of a source system from the control table.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            system (str): Source system ('MOLO' or 'STELLAR')
+            overlap (timedelta): Safety overlap subtracted from the mark
+            full_refresh_days (int): Days between full loads of an incremental table
+
+        Returns:
+            WatermarkStore: Store (disabled if the control table is unavailable)
+        """
+        try:
+            connector.cursor.execute(WATERMARK_SELECT_SQL, [system])
+            entries = {
+                table_name: (high_water_mark, last_full_load)
+                for table_name, high_water_mark, last_full_load
+                in connector.cursor.fetchall()
+            }
+        except Exception as e:
+            logger.warning(f"⚠️  Watermarks unavailable, loading every row: {e}")
+            logger.warning(
+                f"   Create {WATERMARK_TABLE} (tables/oracle_etl_control_tables.sql) "
+                "to load incrementally."
+            )
+            connector.connection.rollback()
+            return cls(system, enabled=False)
+
+        logger.info(f"📋 Watermarks: {len(entries)} {system} tables recorded")
+        return cls(system, entries, overlap=overlap, full_refresh_days=full_refresh_days)
+
+    def cutoff(self, table_name, now=None):
+        """
+        Decide how an incremental run loads a table.
+
+        Args:
+            table_name (str): Table name
+            now (datetime): Current time (default: datetime.now())
+
+        Returns:
+            datetime: Load only rows edited after this time, or None for a
+                      full load (no mark yet, or a full refresh is due)
+        """
+        entry = self.entries.get(table_name)
+        if not self.enabled or entry is None or entry[0] is None:
+            return None
+        high_water_mark, last_full_load = entry
+        now = now or datetime.now()
+        if last_full_load is None or now - last_full_load >= timedelta(days=self.full_refresh_days):
+            return None
+        return high_water_mark - self.overlap
+
+    def stage(self, table_name, watermark):
+        """
+        Remember a successfully loaded table's new mark until save() records it.
+
+        Args:
+            table_name (str): Table name
+            watermark (WatermarkFilter): Filter the table's CSV was read through
+        """
+        if watermark.high_water is None:
+            return
+        with self._lock:
+            self._pending[table_name] = (watermark.high_water, not watermark.incremental)
+
+    def save(self, connector, table_names=None):
+        """
+        Record staged marks in the control table.
+
+        Args:
+            connector: Database connector with cursor and connection attributes
+            table_names (iterable): Only record these staged tables (the ones
+                                    whose merge is known to have run); None
+                                    records every staged table
+
+        Returns:
+            int: Number of tables recorded
+        """
+        with self._lock:
+            names = self._pending.keys() if table_names is None else table_names
+            rows = [
+                (self.system, name, high_water, 1 if full_load else 0)
+                for name in list(names) if name in self._pending
+                for high_water, full_load in [self._pending.pop(name)]
+            ]
+        if not self.enabled or not rows:
+            return 0
+
+        try:
+            connector.cursor.executemany(WATERMARK_MERGE_SQL, rows)
+            connector.connection.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not update watermarks: {e}")
+            connector.connection.rollback()
+            return 0
+
+        logger.info(f"📋 Watermarks updated for {len(rows)} {self.system} tables")
+        return len(rows)